@@ -2,83 +2,257 @@
 Foxnose Python SDK exposing Management and Flux clients plus shared tooling.
 """
 
-from .auth import (
-    AnonymousAuth,
-    AuthStrategy,
-    JWTAuth,
-    RequestData,
-    SecureKeyAuth,
-    SimpleKeyAuth,
-    StaticTokenProvider,
-    TokenProvider,
-)
-from .config import FoxnoseConfig, RetryConfig
-from .errors import (
-    FoxnoseAPIError,
-    FoxnoseAuthError,
-    FoxnoseError,
-    FoxnoseTransportError,
-)
-from .flux.client import AsyncFluxClient, FluxClient
-from .management.client import (
-    APIRef,
-    AsyncManagementClient,
-    ComponentRef,
-    EnvironmentRef,
-    FluxAPIKeyRef,
-    FluxRoleRef,
-    FolderRef,
-    ManagementAPIKeyRef,
-    ManagementClient,
-    ManagementRoleRef,
-    OrgRef,
-    ProjectRef,
-    ResourceRef,
-    RevisionRef,
-    SchemaVersionRef,
-)
-from .management.models import (
-    BatchItemError,
-    BatchUpsertItem,
-    BatchUpsertResult,
-    ComponentList,
-    ComponentSummary,
-    EnvironmentList,
-    EnvironmentSummary,
-    FieldList,
-    FieldSummary,
-    FolderList,
-    FolderSummary,
-    FluxAPIKeyList,
-    FluxAPIKeySummary,
-    ManagementAPIKeyList,
-    ManagementAPIKeySummary,
-    ManagementRoleList,
-    ManagementRoleSummary,
-    FluxRoleList,
-    FluxRoleSummary,
-    LocaleList,
-    LocaleSummary,
-    OrganizationList,
-    OrganizationOwner,
-    OrganizationPlanStatus,
-    OrganizationSummary,
-    OrganizationUsage,
-    PlanDetails,
-    PlanLimits,
-    RolePermission,
-    RolePermissionObject,
-    UserReference,
-    ProjectSummary,
-    ProjectList,
-    RegionInfo,
-    ResourceList,
-    ResourceSummary,
-    RevisionList,
-    RevisionSummary,
-    SchemaVersionList,
-    SchemaVersionSummary,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .auth import (
+        AnonymousAuth,
+        AuthStrategy,
+        JWTAuth,
+        RequestData,
+        SecureKeyAuth,
+        SimpleKeyAuth,
+        StaticTokenProvider,
+        TokenProvider,
+    )
+    from .concurrency import AdaptiveConcurrency, ConcurrencySample, RequestSpec
+    from .config import FoxnoseConfig, RetryConfig
+    from .errors import (
+        FoxnoseAPIError,
+        FoxnoseAuthError,
+        FoxnoseError,
+        FoxnoseTransportError,
+        FoxnoseValidationError,
+    )
+    from .flux.client import AsyncFluxClient, FluxClient
+    from .flux.federated import FederatedHit
+    from .management.cache import ImmutableCache
+    from .management.client import (
+        APIRef,
+        AsyncDataFetch,
+        AsyncManagementClient,
+        ComponentRef,
+        DataFetch,
+        EnvironmentRef,
+        FluxAPIKeyRef,
+        FluxRoleRef,
+        FolderRef,
+        ManagementAPIKeyRef,
+        ManagementClient,
+        ManagementRoleRef,
+        OrgRef,
+        ProjectRef,
+        ResourceRef,
+        RevisionRef,
+        SchemaVersionRef,
+    )
+    from .management.compact import (
+        CompactFolderSummary,
+        CompactPage,
+        CompactResourceSummary,
+        CompactRevisionSummary,
+    )
+    from .management.environment_diff import adiff_environments, diff_environments
+    from .management.folder_index import FolderIndex
+    from .management.hash_store import ResourceHashStore
+    from .management.journal import BatchJournal
+    from .management.models import (
+        BatchItemError,
+        BatchItemResult,
+        BatchOperationError,
+        BatchOperationOutcome,
+        BatchOperationResult,
+        BatchUpdateItem,
+        BatchUpsertItem,
+        BatchUpsertResult,
+        ComponentList,
+        ComponentSummary,
+        EnvironmentChange,
+        EnvironmentDiff,
+        EnvironmentList,
+        EnvironmentSummary,
+        FieldList,
+        FieldSummary,
+        FluxAPIKeyList,
+        FluxAPIKeySummary,
+        FluxRoleList,
+        FluxRoleSummary,
+        FolderList,
+        FolderSummary,
+        LocaleList,
+        LocaleSummary,
+        ManagementAPIKeyList,
+        ManagementAPIKeySummary,
+        ManagementRoleList,
+        ManagementRoleSummary,
+        OrganizationList,
+        OrganizationOwner,
+        OrganizationPlanStatus,
+        OrganizationSummary,
+        OrganizationUsage,
+        PermissionChange,
+        PermissionChangeError,
+        PermissionSyncResult,
+        PlanDetails,
+        PlanLimits,
+        ProjectList,
+        ProjectSummary,
+        RegionInfo,
+        ResourceList,
+        ResourceSummary,
+        RevisionList,
+        RevisionSummary,
+        RolePermission,
+        RolePermissionObject,
+        SchemaApplyResult,
+        SchemaChange,
+        SchemaChangeError,
+        SchemaVersionList,
+        SchemaVersionSummary,
+        SnapshotImportResult,
+        SnapshotStepError,
+        UserReference,
+    )
+    from .management.schema_apply import SchemaPlan
+    from .management.validation import PayloadValidator, ValidationIssue
+
+# Exported names by the module that defines them. They are imported on first
+# attribute access (PEP 562), so ``import foxnose_sdk`` does not load the
+# heavy client and model modules until they are used.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".auth": (
+        "AnonymousAuth",
+        "AuthStrategy",
+        "JWTAuth",
+        "RequestData",
+        "SecureKeyAuth",
+        "SimpleKeyAuth",
+        "StaticTokenProvider",
+        "TokenProvider",
+    ),
+    ".concurrency": (
+        "AdaptiveConcurrency",
+        "ConcurrencySample",
+        "RequestSpec",
+    ),
+    ".config": (
+        "FoxnoseConfig",
+        "RetryConfig",
+    ),
+    ".errors": (
+        "FoxnoseAPIError",
+        "FoxnoseAuthError",
+        "FoxnoseError",
+        "FoxnoseTransportError",
+        "FoxnoseValidationError",
+    ),
+    ".flux.client": (
+        "AsyncFluxClient",
+        "FluxClient",
+    ),
+    ".flux.federated": ("FederatedHit",),
+    ".management.client": (
+        "APIRef",
+        "AsyncDataFetch",
+        "AsyncManagementClient",
+        "ComponentRef",
+        "DataFetch",
+        "EnvironmentRef",
+        "FluxAPIKeyRef",
+        "FluxRoleRef",
+        "FolderRef",
+        "ManagementAPIKeyRef",
+        "ManagementClient",
+        "ManagementRoleRef",
+        "OrgRef",
+        "ProjectRef",
+        "ResourceRef",
+        "RevisionRef",
+        "SchemaVersionRef",
+    ),
+    ".management.cache": ("ImmutableCache",),
+    ".management.compact": (
+        "CompactFolderSummary",
+        "CompactPage",
+        "CompactResourceSummary",
+        "CompactRevisionSummary",
+    ),
+    ".management.environment_diff": (
+        "adiff_environments",
+        "diff_environments",
+    ),
+    ".management.folder_index": ("FolderIndex",),
+    ".management.hash_store": ("ResourceHashStore",),
+    ".management.journal": ("BatchJournal",),
+    ".management.models": (
+        "BatchItemError",
+        "BatchItemResult",
+        "BatchOperationError",
+        "BatchOperationOutcome",
+        "BatchOperationResult",
+        "BatchUpdateItem",
+        "BatchUpsertItem",
+        "BatchUpsertResult",
+        "ComponentList",
+        "ComponentSummary",
+        "EnvironmentChange",
+        "EnvironmentDiff",
+        "EnvironmentList",
+        "EnvironmentSummary",
+        "FieldList",
+        "FieldSummary",
+        "FolderList",
+        "FolderSummary",
+        "FluxAPIKeyList",
+        "FluxAPIKeySummary",
+        "ManagementAPIKeyList",
+        "ManagementAPIKeySummary",
+        "ManagementRoleList",
+        "ManagementRoleSummary",
+        "FluxRoleList",
+        "FluxRoleSummary",
+        "LocaleList",
+        "LocaleSummary",
+        "OrganizationList",
+        "OrganizationOwner",
+        "OrganizationPlanStatus",
+        "OrganizationSummary",
+        "OrganizationUsage",
+        "PermissionChange",
+        "PermissionChangeError",
+        "PermissionSyncResult",
+        "PlanDetails",
+        "PlanLimits",
+        "RolePermission",
+        "RolePermissionObject",
+        "UserReference",
+        "ProjectSummary",
+        "ProjectList",
+        "RegionInfo",
+        "ResourceList",
+        "ResourceSummary",
+        "RevisionList",
+        "RevisionSummary",
+        "SchemaApplyResult",
+        "SchemaChange",
+        "SchemaChangeError",
+        "SnapshotImportResult",
+        "SnapshotStepError",
+        "SchemaVersionList",
+        "SchemaVersionSummary",
+    ),
+    ".management.schema_apply": ("SchemaPlan",),
+    ".management.validation": (
+        "PayloadValidator",
+        "ValidationIssue",
+    ),
+}
+_LAZY_ATTRIBUTES = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
 
 __all__ = [
     "AnonymousAuth",
@@ -91,21 +265,56 @@ __all__ = [
     "TokenProvider",
     "FoxnoseConfig",
     "RetryConfig",
+    "AdaptiveConcurrency",
+    "ConcurrencySample",
+    "RequestSpec",
     "FoxnoseError",
     "FoxnoseAPIError",
     "FoxnoseAuthError",
     "FoxnoseTransportError",
+    "FoxnoseValidationError",
     "ManagementClient",
     "AsyncManagementClient",
     "FluxClient",
     "AsyncFluxClient",
+    "FederatedHit",
     "ResourceSummary",
     "ResourceList",
     "RevisionSummary",
     "RevisionList",
     "BatchUpsertItem",
+    "BatchUpdateItem",
     "BatchItemError",
+    "BatchItemResult",
     "BatchUpsertResult",
+    "BatchOperationOutcome",
+    "BatchOperationError",
+    "BatchOperationResult",
+    "DataFetch",
+    "AsyncDataFetch",
+    "SchemaChange",
+    "SchemaChangeError",
+    "SchemaApplyResult",
+    "SchemaPlan",
+    "SnapshotImportResult",
+    "PermissionChange",
+    "PermissionChangeError",
+    "PermissionSyncResult",
+    "SnapshotStepError",
+    "ResourceHashStore",
+    "ImmutableCache",
+    "FolderIndex",
+    "EnvironmentChange",
+    "EnvironmentDiff",
+    "diff_environments",
+    "adiff_environments",
+    "PayloadValidator",
+    "ValidationIssue",
+    "BatchJournal",
+    "CompactPage",
+    "CompactResourceSummary",
+    "CompactRevisionSummary",
+    "CompactFolderSummary",
     "FolderSummary",
     "FolderList",
     "ComponentSummary",
@@ -155,3 +364,23 @@ __all__ = [
 ]
 
 __version__ = "0.4.1"
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        # Submodules used as attributes (``foxnose_sdk.errors`` after a
+        # bare ``import foxnose_sdk``) are imported on first access too.
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
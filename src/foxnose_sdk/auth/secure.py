@@ -3,12 +3,9 @@ from __future__ import annotations
 import base64
 import datetime as dt
 import hashlib
-from typing import Callable, Mapping
+from typing import Any, Callable, Mapping
 from urllib.parse import urlparse
 
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import ec
-
 from ..errors import FoxnoseAuthError
 from .base import AuthStrategy, RequestData, ensure_bytes
 
@@ -37,16 +34,37 @@ class SecureKeyAuth(AuthStrategy):
         if not public_key or not private_key:
             raise ValueError("public_key and private_key are required")
         self._public_key = public_key
+        self._encoded_private_key = private_key
         self._clock = clock or _utcnow
+        self._private_key = self._load_private_key(private_key)
+
+    @staticmethod
+    def _load_private_key(private_key: str) -> Any:
+        # ``cryptography`` is imported here rather than at module level so that
+        # ``SimpleKeyAuth`` users do not pay for loading it.
+        from cryptography.hazmat.primitives import serialization
+
         try:
             private_bytes = base64.b64decode(private_key)
-            self._private_key = serialization.load_der_private_key(
-                private_bytes, password=None
-            )
+            return serialization.load_der_private_key(private_bytes, password=None)
         except Exception as exc:  # pragma: no cover - cryptography provides details
             raise FoxnoseAuthError("Failed to load private key") from exc
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Key objects from ``cryptography`` cannot be pickled; ship the encoded
+        # key instead so the strategy can cross process boundaries.
+        state = self.__dict__.copy()
+        del state["_private_key"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._private_key = self._load_private_key(self._encoded_private_key)
+
     def build_headers(self, request: RequestData) -> Mapping[str, str]:
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import ec
+
         body = ensure_bytes(request.body)
         timestamp = self._clock().astimezone(dt.timezone.utc).replace(microsecond=0)
         timestamp_str = timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -0,0 +1,634 @@
+"""Bounded-concurrency helpers shared by the batch APIs.
+
+The map helpers pull items lazily from their source and keep at most
+``max_concurrency`` calls in flight, so arbitrarily long iterators can be
+processed in constant memory. The DAG helpers run a dependency graph under the
+same cap, starting each node once its dependencies have succeeded, and the
+fan-out helpers back the clients' ``fan_out`` methods with argument unpacking
+and progress reporting. Outcomes are yielded as :class:`Completed` records
+instead of raising, leaving error policy to the caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from typing import Any, NamedTuple, Union
+
+from .errors import FoxnoseAPIError, FoxnoseTransportError
+
+_logger = logging.getLogger(__name__)
+
+
+class Completed(NamedTuple):
+    """Outcome of one call made by :func:`bounded_map` or :func:`abounded_map`."""
+
+    index: int
+    item: Any
+    result: Any = None
+    error: Exception | None = None
+
+
+class Unmetered(NamedTuple):
+    """Result of a call that was answered locally, without a request.
+
+    Return one from the function passed to :func:`bounded_map` or
+    :func:`abounded_map` to keep the call out of an
+    :class:`AdaptiveConcurrency` limiter: a cache hit finishes in
+    microseconds and would otherwise drag the latency baseline down. The
+    wrapped ``result`` is what the outcome reports.
+    """
+
+    result: Any
+
+
+class ConcurrencySample(NamedTuple):
+    """A point in :attr:`AdaptiveConcurrency.history`."""
+
+    elapsed: float
+    limit: int
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limiter driven by latency, errors and throttling.
+
+    Pass an instance as ``max_concurrency`` to let a batch tune its worker
+    count while it runs. The limit grows by roughly one slot per round trip
+    while requests stay healthy, and shrinks multiplicatively when the API
+    throttles (HTTP 429), fails (5xx, transport errors) or when smoothed
+    latency drifts above ``latency_tolerance`` times the fastest recent
+    round trip, which catches slowdowns hidden by transport-level retries.
+    Only successful calls feed the latency signal: a fast client error such
+    as a 400 or 404 says nothing about load. The baseline is the fastest of
+    the last ``baseline_window`` successful calls, so it follows the API
+    rather than being pinned by one unusually quick response.
+
+    Every change is appended to :attr:`history` so the chosen concurrency can
+    be inspected or plotted after the batch finishes. An instance is
+    thread-safe and may be reused across batches.
+
+    Args:
+        initial: Starting limit (default 4).
+        min_limit: Lower bound for the limit (default 1).
+        max_limit: Upper bound for the limit (default 64).
+        backoff: Factor applied on throttling or server errors (default 0.5).
+        latency_tolerance: Ratio of smoothed to baseline latency above which
+            the limit is reduced (default 2.0).
+        baseline_window: Number of recent successful calls the baseline
+            latency is taken from (default 100).
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        baseline_window: int = 100,
+    ) -> None:
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if not min_limit <= initial <= max_limit:
+            raise ValueError("initial must be between min_limit and max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+        if baseline_window < 1:
+            raise ValueError("baseline_window must be at least 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(initial)
+        self._recent: deque[float] = deque(maxlen=baseline_window)
+        self._smoothed: float | None = None
+        self._last_decrease = float("-inf")
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self.history: list[ConcurrencySample] = [ConcurrencySample(0.0, initial)]
+
+    @property
+    def limit(self) -> int:
+        """Number of calls currently allowed in flight."""
+        return int(self._limit)
+
+    @staticmethod
+    def is_overload(error: BaseException | None) -> bool:
+        """Whether ``error`` signals that the API is overloaded."""
+        if isinstance(error, FoxnoseAPIError):
+            return error.status_code == 429 or error.status_code >= 500
+        return isinstance(error, FoxnoseTransportError)
+
+    def record(self, latency: float, error: BaseException | None = None) -> None:
+        """Feed the outcome of one call back into the limiter."""
+        with self._lock:
+            now = time.monotonic()
+            if self.is_overload(error):
+                self._decrease(now, self.backoff, latency)
+                return
+            if error is not None:
+                return
+            self._recent.append(latency)
+            baseline = min(self._recent)
+            if self._smoothed is None:
+                self._smoothed = latency
+            else:
+                self._smoothed += 0.2 * (latency - self._smoothed)
+            if self._smoothed > baseline * self.latency_tolerance:
+                self._decrease(now, 0.9, latency)
+            else:
+                self._set(min(self.max_limit, self._limit + 1 / self._limit), now)
+
+    def _decrease(self, now: float, factor: float, latency: float) -> None:
+        # Calls already in flight finish after a decrease; ignore their
+        # signals for one round trip so a single burst only backs off once.
+        if now - self._last_decrease < max(self._smoothed or 0.0, latency):
+            return
+        self._last_decrease = now
+        self._set(max(self.min_limit, self._limit * factor), now)
+
+    def _set(self, value: float, now: float) -> None:
+        previous = int(self._limit)
+        self._limit = value
+        if int(value) != previous:
+            self.history.append(ConcurrencySample(now - self._started, int(value)))
+
+
+ConcurrencyLimit = Union[int, AdaptiveConcurrency]
+"""Fixed worker count or an :class:`AdaptiveConcurrency` limiter."""
+
+
+def _check_concurrency(max_concurrency: ConcurrencyLimit) -> None:
+    if isinstance(max_concurrency, AdaptiveConcurrency):
+        return
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+
+def _current_limit(max_concurrency: ConcurrencyLimit) -> int:
+    if isinstance(max_concurrency, AdaptiveConcurrency):
+        return max_concurrency.limit
+    return max_concurrency
+
+
+def _upper_limit(max_concurrency: ConcurrencyLimit) -> int:
+    if isinstance(max_concurrency, AdaptiveConcurrency):
+        return max_concurrency.max_limit
+    return max_concurrency
+
+
+def _timed_callback(
+    max_concurrency: ConcurrencyLimit,
+) -> Callable[[Any], None] | None:
+    """Done-callback that reports a call's latency and error to the limiter."""
+    if not isinstance(max_concurrency, AdaptiveConcurrency):
+        return None
+    limiter = max_concurrency
+    started = time.monotonic()
+
+    def callback(future: Any) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None and isinstance(future.result(), Unmetered):
+            return
+        limiter.record(time.monotonic() - started, error)
+
+    return callback
+
+
+def _unwrap_result(result: Any) -> Any:
+    return result.result if isinstance(result, Unmetered) else result
+
+
+def _unwrap_error(error: BaseException | None) -> Exception | None:
+    # Only ``Exception`` subclasses are per-item failures; anything else
+    # (KeyboardInterrupt, SystemExit) aborts the whole run.
+    if error is not None and not isinstance(error, Exception):
+        raise error
+    return error
+
+
+def bounded_map(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    *,
+    max_concurrency: ConcurrencyLimit,
+    ordered: bool = False,
+) -> Generator[Completed, None, None]:
+    """Call ``fn`` for every item on a thread pool with bounded in-flight work.
+
+    Args:
+        fn: Callable invoked once per item. Wrap results that needed no
+            request in :class:`Unmetered`.
+        items: Any iterable; it is consumed lazily as slots free up.
+        max_concurrency: Maximum number of calls running or awaiting
+            consumption at any time, or an :class:`AdaptiveConcurrency`
+            limiter that adjusts it from observed latency and errors.
+        ordered: Yield outcomes in input order instead of completion order.
+    """
+    _check_concurrency(max_concurrency)
+    return _bounded_map(fn, items, max_concurrency, ordered)
+
+
+def _bounded_map(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: ConcurrencyLimit,
+    ordered: bool,
+) -> Generator[Completed, None, None]:
+    source = enumerate(items)
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=_upper_limit(max_concurrency)
+    )
+    inflight: dict[concurrent.futures.Future[Any], tuple[int, Any]] = {}
+    queue: deque[concurrent.futures.Future[Any]] = deque()
+    exhausted = False
+
+    def fill() -> None:
+        nonlocal exhausted
+        while not exhausted and len(inflight) < _current_limit(max_concurrency):
+            entry = next(source, None)
+            if entry is None:
+                exhausted = True
+                return
+            future = executor.submit(fn, entry[1])
+            callback = _timed_callback(max_concurrency)
+            if callback is not None:
+                future.add_done_callback(callback)
+            inflight[future] = entry
+            if ordered:
+                queue.append(future)
+
+    try:
+        fill()
+        while inflight:
+            if ordered:
+                done: Iterable[concurrent.futures.Future[Any]] = (queue.popleft(),)
+            else:
+                done, _ = concurrent.futures.wait(
+                    inflight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+            for future in done:
+                error = _unwrap_error(future.exception())
+                index, item = inflight.pop(future)
+                fill()
+                result = None if error is not None else _unwrap_result(future.result())
+                yield Completed(index, item, result, error)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def abounded_map(
+    fn: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any] | AsyncIterable[Any],
+    *,
+    max_concurrency: ConcurrencyLimit,
+    ordered: bool = False,
+) -> AsyncGenerator[Completed, None]:
+    """Async variant of :func:`bounded_map` that runs calls as tasks.
+
+    ``items`` may be a regular or an asynchronous iterable. Tasks still in
+    flight are cancelled when the returned iterator is closed early.
+    """
+    _check_concurrency(max_concurrency)
+    return _abounded_map(fn, items, max_concurrency, ordered)
+
+
+async def _aiterate(
+    items: Iterable[Any] | AsyncIterable[Any],
+) -> AsyncGenerator[Any, None]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def _abounded_map(
+    fn: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any] | AsyncIterable[Any],
+    max_concurrency: ConcurrencyLimit,
+    ordered: bool,
+) -> AsyncGenerator[Completed, None]:
+    source = _aiterate(items)
+    position = 0
+    exhausted = False
+    inflight: dict[asyncio.Future[Any], tuple[int, Any]] = {}
+    queue: deque[asyncio.Future[Any]] = deque()
+
+    async def fill() -> None:
+        nonlocal position, exhausted
+        while not exhausted and len(inflight) < _current_limit(max_concurrency):
+            try:
+                item = await source.__anext__()
+            except StopAsyncIteration:
+                exhausted = True
+                return
+            task = asyncio.ensure_future(fn(item))
+            callback = _timed_callback(max_concurrency)
+            if callback is not None:
+                task.add_done_callback(callback)
+            inflight[task] = (position, item)
+            position += 1
+            if ordered:
+                queue.append(task)
+
+    try:
+        await fill()
+        while inflight:
+            if ordered:
+                task = queue.popleft()
+                await asyncio.wait((task,))
+                done: Iterable[asyncio.Future[Any]] = (task,)
+            else:
+                done, _ = await asyncio.wait(
+                    inflight, return_when=asyncio.FIRST_COMPLETED
+                )
+            for task in done:
+                error = _unwrap_error(task.exception())
+                index, item = inflight.pop(task)
+                await fill()
+                result = None if error is not None else _unwrap_result(task.result())
+                yield Completed(index, item, result, error)
+    finally:
+        leftover = list(inflight)
+        for task in leftover:
+            task.cancel()
+        if leftover:
+            await asyncio.gather(*leftover, return_exceptions=True)
+        await source.aclose()
+
+
+def bounded_dag(
+    fn: Callable[[Any], Any],
+    nodes: Sequence[Any],
+    dependencies: Sequence[Iterable[int]],
+    *,
+    max_concurrency: ConcurrencyLimit,
+) -> Generator[Completed, None, None]:
+    """Call ``fn`` for every node of a dependency graph on a thread pool.
+
+    A node is started once all nodes it depends on have succeeded, so
+    independent branches run concurrently while each branch keeps its order.
+    Nodes downstream of a failure (or of a cycle) are never started and are
+    not yielded.
+
+    Args:
+        fn: Callable invoked once per node.
+        nodes: The graph's nodes.
+        dependencies: For each node, the indices of the nodes it depends on.
+        max_concurrency: Maximum number of calls in flight, or an
+            :class:`AdaptiveConcurrency` limiter.
+    """
+    _check_concurrency(max_concurrency)
+    if len(dependencies) != len(nodes):
+        raise ValueError("dependencies must have one entry per node")
+    return _bounded_dag(fn, nodes, dependencies, max_concurrency)
+
+
+def _dag_state(
+    dependencies: Sequence[Iterable[int]],
+) -> tuple[list[set[int]], list[list[int]], deque[int]]:
+    waiting = [set(deps) for deps in dependencies]
+    dependents: list[list[int]] = [[] for _ in waiting]
+    for index, deps in enumerate(waiting):
+        for dep in deps:
+            dependents[dep].append(index)
+    ready = deque(index for index, deps in enumerate(waiting) if not deps)
+    return waiting, dependents, ready
+
+
+def _release(
+    index: int,
+    waiting: list[set[int]],
+    dependents: list[list[int]],
+    ready: deque[int],
+) -> None:
+    for dependent in dependents[index]:
+        waiting[dependent].discard(index)
+        if not waiting[dependent]:
+            ready.append(dependent)
+
+
+def _bounded_dag(
+    fn: Callable[[Any], Any],
+    nodes: Sequence[Any],
+    dependencies: Sequence[Iterable[int]],
+    max_concurrency: ConcurrencyLimit,
+) -> Generator[Completed, None, None]:
+    waiting, dependents, ready = _dag_state(dependencies)
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=_upper_limit(max_concurrency)
+    )
+    inflight: dict[concurrent.futures.Future[Any], int] = {}
+
+    def fill() -> None:
+        while ready and len(inflight) < _current_limit(max_concurrency):
+            index = ready.popleft()
+            future = executor.submit(fn, nodes[index])
+            callback = _timed_callback(max_concurrency)
+            if callback is not None:
+                future.add_done_callback(callback)
+            inflight[future] = index
+
+    try:
+        fill()
+        while inflight:
+            done, _ = concurrent.futures.wait(
+                inflight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                error = _unwrap_error(future.exception())
+                index = inflight.pop(future)
+                if error is None:
+                    _release(index, waiting, dependents, ready)
+                fill()
+                result = None if error is not None else future.result()
+                yield Completed(index, nodes[index], result, error)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def abounded_dag(
+    fn: Callable[[Any], Awaitable[Any]],
+    nodes: Sequence[Any],
+    dependencies: Sequence[Iterable[int]],
+    *,
+    max_concurrency: ConcurrencyLimit,
+) -> AsyncGenerator[Completed, None]:
+    """Async variant of :func:`bounded_dag` that runs calls as tasks."""
+    _check_concurrency(max_concurrency)
+    if len(dependencies) != len(nodes):
+        raise ValueError("dependencies must have one entry per node")
+    return _abounded_dag(fn, nodes, dependencies, max_concurrency)
+
+
+async def _abounded_dag(
+    fn: Callable[[Any], Awaitable[Any]],
+    nodes: Sequence[Any],
+    dependencies: Sequence[Iterable[int]],
+    max_concurrency: ConcurrencyLimit,
+) -> AsyncGenerator[Completed, None]:
+    waiting, dependents, ready = _dag_state(dependencies)
+    inflight: dict[asyncio.Future[Any], int] = {}
+
+    def fill() -> None:
+        while ready and len(inflight) < _current_limit(max_concurrency):
+            index = ready.popleft()
+            task = asyncio.ensure_future(fn(nodes[index]))
+            callback = _timed_callback(max_concurrency)
+            if callback is not None:
+                task.add_done_callback(callback)
+            inflight[task] = index
+
+    try:
+        fill()
+        while inflight:
+            done, _ = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = _unwrap_error(task.exception())
+                index = inflight.pop(task)
+                if error is None:
+                    _release(index, waiting, dependents, ready)
+                fill()
+                result = None if error is not None else task.result()
+                yield Completed(index, nodes[index], result, error)
+    finally:
+        leftover = list(inflight)
+        for task in leftover:
+            task.cancel()
+        if leftover:
+            await asyncio.gather(*leftover, return_exceptions=True)
+
+
+class RequestSpec(NamedTuple):
+    """A raw HTTP call for the clients' ``fan_out`` methods."""
+
+    method: str
+    path: str
+    params: Mapping[str, Any] | None = None
+    json_body: Any = None
+
+
+def _call_args(item: Any) -> tuple[Any, ...]:
+    # Only plain tuples are unpacked, so named tuples such as RequestSpec
+    # are passed through as a single argument.
+    return item if type(item) is tuple else (item,)
+
+
+def _report(
+    on_progress: Callable[[int, int], None] | None, completed: int, total: int
+) -> None:
+    if on_progress is None:
+        return
+    try:
+        on_progress(completed, total)
+    except Exception:
+        # A failing callback must not abort the batch, but should not vanish.
+        _logger.exception("on_progress callback raised; continuing")
+
+
+def fan_out(
+    fn: Callable[..., Any],
+    items: Iterable[Any],
+    *,
+    max_concurrency: ConcurrencyLimit,
+    ordered: bool = True,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> Generator[Completed, None, None]:
+    """Call ``fn(*args)`` for every argument tuple with bounded concurrency.
+
+    Items that are not plain tuples are passed as the single argument. The
+    items are materialized up front so that ``on_progress`` receives
+    ``(completed_count, total_count)`` after each call finishes.
+    """
+    items = list(items)
+    outcomes = bounded_map(
+        lambda args: fn(*_call_args(args)),
+        items,
+        max_concurrency=max_concurrency,
+        ordered=ordered,
+    )
+    return _reported(outcomes, len(items), on_progress)
+
+
+def _reported(
+    outcomes: Generator[Completed, None, None],
+    total: int,
+    on_progress: Callable[[int, int], None] | None,
+) -> Generator[Completed, None, None]:
+    try:
+        for completed, outcome in enumerate(outcomes, 1):
+            _report(on_progress, completed, total)
+            yield outcome
+    finally:
+        outcomes.close()
+
+
+def afan_out(
+    fn: Callable[..., Awaitable[Any]],
+    items: Iterable[Any],
+    *,
+    max_concurrency: ConcurrencyLimit,
+    ordered: bool = True,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> AsyncGenerator[Completed, None]:
+    """Async variant of :func:`fan_out` that runs calls as tasks."""
+    items = list(items)
+    outcomes = abounded_map(
+        lambda args: fn(*_call_args(args)),
+        items,
+        max_concurrency=max_concurrency,
+        ordered=ordered,
+    )
+    return _areported(outcomes, len(items), on_progress)
+
+
+async def _areported(
+    outcomes: AsyncGenerator[Completed, None],
+    total: int,
+    on_progress: Callable[[int, int], None] | None,
+) -> AsyncGenerator[Completed, None]:
+    try:
+        completed = 0
+        async for outcome in outcomes:
+            completed += 1
+            _report(on_progress, completed, total)
+            yield outcome
+    finally:
+        await outcomes.aclose()
+
+
+__all__ = [
+    "AdaptiveConcurrency",
+    "Completed",
+    "ConcurrencyLimit",
+    "ConcurrencySample",
+    "RequestSpec",
+    "Unmetered",
+    "abounded_dag",
+    "abounded_map",
+    "afan_out",
+    "bounded_dag",
+    "bounded_map",
+    "fan_out",
+]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any, Mapping
+from typing import Any
 
 
 class FoxnoseError(Exception):
@@ -23,6 +24,21 @@ class FoxnoseAPIError(FoxnoseError):
         code = f", error_code={self.error_code}" if self.error_code else ""
         return f"{self.message} (status={self.status_code}{code})"
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The dataclass ``__init__`` leaves ``Exception.args`` empty, so the
+        # default exception pickling would lose every field.
+        return (
+            type(self),
+            (
+                self.message,
+                self.status_code,
+                self.error_code,
+                self.detail,
+                self.response_headers,
+                self.response_body,
+            ),
+        )
+
 
 class FoxnoseAuthError(FoxnoseError):
     """Raised when authentication headers cannot be generated."""
@@ -30,3 +46,16 @@ class FoxnoseAuthError(FoxnoseError):
 
 class FoxnoseTransportError(FoxnoseError):
     """Raised when the HTTP layer fails before receiving a response."""
+
+
+class FoxnoseValidationError(FoxnoseError):
+    """Raised when a payload fails local schema validation and is not sent."""
+
+    def __init__(self, message: str, issues: Sequence[Any] = ()) -> None:
+        super().__init__(message, list(issues))
+        self.message = message
+        self.issues = list(issues)
+
+    def __str__(self) -> str:
+        details = "; ".join(f"{issue.path}: {issue.message}" for issue in self.issues)
+        return f"{self.message}: {details}" if details else self.message
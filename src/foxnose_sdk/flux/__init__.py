@@ -1,3 +1,4 @@
 from .client import AsyncFluxClient, FluxClient
+from .federated import FederatedHit
 
-__all__ = ["FluxClient", "AsyncFluxClient"]
+__all__ = ["FluxClient", "AsyncFluxClient", "FederatedHit"]
@@ -1,11 +1,38 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
 import httpx
-from typing import Any, Mapping
 
 from ..auth import AuthStrategy
+from ..concurrency import (
+    Completed,
+    ConcurrencyLimit,
+    RequestSpec,
+    abounded_map,
+    afan_out,
+    bounded_map,
+    fan_out,
+)
 from ..config import FoxnoseConfig, RetryConfig
 from ..http import HttpTransport
+from .federated import FederatedHit, FederatedMerge, ScoreSource
 
 
 def _clean_prefix(prefix: str) -> str:
@@ -19,6 +46,187 @@ def _normalize_folder_path(folder_path: str) -> str:
     return folder_path.strip("/")
 
 
+def _search_signature(folder_path: str, body: Mapping[str, Any]) -> str:
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{_normalize_folder_path(folder_path)}\n{canonical}"
+
+
+def _dedupe_searches(
+    queries: Sequence[tuple[str, Mapping[str, Any]]],
+) -> tuple[list[tuple[str, Mapping[str, Any]]], list[int]]:
+    """Return the distinct queries and, per input query, its distinct index."""
+    unique: list[tuple[str, Mapping[str, Any]]] = []
+    seen: dict[str, int] = {}
+    slots: list[int] = []
+    for folder_path, body in queries:
+        signature = _search_signature(folder_path, body)
+        if signature not in seen:
+            seen[signature] = len(unique)
+            unique.append((folder_path, body))
+        slots.append(seen[signature])
+    return unique, slots
+
+
+def _search_results(
+    queries: Sequence[tuple[str, Mapping[str, Any]]],
+    slots: Sequence[int],
+    outcomes: Sequence[Completed],
+) -> list[Completed]:
+    return [
+        Completed(index, query, outcomes[slot].result, outcomes[slot].error)
+        for index, (query, slot) in enumerate(zip(queries, slots))
+    ]
+
+
+def _cursor_query(query: Mapping[str, Any], cursor: str) -> dict[str, Any]:
+    """Return ``query`` moved to the page that ``cursor`` points at.
+
+    Flux returns an opaque ``next`` cursor that is sent back as the ``next``
+    parameter. A cursor given as a URL has its query string reused instead.
+    """
+    following = dict(query)
+    if "?" in cursor:
+        following.update(parse_qsl(urlsplit(cursor).query, keep_blank_values=True))
+    else:
+        following["next"] = cursor
+    return following
+
+
+def _first_query(
+    params: Mapping[str, Any] | None,
+    page_size: int | None,
+    max_items: int | None,
+    cursor: str | None,
+) -> dict[str, Any]:
+    if page_size is not None and page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if max_items is not None and max_items < 0:
+        raise ValueError("max_items must not be negative")
+    query = dict(params or {})
+    if page_size is not None:
+        query["limit"] = page_size
+    if cursor:
+        query = _cursor_query(query, cursor)
+    return query
+
+
+def _wants_next(page: Mapping[str, Any], remaining: int | None) -> bool:
+    # Skip the next page once ``max_items`` is covered by the current one.
+    return bool(page.get("next")) and (
+        remaining is None or remaining > len(page.get("results") or ())
+    )
+
+
+def _iterate_cursor_pages(
+    fetch: Callable[[dict[str, Any]], Any],
+    query: dict[str, Any],
+    *,
+    max_items: int | None,
+    prefetch: bool,
+) -> Generator[Any, None, None]:
+    """Yield pages of a cursor-paginated endpoint, following ``next``.
+
+    While the caller consumes page N, page N+1 is fetched on a background
+    thread, so at most two pages are held in memory at any time.
+    """
+    remaining = max_items
+    if remaining == 0:
+        return
+    executor = (
+        concurrent.futures.ThreadPoolExecutor(max_workers=1) if prefetch else None
+    )
+    try:
+        page = fetch(query)
+        while True:
+            pending: concurrent.futures.Future[Any] | None = None
+            wants_next = _wants_next(page, remaining)
+            if executor is not None and wants_next:
+                pending = executor.submit(fetch, _cursor_query(query, page["next"]))
+            yield page
+            if not wants_next:
+                return
+            if remaining is not None:
+                remaining -= len(page.get("results") or ())
+            if pending is not None:
+                page = pending.result()
+            else:
+                page = fetch(_cursor_query(query, page["next"]))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def _aiterate_cursor_pages(
+    fetch: Callable[[dict[str, Any]], Awaitable[Any]],
+    query: dict[str, Any],
+    *,
+    max_items: int | None,
+    prefetch: bool,
+) -> AsyncGenerator[Any, None]:
+    """Async variant of :func:`_iterate_cursor_pages` that prefetches with a task."""
+    remaining = max_items
+    if remaining == 0:
+        return
+    pending: asyncio.Future[Any] | None = None
+    try:
+        page = await fetch(query)
+        while True:
+            wants_next = _wants_next(page, remaining)
+            if prefetch and wants_next:
+                pending = asyncio.ensure_future(
+                    fetch(_cursor_query(query, page["next"]))
+                )
+            yield page
+            if not wants_next:
+                return
+            if remaining is not None:
+                remaining -= len(page.get("results") or ())
+            if pending is not None:
+                page = await pending
+                pending = None
+            else:
+                page = await fetch(_cursor_query(query, page["next"]))
+    finally:
+        if pending is not None:
+            pending.cancel()
+            # Wait for the cancellation and retrieve any error, so the task
+            # is neither destroyed pending nor left with an unread exception.
+            with contextlib.suppress(BaseException):
+                await pending
+
+
+def _page_items(
+    pages: Generator[Any, None, None], max_items: int | None
+) -> Iterator[Any]:
+    remaining = max_items
+    try:
+        for page in pages:
+            for item in page.get("results") or ():
+                if remaining == 0:
+                    return
+                yield item
+                if remaining is not None:
+                    remaining -= 1
+    finally:
+        pages.close()
+
+
+async def _apage_items(
+    pages: AsyncGenerator[Any, None], max_items: int | None
+) -> AsyncIterator[Any]:
+    remaining = max_items
+    try:
+        async for page in pages:
+            for item in page.get("results") or ():
+                if remaining == 0:
+                    return
+                yield item
+                if remaining is not None:
+                    remaining -= 1
+    finally:
+        await pages.aclose()
+
+
 class FluxClient:
     """Synchronous client for Flux delivery APIs."""
 
@@ -63,6 +271,69 @@ class FluxClient:
         path = self._build_path(folder_path)
         return self._transport.request("GET", path, params=params)
 
+    def iter_resource_pages(
+        self,
+        folder_path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[Any]:
+        """Iterate over the pages of a folder's resources.
+
+        Follows the ``next`` cursor transparently and prefetches the next page
+        while the current one is consumed. Save ``page["next"]`` after
+        processing a page to resume a scan later with ``cursor=``.
+
+        Args:
+            folder_path: Folder path under the API prefix.
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size sent as ``limit``.
+            cursor: ``next`` cursor of a previous page to resume from.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        query = _first_query(params, page_size, None, cursor)
+        return _iterate_cursor_pages(
+            lambda page_query: self.list_resources(folder_path, params=page_query),
+            query,
+            max_items=None,
+            prefetch=prefetch,
+        )
+
+    def iter_resources(
+        self,
+        folder_path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        cursor: str | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[Any]:
+        """Iterate over all resources in a folder.
+
+        Follows the ``next`` cursor transparently and prefetches the next page
+        while the current one is consumed. Use :meth:`iter_resource_pages` to
+        see the cursors needed for resuming.
+
+        Args:
+            folder_path: Folder path under the API prefix.
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size sent as ``limit``.
+            max_items: Stop after yielding this many resources.
+            cursor: ``next`` cursor of a previous page to resume from.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        query = _first_query(params, page_size, max_items, cursor)
+        pages = _iterate_cursor_pages(
+            lambda page_query: self.list_resources(folder_path, params=page_query),
+            query,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
+        return _page_items(pages, max_items)
+
     def get_resource(
         self,
         folder_path: str,
@@ -83,6 +354,97 @@ class FluxClient:
         path = self._build_path(folder_path, suffix="/_search")
         return self._transport.request("POST", path, json_body=body)
 
+    def search_many(
+        self,
+        queries: Iterable[tuple[str, Mapping[str, Any]]],
+        *,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> list[Completed]:
+        """Run several searches concurrently.
+
+        Identical ``(folder_path, body)`` queries are sent once and share
+        their result. Searches run on up to ``max_concurrency`` threads over
+        this client's connection pool.
+
+        Args:
+            queries: ``(folder_path, body)`` pairs, as passed to :meth:`search`.
+            max_concurrency: Maximum number of searches in flight.
+
+        Returns:
+            One :class:`~foxnose_sdk.concurrency.Completed` per query, in
+            input order. ``item`` is the query, and a failed search sets
+            ``error`` instead of ``result``.
+        """
+        queries = list(queries)
+        unique, slots = _dedupe_searches(queries)
+        outcomes = list(
+            fan_out(
+                lambda folder_path, body: self.search(folder_path, body=body),
+                unique,
+                max_concurrency=max_concurrency,
+            )
+        )
+        return _search_results(queries, slots, outcomes)
+
+    def federated_search(
+        self,
+        folder_paths: Sequence[str],
+        body: Mapping[str, Any],
+        *,
+        top_k: int = 10,
+        score: ScoreSource = "score",
+        page_size: int | None = None,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> list[FederatedHit]:
+        """
+        Search several folders and return the best ``top_k`` hits overall.
+
+        The folders are searched concurrently with the same ``body``, paged
+        with ``limit``/``offset``. Each folder's hits are expected in
+        descending score order; they are merged with a heap, and a folder
+        is paged further only while its next hit could still make the top
+        ``top_k``. The search stops as soon as the top ``top_k`` is settled.
+
+        Args:
+            folder_paths: Folder paths under the API prefix.
+            body: Search body, as passed to :meth:`search`. Its ``limit``
+                and ``offset`` are replaced.
+            top_k: Number of hits to return.
+            score: Key of the score in each hit, or a callable returning it.
+            page_size: Hits requested per folder page. Defaults to an even
+                share of ``top_k`` across the folders.
+            max_concurrency: Maximum number of searches in flight.
+
+        Returns:
+            Up to ``top_k`` :class:`~foxnose_sdk.flux.federated.FederatedHit`
+            records, best first.
+
+        Raises:
+            FoxnoseAPIError: If a folder's search fails.
+        """
+        merge = FederatedMerge(
+            folder_paths, top_k=top_k, score=score, page_size=page_size
+        )
+        hits: list[FederatedHit] = []
+        while not merge.done:
+            requests = [
+                (index, merge.page_body(index, body)) for index in merge.pending()
+            ]
+            outcomes = bounded_map(
+                lambda request: self.search(
+                    merge.folder_paths[request[0]], body=request[1]
+                ),
+                requests,
+                max_concurrency=max_concurrency,
+            )
+            with contextlib.closing(outcomes):
+                for outcome in outcomes:
+                    if outcome.error is not None:
+                        raise outcome.error
+                    merge.add_page(outcome.item[0], outcome.result)
+            hits.extend(merge.drain())
+        return hits
+
     def get_router(self, *, params: Mapping[str, Any] | None = None) -> Any:
         """Return available routes and contracts under the configured API prefix."""
         path = f"/{self.api_prefix}/_router"
@@ -95,6 +457,39 @@ class FluxClient:
         path = self._build_path(folder_path, suffix="/_schema")
         return self._transport.request("GET", path, params=params)
 
+    def fan_out(
+        self,
+        calls: Callable[..., Any] | Iterable[RequestSpec],
+        args: Iterable[Any] | None = None,
+        *,
+        max_concurrency: ConcurrencyLimit = 8,
+        ordered: bool = True,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> Generator[Completed, None, None]:
+        """Run many calls concurrently over this client's connection pool.
+
+        Pass a callable and its argument tuples, e.g.
+        ``client.fan_out(client.get_resource, [("articles", "r-1"), ...])``,
+        or an iterable of :class:`~foxnose_sdk.concurrency.RequestSpec` with
+        paths under the API prefix. Outcomes are streamed as
+        :class:`~foxnose_sdk.concurrency.Completed` records; see
+        ``ManagementClient.fan_out`` for the options.
+        """
+        if args is None:
+            calls, args = self._send_spec, calls
+        return fan_out(
+            calls,
+            args,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            on_progress=on_progress,
+        )
+
+    def _send_spec(self, spec: RequestSpec) -> Any:
+        return self._transport.request(
+            spec.method, spec.path, params=spec.params, json_body=spec.json_body
+        )
+
     def close(self) -> None:
         self._transport.close()
 
@@ -145,6 +540,44 @@ class AsyncFluxClient:
         path = self._build_path(folder_path)
         return await self._transport.arequest("GET", path, params=params)
 
+    def iter_resource_pages(
+        self,
+        folder_path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Any]:
+        """Async variant of ``FluxClient.iter_resource_pages``."""
+        query = _first_query(params, page_size, None, cursor)
+        return _aiterate_cursor_pages(
+            lambda page_query: self.list_resources(folder_path, params=page_query),
+            query,
+            max_items=None,
+            prefetch=prefetch,
+        )
+
+    def iter_resources(
+        self,
+        folder_path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        cursor: str | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Any]:
+        """Async variant of ``FluxClient.iter_resources``."""
+        query = _first_query(params, page_size, max_items, cursor)
+        pages = _aiterate_cursor_pages(
+            lambda page_query: self.list_resources(folder_path, params=page_query),
+            query,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
+        return _apage_items(pages, max_items)
+
     async def get_resource(
         self,
         folder_path: str,
@@ -165,6 +598,61 @@ class AsyncFluxClient:
         path = self._build_path(folder_path, suffix="/_search")
         return await self._transport.arequest("POST", path, json_body=body)
 
+    async def search_many(
+        self,
+        queries: Iterable[tuple[str, Mapping[str, Any]]],
+        *,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> list[Completed]:
+        """Async variant of ``FluxClient.search_many`` that runs searches as tasks."""
+        queries = list(queries)
+        unique, slots = _dedupe_searches(queries)
+        outcomes = [
+            outcome
+            async for outcome in afan_out(
+                lambda folder_path, body: self.search(folder_path, body=body),
+                unique,
+                max_concurrency=max_concurrency,
+            )
+        ]
+        return _search_results(queries, slots, outcomes)
+
+    async def federated_search(
+        self,
+        folder_paths: Sequence[str],
+        body: Mapping[str, Any],
+        *,
+        top_k: int = 10,
+        score: ScoreSource = "score",
+        page_size: int | None = None,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> list[FederatedHit]:
+        """Async variant of ``FluxClient.federated_search``."""
+        merge = FederatedMerge(
+            folder_paths, top_k=top_k, score=score, page_size=page_size
+        )
+        hits: list[FederatedHit] = []
+        while not merge.done:
+            requests = [
+                (index, merge.page_body(index, body)) for index in merge.pending()
+            ]
+            outcomes = abounded_map(
+                lambda request: self.search(
+                    merge.folder_paths[request[0]], body=request[1]
+                ),
+                requests,
+                max_concurrency=max_concurrency,
+            )
+            try:
+                async for outcome in outcomes:
+                    if outcome.error is not None:
+                        raise outcome.error
+                    merge.add_page(outcome.item[0], outcome.result)
+            finally:
+                await outcomes.aclose()
+            hits.extend(merge.drain())
+        return hits
+
     async def get_router(self, *, params: Mapping[str, Any] | None = None) -> Any:
         """Return available routes and contracts under the configured API prefix."""
         path = f"/{self.api_prefix}/_router"
@@ -177,5 +665,30 @@ class AsyncFluxClient:
         path = self._build_path(folder_path, suffix="/_schema")
         return await self._transport.arequest("GET", path, params=params)
 
+    def fan_out(
+        self,
+        calls: Callable[..., Awaitable[Any]] | Iterable[RequestSpec],
+        args: Iterable[Any] | None = None,
+        *,
+        max_concurrency: ConcurrencyLimit = 8,
+        ordered: bool = True,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> AsyncGenerator[Completed, None]:
+        """Run many calls concurrently as tasks (see ``FluxClient.fan_out``)."""
+        if args is None:
+            calls, args = self._send_spec, calls
+        return afan_out(
+            calls,
+            args,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            on_progress=on_progress,
+        )
+
+    async def _send_spec(self, spec: RequestSpec) -> Any:
+        return await self._transport.arequest(
+            spec.method, spec.path, params=spec.params, json_body=spec.json_body
+        )
+
     async def aclose(self) -> None:
         await self._transport.aclose()
@@ -0,0 +1,171 @@
+"""Top-k merge for searches that span several Flux folders.
+
+Each folder's search returns hits in descending score order, so the best
+remaining hit overall is always the best head among the folders. A
+:class:`FederatedMerge` keeps one head per folder in a heap and settles hits
+one at a time. A folder is paged further only when its buffered hits are
+used up while the top-k is still open, so folders that contribute little are
+barely fetched and at most one page per folder is held in memory. To save
+round trips, a folder that keeps contributing gets pages twice as large
+each time (up to the number of hits still missing), and folders that may
+run out soon are fetched along with the folder the merge is waiting on.
+
+The merge does not do any I/O itself. The clients ask it which folders need
+a page (:meth:`FederatedMerge.pending`), fetch those concurrently, feed them
+back with :meth:`FederatedMerge.add_page` and collect settled hits from
+:meth:`FederatedMerge.drain` until :attr:`FederatedMerge.done`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, NamedTuple, Union
+
+ScoreSource = Union[str, Callable[[Any], float]]
+
+
+class FederatedHit(NamedTuple):
+    """A search hit together with the folder it came from."""
+
+    folder_path: str
+    score: float
+    hit: Any
+
+
+class FederatedMerge:
+    """Heap-based k-way merge of per-folder search pages.
+
+    Args:
+        folder_paths: Folders being searched.
+        top_k: Number of hits wanted overall.
+        score: Key of the score in each hit, or a callable returning it.
+        page_size: Hits requested in each folder's first page. Defaults
+            to an even share of ``top_k`` across the folders.
+    """
+
+    def __init__(
+        self,
+        folder_paths: Sequence[str],
+        *,
+        top_k: int,
+        score: ScoreSource = "score",
+        page_size: int | None = None,
+    ) -> None:
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        if page_size is not None and page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if not folder_paths:
+            raise ValueError("folder_paths must not be empty")
+        self.folder_paths = list(folder_paths)
+        self.top_k = top_k
+        self.page_size = page_size or math.ceil(top_k / len(self.folder_paths))
+        self._score = score if callable(score) else _key_score(score)
+        # Buffered (score, hit) pairs per folder, excluding its head.
+        self._buffers: list[deque[tuple[float, Any]]] = [
+            deque() for _ in self.folder_paths
+        ]
+        self._offsets = [0] * len(self.folder_paths)
+        self._limits = [self.page_size] * len(self.folder_paths)
+        self._exhausted = [False] * len(self.folder_paths)
+        self._heads: list[tuple[float, int, int, Any]] = []
+        self._queued = [False] * len(self.folder_paths)
+        self._head_scores = [0.0] * len(self.folder_paths)
+        self._settled = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether ``top_k`` hits are settled or every folder is exhausted."""
+        return self._settled >= self.top_k or (not self._heads and all(self._exhausted))
+
+    def pending(self) -> list[int]:
+        """Return the indices of folders whose next page should be fetched.
+
+        These are the folders the merge is blocked on. Since a round trip is
+        needed anyway, they are joined by folders that may run out of
+        buffered hits before the top-k is settled: those whose lowest
+        buffered score is still among the best scores the merge needs.
+        """
+        blocked = self._blocked()
+        if not blocked:
+            return []
+        missing = self.top_k - self._settled
+        scores = [-head[0] for head in self._heads]
+        scores.extend(score for buffer in self._buffers for score, _ in buffer)
+        needed = heapq.nlargest(missing, scores)
+        threshold = needed[-1] if len(needed) == missing else -math.inf
+        return blocked + [
+            index
+            for index in range(len(self.folder_paths))
+            if self._queued[index]
+            and not self._exhausted[index]
+            and self._lowest_score(index) >= threshold
+        ]
+
+    def page_body(self, index: int, body: Mapping[str, Any]) -> dict[str, Any]:
+        """Return ``body`` limited to the next page of folder ``index``."""
+        return {**body, "limit": self._limits[index], "offset": self._offsets[index]}
+
+    def add_page(self, index: int, page: Mapping[str, Any]) -> None:
+        """Buffer a search response for folder ``index``."""
+        hits = list(page.get("results") or ())
+        self._offsets[index] += len(hits)
+        if len(hits) < self._limits[index]:
+            self._exhausted[index] = True
+        missing = self.top_k - self._settled
+        self._limits[index] = max(self.page_size, min(self._limits[index] * 2, missing))
+        self._buffers[index].extend((self._score(hit), hit) for hit in hits)
+        if not self._queued[index]:
+            self._push_head(index)
+
+    def drain(self) -> list[FederatedHit]:
+        """Settle as many hits as possible without fetching more pages."""
+        settled: list[FederatedHit] = []
+        if self._blocked():
+            return settled
+        while self._heads and self._settled < self.top_k:
+            negative_score, index, _, hit = heapq.heappop(self._heads)
+            self._queued[index] = False
+            settled.append(FederatedHit(self.folder_paths[index], -negative_score, hit))
+            self._settled += 1
+            if not self._push_head(index) and not self._exhausted[index]:
+                # The folder's next hit may beat every buffered head.
+                break
+        return settled
+
+    def _blocked(self) -> list[int]:
+        if self._settled >= self.top_k:
+            return []
+        return [
+            index
+            for index, buffer in enumerate(self._buffers)
+            if not buffer and not self._exhausted[index] and not self._queued[index]
+        ]
+
+    def _lowest_score(self, index: int) -> float:
+        buffer = self._buffers[index]
+        return buffer[-1][0] if buffer else self._head_scores[index]
+
+    def _push_head(self, index: int) -> bool:
+        buffer = self._buffers[index]
+        if not buffer:
+            return False
+        score, hit = buffer.popleft()
+        position = self._offsets[index] - len(buffer)
+        heapq.heappush(self._heads, (-score, index, position, hit))
+        self._head_scores[index] = score
+        self._queued[index] = True
+        return True
+
+
+def _key_score(key: str) -> Callable[[Any], float]:
+    def score(hit: Any) -> float:
+        return float(hit[key])
+
+    return score
+
+
+__all__ = ["FederatedHit", "FederatedMerge", "ScoreSource"]
@@ -1,31 +1,140 @@
 """Management API helpers."""
 
-from .client import (
-    APIRef,
-    AsyncManagementClient,
-    ComponentRef,
-    EnvironmentRef,
-    FluxAPIKeyRef,
-    FluxRoleRef,
-    FolderRef,
-    ManagementAPIKeyRef,
-    ManagementClient,
-    ManagementRoleRef,
-    OrgRef,
-    ProjectRef,
-    ResourceRef,
-    RevisionRef,
-    SchemaVersionRef,
-)
-from .models import (
-    BatchItemError,
-    BatchUpsertItem,
-    BatchUpsertResult,
-    ResourceList,
-    ResourceSummary,
-    RevisionList,
-    RevisionSummary,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache import ImmutableCache
+    from .client import (
+        APIRef,
+        AsyncDataFetch,
+        AsyncManagementClient,
+        ComponentRef,
+        DataFetch,
+        EnvironmentRef,
+        FluxAPIKeyRef,
+        FluxRoleRef,
+        FolderRef,
+        ManagementAPIKeyRef,
+        ManagementClient,
+        ManagementRoleRef,
+        OrgRef,
+        ProjectRef,
+        ResourceRef,
+        RevisionRef,
+        SchemaVersionRef,
+    )
+    from .compact import (
+        CompactFolderSummary,
+        CompactPage,
+        CompactResourceSummary,
+        CompactRevisionSummary,
+    )
+    from .environment_diff import adiff_environments, diff_environments
+    from .folder_index import FolderIndex
+    from .hash_store import ResourceHashStore
+    from .journal import BatchJournal
+    from .models import (
+        BatchItemError,
+        BatchItemResult,
+        BatchOperationError,
+        BatchOperationOutcome,
+        BatchOperationResult,
+        BatchUpdateItem,
+        BatchUpsertItem,
+        BatchUpsertResult,
+        EnvironmentChange,
+        EnvironmentDiff,
+        PermissionChange,
+        PermissionChangeError,
+        PermissionSyncResult,
+        ResourceList,
+        ResourceSummary,
+        RevisionList,
+        RevisionSummary,
+        SchemaApplyResult,
+        SchemaChange,
+        SchemaChangeError,
+        SnapshotImportResult,
+        SnapshotStepError,
+    )
+    from .multiprocess import process_batch_upsert_resources
+    from .schema_apply import SchemaPlan
+    from .validation import PayloadValidator, ValidationIssue
+
+# Exported names by the module that defines them. They are imported on first
+# attribute access (PEP 562), so ``import foxnose_sdk.management`` does not load the
+# heavy client and model modules until they are used.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".client": (
+        "APIRef",
+        "AsyncDataFetch",
+        "AsyncManagementClient",
+        "ComponentRef",
+        "DataFetch",
+        "EnvironmentRef",
+        "FluxAPIKeyRef",
+        "FluxRoleRef",
+        "FolderRef",
+        "ManagementAPIKeyRef",
+        "ManagementClient",
+        "ManagementRoleRef",
+        "OrgRef",
+        "ProjectRef",
+        "ResourceRef",
+        "RevisionRef",
+        "SchemaVersionRef",
+    ),
+    ".cache": ("ImmutableCache",),
+    ".compact": (
+        "CompactFolderSummary",
+        "CompactPage",
+        "CompactResourceSummary",
+        "CompactRevisionSummary",
+    ),
+    ".environment_diff": (
+        "adiff_environments",
+        "diff_environments",
+    ),
+    ".folder_index": ("FolderIndex",),
+    ".hash_store": ("ResourceHashStore",),
+    ".journal": ("BatchJournal",),
+    ".models": (
+        "BatchItemError",
+        "BatchItemResult",
+        "BatchOperationError",
+        "BatchOperationOutcome",
+        "BatchOperationResult",
+        "BatchUpdateItem",
+        "BatchUpsertItem",
+        "BatchUpsertResult",
+        "EnvironmentChange",
+        "EnvironmentDiff",
+        "ResourceList",
+        "ResourceSummary",
+        "RevisionList",
+        "RevisionSummary",
+        "PermissionChange",
+        "PermissionChangeError",
+        "PermissionSyncResult",
+        "SchemaApplyResult",
+        "SchemaChange",
+        "SchemaChangeError",
+        "SnapshotImportResult",
+        "SnapshotStepError",
+    ),
+    ".multiprocess": ("process_batch_upsert_resources",),
+    ".schema_apply": ("SchemaPlan",),
+    ".validation": (
+        "PayloadValidator",
+        "ValidationIssue",
+    ),
+}
+_LAZY_ATTRIBUTES = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
 
 __all__ = [
     "ManagementClient",
@@ -35,8 +144,39 @@ __all__ = [
     "RevisionSummary",
     "RevisionList",
     "BatchUpsertItem",
+    "BatchUpdateItem",
     "BatchItemError",
+    "BatchItemResult",
     "BatchUpsertResult",
+    "BatchOperationOutcome",
+    "BatchOperationError",
+    "BatchOperationResult",
+    "DataFetch",
+    "AsyncDataFetch",
+    "SchemaChange",
+    "SchemaChangeError",
+    "SchemaApplyResult",
+    "SchemaPlan",
+    "SnapshotImportResult",
+    "PermissionChange",
+    "PermissionChangeError",
+    "PermissionSyncResult",
+    "SnapshotStepError",
+    "ResourceHashStore",
+    "ImmutableCache",
+    "FolderIndex",
+    "EnvironmentChange",
+    "EnvironmentDiff",
+    "diff_environments",
+    "adiff_environments",
+    "PayloadValidator",
+    "ValidationIssue",
+    "BatchJournal",
+    "process_batch_upsert_resources",
+    "CompactPage",
+    "CompactResourceSummary",
+    "CompactRevisionSummary",
+    "CompactFolderSummary",
     "FolderRef",
     "ResourceRef",
     "RevisionRef",
@@ -51,3 +191,24 @@ __all__ = [
     "FluxAPIKeyRef",
     "APIRef",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        # Submodules used as attributes (``foxnose_sdk.management.cache``
+        # after a bare ``import foxnose_sdk.management``) are imported on
+        # first access too.
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
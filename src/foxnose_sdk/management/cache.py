@@ -0,0 +1,178 @@
+"""Cache for Management API objects that stop changing once published.
+
+Published revisions and schema versions are frozen server-side: a revision's
+data cannot be edited after it has been published, and a published folder or
+component version keeps its schema forever. :class:`ImmutableCache` keeps the
+JSON of such objects keyed by their revision or version key, in an in-memory
+LRU tier and, optionally, a SQLite file shared between processes and runs.
+
+Objects that can still change (draft versions, draft revision data, revision
+metadata whose status moves when a newer revision is published) are only kept
+in memory for ``mutable_ttl`` seconds.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS immutable_objects (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+)
+"""
+
+
+class ImmutableCache:
+    """Two-tier cache of API responses keyed by ``(kind, key)``.
+
+    Args:
+        max_entries: Maximum number of entries held in memory (default 4096).
+            The least recently used entry is evicted first.
+        path: Optional SQLite file for the disk tier. Only immutable entries
+            are written to it, so it stays valid across runs.
+        mutable_ttl: Seconds a mutable entry is served from memory (default
+            30). Use ``0`` to never cache mutable objects.
+
+    The cache is safe to share between threads and between clients.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        *,
+        path: str | os.PathLike[str] | None = None,
+        mutable_ttl: float = 30.0,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.mutable_ttl = mutable_ttl
+        self.path = os.fspath(path) if path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[str, float | None]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        if self.path is not None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+
+    def get(self, kind: str, key: str) -> Any | None:
+        """Return a fresh copy of the cached JSON value, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end((kind, key))
+                    self.hits += 1
+                    return json.loads(value)
+                del self._entries[(kind, key)]
+            value = self._load(kind, key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._remember(kind, key, value, None)
+            self.hits += 1
+        return json.loads(value)
+
+    def put(self, kind: str, key: str, value: Any, *, immutable: bool) -> None:
+        """Store a JSON-serializable value.
+
+        Immutable values never expire and are also written to the disk tier.
+        Mutable values expire after ``mutable_ttl`` seconds.
+        """
+        if not immutable and self.mutable_ttl <= 0:
+            return
+        encoded = json.dumps(value, separators=(",", ":"))
+        expires_at = None if immutable else time.monotonic() + self.mutable_ttl
+        with self._lock:
+            self._remember(kind, key, encoded, expires_at)
+            if immutable and self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO immutable_objects (kind, key, value) "
+                    "VALUES (?, ?, ?)",
+                    (kind, key, encoded),
+                )
+                self._conn.commit()
+
+    def discard(self, kind: str, key: str) -> None:
+        """Forget one entry in both tiers."""
+        with self._lock:
+            self._entries.pop((kind, key), None)
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM immutable_objects WHERE kind = ? AND key = ?",
+                    (kind, key),
+                )
+                self._conn.commit()
+
+    def discard_prefix(self, kind: str, prefix: str) -> None:
+        """Forget every entry of ``kind`` whose key starts with ``prefix``."""
+        with self._lock:
+            for entry in [
+                entry
+                for entry in self._entries
+                if entry[0] == kind and entry[1].startswith(prefix)
+            ]:
+                del self._entries[entry]
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM immutable_objects "
+                    "WHERE kind = ? AND substr(key, 1, ?) = ?",
+                    (kind, len(prefix), prefix),
+                )
+                self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM immutable_objects")
+                self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def close(self) -> None:
+        """Close the disk tier, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _load(self, kind: str, key: str) -> str | None:
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT value FROM immutable_objects WHERE kind = ? AND key = ?",
+            (kind, key),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _remember(
+        self, kind: str, key: str, value: str, expires_at: float | None
+    ) -> None:
+        self._entries[(kind, key)] = (value, expires_at)
+        self._entries.move_to_end((kind, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+__all__ = ["ImmutableCache"]
@@ -2,20 +2,70 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
-from collections.abc import Callable, Sequence
-from typing import Any, Mapping, Union
+import contextlib
+import os
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from typing import Any, Literal, NamedTuple, Union, overload
+from urllib.parse import parse_qsl, urlsplit
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from ..auth import AuthStrategy
+from ..concurrency import (
+    AdaptiveConcurrency,
+    Completed,
+    ConcurrencyLimit,
+    RequestSpec,
+    Unmetered,
+    _report,
+    abounded_dag,
+    abounded_map,
+    afan_out,
+    bounded_dag,
+    bounded_map,
+    fan_out,
+)
 from ..config import FoxnoseConfig, RetryConfig
+from ..errors import FoxnoseAPIError, FoxnoseError, FoxnoseValidationError
 from ..http import HttpTransport
+from .cache import ImmutableCache
+from .compact import (
+    COMPACT_LIST_MODELS,
+    MODEL_BACKENDS,
+    CompactFolderSummary,
+    CompactPage,
+    CompactResourceSummary,
+    CompactRevisionSummary,
+)
+from .folder_index import FolderIndex
+from .hash_store import ResourceHashStore, payload_hash
+from .journal import BatchJournal
 from .models import (
     APIFolderList,
     APIFolderSummary,
     APIInfo,
     APIList,
     BatchItemError,
+    BatchItemResult,
+    BatchOperationError,
+    BatchOperationOutcome,
+    BatchOperationResult,
+    BatchUpdateItem,
     BatchUpsertItem,
     BatchUpsertResult,
     ComponentList,
@@ -40,6 +90,9 @@ from .models import (
     OrganizationPlanStatus,
     OrganizationSummary,
     OrganizationUsage,
+    PermissionChange,
+    PermissionChangeError,
+    PermissionSyncResult,
     ProjectList,
     ProjectSummary,
     RegionInfo,
@@ -49,8 +102,31 @@ from .models import (
     RevisionSummary,
     RolePermission,
     RolePermissionObject,
+    SchemaApplyResult,
+    SchemaChange,
+    SchemaChangeError,
     SchemaVersionList,
     SchemaVersionSummary,
+    SnapshotImportResult,
+    SnapshotStepError,
+)
+from .permission_sync import plan_permission_changes, scoped_content_types
+from .schema_apply import SchemaPlan, draft_schema_version, plan_schema_changes
+from .snapshot import (
+    SnapshotStep,
+    dump_models,
+    new_snapshot,
+    plan_snapshot_import,
+    read_snapshot,
+    remap_keys,
+    write_snapshot,
+)
+from .validation import (
+    PayloadValidator,
+    ValidationIssue,
+    current_schema_version,
+    resource_data,
+    schema_from_fields,
 )
 
 
@@ -111,6 +187,809 @@ def _coerce_permission_object_payload(
     }
 
 
+def _next_page_params(
+    next_link: str, params: Mapping[str, Any] | None
+) -> dict[str, Any]:
+    """Build query parameters for the page referenced by a ``next`` link.
+
+    The API returns absolute URLs; only their query string is reused so the
+    request keeps going through the client's own base URL and path helpers.
+    """
+    query = dict(params or {})
+    query.update(parse_qsl(urlsplit(next_link).query, keep_blank_values=True))
+    return query
+
+
+def _first_page_params(
+    params: Mapping[str, Any] | None,
+    page_size: int | None,
+    max_items: int | None,
+) -> dict[str, Any]:
+    if page_size is not None and page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if max_items is not None and max_items < 0:
+        raise ValueError("max_items must not be negative")
+    query = dict(params or {})
+    if page_size is not None:
+        query["limit"] = page_size
+    return query
+
+
+def _iterate_pages(
+    fetch: Callable[[dict[str, Any]], Any],
+    params: Mapping[str, Any] | None,
+    *,
+    page_size: int | None,
+    max_items: int | None,
+    prefetch: bool,
+) -> Iterator[Any]:
+    """Yield items from a paginated endpoint, following ``next`` links.
+
+    While the caller consumes page N, page N+1 is fetched on a background
+    thread, so at most two pages are held in memory at any time.
+    """
+    query = _first_page_params(params, page_size, max_items)
+    return _iterate_page_items(fetch, query, max_items=max_items, prefetch=prefetch)
+
+
+def _iterate_page_items(
+    fetch: Callable[[dict[str, Any]], Any],
+    query: dict[str, Any],
+    *,
+    max_items: int | None,
+    prefetch: bool,
+) -> Iterator[Any]:
+    remaining = max_items
+    if remaining == 0:
+        return
+    executor = (
+        concurrent.futures.ThreadPoolExecutor(max_workers=1) if prefetch else None
+    )
+    try:
+        page = fetch(query)
+        while True:
+            pending: concurrent.futures.Future[Any] | None = None
+            if (
+                executor is not None
+                and page.next
+                and (remaining is None or remaining > len(page.results))
+            ):
+                pending = executor.submit(fetch, _next_page_params(page.next, query))
+            for item in page.results:
+                yield item
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+            if not page.next:
+                return
+            if pending is not None:
+                page = pending.result()
+            else:
+                page = fetch(_next_page_params(page.next, query))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _aiterate_pages(
+    fetch: Callable[[dict[str, Any]], Awaitable[Any]],
+    params: Mapping[str, Any] | None,
+    *,
+    page_size: int | None,
+    max_items: int | None,
+    prefetch: bool,
+) -> AsyncIterator[Any]:
+    """Async variant of :func:`_iterate_pages` that prefetches with a task."""
+    query = _first_page_params(params, page_size, max_items)
+    return _aiterate_page_items(fetch, query, max_items=max_items, prefetch=prefetch)
+
+
+async def _aiterate_page_items(
+    fetch: Callable[[dict[str, Any]], Awaitable[Any]],
+    query: dict[str, Any],
+    *,
+    max_items: int | None,
+    prefetch: bool,
+) -> AsyncIterator[Any]:
+    remaining = max_items
+    if remaining == 0:
+        return
+    pending: asyncio.Future[Any] | None = None
+    try:
+        page = await fetch(query)
+        while True:
+            if (
+                prefetch
+                and page.next
+                and (remaining is None or remaining > len(page.results))
+            ):
+                pending = asyncio.ensure_future(
+                    fetch(_next_page_params(page.next, query))
+                )
+            for item in page.results:
+                yield item
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+            if not page.next:
+                return
+            if pending is not None:
+                page = await pending
+                pending = None
+            else:
+                page = await fetch(_next_page_params(page.next, query))
+    finally:
+        if pending is not None:
+            pending.cancel()
+            # Wait for the cancellation and retrieve any error, so the task
+            # is neither destroyed pending nor left with an unread exception.
+            with contextlib.suppress(BaseException):
+                await pending
+
+
+def _scan_windows(
+    params: Mapping[str, Any] | None, page_size: int, max_concurrency: int
+) -> dict[str, Any]:
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    query = dict(params or {})
+    query["limit"] = page_size
+    query["offset"] = int(query.get("offset") or 0)
+    return query
+
+
+def _scan_offsets(first: Any, query: Mapping[str, Any]) -> Iterator[int]:
+    """Offsets of the windows left to fetch after ``first``.
+
+    The step is the size of the first page rather than the requested
+    ``limit`` so a server-side cap on page size never leaves gaps.
+    """
+    if not first.next or not first.results:
+        return iter(())
+    step = len(first.results)
+    return iter(range(query["offset"] + step, first.count, step))
+
+
+def _scan_offset_pages(
+    fetch: Callable[[dict[str, Any]], Any],
+    params: Mapping[str, Any] | None,
+    *,
+    page_size: int,
+    max_concurrency: int,
+    ordered: bool,
+) -> Iterator[Any]:
+    """Yield every item of a limit/offset endpoint using concurrent requests.
+
+    The first page is fetched on its own to learn ``count``; the remaining
+    offset windows are then requested on a thread pool with at most
+    ``max_concurrency`` requests in flight. Items are yielded in offset order
+    when ``ordered`` is true, otherwise page by page as requests complete.
+    """
+    query = _scan_windows(params, page_size, max_concurrency)
+    return _scan_offset_items(fetch, query, max_concurrency, ordered)
+
+
+def _scan_offset_items(
+    fetch: Callable[[dict[str, Any]], Any],
+    query: dict[str, Any],
+    max_concurrency: int,
+    ordered: bool,
+) -> Iterator[Any]:
+    first = fetch(query)
+    yield from first.results
+    offsets = _scan_offsets(first, query)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def submit() -> concurrent.futures.Future[Any] | None:
+        offset = next(offsets, None)
+        if offset is None:
+            return None
+        return executor.submit(fetch, {**query, "offset": offset})
+
+    try:
+        if ordered:
+            window: deque[concurrent.futures.Future[Any]] = deque()
+            for _ in range(max_concurrency):
+                future = submit()
+                if future is None:
+                    break
+                window.append(future)
+            while window:
+                page = window.popleft().result()
+                future = submit()
+                if future is not None:
+                    window.append(future)
+                yield from page.results
+        else:
+            pending: set[concurrent.futures.Future[Any]] = set()
+            for _ in range(max_concurrency):
+                future = submit()
+                if future is None:
+                    break
+                pending.add(future)
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    page = future.result()
+                    refill = submit()
+                    if refill is not None:
+                        pending.add(refill)
+                    yield from page.results
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _ascan_offset_pages(
+    fetch: Callable[[dict[str, Any]], Awaitable[Any]],
+    params: Mapping[str, Any] | None,
+    *,
+    page_size: int,
+    max_concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[Any]:
+    """Async variant of :func:`_scan_offset_pages` that runs windows as tasks."""
+    query = _scan_windows(params, page_size, max_concurrency)
+    return _ascan_offset_items(fetch, query, max_concurrency, ordered)
+
+
+async def _ascan_offset_items(
+    fetch: Callable[[dict[str, Any]], Awaitable[Any]],
+    query: dict[str, Any],
+    max_concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[Any]:
+    first = await fetch(query)
+    for item in first.results:
+        yield item
+    offsets = _scan_offsets(first, query)
+    # Only pages still being fetched or waiting to be consumed are tracked, so
+    # consumed pages can be garbage collected while the scan goes on.
+    inflight: set[asyncio.Future[Any]] = set()
+
+    def submit() -> asyncio.Future[Any] | None:
+        offset = next(offsets, None)
+        if offset is None:
+            return None
+        task = asyncio.ensure_future(fetch({**query, "offset": offset}))
+        inflight.add(task)
+        return task
+
+    try:
+        if ordered:
+            window: deque[asyncio.Future[Any]] = deque()
+            for _ in range(max_concurrency):
+                task = submit()
+                if task is None:
+                    break
+                window.append(task)
+            while window:
+                task = window.popleft()
+                page = await task
+                inflight.discard(task)
+                task = submit()
+                if task is not None:
+                    window.append(task)
+                for item in page.results:
+                    yield item
+        else:
+            pending: set[asyncio.Future[Any]] = set()
+            for _ in range(max_concurrency):
+                task = submit()
+                if task is None:
+                    break
+                pending.add(task)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    page = task.result()
+                    inflight.discard(task)
+                    refill = submit()
+                    if refill is not None:
+                        pending.add(refill)
+                    for item in page.results:
+                        yield item
+    finally:
+        leftover = list(inflight)
+        for task in leftover:
+            task.cancel()
+        if leftover:
+            await asyncio.gather(*leftover, return_exceptions=True)
+
+
+def _batch_item_result(outcome: Completed) -> BatchItemResult:
+    resource, skipped = outcome.result if outcome.error is None else (None, False)
+    return BatchItemResult(
+        index=outcome.index,
+        external_id=outcome.item.external_id,
+        resource=resource,
+        exception=outcome.error,
+        skipped=skipped,
+    )
+
+
+def _stored_summary(resource: Any) -> ResourceSummary:
+    # Listings may come back as compact models; the hash store keeps pydantic
+    # summaries so skipped upserts return the same type as real ones.
+    if isinstance(resource, ResourceSummary):
+        return resource
+    return ResourceSummary.model_validate(resource.model_dump())
+
+
+def _is_not_found(error: Exception) -> bool:
+    return isinstance(error, FoxnoseAPIError) and error.status_code == 404
+
+
+def _journal_outcome(
+    journal: BatchJournal | None, result: BatchItemResult, sync: bool = True
+) -> None:
+    # Items skipped because the journal already had them carry no resource.
+    if journal is None or (result.skipped and result.resource is None):
+        return
+    if result.exception is None:
+        journal.record_success(result.index, result.external_id, sync=sync)
+    else:
+        journal.record_failure(
+            result.index, result.external_id, result.exception, sync=sync
+        )
+
+
+def _batch_item_results(
+    outcomes: Generator[Completed, None, None],
+    journal: BatchJournal | None = None,
+) -> Generator[BatchItemResult, None, None]:
+    try:
+        with contextlib.closing(outcomes):
+            for outcome in outcomes:
+                result = _batch_item_result(outcome)
+                _journal_outcome(journal, result)
+                yield result
+    finally:
+        if journal is not None:
+            journal.sync()
+
+
+async def _abatch_item_results(
+    outcomes: AsyncGenerator[Completed, None],
+    journal: BatchJournal | None = None,
+) -> AsyncGenerator[BatchItemResult, None]:
+    try:
+        async for outcome in outcomes:
+            result = _batch_item_result(outcome)
+            # fsync in a worker thread so the event loop keeps serving
+            # the in-flight requests while the disk catches up.
+            _journal_outcome(journal, result, sync=False)
+            if journal is not None and journal.sync_due:
+                await asyncio.to_thread(journal.sync)
+            yield result
+    finally:
+        await outcomes.aclose()
+        if journal is not None:
+            await asyncio.to_thread(journal.sync)
+
+
+def _resource_pair(item: ResourceRef) -> tuple[None, str]:
+    return None, _resolve_key(item)
+
+
+def _update_pair(item: BatchUpdateItem) -> tuple[None, str]:
+    return None, item.key
+
+
+def _updated_resource(data: Any) -> ResourceSummary | None:
+    # Only trust the PUT body when it is a complete resource representation.
+    if not isinstance(data, dict) or "key" not in data:
+        return None
+    try:
+        return ResourceSummary.model_validate(data)
+    except ValidationError:
+        return None
+
+
+def _revision_pair(item: RevisionItem) -> tuple[str, str]:
+    if isinstance(item, RevisionSummary):
+        return item.resource, item.key
+    resource_key, revision_key = item
+    return _resolve_key(resource_key), _resolve_key(revision_key)
+
+
+def _operation_outcome(
+    outcome: Completed, pair: Callable[[Any], tuple[str | None, str]]
+) -> BatchOperationOutcome:
+    resource, key = pair(outcome.item)
+    return BatchOperationOutcome(
+        index=outcome.index,
+        key=key,
+        resource=resource,
+        result=outcome.result,
+        exception=outcome.error,
+    )
+
+
+def _operation_outcomes(
+    outcomes: Generator[Completed, None, None],
+    pair: Callable[[Any], tuple[str | None, str]],
+) -> Generator[BatchOperationOutcome, None, None]:
+    with contextlib.closing(outcomes):
+        for outcome in outcomes:
+            yield _operation_outcome(outcome, pair)
+
+
+async def _aoperation_outcomes(
+    outcomes: AsyncGenerator[Completed, None],
+    pair: Callable[[Any], tuple[str | None, str]],
+) -> AsyncGenerator[BatchOperationOutcome, None]:
+    try:
+        async for outcome in outcomes:
+            yield _operation_outcome(outcome, pair)
+    finally:
+        await outcomes.aclose()
+
+
+class DataFetch(Iterator[tuple[str, Mapping[str, Any]]]):
+    """Iterator of ``(key, data)`` pairs returned by the ``*_data_many`` methods.
+
+    Items that still fail after their retries do not stop the iteration.
+    They are appended to :attr:`failed` as they come up, so the list is
+    complete once the iterator is exhausted.
+    """
+
+    def __init__(
+        self,
+        outcomes: Generator[Completed, None, None],
+        pair: Callable[[Any], tuple[str | None, str]],
+        on_error: Callable[[str, Exception], None] | None = None,
+    ) -> None:
+        self.failed: list[BatchOperationError] = []
+        self._pairs = self._collect(outcomes, pair, on_error)
+
+    def __iter__(self) -> DataFetch:
+        return self
+
+    def __next__(self) -> tuple[str, Mapping[str, Any]]:
+        return next(self._pairs)
+
+    def close(self) -> None:
+        """Stop fetching and cancel the requests still queued."""
+        self._pairs.close()
+
+    def _collect(
+        self,
+        outcomes: Generator[Completed, None, None],
+        pair: Callable[[Any], tuple[str | None, str]],
+        on_error: Callable[[str, Exception], None] | None,
+    ) -> Generator[tuple[str, Mapping[str, Any]], None, None]:
+        with contextlib.closing(outcomes):
+            for outcome in outcomes:
+                resource, key = pair(outcome.item)
+                if outcome.error is None:
+                    yield key, outcome.result
+                    continue
+                self.failed.append(
+                    BatchOperationError(
+                        index=outcome.index,
+                        key=key,
+                        resource=resource,
+                        exception=outcome.error,
+                    )
+                )
+                if on_error is not None:
+                    on_error(key, outcome.error)
+
+
+class AsyncDataFetch(AsyncIterator[tuple[str, Mapping[str, Any]]]):
+    """Async variant of :class:`DataFetch`."""
+
+    def __init__(
+        self,
+        outcomes: AsyncGenerator[Completed, None],
+        pair: Callable[[Any], tuple[str | None, str]],
+        on_error: Callable[[str, Exception], None] | None = None,
+    ) -> None:
+        self.failed: list[BatchOperationError] = []
+        self._pairs = self._collect(outcomes, pair, on_error)
+
+    def __aiter__(self) -> AsyncDataFetch:
+        return self
+
+    async def __anext__(self) -> tuple[str, Mapping[str, Any]]:
+        return await self._pairs.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop fetching and cancel the requests still in flight."""
+        await self._pairs.aclose()
+
+    async def _collect(
+        self,
+        outcomes: AsyncGenerator[Completed, None],
+        pair: Callable[[Any], tuple[str | None, str]],
+        on_error: Callable[[str, Exception], None] | None,
+    ) -> AsyncGenerator[tuple[str, Mapping[str, Any]], None]:
+        try:
+            async for outcome in outcomes:
+                resource, key = pair(outcome.item)
+                if outcome.error is None:
+                    yield key, outcome.result
+                    continue
+                self.failed.append(
+                    BatchOperationError(
+                        index=outcome.index,
+                        key=key,
+                        resource=resource,
+                        exception=outcome.error,
+                    )
+                )
+                if on_error is not None:
+                    on_error(key, outcome.error)
+        finally:
+            await outcomes.aclose()
+
+
+def _fetch_retrying(fetch: Callable[[], Any], retries: int, backoff: float) -> Any:
+    # The transport has already retried each request; this retries the item
+    # once the transport gives up on a throttled or failing API.
+    for attempt in range(retries + 1):
+        try:
+            return fetch()
+        except FoxnoseError as exc:
+            if attempt == retries or not AdaptiveConcurrency.is_overload(exc):
+                raise
+        time.sleep(backoff * 2**attempt)
+
+
+async def _afetch_retrying(
+    fetch: Callable[[], Awaitable[Any]], retries: int, backoff: float
+) -> Any:
+    for attempt in range(retries + 1):
+        try:
+            return await fetch()
+        except FoxnoseError as exc:
+            if attempt == retries or not AdaptiveConcurrency.is_overload(exc):
+                raise
+        await asyncio.sleep(backoff * 2**attempt)
+
+
+class _PermissionEndpoints(NamedTuple):
+    """Bound Management or Flux role permission methods of one client."""
+
+    list_permissions: Callable[..., Any]
+    upsert_permission: Callable[..., Any]
+    delete_permission: Callable[..., Any]
+    list_objects: Callable[..., Any]
+    add_object: Callable[..., Any]
+    delete_object: Callable[..., Any]
+
+
+def _permission_result(
+    changes: list[PermissionChange],
+    result: PermissionSyncResult,
+    outcomes: list[Completed],
+) -> None:
+    attempted: set[int] = set()
+    for outcome in sorted(outcomes, key=lambda o: o.index):
+        attempted.add(outcome.index)
+        if outcome.error is None:
+            result.applied.append(outcome.item)
+        else:
+            result.failed.append(
+                PermissionChangeError(change=outcome.item, exception=outcome.error)
+            )
+    result.skipped = [
+        change for index, change in enumerate(changes) if index not in attempted
+    ]
+
+
+def _objects_to_fetch(
+    current: list[RolePermission], permissions: Sequence[Mapping[str, Any]]
+) -> list[str]:
+    # Listings that already carry ``objects`` need no extra request.
+    unknown = {p.content_type for p in current if p.objects is None}
+    return [ct for ct in scoped_content_types(permissions) if ct in unknown]
+
+
+def _known_objects(current: list[RolePermission]) -> dict[str, list[str]]:
+    return {p.content_type: p.objects for p in current if p.objects is not None}
+
+
+class _SchemaEndpoints(NamedTuple):
+    """Bound folder or component schema methods of one client."""
+
+    iter_versions: Callable[..., Any]
+    get_version: Callable[..., Any]
+    create_version: Callable[..., Any]
+    publish_version: Callable[..., Any]
+    iter_fields: Callable[..., Any]
+    create_field: Callable[..., Any]
+    update_field: Callable[..., Any]
+    delete_field: Callable[..., Any]
+
+
+class _SchemaBaseline(NamedTuple):
+    """Version a schema apply writes to and the fields it starts from."""
+
+    version: str | None
+    base: SchemaVersionSummary | None
+    fields: list[Any]
+    next_number: int
+
+
+def _schema_result(
+    plan: SchemaPlan, result: SchemaApplyResult, outcomes: list[Completed]
+) -> None:
+    applied: list[tuple[int, SchemaChange]] = []
+    attempted: set[int] = set()
+    for outcome in outcomes:
+        attempted.add(outcome.index)
+        if outcome.error is None:
+            applied.append((outcome.index, outcome.item))
+        else:
+            result.failed.append(
+                SchemaChangeError(change=outcome.item, exception=outcome.error)
+            )
+    result.applied = [change for _, change in sorted(applied, key=lambda a: a[0])]
+    result.skipped = [
+        change for index, change in enumerate(plan.changes) if index not in attempted
+    ]
+
+
+# Snapshot sections with per-object details: (attribute, detail kind).
+_SNAPSHOT_DETAILS = {
+    "components": ("schema", "component"),
+    "folders": ("schema", "folder"),
+    "management_roles": ("permissions", "management_role"),
+    "flux_roles": ("permissions", "flux_role"),
+    "apis": ("folders", "api"),
+}
+
+# Import steps that create an object from a payload.
+_SNAPSHOT_CREATES = frozenset(
+    {"locale", "component", "folder", "management_role", "flux_role", "api"}
+)
+
+
+def _snapshot_details(snapshot: Mapping[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+    return [
+        (kind, entry)
+        for section, (_, kind) in _SNAPSHOT_DETAILS.items()
+        for entry in snapshot[section]
+    ]
+
+
+def _store_snapshot_detail(kind: str, entry: dict[str, Any], detail: Any) -> None:
+    attribute = next(a for a, k in _SNAPSHOT_DETAILS.values() if k == kind)
+    entry[attribute] = detail
+
+
+def _raise_schema_failure(result: SchemaApplyResult) -> None:
+    if result.failed:
+        raise result.failed[0].exception
+
+
+def _snapshot_result(
+    steps: list[SnapshotStep], result: SnapshotImportResult, outcomes: list[Completed]
+) -> None:
+    attempted: set[int] = set()
+    for outcome in sorted(outcomes, key=lambda o: o.index):
+        attempted.add(outcome.index)
+        if outcome.error is None:
+            result.completed.append(outcome.item.name)
+        else:
+            result.failed.append(
+                SnapshotStepError(step=outcome.item.name, exception=outcome.error)
+            )
+    result.skipped = [
+        step.name for index, step in enumerate(steps) if index not in attempted
+    ]
+
+
+class _OperationTally:
+    """Folds streamed operation outcomes into a :class:`BatchOperationResult`."""
+
+    def __init__(
+        self,
+        total: int,
+        fail_fast: bool,
+        on_progress: Callable[[int, int], None] | None,
+        collect_results: bool,
+    ) -> None:
+        self.total = total
+        self.fail_fast = fail_fast
+        self.on_progress = on_progress
+        self.collect_results = collect_results
+        self.succeeded: list[BatchOperationOutcome] = []
+        self.failed: list[BatchOperationError] = []
+        self.omitted = 0
+        self.completed = 0
+
+    def add(self, outcome: BatchOperationOutcome) -> None:
+        if outcome.exception is None:
+            if self.collect_results:
+                self.succeeded.append(outcome)
+            else:
+                self.omitted += 1
+        elif not self.fail_fast:
+            self.failed.append(
+                BatchOperationError(
+                    index=outcome.index,
+                    key=outcome.key,
+                    resource=outcome.resource,
+                    exception=outcome.exception,
+                )
+            )
+        self.completed += 1
+        _report(self.on_progress, self.completed, self.total)
+        if self.fail_fast and outcome.exception is not None:
+            raise outcome.exception
+
+    def result(self) -> BatchOperationResult:
+        return BatchOperationResult(
+            succeeded=self.succeeded,
+            failed=self.failed,
+            omitted_count=self.omitted,
+        )
+
+
+# Fields whose values repeat across the items of a list response (the same
+# folder, owner or schema version thousands of times). Interning them lets every
+# item share one string object instead of holding its own copy.
+_INTERNED_LIST_FIELDS = (
+    "folder",
+    "content_type",
+    "component",
+    "resource_owner",
+    "schema_version",
+    "environment",
+    "resource",
+    "status",
+    "parent",
+    "folder_type",
+    "mode",
+)
+
+
+def _intern_list_payload(payload: Any) -> Any:
+    """Intern low-cardinality string fields of paginated ``results`` in place."""
+    if not isinstance(payload, dict):
+        return payload
+    results = payload.get("results")
+    if not results or not isinstance(results, list):
+        return payload
+    intern = sys.intern
+    for item in results:
+        if not isinstance(item, dict):
+            continue
+        # Optional fields may be missing from some items, so every item is
+        # probed for every field.
+        for name in _INTERNED_LIST_FIELDS:
+            value = item.get(name)
+            if value.__class__ is str:
+                item[name] = intern(value)
+    return payload
+
+
+# List-shaped responses are validated in a single pydantic-core call instead of
+# a per-item Python loop. Adapters are built once at import time.
+_ORGANIZATION_LIST_ADAPTER: TypeAdapter[OrganizationList] = TypeAdapter(
+    OrganizationList
+)
+_REGION_LIST_ADAPTER: TypeAdapter[list[RegionInfo]] = TypeAdapter(list[RegionInfo])
+_ENVIRONMENT_LIST_ADAPTER: TypeAdapter[EnvironmentList] = TypeAdapter(EnvironmentList)
+_LOCALE_LIST_ADAPTER: TypeAdapter[LocaleList] = TypeAdapter(LocaleList)
+_ROLE_PERMISSION_LIST_ADAPTER: TypeAdapter[list[RolePermission]] = TypeAdapter(
+    list[RolePermission]
+)
+_PERMISSION_OBJECT_LIST_ADAPTER: TypeAdapter[list[RolePermissionObject]] = TypeAdapter(
+    list[RolePermissionObject]
+)
+
+
 FolderRef = Union[str, FolderSummary]
 ResourceRef = Union[str, ResourceSummary]
 RevisionRef = Union[str, RevisionSummary]
@@ -124,12 +1003,233 @@ FluxRoleRef = Union[str, FluxRoleSummary]
 ManagementAPIKeyRef = Union[str, ManagementAPIKeySummary]
 FluxAPIKeyRef = Union[str, FluxAPIKeySummary]
 APIRef = Union[str, APIInfo]
+# A revision given as its summary or as a ``(resource, revision)`` key pair.
+RevisionItem = Union[RevisionSummary, tuple[ResourceRef, RevisionRef]]
 
 
 class _ManagementPathsMixin:
     """Mixin providing URL path helpers for Management API clients."""
 
     environment_key: str
+    model_backend: str
+    intern_strings: bool
+    object_cache: ImmutableCache | None
+    _folder_index: FolderIndex | None
+    _payload_validators: dict[tuple[str, str], PayloadValidator]
+
+    def _validate_page(self, model: Any, data: Any) -> Any:
+        """Validate a paginated list response using the configured model backend."""
+        if self.intern_strings:
+            data = _intern_list_payload(data)
+        if self.model_backend == "compact":
+            item_cls = COMPACT_LIST_MODELS.get(model)
+            if item_cls is not None:
+                return CompactPage.from_dict(item_cls, data)
+        return model.model_validate(data)
+
+    # Immutable object cache
+    def _cache_lookup(self, kind: str, key: str) -> Any | None:
+        if self.object_cache is None:
+            return None
+        return self.object_cache.get(kind, key)
+
+    def _cache_store(self, kind: str, key: str, data: Any, immutable: bool) -> None:
+        if self.object_cache is not None and data is not None:
+            self.object_cache.put(kind, key, data, immutable=immutable)
+
+    def _frozen_schema(
+        self,
+        kind: str,
+        parent_key: str,
+        version_key: str,
+        include_schema: bool | None,
+    ) -> Any | None:
+        if not include_schema:
+            return None
+        return self._cache_lookup(f"{kind}_schema", f"{parent_key}/{version_key}")
+
+    def _cache_version(
+        self,
+        kind: str,
+        parent_key: str,
+        version_key: str,
+        include_schema: bool | None,
+        data: Any,
+    ) -> None:
+        # A published version's schema never changes, but its lifecycle
+        # metadata does (``archived_at``), so only the schema is frozen.
+        self._cache_store(
+            kind, f"{parent_key}/{version_key}/{include_schema}", data, False
+        )
+        if (
+            isinstance(data, dict)
+            and data.get("published_at") is not None
+            and data.get("json_schema") is not None
+        ):
+            self._cache_store(
+                f"{kind}_schema",
+                f"{parent_key}/{version_key}",
+                data["json_schema"],
+                True,
+            )
+
+    def _forget_version(self, kind: str, parent_key: str, version_key: str) -> None:
+        if self.object_cache is not None:
+            for include_schema in (None, True, False):
+                self.object_cache.discard(
+                    kind, f"{parent_key}/{version_key}/{include_schema}"
+                )
+            self.object_cache.discard(f"{kind}_schema", f"{parent_key}/{version_key}")
+
+    def _forget_versions(self, kind: str, parent_key: str) -> None:
+        # Publishing archives the previously live version, so the cached
+        # metadata of every version of the folder or component is stale.
+        if self.object_cache is not None:
+            self.object_cache.discard_prefix(kind, f"{parent_key}/")
+
+    def _cache_revision(self, revision_key: str, data: Any) -> None:
+        # Revision metadata changes when a newer revision is published, so it
+        # always expires; once published, the revision's data never changes.
+        self._cache_store("revision", revision_key, data, False)
+        if isinstance(data, dict) and data.get("published_at") is not None:
+            self._cache_store("revision_sealed", revision_key, True, True)
+
+    def _revision_sealed(self, revision_key: str) -> bool:
+        return self._cache_lookup("revision_sealed", revision_key) is not None
+
+    def _forget_revision(self, revision_key: str) -> None:
+        if self.object_cache is not None:
+            for kind in ("revision", "revision_data", "revision_sealed"):
+                self.object_cache.discard(kind, revision_key)
+
+    # Folder index
+    def _indexed_folder(self, folder_key: str) -> FolderSummary | None:
+        if self._folder_index is None:
+            return None
+        return self._folder_index.get(folder_key)
+
+    def _indexed_folder_by_path(self, path: str) -> FolderSummary | None:
+        if self._folder_index is None:
+            return None
+        return self._folder_index.get_by_path(path)
+
+    def _index_folder(self, folder: FolderSummary) -> FolderSummary:
+        if self._folder_index is not None:
+            self._folder_index.put(folder)
+        return folder
+
+    def _unindex_folder(self, folder_key: str) -> None:
+        if self._folder_index is not None:
+            self._folder_index.remove(folder_key)
+
+    # Payload validation
+    def _check_payload(
+        self,
+        validator: PayloadValidator,
+        payload: Mapping[str, Any],
+        folder_key: str,
+        component: str | None,
+        external_id: str | None = None,
+    ) -> None:
+        issues = validator.validate(resource_data(payload, validator))
+        if issues:
+            target = (
+                f"component {component!r}" if component else f"folder {folder_key!r}"
+            )
+            subject = f"Payload for {external_id!r}" if external_id else "Payload"
+            raise FoxnoseValidationError(
+                f"{subject} does not match the schema of {target}", issues
+            )
+
+    def _forget_payload_validator(self, kind: str, key: str) -> None:
+        self._payload_validators.pop((kind, key), None)
+
+    # Declarative schemas
+    def _schema_endpoints(self, kind: str) -> _SchemaEndpoints:
+        client: Any = self
+        if kind == "component":
+            return _SchemaEndpoints(
+                client.iter_component_versions,
+                client.get_component_version,
+                client.create_component_version,
+                client.publish_component_version,
+                client.iter_component_fields,
+                client.create_component_field,
+                client.update_component_field,
+                client.delete_component_field,
+            )
+        return _SchemaEndpoints(
+            client.iter_folder_versions,
+            client.get_folder_version,
+            client.create_folder_version,
+            client.publish_folder_version,
+            client.iter_folder_fields,
+            client.create_folder_field,
+            client.update_folder_field,
+            client.delete_folder_field,
+        )
+
+    @staticmethod
+    def _schema_target(
+        versions: list[SchemaVersionSummary],
+    ) -> tuple[SchemaVersionSummary | None, SchemaVersionSummary | None, int]:
+        numbers = [version.version_number or 0 for version in versions]
+        next_number = max(numbers, default=0) + 1
+        draft = draft_schema_version(versions)
+        if draft is not None:
+            return draft, None, next_number
+        return None, current_schema_version(versions), next_number
+
+    # Permission synchronization
+    def _permission_endpoints(self, kind: str) -> _PermissionEndpoints:
+        client: Any = self
+        if kind == "flux":
+            return _PermissionEndpoints(
+                client.list_flux_role_permissions,
+                client.upsert_flux_role_permission,
+                client.delete_flux_role_permission,
+                client.list_flux_permission_objects,
+                client.add_flux_permission_object,
+                client.delete_flux_permission_object,
+            )
+        return _PermissionEndpoints(
+            client.list_management_role_permissions,
+            client.upsert_management_role_permission,
+            client.delete_management_role_permission,
+            client.list_management_permission_objects,
+            client.add_management_permission_object,
+            client.delete_management_permission_object,
+        )
+
+    # Environment snapshots
+    def _snapshot_listings(self) -> dict[str, Callable[[], Any]]:
+        client: Any = self
+        return {
+            "locales": client.list_locales,
+            "components": client.iter_components,
+            "folders": client.iter_folders,
+            "management_roles": client.iter_management_roles,
+            "flux_roles": client.iter_flux_roles,
+            "apis": client.iter_apis,
+            "management_api_keys": client.iter_management_api_keys,
+            "flux_api_keys": client.iter_flux_api_keys,
+        }
+
+    def _snapshot_writer(self, kind: str) -> Callable[..., Any]:
+        client: Any = self
+        return {
+            "locale": client.create_locale,
+            "component": client.create_component,
+            "component_schema": client.apply_component_schema,
+            "folder": client.create_folder,
+            "folder_schema": client.apply_folder_schema,
+            "api": client.create_api,
+            "api_folder": client.add_api_folder,
+            "management_role": client.create_management_role,
+            "management_role_permissions": client.replace_management_role_permissions,
+            "flux_role": client.create_flux_role,
+            "flux_role_permissions": client.replace_flux_role_permissions,
+        }[kind]
 
     # Organization paths
     def _org_root(self, org_key: str) -> str:
@@ -264,7 +1364,7 @@ class _ManagementPathsMixin:
             items = payload
         else:
             items = [payload]
-        return [EnvironmentSummary.model_validate(item) for item in items]
+        return _ENVIRONMENT_LIST_ADAPTER.validate_python(items)
 
 
 class ManagementClient(_ManagementPathsMixin):
@@ -279,10 +1379,24 @@ class ManagementClient(_ManagementPathsMixin):
         timeout: float = 30.0,
         retry_config: RetryConfig | None = None,
         default_headers: Mapping[str, str] | None = None,
+        model_backend: str = "pydantic",
+        intern_strings: bool = True,
+        object_cache: ImmutableCache | None = None,
     ) -> None:
         if not environment_key:
             raise ValueError("environment_key must be provided")
+        if model_backend not in MODEL_BACKENDS:
+            raise ValueError(
+                f"model_backend must be one of {', '.join(MODEL_BACKENDS)}"
+            )
         self.environment_key = environment_key
+        self.model_backend = model_backend
+        self.intern_strings = intern_strings
+        self.object_cache = object_cache
+        self._folder_index: FolderIndex | None = None
+        self._payload_validators: dict[tuple[str, str], PayloadValidator] = {}
+        self._validator_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._validator_locks_guard = threading.Lock()
         config = FoxnoseConfig(
             base_url=base_url,
             timeout=timeout,
@@ -312,6 +1426,56 @@ class ManagementClient(_ManagementPathsMixin):
             parse_json=parse_json,
         )
 
+    def fan_out(
+        self,
+        calls: Callable[..., Any] | Iterable[RequestSpec],
+        args: Iterable[Any] | None = None,
+        *,
+        max_concurrency: ConcurrencyLimit = 8,
+        ordered: bool = True,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> Generator[Completed, None, None]:
+        """
+        Run many client calls concurrently and stream their outcomes.
+
+        Pass a callable and its argument tuples (an item that is not a plain
+        tuple is passed as the only argument), or an iterable of
+        :class:`~foxnose_sdk.concurrency.RequestSpec` for raw requests::
+
+            for outcome in client.fan_out(client.get_folder, ["f-1", "f-2"]):
+                print(outcome.item, outcome.result, outcome.error)
+
+        Calls run on up to ``max_concurrency`` threads sharing this client's
+        connection pool. Each outcome is a
+        :class:`~foxnose_sdk.concurrency.Completed` record; a failing call
+        sets its ``error`` instead of raising. Close the generator (or
+        leave the loop) to cancel calls not yet started.
+
+        Args:
+            calls: Callable to run, or raw request specs.
+            args: Argument tuples for ``calls``; omit when passing specs.
+            max_concurrency: Maximum number of calls in flight, or an
+                :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency` limiter.
+            ordered: Yield outcomes in input order (default) instead of
+                completion order.
+            on_progress: Optional callback invoked as
+                ``(completed_count, total_count)`` after each call finishes.
+        """
+        if args is None:
+            calls, args = self._send_spec, calls
+        return fan_out(
+            calls,
+            args,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            on_progress=on_progress,
+        )
+
+    def _send_spec(self, spec: RequestSpec) -> Any:
+        return self.request(
+            spec.method, spec.path, params=spec.params, json_body=spec.json_body
+        )
+
     # ------------------------------------------------------------------ #
     # Organization operations
     # ------------------------------------------------------------------ #
@@ -321,7 +1485,7 @@ class ManagementClient(_ManagementPathsMixin):
         payload = self.request("GET", "/organizations/") or []
         if not isinstance(payload, list):
             payload = [payload]
-        return [OrganizationSummary.model_validate(item) for item in payload]
+        return _ORGANIZATION_LIST_ADAPTER.validate_python(payload)
 
     def get_organization(self, org_key: OrgRef) -> OrganizationSummary:
         """Retrieve details for a specific organization.
@@ -351,7 +1515,7 @@ class ManagementClient(_ManagementPathsMixin):
         payload = self.request("GET", "/regions/") or []
         if not isinstance(payload, list):
             payload = [payload]
-        return [RegionInfo.model_validate(item) for item in payload]
+        return _REGION_LIST_ADAPTER.validate_python(payload)
 
     def get_available_plans(self) -> OrganizationPlanStatus:
         """Retrieve the list of available subscription plans."""
@@ -406,7 +1570,34 @@ class ManagementClient(_ManagementPathsMixin):
         data = self.request(
             "GET", f"{self._management_api_keys_root()}/", params=params
         )
-        return ManagementAPIKeyList.model_validate(data)
+        return self._validate_page(ManagementAPIKeyList, data)
+
+    def iter_management_api_keys(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[ManagementAPIKeySummary]:
+        """Iterate over all Management API keys in the environment.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        return _iterate_pages(
+            lambda query: self.list_management_api_keys(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def create_management_api_key(
         self, payload: Mapping[str, Any]
@@ -468,7 +1659,34 @@ class ManagementClient(_ManagementPathsMixin):
             params: Optional query parameters for filtering/pagination.
         """
         data = self.request("GET", f"{self._flux_api_keys_root()}/", params=params)
-        return FluxAPIKeyList.model_validate(data)
+        return self._validate_page(FluxAPIKeyList, data)
+
+    def iter_flux_api_keys(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[FluxAPIKeySummary]:
+        """Iterate over all Flux API keys in the environment.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        return _iterate_pages(
+            lambda query: self.list_flux_api_keys(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def create_flux_api_key(self, payload: Mapping[str, Any]) -> FluxAPIKeySummary:
         """Create a new Flux API key.
@@ -524,7 +1742,34 @@ class ManagementClient(_ManagementPathsMixin):
             params: Optional query parameters for filtering/pagination.
         """
         data = self.request("GET", f"{self._apis_root()}/", params=params)
-        return APIList.model_validate(data)
+        return self._validate_page(APIList, data)
+
+    def iter_apis(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[APIInfo]:
+        """Iterate over all APIs in the environment.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        return _iterate_pages(
+            lambda query: self.list_apis(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def create_api(self, payload: Mapping[str, Any]) -> APIInfo:
         """Create a new API endpoint configuration.
@@ -576,7 +1821,37 @@ class ManagementClient(_ManagementPathsMixin):
         """
         api_key = _resolve_key(api_key)
         data = self.request("GET", f"{self._api_folders_root(api_key)}/", params=params)
-        return APIFolderList.model_validate(data)
+        return self._validate_page(APIFolderList, data)
+
+    def iter_api_folders(
+        self,
+        api_key: APIRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[APIFolderSummary]:
+        """Iterate over all folders exposed through an API.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            api_key: Unique identifier of the API.
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        api_key = _resolve_key(api_key)
+        return _iterate_pages(
+            lambda query: self.list_api_folders(api_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def add_api_folder(
         self,
@@ -700,7 +1975,34 @@ class ManagementClient(_ManagementPathsMixin):
             params: Optional query parameters for filtering/pagination.
         """
         data = self.request("GET", f"{self._management_roles_root()}/", params=params)
-        return ManagementRoleList.model_validate(data)
+        return self._validate_page(ManagementRoleList, data)
+
+    def iter_management_roles(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[ManagementRoleSummary]:
+        """Iterate over all Management API roles in the environment.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        return _iterate_pages(
+            lambda query: self.list_management_roles(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def create_management_role(
         self, payload: Mapping[str, Any]
@@ -761,10 +2063,9 @@ class ManagementClient(_ManagementPathsMixin):
         """
         role_key = _resolve_key(role_key)
         payload = self.request("GET", f"{self._role_permissions_root(role_key)}/")
-        return [
-            RolePermission.model_validate(item)
-            for item in _coerce_list_payload(payload)
-        ]
+        return _ROLE_PERMISSION_LIST_ADAPTER.validate_python(
+            _coerce_list_payload(payload)
+        )
 
     def upsert_management_role_permission(
         self,
@@ -821,7 +2122,7 @@ class ManagementClient(_ManagementPathsMixin):
             )
             or []
         )
-        return [RolePermission.model_validate(item) for item in data]
+        return _ROLE_PERMISSION_LIST_ADAPTER.validate_python(data)
 
     def list_management_permission_objects(
         self, role_key: ManagementRoleRef, *, content_type: str
@@ -837,10 +2138,9 @@ class ManagementClient(_ManagementPathsMixin):
         payload = self.request(
             "GET", f"{self._role_permission_objects_root(role_key)}/", params=params
         )
-        return [
-            RolePermissionObject.model_validate(item)
-            for item in _coerce_list_payload(payload)
-        ]
+        return _PERMISSION_OBJECT_LIST_ADAPTER.validate_python(
+            _coerce_list_payload(payload)
+        )
 
     def add_management_permission_object(
         self,
@@ -891,7 +2191,34 @@ class ManagementClient(_ManagementPathsMixin):
             params: Optional query parameters for filtering/pagination.
         """
         data = self.request("GET", f"{self._flux_roles_root()}/", params=params)
-        return FluxRoleList.model_validate(data)
+        return self._validate_page(FluxRoleList, data)
+
+    def iter_flux_roles(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[FluxRoleSummary]:
+        """Iterate over all Flux API roles in the environment.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        return _iterate_pages(
+            lambda query: self.list_flux_roles(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def create_flux_role(self, payload: Mapping[str, Any]) -> FluxRoleSummary:
         """Create a new Flux API role.
@@ -944,10 +2271,9 @@ class ManagementClient(_ManagementPathsMixin):
         """
         role_key = _resolve_key(role_key)
         payload = self.request("GET", f"{self._flux_role_permissions_root(role_key)}/")
-        return [
-            RolePermission.model_validate(item)
-            for item in _coerce_list_payload(payload)
-        ]
+        return _ROLE_PERMISSION_LIST_ADAPTER.validate_python(
+            _coerce_list_payload(payload)
+        )
 
     def upsert_flux_role_permission(
         self, role_key: FluxRoleRef, payload: Mapping[str, Any]
@@ -1001,7 +2327,7 @@ class ManagementClient(_ManagementPathsMixin):
             )
             or []
         )
-        return [RolePermission.model_validate(item) for item in payload]
+        return _ROLE_PERMISSION_LIST_ADAPTER.validate_python(payload)
 
     def list_flux_permission_objects(
         self, role_key: FluxRoleRef, *, content_type: str
@@ -1018,10 +2344,9 @@ class ManagementClient(_ManagementPathsMixin):
             f"{self._flux_role_permission_objects_root(role_key)}/",
             params={"content_type": content_type},
         )
-        return [
-            RolePermissionObject.model_validate(item)
-            for item in _coerce_list_payload(payload)
-        ]
+        return _PERMISSION_OBJECT_LIST_ADAPTER.validate_python(
+            _coerce_list_payload(payload)
+        )
 
     def add_flux_permission_object(
         self, role_key: FluxRoleRef, payload: Mapping[str, Any]
@@ -1059,11 +2384,116 @@ class ManagementClient(_ManagementPathsMixin):
             parse_json=False,
         )
 
+    # ------------------------------------------------------------------ #
+    # Permission synchronization
+    # ------------------------------------------------------------------ #
+
+    def sync_management_role_permissions(
+        self,
+        role_key: ManagementRoleRef,
+        permissions: Sequence[Mapping[str, Any]],
+        *,
+        prune: bool = True,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> PermissionSyncResult:
+        """
+        Bring a Management API role's permissions in line with ``permissions``.
+
+        Unlike :meth:`replace_management_role_permissions`, only what differs
+        is sent. Each permission is an upsert payload with an optional
+        ``"objects"`` list of object keys it is scoped to. Changed or missing
+        permissions are upserted and, with ``prune``, permissions of other
+        content types are deleted. Where ``"objects"`` is given, the current
+        objects are fetched and the missing ones added and the extra ones
+        removed. The changes run concurrently on up to ``max_concurrency``
+        threads; objects of a permission that is being upserted wait for it.
+
+        Args:
+            role_key: Role whose permissions are synchronized.
+            permissions: Desired permissions.
+            prune: Delete permissions not in ``permissions`` (default ``True``).
+            max_concurrency: Maximum number of requests in flight.
+        """
+        role_key = _resolve_key(role_key)
+        return self._sync_permissions(
+            "management", role_key, permissions, prune, max_concurrency
+        )
+
+    def sync_flux_role_permissions(
+        self,
+        role_key: FluxRoleRef,
+        permissions: Sequence[Mapping[str, Any]],
+        *,
+        prune: bool = True,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> PermissionSyncResult:
+        """
+        Bring a Flux API role's permissions in line with ``permissions``.
+
+        Works like :meth:`sync_management_role_permissions`.
+
+        Args:
+            role_key: Role whose permissions are synchronized.
+            permissions: Desired permissions.
+            prune: Delete permissions not in ``permissions`` (default ``True``).
+            max_concurrency: Maximum number of requests in flight.
+        """
+        role_key = _resolve_key(role_key)
+        return self._sync_permissions(
+            "flux", role_key, permissions, prune, max_concurrency
+        )
+
+    def _sync_permissions(
+        self,
+        kind: str,
+        role_key: str,
+        permissions: Sequence[Mapping[str, Any]],
+        prune: bool,
+        max_concurrency: ConcurrencyLimit,
+    ) -> PermissionSyncResult:
+        endpoints = self._permission_endpoints(kind)
+        current = endpoints.list_permissions(role_key)
+        objects = _known_objects(current)
+        outcomes = bounded_map(
+            lambda content_type: endpoints.list_objects(
+                role_key, content_type=content_type
+            ),
+            _objects_to_fetch(current, permissions),
+            max_concurrency=max_concurrency,
+        )
+        with contextlib.closing(outcomes):
+            for outcome in outcomes:
+                if outcome.error is not None:
+                    raise outcome.error
+                objects[outcome.item] = [o.object_key for o in outcome.result]
+        changes, dependencies = plan_permission_changes(
+            current, objects, permissions, prune=prune
+        )
+        result = PermissionSyncResult(role=role_key)
+
+        def run(change: PermissionChange) -> Any:
+            if change.action == "upsert":
+                return endpoints.upsert_permission(role_key, change.payload)
+            if change.action == "delete":
+                return endpoints.delete_permission(role_key, change.content_type)
+            if change.action == "add_object":
+                return endpoints.add_object(role_key, change.payload)
+            return endpoints.delete_object(role_key, change.payload)
+
+        outcomes = bounded_dag(
+            run, changes, dependencies, max_concurrency=max_concurrency
+        )
+        with contextlib.closing(outcomes):
+            _permission_result(changes, result, list(outcomes))
+        return result
+
     # ------------------------------------------------------------------ #
     # Folder operations
     # ------------------------------------------------------------------ #
 
-    def list_folders(self, *, params: Mapping[str, Any] | None = None) -> FolderList:
+    def list_folders(
+        self, *, params: Mapping[str, Any] | None = None
+    ) -> FolderList | CompactPage:
         """List all folders in the environment.
 
         Args:
@@ -1071,7 +2501,54 @@ class ManagementClient(_ManagementPathsMixin):
         """
         path = f"{self._folders_tree_root()}/"
         data = self.request("GET", path, params=params)
-        return FolderList.model_validate(data)
+        return self._validate_page(FolderList, data)
+
+    def iter_folders(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[FolderSummary | CompactFolderSummary]:
+        """Iterate over all folders in the environment.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        return _iterate_pages(
+            lambda query: self.list_folders(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
+
+    def folder_index(self, *, refresh: bool = False) -> FolderIndex:
+        """Return the folder index of this environment, building it on first use.
+
+        The whole tree is loaded once; afterwards :meth:`create_folder`,
+        :meth:`update_folder` and :meth:`delete_folder` on this client keep
+        it current, and :meth:`get_folder` and :meth:`get_folder_by_path`
+        answer from it without a request.
+
+        Args:
+            refresh: Reload the whole tree, e.g. after folders were changed
+                by another client or in the dashboard.
+        """
+        if self._folder_index is None or refresh:
+            folders = list(self.iter_folders())
+            if self._folder_index is None:
+                self._folder_index = FolderIndex(folders)
+            else:
+                self._folder_index.load(folders)
+        return self._folder_index
 
     def get_folder(self, folder_key: FolderRef) -> FolderSummary:
         """Retrieve details for a specific folder by key.
@@ -1080,10 +2557,13 @@ class ManagementClient(_ManagementPathsMixin):
             folder_key: Unique identifier of the folder.
         """
         folder_key = _resolve_key(folder_key)
+        folder = self._indexed_folder(folder_key)
+        if folder is not None:
+            return folder
         data = self.request(
             "GET", f"{self._folders_tree_item()}/", params={"key": folder_key}
         )
-        return FolderSummary.model_validate(data)
+        return self._index_folder(FolderSummary.model_validate(data))
 
     def get_folder_by_path(self, path: str) -> FolderSummary:
         """Retrieve details for a folder by its path.
@@ -1091,19 +2571,22 @@ class ManagementClient(_ManagementPathsMixin):
         Args:
             path: Hierarchical path to the folder (e.g., "parent/child").
         """
+        folder = self._indexed_folder_by_path(path)
+        if folder is not None:
+            return folder
         data = self.request(
             "GET",
             f"{self._folders_tree_item()}/",
             params={"path": path},
         )
-        return FolderSummary.model_validate(data)
+        return self._index_folder(FolderSummary.model_validate(data))
 
     def list_folder_tree(
         self,
         *,
         key: str | None = None,
         mode: str | None = None,
-    ) -> FolderList:
+    ) -> FolderList | CompactPage:
         """List folders as a hierarchical tree.
 
         Args:
@@ -1117,7 +2600,7 @@ class ManagementClient(_ManagementPathsMixin):
             params["mode"] = mode
         path = f"{self._folders_tree_root()}/"
         data = self.request("GET", path, params=params or None)
-        return FolderList.model_validate(data)
+        return self._validate_page(FolderList, data)
 
     def create_folder(self, payload: Mapping[str, Any]) -> FolderSummary:
         """Create a new folder.
@@ -1126,7 +2609,7 @@ class ManagementClient(_ManagementPathsMixin):
             payload: Folder configuration including name, alias, folder_type, and content_type.
         """
         data = self.request("POST", f"{self._folders_tree_root()}/", json_body=payload)
-        return FolderSummary.model_validate(data)
+        return self._index_folder(FolderSummary.model_validate(data))
 
     def update_folder(
         self, folder_key: FolderRef, payload: Mapping[str, Any]
@@ -1144,7 +2627,7 @@ class ManagementClient(_ManagementPathsMixin):
             params={"key": folder_key},
             json_body=payload,
         )
-        return FolderSummary.model_validate(data)
+        return self._index_folder(FolderSummary.model_validate(data))
 
     def delete_folder(self, folder_key: FolderRef) -> None:
         """Delete a folder.
@@ -1159,6 +2642,7 @@ class ManagementClient(_ManagementPathsMixin):
             params={"key": folder_key},
             parse_json=False,
         )
+        self._unindex_folder(folder_key)
 
     # ------------------------------------------------------------------ #
     # Project operations
@@ -1175,10 +2659,40 @@ class ManagementClient(_ManagementPathsMixin):
         """
         org_key = _resolve_key(org_key)
         data = self.request("GET", f"{self._projects_base(org_key)}/", params=params)
-        return ProjectList.model_validate(data)
-
-    def get_project(self, org_key: OrgRef, project_key: ProjectRef) -> ProjectSummary:
-        """Retrieve details for a specific project.
+        return self._validate_page(ProjectList, data)
+
+    def iter_projects(
+        self,
+        org_key: OrgRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[ProjectSummary]:
+        """Iterate over all projects in an organization.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            org_key: Unique identifier of the organization.
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        org_key = _resolve_key(org_key)
+        return _iterate_pages(
+            lambda query: self.list_projects(org_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
+
+    def get_project(self, org_key: OrgRef, project_key: ProjectRef) -> ProjectSummary:
+        """Retrieve details for a specific project.
 
         Args:
             org_key: Unique identifier of the organization.
@@ -1422,7 +2936,7 @@ class ManagementClient(_ManagementPathsMixin):
     def list_locales(self) -> LocaleList:
         """List all locales configured in the environment."""
         payload = self.request("GET", f"{self._locales_root()}/") or []
-        return [LocaleSummary.model_validate(item) for item in payload]
+        return _LOCALE_LIST_ADAPTER.validate_python(payload)
 
     def create_locale(self, payload: Mapping[str, Any]) -> LocaleSummary:
         """Create a new locale.
@@ -1473,7 +2987,34 @@ class ManagementClient(_ManagementPathsMixin):
             params: Optional query parameters for filtering/pagination.
         """
         data = self.request("GET", f"{self._components_root()}/", params=params)
-        return ComponentList.model_validate(data)
+        return self._validate_page(ComponentList, data)
+
+    def iter_components(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[ComponentSummary]:
+        """Iterate over all reusable components in the environment.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        return _iterate_pages(
+            lambda query: self.list_components(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def get_component(self, component_key: ComponentRef) -> ComponentSummary:
         """Retrieve details for a specific component.
@@ -1536,7 +3077,37 @@ class ManagementClient(_ManagementPathsMixin):
         data = self.request(
             "GET", f"{self._component_versions_base(component_key)}/", params=params
         )
-        return SchemaVersionList.model_validate(data)
+        return self._validate_page(SchemaVersionList, data)
+
+    def iter_component_versions(
+        self,
+        component_key: ComponentRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[SchemaVersionSummary]:
+        """Iterate over all schema versions of a component.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            component_key: Unique identifier of the component.
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        component_key = _resolve_key(component_key)
+        return _iterate_pages(
+            lambda query: self.list_component_versions(component_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def create_component_version(
         self,
@@ -1584,11 +3155,25 @@ class ManagementClient(_ManagementPathsMixin):
             if include_schema is not None
             else None
         )
-        data = self.request(
-            "GET",
-            f"{self._component_versions_base(component_key)}/{version_key}/",
-            params=params,
-        )
+        cache_key = f"{component_key}/{version_key}/{include_schema}"
+        data = self._cache_lookup("component_version", cache_key)
+        if data is None:
+            schema = self._frozen_schema(
+                "component_version", component_key, version_key, include_schema
+            )
+            if schema is not None:
+                # Only the metadata is refetched; the schema is known.
+                params = {"include_schema": "false"}
+            data = self.request(
+                "GET",
+                f"{self._component_versions_base(component_key)}/{version_key}/",
+                params=params,
+            )
+            if schema is not None:
+                data["json_schema"] = schema
+            self._cache_version(
+                "component_version", component_key, version_key, include_schema, data
+            )
         return SchemaVersionSummary.model_validate(data)
 
     def publish_component_version(
@@ -1604,6 +3189,9 @@ class ManagementClient(_ManagementPathsMixin):
         """
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
+        self._forget_versions("component_version", component_key)
+        self._forget_payload_validator("component", component_key)
         data = self.request(
             "POST",
             f"{self._component_versions_base(component_key)}/{version_key}/publish/",
@@ -1626,6 +3214,7 @@ class ManagementClient(_ManagementPathsMixin):
         """
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
         data = self.request(
             "PUT",
             f"{self._component_versions_base(component_key)}/{version_key}/",
@@ -1644,6 +3233,7 @@ class ManagementClient(_ManagementPathsMixin):
         """
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
         self.request(
             "DELETE",
             f"{self._component_versions_base(component_key)}/{version_key}/",
@@ -1671,7 +3261,42 @@ class ManagementClient(_ManagementPathsMixin):
             f"{self._component_schema_tree(component_key, version_key)}/",
             params=params,
         )
-        return FieldList.model_validate(data)
+        return self._validate_page(FieldList, data)
+
+    def iter_component_fields(
+        self,
+        component_key: ComponentRef,
+        version_key: SchemaVersionRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[FieldSummary]:
+        """Iterate over all fields in a component version's schema.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            component_key: Unique identifier of the component.
+            version_key: Unique identifier of the version.
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        component_key = _resolve_key(component_key)
+        version_key = _resolve_key(version_key)
+        return _iterate_pages(
+            lambda query: self.list_component_fields(
+                component_key, version_key, params=query
+            ),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def create_component_field(
         self,
@@ -1688,6 +3313,7 @@ class ManagementClient(_ManagementPathsMixin):
         """
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
         data = self.request(
             "POST",
             f"{self._component_schema_tree(component_key, version_key)}/",
@@ -1734,6 +3360,7 @@ class ManagementClient(_ManagementPathsMixin):
         """
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
         data = self.request(
             "PUT",
             f"{self._component_schema_tree(component_key, version_key)}/field/",
@@ -1757,6 +3384,7 @@ class ManagementClient(_ManagementPathsMixin):
         """
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
         self.request(
             "DELETE",
             f"{self._component_schema_tree(component_key, version_key)}/field/",
@@ -1784,7 +3412,37 @@ class ManagementClient(_ManagementPathsMixin):
         data = self.request(
             "GET", f"{self._folder_versions_base(folder_key)}/", params=params
         )
-        return SchemaVersionList.model_validate(data)
+        return self._validate_page(SchemaVersionList, data)
+
+    def iter_folder_versions(
+        self,
+        folder_key: FolderRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[SchemaVersionSummary]:
+        """Iterate over all schema versions of a collection folder.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            folder_key: Unique identifier of the folder.
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        folder_key = _resolve_key(folder_key)
+        return _iterate_pages(
+            lambda query: self.list_folder_versions(folder_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def create_folder_version(
         self,
@@ -1832,11 +3490,25 @@ class ManagementClient(_ManagementPathsMixin):
             if include_schema is not None
             else None
         )
-        data = self.request(
-            "GET",
-            f"{self._folder_versions_base(folder_key)}/{version_key}/",
-            params=params,
-        )
+        cache_key = f"{folder_key}/{version_key}/{include_schema}"
+        data = self._cache_lookup("folder_version", cache_key)
+        if data is None:
+            schema = self._frozen_schema(
+                "folder_version", folder_key, version_key, include_schema
+            )
+            if schema is not None:
+                # Only the metadata is refetched; the schema is known.
+                params = {"include_schema": "false"}
+            data = self.request(
+                "GET",
+                f"{self._folder_versions_base(folder_key)}/{version_key}/",
+                params=params,
+            )
+            if schema is not None:
+                data["json_schema"] = schema
+            self._cache_version(
+                "folder_version", folder_key, version_key, include_schema, data
+            )
         return SchemaVersionSummary.model_validate(data)
 
     def update_folder_version(
@@ -1854,6 +3526,7 @@ class ManagementClient(_ManagementPathsMixin):
         """
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
         data = self.request(
             "PUT",
             f"{self._folder_versions_base(folder_key)}/{version_key}/",
@@ -1872,6 +3545,7 @@ class ManagementClient(_ManagementPathsMixin):
         """
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
         self.request(
             "DELETE",
             f"{self._folder_versions_base(folder_key)}/{version_key}/",
@@ -1891,6 +3565,9 @@ class ManagementClient(_ManagementPathsMixin):
         """
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
+        self._forget_versions("folder_version", folder_key)
+        self._forget_payload_validator("folder", folder_key)
         data = self.request(
             "POST",
             f"{self._folder_versions_base(folder_key)}/{version_key}/publish/",
@@ -1918,7 +3595,42 @@ class ManagementClient(_ManagementPathsMixin):
             f"{self._folder_schema_tree(folder_key, version_key)}/",
             params=params,
         )
-        return FieldList.model_validate(data)
+        return self._validate_page(FieldList, data)
+
+    def iter_folder_fields(
+        self,
+        folder_key: FolderRef,
+        version_key: SchemaVersionRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[FieldSummary]:
+        """Iterate over all fields in a folder schema version.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            folder_key: Unique identifier of the folder.
+            version_key: Unique identifier of the version.
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        folder_key = _resolve_key(folder_key)
+        version_key = _resolve_key(version_key)
+        return _iterate_pages(
+            lambda query: self.list_folder_fields(
+                folder_key, version_key, params=query
+            ),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def create_folder_field(
         self,
@@ -1935,6 +3647,7 @@ class ManagementClient(_ManagementPathsMixin):
         """
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
         data = self.request(
             "POST",
             f"{self._folder_schema_tree(folder_key, version_key)}/",
@@ -1981,6 +3694,7 @@ class ManagementClient(_ManagementPathsMixin):
         """
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
         data = self.request(
             "PUT",
             f"{self._folder_schema_tree(folder_key, version_key)}/field/",
@@ -2001,6 +3715,7 @@ class ManagementClient(_ManagementPathsMixin):
         """
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
         self.request(
             "DELETE",
             f"{self._folder_schema_tree(folder_key, version_key)}/field/",
@@ -2008,17 +3723,416 @@ class ManagementClient(_ManagementPathsMixin):
             parse_json=False,
         )
 
+    # ------------------------------------------------------------------ #
+    # Declarative schema operations
+    # ------------------------------------------------------------------ #
+
+    def plan_folder_schema(
+        self,
+        folder_key: FolderRef,
+        fields: Sequence[Mapping[str, Any]],
+        *,
+        version: SchemaVersionRef | None = None,
+        prune: bool = True,
+    ) -> SchemaPlan:
+        """
+        Compute the field changes needed to reach a declarative folder schema.
+
+        Nothing is written. See :meth:`apply_folder_schema` for the spec format
+        and for how the compared version is chosen.
+
+        Args:
+            folder_key: Folder whose schema is planned.
+            fields: Desired field specs; nested fields go under ``"fields"``.
+            version: Compare against this version instead of the default.
+            prune: Plan deletes for fields missing from ``fields``.
+        """
+        folder_key = _resolve_key(folder_key)
+        baseline = self._schema_baseline("folder", folder_key, version)
+        return plan_schema_changes(baseline.fields, fields, prune=prune)
+
+    def apply_folder_schema(
+        self,
+        folder_key: FolderRef,
+        fields: Sequence[Mapping[str, Any]],
+        *,
+        version: SchemaVersionRef | None = None,
+        version_name: str | None = None,
+        publish: bool = False,
+        prune: bool = True,
+        max_concurrency: ConcurrencyLimit = 5,
+    ) -> SchemaApplyResult:
+        """
+        Bring a folder's schema in line with a declarative field spec.
+
+        Each spec is a ``create_folder_field`` payload with an optional
+        ``"fields"`` list of nested specs. The current fields are fetched and
+        only the differences are written: new fields are created, changed
+        attributes are updated, fields whose ``type`` changed are re-created
+        and, with ``prune``, fields missing from the spec are deleted. The
+        changes run as a dependency graph on up to ``max_concurrency``
+        threads: a nested field waits for its parent, independent fields are
+        written in parallel, and changes below a failed one are skipped.
+
+        Changes go to ``version`` if given, otherwise to the newest draft. If
+        there is no draft and something needs to change, a new version named
+        ``version_name`` is created as a copy of the current published one.
+
+        Args:
+            folder_key: Folder whose schema is applied.
+            fields: Desired field specs.
+            version: Write to this (draft) version.
+            version_name: Name for a newly created version (default
+                ``"Version <n>"``).
+            publish: Publish the version once every change succeeded.
+            prune: Delete fields that are not in ``fields`` (default ``True``).
+            max_concurrency: Maximum number of field requests in flight.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._apply_schema(
+            "folder",
+            folder_key,
+            fields,
+            version,
+            version_name,
+            publish,
+            prune,
+            max_concurrency,
+        )
+
+    def plan_component_schema(
+        self,
+        component_key: ComponentRef,
+        fields: Sequence[Mapping[str, Any]],
+        *,
+        version: SchemaVersionRef | None = None,
+        prune: bool = True,
+    ) -> SchemaPlan:
+        """
+        Compute the field changes needed to reach a declarative component schema.
+
+        Args:
+            component_key: Component whose schema is planned.
+            fields: Desired field specs; nested fields go under ``"fields"``.
+            version: Compare against this version instead of the default.
+            prune: Plan deletes for fields missing from ``fields``.
+        """
+        component_key = _resolve_key(component_key)
+        baseline = self._schema_baseline("component", component_key, version)
+        return plan_schema_changes(baseline.fields, fields, prune=prune)
+
+    def apply_component_schema(
+        self,
+        component_key: ComponentRef,
+        fields: Sequence[Mapping[str, Any]],
+        *,
+        version: SchemaVersionRef | None = None,
+        version_name: str | None = None,
+        publish: bool = False,
+        prune: bool = True,
+        max_concurrency: ConcurrencyLimit = 5,
+    ) -> SchemaApplyResult:
+        """
+        Bring a component's schema in line with a declarative field spec.
+
+        Works like :meth:`apply_folder_schema` on the component's versions.
+
+        Args:
+            component_key: Component whose schema is applied.
+            fields: Desired field specs.
+            version: Write to this (draft) version.
+            version_name: Name for a newly created version.
+            publish: Publish the version once every change succeeded.
+            prune: Delete fields that are not in ``fields`` (default ``True``).
+            max_concurrency: Maximum number of field requests in flight.
+        """
+        component_key = _resolve_key(component_key)
+        return self._apply_schema(
+            "component",
+            component_key,
+            fields,
+            version,
+            version_name,
+            publish,
+            prune,
+            max_concurrency,
+        )
+
+    def _schema_baseline(
+        self, kind: str, key: str, version: SchemaVersionRef | None
+    ) -> _SchemaBaseline:
+        endpoints = self._schema_endpoints(kind)
+        if version is not None:
+            version = _resolve_key(version)
+            return _SchemaBaseline(
+                version, None, list(endpoints.iter_fields(key, version)), 0
+            )
+        draft, base, next_number = self._schema_target(
+            list(endpoints.iter_versions(key))
+        )
+        source = draft or base
+        fields = list(endpoints.iter_fields(key, source.key)) if source else []
+        return _SchemaBaseline(draft.key if draft else None, base, fields, next_number)
+
+    def _apply_schema(
+        self,
+        kind: str,
+        key: str,
+        fields: Sequence[Mapping[str, Any]],
+        version: SchemaVersionRef | None,
+        version_name: str | None,
+        publish: bool,
+        prune: bool,
+        max_concurrency: ConcurrencyLimit,
+    ) -> SchemaApplyResult:
+        endpoints = self._schema_endpoints(kind)
+        baseline = self._schema_baseline(kind, key, version)
+        plan = plan_schema_changes(baseline.fields, fields, prune=prune)
+        result = SchemaApplyResult(version=baseline.version)
+        if result.version is None:
+            if not plan:
+                return result
+            created = endpoints.create_version(
+                key,
+                {"name": version_name or f"Version {baseline.next_number}"},
+                copy_from=baseline.base.key if baseline.base else None,
+            )
+            result.version = created.key
+            result.created_version = True
+        version_key = result.version
+
+        def run(change: SchemaChange) -> Any:
+            if change.action in ("delete", "replace"):
+                endpoints.delete_field(key, version_key, change.path)
+            if change.action == "update":
+                return endpoints.update_field(
+                    key, version_key, change.path, change.payload
+                )
+            if change.action == "delete":
+                return None
+            return endpoints.create_field(key, version_key, change.payload)
+
+        outcomes = bounded_dag(
+            run, plan.changes, plan.dependencies, max_concurrency=max_concurrency
+        )
+        with contextlib.closing(outcomes):
+            _schema_result(plan, result, list(outcomes))
+        if publish and not result.failed and not result.skipped:
+            endpoints.publish_version(key, version_key)
+            result.published = True
+        return result
+
+    # ------------------------------------------------------------------ #
+    # Environment snapshots
+    # ------------------------------------------------------------------ #
+
+    def export_snapshot(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> dict[str, Any]:
+        """
+        Export the environment's configuration as a snapshot.
+
+        The snapshot holds locales, components and folders with the fields of
+        their current published schema, Management and Flux roles with their
+        permissions, APIs with their folders, and API key metadata (secrets
+        are never included). The object listings are fetched concurrently,
+        followed by the per-object schemas, permissions and API folders, with
+        up to ``max_concurrency`` requests in flight.
+
+        Args:
+            path: Also write the snapshot to this JSON file.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            The snapshot document, which :meth:`import_snapshot` accepts.
+        """
+        listings = self._snapshot_listings()
+        sections: dict[str, Any] = {}
+        outcomes = bounded_map(
+            lambda name: dump_models(listings[name](), exclude=("secret_key",)),
+            list(listings),
+            max_concurrency=max_concurrency,
+        )
+        with contextlib.closing(outcomes):
+            for outcome in outcomes:
+                if outcome.error is not None:
+                    raise outcome.error
+                sections[outcome.item] = outcome.result
+        snapshot = new_snapshot(self.environment_key, **sections)
+
+        outcomes = bounded_map(
+            lambda job: self._snapshot_detail(job[0], job[1]["key"]),
+            _snapshot_details(snapshot),
+            max_concurrency=max_concurrency,
+        )
+        with contextlib.closing(outcomes):
+            for outcome in outcomes:
+                if outcome.error is not None:
+                    raise outcome.error
+                _store_snapshot_detail(*outcome.item, outcome.result)
+        if path is not None:
+            write_snapshot(snapshot, path)
+        return snapshot
+
+    def import_snapshot(
+        self,
+        snapshot: Mapping[str, Any] | str | os.PathLike[str],
+        *,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> SnapshotImportResult:
+        """
+        Recreate a snapshot's configuration in this environment.
+
+        Every object is created anew, so keys change; references between
+        objects (folder parents, API folders, role permissions, field
+        metadata) are rewritten to the new keys. The import runs as a
+        dependency graph on up to ``max_concurrency`` threads: independent
+        objects are created in parallel, a folder waits for its parent, a
+        schema waits for its folder and the components it may embed, and
+        steps below a failed one are skipped. Schemas are created and
+        published as a new version. Locales that already exist are skipped
+        and API keys are not imported.
+
+        Args:
+            snapshot: Snapshot document or path of a snapshot file.
+            max_concurrency: Maximum number of steps in flight.
+        """
+        if not isinstance(snapshot, Mapping):
+            snapshot = read_snapshot(snapshot)
+        existing = [locale.code for locale in self.list_locales()]
+        steps, dependencies = plan_snapshot_import(snapshot, existing_locales=existing)
+        result = SnapshotImportResult()
+        outcomes = bounded_dag(
+            lambda step: self._import_snapshot_step(step, result.key_map),
+            steps,
+            dependencies,
+            max_concurrency=max_concurrency,
+        )
+        with contextlib.closing(outcomes):
+            _snapshot_result(steps, result, list(outcomes))
+        return result
+
+    def _snapshot_detail(self, kind: str, key: str) -> Any:
+        if kind in ("folder", "component"):
+            endpoints = self._schema_endpoints(kind)
+            try:
+                version = current_schema_version(list(endpoints.iter_versions(key)))
+            except FoxnoseAPIError as exc:
+                if _is_not_found(exc):
+                    return None
+                raise
+            if version is None:
+                return None
+            # Fields of a published version never change.
+            fields = self._cache_lookup(f"{kind}_fields", f"{key}/{version.key}")
+            if fields is None:
+                fields = dump_models(endpoints.iter_fields(key, version.key))
+                self._cache_store(
+                    f"{kind}_fields", f"{key}/{version.key}", fields, True
+                )
+            return {"version": version.name, "fields": fields}
+        if kind == "management_role":
+            return dump_models(self.list_management_role_permissions(key))
+        if kind == "flux_role":
+            return dump_models(self.list_flux_role_permissions(key))
+        return dump_models(self.iter_api_folders(key), exclude=("api", "path"))
+
+    def _import_snapshot_step(
+        self, step: SnapshotStep, key_map: dict[str, str]
+    ) -> None:
+        write = self._snapshot_writer(step.kind)
+        payload = remap_keys(step.payload, key_map)
+        if step.kind in _SNAPSHOT_CREATES:
+            created = write(payload)
+            if step.kind != "locale":
+                key_map[step.key] = created.key
+            return
+        target = key_map[step.key]
+        if step.kind == "api_folder":
+            folder = payload.pop("folder")
+            write(target, folder, **payload)
+        elif step.kind.endswith("_schema"):
+            _raise_schema_failure(write(target, payload, publish=True))
+        else:
+            write(target, payload)
+
     def list_resources(
         self,
         folder_key: FolderRef,
         *,
         params: Mapping[str, Any] | None = None,
-    ) -> ResourceList:
+    ) -> ResourceList | CompactPage:
         """List resources inside a specific folder using limit/offset pagination."""
         folder_key = _resolve_key(folder_key)
         path = f"{self._resource_base(folder_key)}/"
         data = self.request("GET", path, params=params)
-        return ResourceList.model_validate(data)
+        return self._validate_page(ResourceList, data)
+
+    def iter_resources(
+        self,
+        folder_key: FolderRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[ResourceSummary | CompactResourceSummary]:
+        """Iterate over all resources in a folder.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            folder_key: Unique identifier of the folder.
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        folder_key = _resolve_key(folder_key)
+        return _iterate_pages(
+            lambda query: self.list_resources(folder_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
+
+    def scan_resources(
+        self,
+        folder_key: FolderRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int = 100,
+        max_concurrency: int = 5,
+        ordered: bool = True,
+    ) -> Iterator[ResourceSummary | CompactResourceSummary]:
+        """Scan every resource in a folder with concurrent page requests.
+
+        Reads ``count`` from the first page, then fetches the remaining
+        offset windows in parallel. Suited to full-folder exports where
+        :meth:`iter_resources` would be bound by round-trip latency.
+
+        Args:
+            folder_key: Unique identifier of the folder.
+            params: Optional query parameters applied to every page.
+            page_size: Number of resources requested per window (default 100).
+            max_concurrency: Maximum number of page requests in flight
+                (default 5).
+            ordered: Yield resources in offset order (default ``True``).
+                If ``False``, pages are yielded as soon as they arrive.
+        """
+        folder_key = _resolve_key(folder_key)
+        return _scan_offset_pages(
+            lambda query: self.list_resources(folder_key, params=query),
+            params,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
 
     def get_resource(
         self, folder_key: FolderRef, resource_key: ResourceRef
@@ -2030,6 +4144,95 @@ class ManagementClient(_ManagementPathsMixin):
         data = self.request("GET", path)
         return ResourceSummary.model_validate(data)
 
+    def get_payload_validator(
+        self,
+        folder_key: FolderRef,
+        *,
+        component: ComponentRef | None = None,
+        refresh: bool = False,
+    ) -> PayloadValidator:
+        """
+        Return the compiled validator for a folder's or component's schema.
+
+        The schema is taken from the current version, i.e. the published,
+        non-archived version with the highest number. Its ``json_schema`` is
+        used when the API provides one; otherwise a schema is built from the
+        version's fields. Validators are compiled once and kept on the client
+        until ``refresh=True`` is passed or a new version is published
+        through this client.
+
+        Args:
+            folder_key: Folder whose schema payloads must match.
+            component: Optional component key for component-based folders;
+                its schema is used instead of the folder's.
+            refresh: Reload and recompile the schema.
+        """
+        folder_key = _resolve_key(folder_key)
+        component = _resolve_key(component) if component is not None else None
+        kind, key = ("component", component) if component else ("folder", folder_key)
+        validator = self._payload_validators.get((kind, key))
+        if validator is not None and not refresh:
+            return validator
+        # Concurrent batch workers wait for one load instead of each
+        # fetching the same schema.
+        with self._validator_locks_guard:
+            lock = self._validator_locks.setdefault((kind, key), threading.Lock())
+        with lock:
+            validator = self._payload_validators.get((kind, key))
+            if validator is None or refresh:
+                validator = self._load_payload_validator(kind, key)
+                self._payload_validators[(kind, key)] = validator
+        return validator
+
+    def _load_payload_validator(self, kind: str, key: str) -> PayloadValidator:
+        endpoints = self._schema_endpoints(kind)
+        version = current_schema_version(endpoints.iter_versions(key))
+        if version is None:
+            raise FoxnoseError(f"{kind.capitalize()} {key!r} has no published schema")
+        schema = version.json_schema
+        if schema is None:
+            schema = endpoints.get_version(
+                key, version.key, include_schema=True
+            ).json_schema
+        if schema is None:
+            schema = schema_from_fields(endpoints.iter_fields(key, version.key))
+        return PayloadValidator(schema)
+
+    def validate_payload(
+        self,
+        folder_key: FolderRef,
+        payload: Mapping[str, Any],
+        *,
+        component: ComponentRef | None = None,
+    ) -> list[ValidationIssue]:
+        """
+        Check a create/upsert payload against the current schema locally.
+
+        Only the first call per folder or component reaches the API (to load
+        the schema); afterwards validation is pure Python. A payload wrapped
+        as ``{"data": {...}}`` is checked by its ``data`` object.
+
+        Args:
+            folder_key: Target folder key.
+            payload: Payload as it would be sent to :meth:`create_resource`.
+            component: Optional component key for component-based folders.
+
+        Returns:
+            Every issue found; an empty list means the payload is valid.
+        """
+        validator = self.get_payload_validator(folder_key, component=component)
+        return validator.validate(resource_data(payload, validator))
+
+    def _preflight(
+        self,
+        folder_key: str,
+        payload: Mapping[str, Any],
+        component: str | None,
+        external_id: str | None = None,
+    ) -> None:
+        validator = self.get_payload_validator(folder_key, component=component)
+        self._check_payload(validator, payload, folder_key, component, external_id)
+
     def create_resource(
         self,
         folder_key: FolderRef,
@@ -2037,6 +4240,7 @@ class ManagementClient(_ManagementPathsMixin):
         *,
         component: ComponentRef | None = None,
         external_id: str | None = None,
+        validate: bool = False,
     ) -> ResourceSummary:
         """
         Create a new resource.
@@ -2046,9 +4250,14 @@ class ManagementClient(_ManagementPathsMixin):
             payload: JSON payload that matches the folder/component schema.
             component: Optional component key for component-based folders.
             external_id: Optional external identifier for the resource.
+            validate: Check the payload with :meth:`validate_payload` first
+                and raise :class:`FoxnoseValidationError` instead of sending
+                an invalid request.
         """
         folder_key = _resolve_key(folder_key)
         component = _resolve_key(component) if component is not None else None
+        if validate:
+            self._preflight(folder_key, payload, component, external_id)
 
         params = {"component": component} if component else None
         body: dict[str, Any] = dict(payload)
@@ -2069,6 +4278,8 @@ class ManagementClient(_ManagementPathsMixin):
         *,
         external_id: str,
         component: ComponentRef | None = None,
+        hash_store: ResourceHashStore | None = None,
+        validate: bool = False,
     ) -> ResourceSummary:
         """
         Create or update a resource by external_id.
@@ -2082,9 +4293,37 @@ class ManagementClient(_ManagementPathsMixin):
             payload: JSON payload matching the folder/component schema.
             external_id: External identifier for the resource (required).
             component: Optional component key for component-based folders.
+            hash_store: Optional :class:`ResourceHashStore`. If the payload
+                hashes to the digest recorded for the last upload, no request
+                is sent and the stored resource is returned.
+            validate: Check the payload against the current schema first and
+                raise :class:`FoxnoseValidationError` if it does not match.
         """
         folder_key = _resolve_key(folder_key)
         component = _resolve_key(component) if component is not None else None
+        resource, _ = self._upsert_resource(
+            folder_key, payload, external_id, component, hash_store, validate
+        )
+        return resource
+
+    def _upsert_resource(
+        self,
+        folder_key: str,
+        payload: Mapping[str, Any],
+        external_id: str,
+        component: str | None,
+        hash_store: ResourceHashStore | None,
+        validate: bool = False,
+    ) -> tuple[ResourceSummary, bool]:
+        """Upsert one resource, returning it and whether it was skipped."""
+        if validate:
+            self._preflight(folder_key, payload, component, external_id)
+        digest = ""
+        if hash_store is not None:
+            digest = payload_hash(payload, component)
+            stored = hash_store.lookup(folder_key, external_id, digest)
+            if stored is not None:
+                return stored, True
         params: dict[str, str] = {"external_id": external_id}
         if component:
             params["component"] = component
@@ -2094,16 +4333,144 @@ class ManagementClient(_ManagementPathsMixin):
             params=params,
             json_body=payload,
         )
-        return ResourceSummary.model_validate(data)
+        resource = ResourceSummary.model_validate(data)
+        if hash_store is not None:
+            hash_store.put(folder_key, external_id, digest, resource)
+        return resource, False
+
+    def seed_hash_store(
+        self,
+        folder_key: FolderRef,
+        hash_store: ResourceHashStore,
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+    ) -> int:
+        """
+        Fill a hash store from the published data of a folder's resources.
+
+        Every resource with an ``external_id`` is listed and its published
+        data is fetched and hashed, so the first sync run can already skip
+        unchanged items. Resources without a published revision are left out.
+        Returns the number of entries written.
+
+        Args:
+            folder_key: Folder to read.
+            hash_store: Store to fill.
+            max_concurrency: Maximum number of data requests in flight.
+        """
+        folder_key = _resolve_key(folder_key)
+        resources = (
+            resource
+            for resource in self.iter_resources(folder_key)
+            if resource.external_id
+        )
+        outcomes = bounded_map(
+            lambda resource: self.get_resource_data(folder_key, resource.key),
+            resources,
+            max_concurrency=max_concurrency,
+        )
+        seeded = 0
+        with contextlib.closing(outcomes):
+            for outcome in outcomes:
+                if outcome.error is not None:
+                    if _is_not_found(outcome.error):
+                        continue
+                    raise outcome.error
+                resource = outcome.item
+                digest = payload_hash(outcome.result, resource.component)
+                hash_store.put(
+                    folder_key,
+                    resource.external_id,
+                    digest,
+                    _stored_summary(resource),
+                )
+                seeded += 1
+        return seeded
+
+    def stream_upsert_resources(
+        self,
+        folder_key: FolderRef,
+        items: Iterable[BatchUpsertItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = False,
+        hash_store: ResourceHashStore | None = None,
+        journal: BatchJournal | None = None,
+        validate: bool = False,
+    ) -> Iterator[BatchItemResult]:
+        """
+        Upsert resources from any iterable, yielding each outcome as it completes.
+
+        Items are pulled lazily and at most ``max_concurrency`` upserts are in
+        flight at a time, so generators of arbitrary length can be imported in
+        constant memory. Failures are reported as :class:`BatchItemResult`
+        entries with ``exception`` set instead of being raised.
+
+        Args:
+            folder_key: Target folder key (shared across all items).
+            items: Iterable of :class:`BatchUpsertItem` to upsert.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter that tunes it from latency, errors and 429s.
+            ordered: Yield results in input order instead of completion order.
+            hash_store: Optional :class:`ResourceHashStore`; unchanged items
+                are reported with ``skipped=True`` and no request is sent.
+            journal: Optional :class:`BatchJournal`. Outcomes are appended to
+                it, and items it already records as done are skipped.
+            validate: Check each payload against the current schema before
+                sending it. Invalid items fail with
+                :class:`FoxnoseValidationError` and cost no request.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._stream_upsert(
+            folder_key, items, max_concurrency, ordered, hash_store, journal, validate
+        )
+
+    def _stream_upsert(
+        self,
+        folder_key: str,
+        items: Iterable[BatchUpsertItem],
+        max_concurrency: ConcurrencyLimit,
+        ordered: bool,
+        hash_store: ResourceHashStore | None,
+        journal: BatchJournal | None,
+        validate: bool = False,
+    ) -> Generator[BatchItemResult, None, None]:
+        if journal is not None:
+            journal.bind(folder_key)
+
+        def upsert(item: BatchUpsertItem) -> Any:
+            # Skipped items cost no request, so they are kept out of an
+            # adaptive limiter's latency signal.
+            if journal is not None and journal.is_done(item.external_id):
+                return Unmetered((None, True))
+            outcome = self._upsert_resource(
+                folder_key,
+                item.payload,
+                item.external_id,
+                item.component,
+                hash_store,
+                validate,
+            )
+            return Unmetered(outcome) if outcome[1] else outcome
+
+        outcomes = bounded_map(
+            upsert, items, max_concurrency=max_concurrency, ordered=ordered
+        )
+        return _batch_item_results(outcomes, journal)
 
     def batch_upsert_resources(
         self,
         folder_key: FolderRef,
         items: Sequence[BatchUpsertItem],
         *,
-        max_concurrency: int = 5,
+        max_concurrency: ConcurrencyLimit = 5,
         fail_fast: bool = False,
         on_progress: Callable[[int, int], None] | None = None,
+        collect_results: bool = True,
+        hash_store: ResourceHashStore | None = None,
+        journal: BatchJournal | None = None,
+        validate: bool = False,
     ) -> BatchUpsertResult:
         """
         Upsert multiple resources concurrently using threads.
@@ -2115,13 +4482,27 @@ class ManagementClient(_ManagementPathsMixin):
         Args:
             folder_key: Target folder key (shared across all items).
             items: Sequence of :class:`BatchUpsertItem` to upsert.
-            max_concurrency: Maximum number of parallel workers (default 5).
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter that tunes it from latency, errors and 429s.
             fail_fast: If ``True``, stop on first error and raise it.
                 If ``False`` (default), collect all results.
             on_progress: Optional callback invoked as
                 ``(completed_count, total_count)`` after each item finishes.
+            collect_results: If ``False``, successful resources are counted
+                in ``omitted_count`` instead of being kept in ``succeeded``.
+            hash_store: Optional :class:`ResourceHashStore`. Items whose
+                payload is unchanged since the last upload are not sent and
+                are counted in ``skipped_count``.
+            journal: Optional :class:`BatchJournal` that records every
+                outcome durably. Rerunning with the same journal skips items
+                it already records as done (counted in ``skipped_count``).
+            validate: Check each payload against the current folder or
+                component schema before sending it. Invalid items are
+                reported in ``failed`` with a :class:`FoxnoseValidationError`
+                and cost no request.
         """
-        if max_concurrency < 1:
+        if isinstance(max_concurrency, int) and max_concurrency < 1:
             raise ValueError("max_concurrency must be at least 1")
         folder_key = _resolve_key(folder_key)
         total = len(items)
@@ -2130,72 +4511,337 @@ class ManagementClient(_ManagementPathsMixin):
 
         succeeded: list[ResourceSummary] = []
         failed: list[BatchItemError] = []
+        omitted = 0
+        skipped = 0
         completed = 0
 
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=max_concurrency,
-        ) as executor:
-            future_to_item: dict[
-                concurrent.futures.Future[ResourceSummary],
-                tuple[int, BatchUpsertItem],
-            ] = {
-                executor.submit(
-                    self.upsert_resource,
-                    folder_key,
-                    item.payload,
-                    external_id=item.external_id,
-                    component=item.component,
-                ): (idx, item)
-                for idx, item in enumerate(items)
-            }
-
-            for future in concurrent.futures.as_completed(future_to_item):
-                idx, item = future_to_item[future]
-                try:
-                    result = future.result()
-                    succeeded.append(result)
-                except Exception as exc:
-                    if fail_fast:
-                        # Cancel remaining futures and propagate.
-                        for f in future_to_item:
-                            f.cancel()
-                        raise
+        if validate:
+            # Load each schema once up front instead of once per worker.
+            for component in {item.component for item in items}:
+                self.get_payload_validator(folder_key, component=component)
+        results = self._stream_upsert(
+            folder_key, items, max_concurrency, False, hash_store, journal, validate
+        )
+        with contextlib.closing(results):
+            for outcome in results:
+                if outcome.skipped:
+                    skipped += 1
+                elif outcome.exception is None:
+                    if collect_results:
+                        succeeded.append(outcome.resource)
+                    else:
+                        omitted += 1
+                elif not fail_fast:
                     failed.append(
                         BatchItemError(
-                            index=idx,
-                            external_id=item.external_id,
-                            exception=exc,
+                            index=outcome.index,
+                            external_id=outcome.external_id,
+                            exception=outcome.exception,
                         )
                     )
-                finally:
-                    completed += 1
-                    if on_progress is not None:
-                        try:
-                            on_progress(completed, total)
-                        except Exception:
-                            pass
+                completed += 1
+                _report(on_progress, completed, total)
+                if fail_fast and outcome.exception is not None:
+                    # Closing the stream cancels the items still queued.
+                    raise outcome.exception
 
-        return BatchUpsertResult(succeeded=succeeded, failed=failed)
+        return BatchUpsertResult(
+            succeeded=succeeded,
+            failed=failed,
+            omitted_count=omitted,
+            skipped_count=skipped,
+        )
 
+    @overload
     def update_resource(
         self,
         folder_key: FolderRef,
         resource_key: ResourceRef,
         payload: Mapping[str, Any],
-    ) -> ResourceSummary:
-        """Update a resource by creating a new revision payload."""
-        folder_key = _resolve_key(folder_key)
+        *,
+        refetch: Literal[True] = ...,
+    ) -> ResourceSummary: ...
+
+    @overload
+    def update_resource(
+        self,
+        folder_key: FolderRef,
+        resource_key: ResourceRef,
+        payload: Mapping[str, Any],
+        *,
+        refetch: bool,
+    ) -> ResourceSummary | None: ...
+
+    def update_resource(
+        self,
+        folder_key: FolderRef,
+        resource_key: ResourceRef,
+        payload: Mapping[str, Any],
+        *,
+        refetch: bool = True,
+    ) -> ResourceSummary | None:
+        """Update a resource by creating a new revision payload.
+
+        When the API returns the updated resource in the PUT response it is
+        used directly and only one request is sent. Otherwise the resource is
+        fetched with :meth:`get_resource`, unless ``refetch`` is ``False``.
+
+        Args:
+            folder_key: Unique identifier of the folder.
+            resource_key: Unique identifier of the resource.
+            payload: New resource data.
+            refetch: Fetch the resource if the PUT response does not contain
+                it (default ``True``). With ``False`` the method returns
+                ``None`` in that case instead of sending a second request.
+        """
+        folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         path = f"{self._resource_base(folder_key)}/{resource_key}/"
-        self.request("PUT", path, json_body=payload, parse_json=False)
-        return self.get_resource(folder_key, resource_key)
+        resource = _updated_resource(self.request("PUT", path, json_body=payload))
+        if resource is None and refetch:
+            return self.get_resource(folder_key, resource_key)
+        return resource
+
+    def stream_update_resources(
+        self,
+        folder_key: FolderRef,
+        items: Iterable[BatchUpdateItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = False,
+        refetch: bool = False,
+    ) -> Iterator[BatchOperationOutcome]:
+        """
+        Update resources from any iterable, yielding each outcome as it completes.
+
+        Each outcome's ``result`` is the updated :class:`ResourceSummary`
+        when the PUT response contains it, otherwise ``None``.
+
+        Args:
+            folder_key: Folder the resources belong to.
+            items: Iterable of :class:`BatchUpdateItem` to apply.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter.
+            ordered: Yield results in input order instead of completion order.
+            refetch: Fetch each resource after its update when the response
+                does not contain it. Defaults to ``False`` so every item costs
+                a single request.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._stream_operation(
+            lambda item: self.update_resource(
+                folder_key, item.key, item.payload, refetch=refetch
+            ),
+            items,
+            _update_pair,
+            max_concurrency,
+            ordered,
+        )
+
+    def batch_update_resources(
+        self,
+        folder_key: FolderRef,
+        items: Sequence[BatchUpdateItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        fail_fast: bool = False,
+        on_progress: Callable[[int, int], None] | None = None,
+        collect_results: bool = True,
+        refetch: bool = False,
+    ) -> BatchOperationResult:
+        """
+        Update multiple resources concurrently using threads.
+
+        Args:
+            folder_key: Folder the resources belong to.
+            items: Sequence of :class:`BatchUpdateItem` to apply.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter.
+            fail_fast: If ``True``, stop on first error and raise it.
+                If ``False`` (default), collect all results.
+            on_progress: Optional callback invoked as
+                ``(completed_count, total_count)`` after each item finishes.
+            collect_results: If ``False``, successful outcomes are counted
+                in ``omitted_count`` instead of being kept in ``succeeded``.
+            refetch: Fetch each resource after its update when the response
+                does not contain it. Defaults to ``False`` so every item costs
+                a single request.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._batch_operation(
+            lambda item: self.update_resource(
+                folder_key, item.key, item.payload, refetch=refetch
+            ),
+            items,
+            _update_pair,
+            max_concurrency,
+            fail_fast,
+            on_progress,
+            collect_results,
+        )
+
+    def delete_resource(
+        self,
+        folder_key: FolderRef,
+        resource_key: ResourceRef,
+        *,
+        hash_store: ResourceHashStore | None = None,
+    ) -> None:
+        """Delete a resource.
 
-    def delete_resource(self, folder_key: FolderRef, resource_key: ResourceRef) -> None:
-        """Delete a resource."""
+        Args:
+            folder_key: Folder the resource belongs to.
+            resource_key: Resource key or summary.
+            hash_store: Optional :class:`ResourceHashStore` whose entry for
+                the resource is discarded, so a later upsert of the same
+                payload recreates it instead of being skipped.
+        """
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         path = f"{self._resource_base(folder_key)}/{resource_key}/"
         self.request("DELETE", path, parse_json=False)
+        if hash_store is not None:
+            hash_store.discard_resource(folder_key, resource_key)
+
+    def stream_delete_resources(
+        self,
+        folder_key: FolderRef,
+        resource_keys: Iterable[ResourceRef],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = False,
+        missing_ok: bool = False,
+        hash_store: ResourceHashStore | None = None,
+    ) -> Iterator[BatchOperationOutcome]:
+        """
+        Delete resources from any iterable, yielding each outcome as it completes.
+
+        Keys are pulled lazily and at most ``max_concurrency`` deletes are in
+        flight at a time. Failures are reported as
+        :class:`BatchOperationOutcome` entries with ``exception`` set instead
+        of being raised.
+
+        Args:
+            folder_key: Folder the resources belong to.
+            resource_keys: Iterable of resource keys or summaries.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter.
+            ordered: Yield results in input order instead of completion order.
+            missing_ok: Treat resources that no longer exist (404) as deleted,
+                so an interrupted cleanup can simply be rerun.
+            hash_store: Optional :class:`ResourceHashStore` whose entries for
+                the deleted resources are discarded.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._stream_operation(
+            self._resource_deleter(folder_key, missing_ok, hash_store),
+            resource_keys,
+            _resource_pair,
+            max_concurrency,
+            ordered,
+        )
+
+    def batch_delete_resources(
+        self,
+        folder_key: FolderRef,
+        resource_keys: Sequence[ResourceRef],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        fail_fast: bool = False,
+        on_progress: Callable[[int, int], None] | None = None,
+        collect_results: bool = True,
+        missing_ok: bool = False,
+        hash_store: ResourceHashStore | None = None,
+    ) -> BatchOperationResult:
+        """
+        Delete multiple resources concurrently using threads.
+
+        Args:
+            folder_key: Folder the resources belong to.
+            resource_keys: Sequence of resource keys or summaries.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter.
+            fail_fast: If ``True``, stop on first error and raise it.
+                If ``False`` (default), collect all results.
+            on_progress: Optional callback invoked as
+                ``(completed_count, total_count)`` after each item finishes.
+            collect_results: If ``False``, successful outcomes are counted
+                in ``omitted_count`` instead of being kept in ``succeeded``.
+            missing_ok: Treat resources that no longer exist (404) as deleted.
+            hash_store: Optional :class:`ResourceHashStore` whose entries for
+                the deleted resources are discarded.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._batch_operation(
+            self._resource_deleter(folder_key, missing_ok, hash_store),
+            resource_keys,
+            _resource_pair,
+            max_concurrency,
+            fail_fast,
+            on_progress,
+            collect_results,
+        )
+
+    def _resource_deleter(
+        self,
+        folder_key: str,
+        missing_ok: bool,
+        hash_store: ResourceHashStore | None = None,
+    ) -> Callable[[ResourceRef], None]:
+        def delete(resource_key: ResourceRef) -> None:
+            try:
+                self.delete_resource(folder_key, resource_key, hash_store=hash_store)
+            except FoxnoseAPIError as exc:
+                if not (missing_ok and _is_not_found(exc)):
+                    raise
+                if hash_store is not None:
+                    hash_store.discard_resource(folder_key, _resolve_key(resource_key))
+
+        return delete
+
+    def _stream_operation(
+        self,
+        operation: Callable[[Any], Any],
+        items: Iterable[Any],
+        pair: Callable[[Any], tuple[str | None, str]],
+        max_concurrency: ConcurrencyLimit,
+        ordered: bool,
+    ) -> Generator[BatchOperationOutcome, None, None]:
+        outcomes = bounded_map(
+            operation,
+            items,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+        return _operation_outcomes(outcomes, pair)
+
+    def _batch_operation(
+        self,
+        operation: Callable[[Any], Any],
+        items: Sequence[Any],
+        pair: Callable[[Any], tuple[str | None, str]],
+        max_concurrency: ConcurrencyLimit,
+        fail_fast: bool,
+        on_progress: Callable[[int, int], None] | None,
+        collect_results: bool,
+    ) -> BatchOperationResult:
+        if isinstance(max_concurrency, int) and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        tally = _OperationTally(len(items), fail_fast, on_progress, collect_results)
+        if not items:
+            return tally.result()
+        outcomes = self._stream_operation(
+            operation, items, pair, max_concurrency, False
+        )
+        with contextlib.closing(outcomes):
+            for outcome in outcomes:
+                # With fail_fast this raises; closing the stream cancels the rest.
+                tally.add(outcome)
+        return tally.result()
 
     def get_resource_data(
         self, folder_key: FolderRef, resource_key: ResourceRef
@@ -2206,13 +4852,65 @@ class ManagementClient(_ManagementPathsMixin):
         path = f"{self._resource_base(folder_key)}/{resource_key}/data/"
         return self.request("GET", path)
 
+    def get_resources_data_many(
+        self,
+        folder_key: FolderRef,
+        resource_keys: Iterable[ResourceRef],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = True,
+        on_error: Callable[[str, Exception], None] | None = None,
+        retries: int = 2,
+        retry_backoff: float = 1.0,
+    ) -> DataFetch:
+        """
+        Fetch the published data of many resources concurrently.
+
+        Keys are pulled lazily and at most ``max_concurrency`` requests are in
+        flight at a time. Retryable failures (429, 5xx, timeouts) are retried
+        by the transport according to the client's ``retry_config`` first,
+        then up to ``retries`` more times for the item. Items that still fail
+        do not abort the iteration; they are collected in
+        :attr:`DataFetch.failed`.
+
+        Args:
+            folder_key: Folder the resources belong to.
+            resource_keys: Iterable of resource keys or summaries.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter.
+            ordered: Yield pairs in input order (default) instead of
+                completion order.
+            on_error: Optional callback invoked as ``(resource_key, exception)``
+                for each item that still fails.
+            retries: Item-level retries after the transport gives up on a
+                retryable error (default 2).
+            retry_backoff: Delay before the first item-level retry, in
+                seconds; it doubles on each further retry (default 1.0).
+
+        Yields:
+            ``(resource_key, data)`` pairs.
+        """
+        folder_key = _resolve_key(folder_key)
+        outcomes = bounded_map(
+            lambda item: _fetch_retrying(
+                lambda: self.get_resource_data(folder_key, _resolve_key(item)),
+                retries,
+                retry_backoff,
+            ),
+            resource_keys,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+        return DataFetch(outcomes, _resource_pair, on_error)
+
     def list_revisions(
         self,
         folder_key: FolderRef,
         resource_key: ResourceRef,
         *,
         params: Mapping[str, Any] | None = None,
-    ) -> RevisionList:
+    ) -> RevisionList | CompactPage:
         """List all revisions for a resource.
 
         Args:
@@ -2224,7 +4922,40 @@ class ManagementClient(_ManagementPathsMixin):
         resource_key = _resolve_key(resource_key)
         path = f"{self._revision_base(folder_key, resource_key)}/"
         data = self.request("GET", path, params=params)
-        return RevisionList.model_validate(data)
+        return self._validate_page(RevisionList, data)
+
+    def iter_revisions(
+        self,
+        folder_key: FolderRef,
+        resource_key: ResourceRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[RevisionSummary | CompactRevisionSummary]:
+        """Iterate over all revisions of a resource.
+
+        Follows ``next`` links transparently and prefetches the next page
+        while the current one is consumed.
+
+        Args:
+            folder_key: Unique identifier of the folder.
+            resource_key: Unique identifier of the resource.
+            params: Optional query parameters applied to every page.
+            page_size: Optional page size hint sent as ``limit``.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page in the background (default ``True``).
+        """
+        folder_key = _resolve_key(folder_key)
+        resource_key = _resolve_key(resource_key)
+        return _iterate_pages(
+            lambda query: self.list_revisions(folder_key, resource_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     def create_revision(
         self,
@@ -2262,7 +4993,10 @@ class ManagementClient(_ManagementPathsMixin):
         resource_key = _resolve_key(resource_key)
         revision_key = _resolve_key(revision_key)
         path = f"{self._revision_base(folder_key, resource_key)}/{revision_key}/"
-        data = self.request("GET", path)
+        data = self._cache_lookup("revision", revision_key)
+        if data is None:
+            data = self.request("GET", path)
+            self._cache_revision(revision_key, data)
         return RevisionSummary.model_validate(data)
 
     def update_revision(
@@ -2283,6 +5017,7 @@ class ManagementClient(_ManagementPathsMixin):
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         revision_key = _resolve_key(revision_key)
+        self._forget_revision(revision_key)
         path = f"{self._revision_base(folder_key, resource_key)}/{revision_key}/"
         data = self.request("PUT", path, json_body=payload)
         return RevisionSummary.model_validate(data)
@@ -2303,6 +5038,7 @@ class ManagementClient(_ManagementPathsMixin):
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         revision_key = _resolve_key(revision_key)
+        self._forget_revision(revision_key)
         path = f"{self._revision_base(folder_key, resource_key)}/{revision_key}/"
         self.request("DELETE", path, parse_json=False)
 
@@ -2324,10 +5060,12 @@ class ManagementClient(_ManagementPathsMixin):
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         revision_key = _resolve_key(revision_key)
+        self._forget_revision(revision_key)
         path = (
             f"{self._revision_base(folder_key, resource_key)}/{revision_key}/publish/"
         )
         data = self.request("POST", path, json_body=payload)
+        self._cache_revision(revision_key, data)
         return RevisionSummary.model_validate(data)
 
     def validate_revision(
@@ -2354,6 +5092,160 @@ class ManagementClient(_ManagementPathsMixin):
         )
         return self.request("POST", path)
 
+    def stream_publish_revisions(
+        self,
+        folder_key: FolderRef,
+        revisions: Iterable[RevisionItem],
+        *,
+        payload: Mapping[str, Any] | None = None,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = False,
+    ) -> Iterator[BatchOperationOutcome]:
+        """
+        Publish revisions from any iterable, yielding each outcome as it completes.
+
+        Each outcome's ``result`` is the published :class:`RevisionSummary`.
+
+        Args:
+            folder_key: Folder the revisions belong to.
+            revisions: Iterable of :class:`RevisionSummary` objects or
+                ``(resource_key, revision_key)`` pairs.
+            payload: Optional publish configuration sent with every
+                revision.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter.
+            ordered: Yield results in input order instead of completion order.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._stream_operation(
+            lambda item: self.publish_revision(
+                folder_key, *_revision_pair(item), payload
+            ),
+            revisions,
+            _revision_pair,
+            max_concurrency,
+            ordered,
+        )
+
+    def batch_publish_revisions(
+        self,
+        folder_key: FolderRef,
+        revisions: Sequence[RevisionItem],
+        *,
+        payload: Mapping[str, Any] | None = None,
+        max_concurrency: ConcurrencyLimit = 5,
+        fail_fast: bool = False,
+        on_progress: Callable[[int, int], None] | None = None,
+        collect_results: bool = True,
+    ) -> BatchOperationResult:
+        """
+        Publish multiple revisions concurrently using threads.
+
+        Each succeeded outcome's ``result`` is the published :class:`RevisionSummary`.
+
+        Args:
+            folder_key: Folder the revisions belong to.
+            revisions: Sequence of :class:`RevisionSummary` objects or
+                ``(resource_key, revision_key)`` pairs.
+            payload: Optional publish configuration sent with every
+                revision.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter.
+            fail_fast: If ``True``, stop on first error and raise it.
+                If ``False`` (default), collect all results.
+            on_progress: Optional callback invoked as
+                ``(completed_count, total_count)`` after each item finishes.
+            collect_results: If ``False``, successful outcomes are counted
+                in ``omitted_count`` instead of being kept in ``succeeded``.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._batch_operation(
+            lambda item: self.publish_revision(
+                folder_key, *_revision_pair(item), payload
+            ),
+            revisions,
+            _revision_pair,
+            max_concurrency,
+            fail_fast,
+            on_progress,
+            collect_results,
+        )
+
+    def stream_validate_revisions(
+        self,
+        folder_key: FolderRef,
+        revisions: Iterable[RevisionItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = False,
+    ) -> Iterator[BatchOperationOutcome]:
+        """
+        Validate revisions from any iterable, yielding each outcome as it completes.
+
+        Each outcome's ``result`` is the validation report; a revision with validation errors still
+        counts as succeeded, only failed requests are reported as errors.
+
+        Args:
+            folder_key: Folder the revisions belong to.
+            revisions: Iterable of :class:`RevisionSummary` objects or
+                ``(resource_key, revision_key)`` pairs.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter.
+            ordered: Yield results in input order instead of completion order.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._stream_operation(
+            lambda item: self.validate_revision(folder_key, *_revision_pair(item)),
+            revisions,
+            _revision_pair,
+            max_concurrency,
+            ordered,
+        )
+
+    def batch_validate_revisions(
+        self,
+        folder_key: FolderRef,
+        revisions: Sequence[RevisionItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        fail_fast: bool = False,
+        on_progress: Callable[[int, int], None] | None = None,
+        collect_results: bool = True,
+    ) -> BatchOperationResult:
+        """
+        Validate multiple revisions concurrently using threads.
+
+        Each succeeded outcome's ``result`` is the validation report; a revision with validation errors still
+        counts as succeeded, only failed requests are reported as errors.
+
+        Args:
+            folder_key: Folder the revisions belong to.
+            revisions: Sequence of :class:`RevisionSummary` objects or
+                ``(resource_key, revision_key)`` pairs.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter.
+            fail_fast: If ``True``, stop on first error and raise it.
+                If ``False`` (default), collect all results.
+            on_progress: Optional callback invoked as
+                ``(completed_count, total_count)`` after each item finishes.
+            collect_results: If ``False``, successful outcomes are counted
+                in ``omitted_count`` instead of being kept in ``succeeded``.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._batch_operation(
+            lambda item: self.validate_revision(folder_key, *_revision_pair(item)),
+            revisions,
+            _revision_pair,
+            max_concurrency,
+            fail_fast,
+            on_progress,
+            collect_results,
+        )
+
     def get_revision_data(
         self,
         folder_key: FolderRef,
@@ -2371,7 +5263,61 @@ class ManagementClient(_ManagementPathsMixin):
         resource_key = _resolve_key(resource_key)
         revision_key = _resolve_key(revision_key)
         path = f"{self._revision_base(folder_key, resource_key)}/{revision_key}/data/"
-        return self.request("GET", path)
+        data = self._cache_lookup("revision_data", revision_key)
+        if data is None:
+            data = self.request("GET", path)
+            self._cache_store(
+                "revision_data", revision_key, data, self._revision_sealed(revision_key)
+            )
+        return data
+
+    def get_revisions_data_many(
+        self,
+        folder_key: FolderRef,
+        revisions: Iterable[RevisionItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = True,
+        on_error: Callable[[str, Exception], None] | None = None,
+        retries: int = 2,
+        retry_backoff: float = 1.0,
+    ) -> DataFetch:
+        """
+        Fetch the data of many revisions concurrently.
+
+        Behaves like :meth:`get_resources_data_many`.
+
+        Args:
+            folder_key: Folder the revisions belong to.
+            revisions: Iterable of :class:`RevisionSummary` objects or
+                ``(resource_key, revision_key)`` pairs.
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter.
+            ordered: Yield pairs in input order (default) instead of
+                completion order.
+            on_error: Optional callback invoked as ``(revision_key, exception)``
+                for each item that still fails.
+            retries: Item-level retries after the transport gives up on a
+                retryable error (default 2).
+            retry_backoff: Delay before the first item-level retry, in
+                seconds; it doubles on each further retry (default 1.0).
+
+        Yields:
+            ``(revision_key, data)`` pairs.
+        """
+        folder_key = _resolve_key(folder_key)
+        outcomes = bounded_map(
+            lambda item: _fetch_retrying(
+                lambda: self.get_revision_data(folder_key, *_revision_pair(item)),
+                retries,
+                retry_backoff,
+            ),
+            revisions,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+        return DataFetch(outcomes, _revision_pair, on_error)
 
     def close(self) -> None:
         """Close the HTTP transport and release resources."""
@@ -2390,10 +5336,23 @@ class AsyncManagementClient(_ManagementPathsMixin):
         timeout: float = 30.0,
         retry_config: RetryConfig | None = None,
         default_headers: Mapping[str, str] | None = None,
+        model_backend: str = "pydantic",
+        intern_strings: bool = True,
+        object_cache: ImmutableCache | None = None,
     ) -> None:
         if not environment_key:
             raise ValueError("environment_key must be provided")
+        if model_backend not in MODEL_BACKENDS:
+            raise ValueError(
+                f"model_backend must be one of {', '.join(MODEL_BACKENDS)}"
+            )
         self.environment_key = environment_key
+        self.model_backend = model_backend
+        self.intern_strings = intern_strings
+        self.object_cache = object_cache
+        self._folder_index: FolderIndex | None = None
+        self._payload_validators: dict[tuple[str, str], PayloadValidator] = {}
+        self._validator_locks: dict[tuple[str, str], asyncio.Lock] = {}
         config = FoxnoseConfig(
             base_url=base_url,
             timeout=timeout,
@@ -2422,6 +5381,31 @@ class AsyncManagementClient(_ManagementPathsMixin):
             parse_json=parse_json,
         )
 
+    def fan_out(
+        self,
+        calls: Callable[..., Awaitable[Any]] | Iterable[RequestSpec],
+        args: Iterable[Any] | None = None,
+        *,
+        max_concurrency: ConcurrencyLimit = 8,
+        ordered: bool = True,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> AsyncGenerator[Completed, None]:
+        """Run many client calls concurrently as tasks (see ``ManagementClient.fan_out``)."""
+        if args is None:
+            calls, args = self._send_spec, calls
+        return afan_out(
+            calls,
+            args,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            on_progress=on_progress,
+        )
+
+    async def _send_spec(self, spec: RequestSpec) -> Any:
+        return await self.request(
+            spec.method, spec.path, params=spec.params, json_body=spec.json_body
+        )
+
     # ------------------------------------------------------------------ #
     # Organization operations
     # ------------------------------------------------------------------ #
@@ -2430,7 +5414,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
         payload = await self.request("GET", "/organizations/") or []
         if not isinstance(payload, list):
             payload = [payload]
-        return [OrganizationSummary.model_validate(item) for item in payload]
+        return _ORGANIZATION_LIST_ADAPTER.validate_python(payload)
 
     async def get_organization(self, org_key: OrgRef) -> OrganizationSummary:
         org_key = _resolve_key(org_key)
@@ -2450,7 +5434,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
         payload = await self.request("GET", "/regions/") or []
         if not isinstance(payload, list):
             payload = [payload]
-        return [RegionInfo.model_validate(item) for item in payload]
+        return _REGION_LIST_ADAPTER.validate_python(payload)
 
     async def get_available_plans(self) -> OrganizationPlanStatus:
         data = await self.request("GET", "/plans/")
@@ -2485,7 +5469,24 @@ class AsyncManagementClient(_ManagementPathsMixin):
         data = await self.request(
             "GET", f"{self._management_api_keys_root()}/", params=params
         )
-        return ManagementAPIKeyList.model_validate(data)
+        return self._validate_page(ManagementAPIKeyList, data)
+
+    def iter_management_api_keys(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[ManagementAPIKeySummary]:
+        """Iterate over all Management API keys in the environment, following ``next`` links."""
+        return _aiterate_pages(
+            lambda query: self.list_management_api_keys(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def create_management_api_key(
         self, payload: Mapping[str, Any]
@@ -2523,7 +5524,24 @@ class AsyncManagementClient(_ManagementPathsMixin):
         data = await self.request(
             "GET", f"{self._flux_api_keys_root()}/", params=params
         )
-        return FluxAPIKeyList.model_validate(data)
+        return self._validate_page(FluxAPIKeyList, data)
+
+    def iter_flux_api_keys(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[FluxAPIKeySummary]:
+        """Iterate over all Flux API keys in the environment, following ``next`` links."""
+        return _aiterate_pages(
+            lambda query: self.list_flux_api_keys(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def create_flux_api_key(
         self, payload: Mapping[str, Any]
@@ -2559,7 +5577,24 @@ class AsyncManagementClient(_ManagementPathsMixin):
 
     async def list_apis(self, *, params: Mapping[str, Any] | None = None) -> APIList:
         data = await self.request("GET", f"{self._apis_root()}/", params=params)
-        return APIList.model_validate(data)
+        return self._validate_page(APIList, data)
+
+    def iter_apis(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[APIInfo]:
+        """Iterate over all APIs in the environment, following ``next`` links."""
+        return _aiterate_pages(
+            lambda query: self.list_apis(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def create_api(self, payload: Mapping[str, Any]) -> APIInfo:
         data = await self.request("POST", f"{self._apis_root()}/", json_body=payload)
@@ -2588,7 +5623,26 @@ class AsyncManagementClient(_ManagementPathsMixin):
         data = await self.request(
             "GET", f"{self._api_folders_root(api_key)}/", params=params
         )
-        return APIFolderList.model_validate(data)
+        return self._validate_page(APIFolderList, data)
+
+    def iter_api_folders(
+        self,
+        api_key: APIRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[APIFolderSummary]:
+        """Iterate over all folders exposed through an API, following ``next`` links."""
+        api_key = _resolve_key(api_key)
+        return _aiterate_pages(
+            lambda query: self.list_api_folders(api_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def add_api_folder(
         self,
@@ -2677,7 +5731,24 @@ class AsyncManagementClient(_ManagementPathsMixin):
         data = await self.request(
             "GET", f"{self._management_roles_root()}/", params=params
         )
-        return ManagementRoleList.model_validate(data)
+        return self._validate_page(ManagementRoleList, data)
+
+    def iter_management_roles(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[ManagementRoleSummary]:
+        """Iterate over all Management API roles in the environment, following ``next`` links."""
+        return _aiterate_pages(
+            lambda query: self.list_management_roles(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def create_management_role(
         self, payload: Mapping[str, Any]
@@ -2714,10 +5785,9 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> list[RolePermission]:
         role_key = _resolve_key(role_key)
         payload = await self.request("GET", f"{self._role_permissions_root(role_key)}/")
-        return [
-            RolePermission.model_validate(item)
-            for item in _coerce_list_payload(payload)
-        ]
+        return _ROLE_PERMISSION_LIST_ADAPTER.validate_python(
+            _coerce_list_payload(payload)
+        )
 
     async def upsert_management_role_permission(
         self,
@@ -2755,7 +5825,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
             )
             or []
         )
-        return [RolePermission.model_validate(item) for item in data]
+        return _ROLE_PERMISSION_LIST_ADAPTER.validate_python(data)
 
     async def list_management_permission_objects(
         self, role_key: ManagementRoleRef, *, content_type: str
@@ -2766,10 +5836,9 @@ class AsyncManagementClient(_ManagementPathsMixin):
             f"{self._role_permission_objects_root(role_key)}/",
             params={"content_type": content_type},
         )
-        return [
-            RolePermissionObject.model_validate(item)
-            for item in _coerce_list_payload(payload)
-        ]
+        return _PERMISSION_OBJECT_LIST_ADAPTER.validate_python(
+            _coerce_list_payload(payload)
+        )
 
     async def add_management_permission_object(
         self,
@@ -2803,7 +5872,24 @@ class AsyncManagementClient(_ManagementPathsMixin):
         self, *, params: Mapping[str, Any] | None = None
     ) -> FluxRoleList:
         data = await self.request("GET", f"{self._flux_roles_root()}/", params=params)
-        return FluxRoleList.model_validate(data)
+        return self._validate_page(FluxRoleList, data)
+
+    def iter_flux_roles(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[FluxRoleSummary]:
+        """Iterate over all Flux API roles in the environment, following ``next`` links."""
+        return _aiterate_pages(
+            lambda query: self.list_flux_roles(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def create_flux_role(self, payload: Mapping[str, Any]) -> FluxRoleSummary:
         data = await self.request(
@@ -2838,10 +5924,9 @@ class AsyncManagementClient(_ManagementPathsMixin):
         payload = await self.request(
             "GET", f"{self._flux_role_permissions_root(role_key)}/"
         )
-        return [
-            RolePermission.model_validate(item)
-            for item in _coerce_list_payload(payload)
-        ]
+        return _ROLE_PERMISSION_LIST_ADAPTER.validate_python(
+            _coerce_list_payload(payload)
+        )
 
     async def upsert_flux_role_permission(
         self, role_key: FluxRoleRef, payload: Mapping[str, Any]
@@ -2877,7 +5962,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
             )
             or []
         )
-        return [RolePermission.model_validate(item) for item in payload]
+        return _ROLE_PERMISSION_LIST_ADAPTER.validate_python(payload)
 
     async def list_flux_permission_objects(
         self, role_key: FluxRoleRef, *, content_type: str
@@ -2888,10 +5973,9 @@ class AsyncManagementClient(_ManagementPathsMixin):
             f"{self._flux_role_permission_objects_root(role_key)}/",
             params={"content_type": content_type},
         )
-        return [
-            RolePermissionObject.model_validate(item)
-            for item in _coerce_list_payload(payload)
-        ]
+        return _PERMISSION_OBJECT_LIST_ADAPTER.validate_python(
+            _coerce_list_payload(payload)
+        )
 
     async def add_flux_permission_object(
         self,
@@ -2921,37 +6005,150 @@ class AsyncManagementClient(_ManagementPathsMixin):
             parse_json=False,
         )
 
+    # ------------------------------------------------------------------ #
+    # Permission synchronization
+    # ------------------------------------------------------------------ #
+
+    async def sync_management_role_permissions(
+        self,
+        role_key: ManagementRoleRef,
+        permissions: Sequence[Mapping[str, Any]],
+        *,
+        prune: bool = True,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> PermissionSyncResult:
+        """Synchronize a Management API role's permissions with minimal calls."""
+        role_key = _resolve_key(role_key)
+        return await self._sync_permissions(
+            "management", role_key, permissions, prune, max_concurrency
+        )
+
+    async def sync_flux_role_permissions(
+        self,
+        role_key: FluxRoleRef,
+        permissions: Sequence[Mapping[str, Any]],
+        *,
+        prune: bool = True,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> PermissionSyncResult:
+        """Synchronize a Flux API role's permissions with minimal calls."""
+        role_key = _resolve_key(role_key)
+        return await self._sync_permissions(
+            "flux", role_key, permissions, prune, max_concurrency
+        )
+
+    async def _sync_permissions(
+        self,
+        kind: str,
+        role_key: str,
+        permissions: Sequence[Mapping[str, Any]],
+        prune: bool,
+        max_concurrency: ConcurrencyLimit,
+    ) -> PermissionSyncResult:
+        endpoints = self._permission_endpoints(kind)
+        current = await endpoints.list_permissions(role_key)
+        objects = _known_objects(current)
+        outcomes = abounded_map(
+            lambda content_type: endpoints.list_objects(
+                role_key, content_type=content_type
+            ),
+            _objects_to_fetch(current, permissions),
+            max_concurrency=max_concurrency,
+        )
+        try:
+            async for outcome in outcomes:
+                if outcome.error is not None:
+                    raise outcome.error
+                objects[outcome.item] = [o.object_key for o in outcome.result]
+        finally:
+            await outcomes.aclose()
+        changes, dependencies = plan_permission_changes(
+            current, objects, permissions, prune=prune
+        )
+        result = PermissionSyncResult(role=role_key)
+
+        async def run(change: PermissionChange) -> Any:
+            if change.action == "upsert":
+                return await endpoints.upsert_permission(role_key, change.payload)
+            if change.action == "delete":
+                return await endpoints.delete_permission(role_key, change.content_type)
+            if change.action == "add_object":
+                return await endpoints.add_object(role_key, change.payload)
+            return await endpoints.delete_object(role_key, change.payload)
+
+        outcomes = abounded_dag(
+            run, changes, dependencies, max_concurrency=max_concurrency
+        )
+        try:
+            _permission_result(changes, result, [o async for o in outcomes])
+        finally:
+            await outcomes.aclose()
+        return result
+
     # ------------------------------------------------------------------ #
     # Folder operations
     # ------------------------------------------------------------------ #
 
     async def list_folders(
         self, *, params: Mapping[str, Any] | None = None
-    ) -> FolderList:
+    ) -> FolderList | CompactPage:
         data = await self.request("GET", f"{self._folders_tree_root()}/", params=params)
-        return FolderList.model_validate(data)
+        return self._validate_page(FolderList, data)
+
+    def iter_folders(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[FolderSummary | CompactFolderSummary]:
+        """Iterate over all folders in the environment, following ``next`` links."""
+        return _aiterate_pages(
+            lambda query: self.list_folders(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
+
+    async def folder_index(self, *, refresh: bool = False) -> FolderIndex:
+        """Return the folder index, building it on first use (see ``ManagementClient.folder_index``)."""
+        if self._folder_index is None or refresh:
+            folders = [folder async for folder in self.iter_folders()]
+            if self._folder_index is None:
+                self._folder_index = FolderIndex(folders)
+            else:
+                self._folder_index.load(folders)
+        return self._folder_index
 
     async def get_folder(self, folder_key: FolderRef) -> FolderSummary:
         folder_key = _resolve_key(folder_key)
+        folder = self._indexed_folder(folder_key)
+        if folder is not None:
+            return folder
         data = await self.request(
             "GET", f"{self._folders_tree_item()}/", params={"key": folder_key}
         )
-        return FolderSummary.model_validate(data)
+        return self._index_folder(FolderSummary.model_validate(data))
 
     async def get_folder_by_path(self, path: str) -> FolderSummary:
+        folder = self._indexed_folder_by_path(path)
+        if folder is not None:
+            return folder
         data = await self.request(
             "GET",
             f"{self._folders_tree_item()}/",
             params={"path": path},
         )
-        return FolderSummary.model_validate(data)
+        return self._index_folder(FolderSummary.model_validate(data))
 
     async def list_folder_tree(
         self,
         *,
         key: str | None = None,
         mode: str | None = None,
-    ) -> FolderList:
+    ) -> FolderList | CompactPage:
         params: dict[str, Any] = {}
         if key:
             params["key"] = key
@@ -2960,13 +6157,13 @@ class AsyncManagementClient(_ManagementPathsMixin):
         data = await self.request(
             "GET", f"{self._folders_tree_root()}/", params=params or None
         )
-        return FolderList.model_validate(data)
+        return self._validate_page(FolderList, data)
 
     async def create_folder(self, payload: Mapping[str, Any]) -> FolderSummary:
         data = await self.request(
             "POST", f"{self._folders_tree_root()}/", json_body=payload
         )
-        return FolderSummary.model_validate(data)
+        return self._index_folder(FolderSummary.model_validate(data))
 
     async def update_folder(
         self, folder_key: FolderRef, payload: Mapping[str, Any]
@@ -2978,7 +6175,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
             params={"key": folder_key},
             json_body=payload,
         )
-        return FolderSummary.model_validate(data)
+        return self._index_folder(FolderSummary.model_validate(data))
 
     async def delete_folder(self, folder_key: FolderRef) -> None:
         folder_key = _resolve_key(folder_key)
@@ -2988,6 +6185,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
             params={"key": folder_key},
             parse_json=False,
         )
+        self._unindex_folder(folder_key)
 
     # ------------------------------------------------------------------ #
     # Component operations
@@ -2997,7 +6195,24 @@ class AsyncManagementClient(_ManagementPathsMixin):
         self, *, params: Mapping[str, Any] | None = None
     ) -> ComponentList:
         data = await self.request("GET", f"{self._components_root()}/", params=params)
-        return ComponentList.model_validate(data)
+        return self._validate_page(ComponentList, data)
+
+    def iter_components(
+        self,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[ComponentSummary]:
+        """Iterate over all reusable components in the environment, following ``next`` links."""
+        return _aiterate_pages(
+            lambda query: self.list_components(params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def get_component(self, component_key: ComponentRef) -> ComponentSummary:
         component_key = _resolve_key(component_key)
@@ -3037,15 +6252,34 @@ class AsyncManagementClient(_ManagementPathsMixin):
         data = await self.request(
             "GET", f"{self._component_versions_base(component_key)}/", params=params
         )
-        return SchemaVersionList.model_validate(data)
+        return self._validate_page(SchemaVersionList, data)
 
-    async def create_component_version(
+    def iter_component_versions(
         self,
         component_key: ComponentRef,
-        payload: Mapping[str, Any],
         *,
-        copy_from: SchemaVersionRef | None = None,
-    ) -> SchemaVersionSummary:
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[SchemaVersionSummary]:
+        """Iterate over all schema versions of a component, following ``next`` links."""
+        component_key = _resolve_key(component_key)
+        return _aiterate_pages(
+            lambda query: self.list_component_versions(component_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
+
+    async def create_component_version(
+        self,
+        component_key: ComponentRef,
+        payload: Mapping[str, Any],
+        *,
+        copy_from: SchemaVersionRef | None = None,
+    ) -> SchemaVersionSummary:
         component_key = _resolve_key(component_key)
         copy_from = _resolve_key(copy_from) if copy_from is not None else None
         params = {"copy_from": copy_from} if copy_from else None
@@ -3071,11 +6305,25 @@ class AsyncManagementClient(_ManagementPathsMixin):
             if include_schema is not None
             else None
         )
-        data = await self.request(
-            "GET",
-            f"{self._component_versions_base(component_key)}/{version_key}/",
-            params=params,
-        )
+        cache_key = f"{component_key}/{version_key}/{include_schema}"
+        data = self._cache_lookup("component_version", cache_key)
+        if data is None:
+            schema = self._frozen_schema(
+                "component_version", component_key, version_key, include_schema
+            )
+            if schema is not None:
+                # Only the metadata is refetched; the schema is known.
+                params = {"include_schema": "false"}
+            data = await self.request(
+                "GET",
+                f"{self._component_versions_base(component_key)}/{version_key}/",
+                params=params,
+            )
+            if schema is not None:
+                data["json_schema"] = schema
+            self._cache_version(
+                "component_version", component_key, version_key, include_schema, data
+            )
         return SchemaVersionSummary.model_validate(data)
 
     async def publish_component_version(
@@ -3085,6 +6333,9 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> SchemaVersionSummary:
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
+        self._forget_versions("component_version", component_key)
+        self._forget_payload_validator("component", component_key)
         data = await self.request(
             "POST",
             f"{self._component_versions_base(component_key)}/{version_key}/publish/",
@@ -3099,6 +6350,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> SchemaVersionSummary:
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
         data = await self.request(
             "PUT",
             f"{self._component_versions_base(component_key)}/{version_key}/",
@@ -3111,6 +6363,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> None:
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
         await self.request(
             "DELETE",
             f"{self._component_versions_base(component_key)}/{version_key}/",
@@ -3131,7 +6384,30 @@ class AsyncManagementClient(_ManagementPathsMixin):
             f"{self._component_schema_tree(component_key, version_key)}/",
             params=params,
         )
-        return FieldList.model_validate(data)
+        return self._validate_page(FieldList, data)
+
+    def iter_component_fields(
+        self,
+        component_key: ComponentRef,
+        version_key: SchemaVersionRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[FieldSummary]:
+        """Iterate over all fields in a component version's schema, following ``next`` links."""
+        component_key = _resolve_key(component_key)
+        version_key = _resolve_key(version_key)
+        return _aiterate_pages(
+            lambda query: self.list_component_fields(
+                component_key, version_key, params=query
+            ),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def create_component_field(
         self,
@@ -3141,6 +6417,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> FieldSummary:
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
         data = await self.request(
             "POST",
             f"{self._component_schema_tree(component_key, version_key)}/",
@@ -3172,6 +6449,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> FieldSummary:
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
         data = await self.request(
             "PUT",
             f"{self._component_schema_tree(component_key, version_key)}/field/",
@@ -3188,6 +6466,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> None:
         component_key = _resolve_key(component_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("component_version", component_key, version_key)
         await self.request(
             "DELETE",
             f"{self._component_schema_tree(component_key, version_key)}/field/",
@@ -3205,7 +6484,26 @@ class AsyncManagementClient(_ManagementPathsMixin):
         data = await self.request(
             "GET", f"{self._folder_versions_base(folder_key)}/", params=params
         )
-        return SchemaVersionList.model_validate(data)
+        return self._validate_page(SchemaVersionList, data)
+
+    def iter_folder_versions(
+        self,
+        folder_key: FolderRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[SchemaVersionSummary]:
+        """Iterate over all schema versions of a collection folder, following ``next`` links."""
+        folder_key = _resolve_key(folder_key)
+        return _aiterate_pages(
+            lambda query: self.list_folder_versions(folder_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def create_folder_version(
         self,
@@ -3239,11 +6537,25 @@ class AsyncManagementClient(_ManagementPathsMixin):
             if include_schema is not None
             else None
         )
-        data = await self.request(
-            "GET",
-            f"{self._folder_versions_base(folder_key)}/{version_key}/",
-            params=params,
-        )
+        cache_key = f"{folder_key}/{version_key}/{include_schema}"
+        data = self._cache_lookup("folder_version", cache_key)
+        if data is None:
+            schema = self._frozen_schema(
+                "folder_version", folder_key, version_key, include_schema
+            )
+            if schema is not None:
+                # Only the metadata is refetched; the schema is known.
+                params = {"include_schema": "false"}
+            data = await self.request(
+                "GET",
+                f"{self._folder_versions_base(folder_key)}/{version_key}/",
+                params=params,
+            )
+            if schema is not None:
+                data["json_schema"] = schema
+            self._cache_version(
+                "folder_version", folder_key, version_key, include_schema, data
+            )
         return SchemaVersionSummary.model_validate(data)
 
     async def update_folder_version(
@@ -3254,6 +6566,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> SchemaVersionSummary:
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
         data = await self.request(
             "PUT",
             f"{self._folder_versions_base(folder_key)}/{version_key}/",
@@ -3266,6 +6579,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> None:
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
         await self.request(
             "DELETE",
             f"{self._folder_versions_base(folder_key)}/{version_key}/",
@@ -3279,6 +6593,9 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> SchemaVersionSummary:
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
+        self._forget_versions("folder_version", folder_key)
+        self._forget_payload_validator("folder", folder_key)
         data = await self.request(
             "POST",
             f"{self._folder_versions_base(folder_key)}/{version_key}/publish/",
@@ -3299,7 +6616,30 @@ class AsyncManagementClient(_ManagementPathsMixin):
             f"{self._folder_schema_tree(folder_key, version_key)}/",
             params=params,
         )
-        return FieldList.model_validate(data)
+        return self._validate_page(FieldList, data)
+
+    def iter_folder_fields(
+        self,
+        folder_key: FolderRef,
+        version_key: SchemaVersionRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[FieldSummary]:
+        """Iterate over all fields in a folder schema version, following ``next`` links."""
+        folder_key = _resolve_key(folder_key)
+        version_key = _resolve_key(version_key)
+        return _aiterate_pages(
+            lambda query: self.list_folder_fields(
+                folder_key, version_key, params=query
+            ),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def create_folder_field(
         self,
@@ -3309,6 +6649,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> FieldSummary:
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
         data = await self.request(
             "POST",
             f"{self._folder_schema_tree(folder_key, version_key)}/",
@@ -3340,6 +6681,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> FieldSummary:
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
         data = await self.request(
             "PUT",
             f"{self._folder_schema_tree(folder_key, version_key)}/field/",
@@ -3353,6 +6695,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
     ) -> None:
         folder_key = _resolve_key(folder_key)
         version_key = _resolve_key(version_key)
+        self._forget_version("folder_version", folder_key, version_key)
         await self.request(
             "DELETE",
             f"{self._folder_schema_tree(folder_key, version_key)}/field/",
@@ -3360,6 +6703,273 @@ class AsyncManagementClient(_ManagementPathsMixin):
             parse_json=False,
         )
 
+    # ------------------------------------------------------------------ #
+    # Declarative schema operations
+    # ------------------------------------------------------------------ #
+
+    async def plan_folder_schema(
+        self,
+        folder_key: FolderRef,
+        fields: Sequence[Mapping[str, Any]],
+        *,
+        version: SchemaVersionRef | None = None,
+        prune: bool = True,
+    ) -> SchemaPlan:
+        """Compute the field changes needed to reach a declarative folder schema."""
+        folder_key = _resolve_key(folder_key)
+        baseline = await self._schema_baseline("folder", folder_key, version)
+        return plan_schema_changes(baseline.fields, fields, prune=prune)
+
+    async def apply_folder_schema(
+        self,
+        folder_key: FolderRef,
+        fields: Sequence[Mapping[str, Any]],
+        *,
+        version: SchemaVersionRef | None = None,
+        version_name: str | None = None,
+        publish: bool = False,
+        prune: bool = True,
+        max_concurrency: ConcurrencyLimit = 5,
+    ) -> SchemaApplyResult:
+        """Bring a folder's schema in line with a declarative field spec."""
+        folder_key = _resolve_key(folder_key)
+        return await self._apply_schema(
+            "folder",
+            folder_key,
+            fields,
+            version,
+            version_name,
+            publish,
+            prune,
+            max_concurrency,
+        )
+
+    async def plan_component_schema(
+        self,
+        component_key: ComponentRef,
+        fields: Sequence[Mapping[str, Any]],
+        *,
+        version: SchemaVersionRef | None = None,
+        prune: bool = True,
+    ) -> SchemaPlan:
+        """Compute the field changes needed to reach a declarative component schema."""
+        component_key = _resolve_key(component_key)
+        baseline = await self._schema_baseline("component", component_key, version)
+        return plan_schema_changes(baseline.fields, fields, prune=prune)
+
+    async def apply_component_schema(
+        self,
+        component_key: ComponentRef,
+        fields: Sequence[Mapping[str, Any]],
+        *,
+        version: SchemaVersionRef | None = None,
+        version_name: str | None = None,
+        publish: bool = False,
+        prune: bool = True,
+        max_concurrency: ConcurrencyLimit = 5,
+    ) -> SchemaApplyResult:
+        """Bring a component's schema in line with a declarative field spec."""
+        component_key = _resolve_key(component_key)
+        return await self._apply_schema(
+            "component",
+            component_key,
+            fields,
+            version,
+            version_name,
+            publish,
+            prune,
+            max_concurrency,
+        )
+
+    async def _schema_baseline(
+        self, kind: str, key: str, version: SchemaVersionRef | None
+    ) -> _SchemaBaseline:
+        endpoints = self._schema_endpoints(kind)
+        if version is not None:
+            version = _resolve_key(version)
+            fields = [field async for field in endpoints.iter_fields(key, version)]
+            return _SchemaBaseline(version, None, fields, 0)
+        versions = [item async for item in endpoints.iter_versions(key)]
+        draft, base, next_number = self._schema_target(versions)
+        source = draft or base
+        fields = (
+            [field async for field in endpoints.iter_fields(key, source.key)]
+            if source
+            else []
+        )
+        return _SchemaBaseline(draft.key if draft else None, base, fields, next_number)
+
+    async def _apply_schema(
+        self,
+        kind: str,
+        key: str,
+        fields: Sequence[Mapping[str, Any]],
+        version: SchemaVersionRef | None,
+        version_name: str | None,
+        publish: bool,
+        prune: bool,
+        max_concurrency: ConcurrencyLimit,
+    ) -> SchemaApplyResult:
+        endpoints = self._schema_endpoints(kind)
+        baseline = await self._schema_baseline(kind, key, version)
+        plan = plan_schema_changes(baseline.fields, fields, prune=prune)
+        result = SchemaApplyResult(version=baseline.version)
+        if result.version is None:
+            if not plan:
+                return result
+            created = await endpoints.create_version(
+                key,
+                {"name": version_name or f"Version {baseline.next_number}"},
+                copy_from=baseline.base.key if baseline.base else None,
+            )
+            result.version = created.key
+            result.created_version = True
+        version_key = result.version
+
+        async def run(change: SchemaChange) -> Any:
+            if change.action in ("delete", "replace"):
+                await endpoints.delete_field(key, version_key, change.path)
+            if change.action == "update":
+                return await endpoints.update_field(
+                    key, version_key, change.path, change.payload
+                )
+            if change.action == "delete":
+                return None
+            return await endpoints.create_field(key, version_key, change.payload)
+
+        outcomes = abounded_dag(
+            run, plan.changes, plan.dependencies, max_concurrency=max_concurrency
+        )
+        try:
+            _schema_result(plan, result, [outcome async for outcome in outcomes])
+        finally:
+            await outcomes.aclose()
+        if publish and not result.failed and not result.skipped:
+            await endpoints.publish_version(key, version_key)
+            result.published = True
+        return result
+
+    # ------------------------------------------------------------------ #
+    # Environment snapshots
+    # ------------------------------------------------------------------ #
+
+    async def export_snapshot(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> dict[str, Any]:
+        """Export the environment's configuration as a snapshot (see ``ManagementClient.export_snapshot``)."""
+        listings = self._snapshot_listings()
+
+        async def listing(name: str) -> list[dict[str, Any]]:
+            items = listings[name]()
+            if name == "locales":
+                items = await items
+            else:
+                items = [item async for item in items]
+            return dump_models(items, exclude=("secret_key",))
+
+        sections: dict[str, Any] = {}
+        outcomes = abounded_map(
+            listing, list(listings), max_concurrency=max_concurrency
+        )
+        try:
+            async for outcome in outcomes:
+                if outcome.error is not None:
+                    raise outcome.error
+                sections[outcome.item] = outcome.result
+        finally:
+            await outcomes.aclose()
+        snapshot = new_snapshot(self.environment_key, **sections)
+
+        outcomes = abounded_map(
+            lambda job: self._snapshot_detail(job[0], job[1]["key"]),
+            _snapshot_details(snapshot),
+            max_concurrency=max_concurrency,
+        )
+        try:
+            async for outcome in outcomes:
+                if outcome.error is not None:
+                    raise outcome.error
+                _store_snapshot_detail(*outcome.item, outcome.result)
+        finally:
+            await outcomes.aclose()
+        if path is not None:
+            write_snapshot(snapshot, path)
+        return snapshot
+
+    async def import_snapshot(
+        self,
+        snapshot: Mapping[str, Any] | str | os.PathLike[str],
+        *,
+        max_concurrency: ConcurrencyLimit = 8,
+    ) -> SnapshotImportResult:
+        """Recreate a snapshot's configuration in this environment (see ``ManagementClient.import_snapshot``)."""
+        if not isinstance(snapshot, Mapping):
+            snapshot = read_snapshot(snapshot)
+        existing = [locale.code for locale in await self.list_locales()]
+        steps, dependencies = plan_snapshot_import(snapshot, existing_locales=existing)
+        result = SnapshotImportResult()
+        outcomes = abounded_dag(
+            lambda step: self._import_snapshot_step(step, result.key_map),
+            steps,
+            dependencies,
+            max_concurrency=max_concurrency,
+        )
+        try:
+            _snapshot_result(steps, result, [outcome async for outcome in outcomes])
+        finally:
+            await outcomes.aclose()
+        return result
+
+    async def _snapshot_detail(self, kind: str, key: str) -> Any:
+        if kind in ("folder", "component"):
+            endpoints = self._schema_endpoints(kind)
+            try:
+                versions = [version async for version in endpoints.iter_versions(key)]
+            except FoxnoseAPIError as exc:
+                if _is_not_found(exc):
+                    return None
+                raise
+            version = current_schema_version(versions)
+            if version is None:
+                return None
+            fields = self._cache_lookup(f"{kind}_fields", f"{key}/{version.key}")
+            if fields is None:
+                fields = dump_models(
+                    [field async for field in endpoints.iter_fields(key, version.key)]
+                )
+                self._cache_store(
+                    f"{kind}_fields", f"{key}/{version.key}", fields, True
+                )
+            return {"version": version.name, "fields": fields}
+        if kind == "management_role":
+            return dump_models(await self.list_management_role_permissions(key))
+        if kind == "flux_role":
+            return dump_models(await self.list_flux_role_permissions(key))
+        folders = [folder async for folder in self.iter_api_folders(key)]
+        return dump_models(folders, exclude=("api", "path"))
+
+    async def _import_snapshot_step(
+        self, step: SnapshotStep, key_map: dict[str, str]
+    ) -> None:
+        write = self._snapshot_writer(step.kind)
+        payload = remap_keys(step.payload, key_map)
+        if step.kind in _SNAPSHOT_CREATES:
+            created = await write(payload)
+            if step.kind != "locale":
+                key_map[step.key] = created.key
+            return
+        target = key_map[step.key]
+        if step.kind == "api_folder":
+            folder = payload.pop("folder")
+            await write(target, folder, **payload)
+        elif step.kind.endswith("_schema"):
+            _raise_schema_failure(await write(target, payload, publish=True))
+        else:
+            await write(target, payload)
+
     async def list_projects(
         self, org_key: OrgRef, *, params: Mapping[str, Any] | None = None
     ) -> ProjectList:
@@ -3367,7 +6977,26 @@ class AsyncManagementClient(_ManagementPathsMixin):
         data = await self.request(
             "GET", f"{self._projects_base(org_key)}/", params=params
         )
-        return ProjectList.model_validate(data)
+        return self._validate_page(ProjectList, data)
+
+    def iter_projects(
+        self,
+        org_key: OrgRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[ProjectSummary]:
+        """Iterate over all projects in an organization, following ``next`` links."""
+        org_key = _resolve_key(org_key)
+        return _aiterate_pages(
+            lambda query: self.list_projects(org_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def get_project(
         self, org_key: OrgRef, project_key: ProjectRef
@@ -3527,7 +7156,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
 
     async def list_locales(self) -> LocaleList:
         payload = await self.request("GET", f"{self._locales_root()}/") or []
-        return [LocaleSummary.model_validate(item) for item in payload]
+        return _LOCALE_LIST_ADAPTER.validate_python(payload)
 
     async def create_locale(self, payload: Mapping[str, Any]) -> LocaleSummary:
         data = await self.request("POST", f"{self._locales_root()}/", json_body=payload)
@@ -3557,12 +7186,50 @@ class AsyncManagementClient(_ManagementPathsMixin):
         folder_key: FolderRef,
         *,
         params: Mapping[str, Any] | None = None,
-    ) -> ResourceList:
+    ) -> ResourceList | CompactPage:
         folder_key = _resolve_key(folder_key)
         data = await self.request(
             "GET", f"{self._resource_base(folder_key)}/", params=params
         )
-        return ResourceList.model_validate(data)
+        return self._validate_page(ResourceList, data)
+
+    def iter_resources(
+        self,
+        folder_key: FolderRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[ResourceSummary | CompactResourceSummary]:
+        """Iterate over all resources in a folder, following ``next`` links."""
+        folder_key = _resolve_key(folder_key)
+        return _aiterate_pages(
+            lambda query: self.list_resources(folder_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
+
+    def scan_resources(
+        self,
+        folder_key: FolderRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int = 100,
+        max_concurrency: int = 5,
+        ordered: bool = True,
+    ) -> AsyncIterator[ResourceSummary | CompactResourceSummary]:
+        """Scan every resource in a folder with concurrent page requests."""
+        folder_key = _resolve_key(folder_key)
+        return _ascan_offset_pages(
+            lambda query: self.list_resources(folder_key, params=query),
+            params,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
 
     async def get_resource(
         self, folder_key: FolderRef, resource_key: ResourceRef
@@ -3574,6 +7241,64 @@ class AsyncManagementClient(_ManagementPathsMixin):
         )
         return ResourceSummary.model_validate(data)
 
+    async def get_payload_validator(
+        self,
+        folder_key: FolderRef,
+        *,
+        component: ComponentRef | None = None,
+        refresh: bool = False,
+    ) -> PayloadValidator:
+        """Return the compiled validator for a folder's or component's current schema."""
+        folder_key = _resolve_key(folder_key)
+        component = _resolve_key(component) if component is not None else None
+        kind, key = ("component", component) if component else ("folder", folder_key)
+        validator = self._payload_validators.get((kind, key))
+        if validator is not None and not refresh:
+            return validator
+        lock = self._validator_locks.setdefault((kind, key), asyncio.Lock())
+        async with lock:
+            validator = self._payload_validators.get((kind, key))
+            if validator is None or refresh:
+                validator = await self._load_payload_validator(kind, key)
+                self._payload_validators[(kind, key)] = validator
+        return validator
+
+    async def _load_payload_validator(self, kind: str, key: str) -> PayloadValidator:
+        endpoints = self._schema_endpoints(kind)
+        versions = [item async for item in endpoints.iter_versions(key)]
+        version = current_schema_version(versions)
+        if version is None:
+            raise FoxnoseError(f"{kind.capitalize()} {key!r} has no published schema")
+        schema = version.json_schema
+        if schema is None:
+            detail = await endpoints.get_version(key, version.key, include_schema=True)
+            schema = detail.json_schema
+        if schema is None:
+            fields = [field async for field in endpoints.iter_fields(key, version.key)]
+            schema = schema_from_fields(fields)
+        return PayloadValidator(schema)
+
+    async def validate_payload(
+        self,
+        folder_key: FolderRef,
+        payload: Mapping[str, Any],
+        *,
+        component: ComponentRef | None = None,
+    ) -> list[ValidationIssue]:
+        """Check a create/upsert payload against the current schema locally."""
+        validator = await self.get_payload_validator(folder_key, component=component)
+        return validator.validate(resource_data(payload, validator))
+
+    async def _preflight(
+        self,
+        folder_key: str,
+        payload: Mapping[str, Any],
+        component: str | None,
+        external_id: str | None = None,
+    ) -> None:
+        validator = await self.get_payload_validator(folder_key, component=component)
+        self._check_payload(validator, payload, folder_key, component, external_id)
+
     async def create_resource(
         self,
         folder_key: FolderRef,
@@ -3581,9 +7306,12 @@ class AsyncManagementClient(_ManagementPathsMixin):
         *,
         component: ComponentRef | None = None,
         external_id: str | None = None,
+        validate: bool = False,
     ) -> ResourceSummary:
         folder_key = _resolve_key(folder_key)
         component = _resolve_key(component) if component is not None else None
+        if validate:
+            await self._preflight(folder_key, payload, component, external_id)
         params = {"component": component} if component else None
         body: dict[str, Any] = dict(payload)
         if external_id is not None:
@@ -3603,6 +7331,8 @@ class AsyncManagementClient(_ManagementPathsMixin):
         *,
         external_id: str,
         component: ComponentRef | None = None,
+        hash_store: ResourceHashStore | None = None,
+        validate: bool = False,
     ) -> ResourceSummary:
         """
         Create or update a resource by external_id.
@@ -3616,9 +7346,37 @@ class AsyncManagementClient(_ManagementPathsMixin):
             payload: JSON payload matching the folder/component schema.
             external_id: External identifier for the resource (required).
             component: Optional component key for component-based folders.
+            hash_store: Optional :class:`ResourceHashStore`. If the payload
+                hashes to the digest recorded for the last upload, no request
+                is sent and the stored resource is returned.
+            validate: Check the payload against the current schema first and
+                raise :class:`FoxnoseValidationError` if it does not match.
         """
         folder_key = _resolve_key(folder_key)
         component = _resolve_key(component) if component is not None else None
+        resource, _ = await self._upsert_resource(
+            folder_key, payload, external_id, component, hash_store, validate
+        )
+        return resource
+
+    async def _upsert_resource(
+        self,
+        folder_key: str,
+        payload: Mapping[str, Any],
+        external_id: str,
+        component: str | None,
+        hash_store: ResourceHashStore | None,
+        validate: bool = False,
+    ) -> tuple[ResourceSummary, bool]:
+        """Upsert one resource, returning it and whether it was skipped."""
+        if validate:
+            await self._preflight(folder_key, payload, component, external_id)
+        digest = ""
+        if hash_store is not None:
+            digest = payload_hash(payload, component)
+            stored = hash_store.lookup(folder_key, external_id, digest)
+            if stored is not None:
+                return stored, True
         params: dict[str, str] = {"external_id": external_id}
         if component:
             params["component"] = component
@@ -3628,16 +7386,133 @@ class AsyncManagementClient(_ManagementPathsMixin):
             params=params,
             json_body=payload,
         )
-        return ResourceSummary.model_validate(data)
+        resource = ResourceSummary.model_validate(data)
+        if hash_store is not None:
+            hash_store.put(folder_key, external_id, digest, resource)
+        return resource, False
+
+    async def seed_hash_store(
+        self,
+        folder_key: FolderRef,
+        hash_store: ResourceHashStore,
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+    ) -> int:
+        """
+        Fill a hash store from the published data of a folder's resources.
+
+        Every resource with an ``external_id`` is listed and its published
+        data is fetched and hashed, so the first sync run can already skip
+        unchanged items. Resources without a published revision are left out.
+        Returns the number of entries written.
+
+        Args:
+            folder_key: Folder to read.
+            hash_store: Store to fill.
+            max_concurrency: Maximum number of data requests in flight.
+        """
+        folder_key = _resolve_key(folder_key)
+        resources = self._external_resources(folder_key)
+        outcomes = abounded_map(
+            lambda resource: self.get_resource_data(folder_key, resource.key),
+            resources,
+            max_concurrency=max_concurrency,
+        )
+        seeded = 0
+        try:
+            async for outcome in outcomes:
+                if outcome.error is not None:
+                    if _is_not_found(outcome.error):
+                        continue
+                    raise outcome.error
+                resource = outcome.item
+                digest = payload_hash(outcome.result, resource.component)
+                hash_store.put(
+                    folder_key,
+                    resource.external_id,
+                    digest,
+                    _stored_summary(resource),
+                )
+                seeded += 1
+        finally:
+            await outcomes.aclose()
+        return seeded
+
+    async def _external_resources(self, folder_key: str) -> AsyncIterator[Any]:
+        async for resource in self.iter_resources(folder_key):
+            if resource.external_id:
+                yield resource
+
+    def stream_upsert_resources(
+        self,
+        folder_key: FolderRef,
+        items: Iterable[BatchUpsertItem] | AsyncIterable[BatchUpsertItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = False,
+        hash_store: ResourceHashStore | None = None,
+        journal: BatchJournal | None = None,
+        validate: bool = False,
+    ) -> AsyncIterator[BatchItemResult]:
+        """
+        Upsert resources from any iterable, yielding each outcome as it completes.
+
+        Accepts regular and asynchronous iterables. Items are pulled lazily and
+        at most ``max_concurrency`` upserts are in flight at a time. Failures
+        are reported as :class:`BatchItemResult` entries with ``exception``
+        set instead of being raised. Items unchanged according to
+        ``hash_store`` or already completed according to ``journal`` are
+        reported with ``skipped=True``. With ``validate=True`` invalid payloads
+        fail with :class:`FoxnoseValidationError` without being sent.
+        """
+        folder_key = _resolve_key(folder_key)
+        return self._stream_upsert(
+            folder_key, items, max_concurrency, ordered, hash_store, journal, validate
+        )
+
+    def _stream_upsert(
+        self,
+        folder_key: str,
+        items: Iterable[BatchUpsertItem] | AsyncIterable[BatchUpsertItem],
+        max_concurrency: ConcurrencyLimit,
+        ordered: bool,
+        hash_store: ResourceHashStore | None,
+        journal: BatchJournal | None,
+        validate: bool = False,
+    ) -> AsyncGenerator[BatchItemResult, None]:
+        if journal is not None:
+            journal.bind(folder_key)
+
+        async def upsert(item: BatchUpsertItem) -> Any:
+            if journal is not None and journal.is_done(item.external_id):
+                return Unmetered((None, True))
+            outcome = await self._upsert_resource(
+                folder_key,
+                item.payload,
+                item.external_id,
+                item.component,
+                hash_store,
+                validate,
+            )
+            return Unmetered(outcome) if outcome[1] else outcome
+
+        outcomes = abounded_map(
+            upsert, items, max_concurrency=max_concurrency, ordered=ordered
+        )
+        return _abatch_item_results(outcomes, journal)
 
     async def batch_upsert_resources(
         self,
         folder_key: FolderRef,
         items: Sequence[BatchUpsertItem],
         *,
-        max_concurrency: int = 5,
+        max_concurrency: ConcurrencyLimit = 5,
         fail_fast: bool = False,
         on_progress: Callable[[int, int], None] | None = None,
+        collect_results: bool = True,
+        hash_store: ResourceHashStore | None = None,
+        journal: BatchJournal | None = None,
+        validate: bool = False,
     ) -> BatchUpsertResult:
         """
         Upsert multiple resources concurrently using async tasks.
@@ -3649,88 +7524,171 @@ class AsyncManagementClient(_ManagementPathsMixin):
         Args:
             folder_key: Target folder key (shared across all items).
             items: Sequence of :class:`BatchUpsertItem` to upsert.
-            max_concurrency: Maximum number of parallel workers (default 5).
+            max_concurrency: Maximum number of parallel workers (default 5),
+                or an :class:`~foxnose_sdk.concurrency.AdaptiveConcurrency`
+                limiter that tunes it from latency, errors and 429s.
             fail_fast: If ``True``, stop on first error and raise it.
                 If ``False`` (default), collect all results.
             on_progress: Optional callback invoked as
                 ``(completed_count, total_count)`` after each item finishes.
+            collect_results: If ``False``, successful resources are counted
+                in ``omitted_count`` instead of being kept in ``succeeded``.
+            hash_store: Optional :class:`ResourceHashStore`. Items whose
+                payload is unchanged since the last upload are not sent and
+                are counted in ``skipped_count``.
+            journal: Optional :class:`BatchJournal` that records every
+                outcome durably. Rerunning with the same journal skips items
+                it already records as done (counted in ``skipped_count``).
+            validate: Check each payload against the current folder or
+                component schema before sending it. Invalid items are
+                reported in ``failed`` with a :class:`FoxnoseValidationError`
+                and cost no request.
         """
-        if max_concurrency < 1:
+        if isinstance(max_concurrency, int) and max_concurrency < 1:
             raise ValueError("max_concurrency must be at least 1")
         folder_key = _resolve_key(folder_key)
         total = len(items)
         if total == 0:
             return BatchUpsertResult()
 
-        semaphore = asyncio.Semaphore(max_concurrency)
         succeeded: list[ResourceSummary] = []
         failed: list[BatchItemError] = []
+        omitted = 0
+        skipped = 0
         completed = 0
-        first_error: Exception | None = None
-        cancel_event = asyncio.Event()
 
-        async def _process(index: int, item: BatchUpsertItem) -> None:
-            nonlocal completed, first_error
-            if cancel_event.is_set():
-                return
-            async with semaphore:
-                if cancel_event.is_set():
-                    return
-                try:
-                    result = await self.upsert_resource(
-                        folder_key,
-                        item.payload,
-                        external_id=item.external_id,
-                        component=item.component,
-                    )
-                    succeeded.append(result)
-                except Exception as exc:
-                    if fail_fast:
-                        if first_error is None:
-                            first_error = exc
-                        cancel_event.set()
-                        return
+        if validate:
+            # Load each schema once up front instead of once per task.
+            for component in {item.component for item in items}:
+                await self.get_payload_validator(folder_key, component=component)
+        results = self._stream_upsert(
+            folder_key, items, max_concurrency, False, hash_store, journal, validate
+        )
+        try:
+            async for outcome in results:
+                if outcome.skipped:
+                    skipped += 1
+                elif outcome.exception is None:
+                    if collect_results:
+                        succeeded.append(outcome.resource)
+                    else:
+                        omitted += 1
+                elif not fail_fast:
                     failed.append(
                         BatchItemError(
-                            index=index,
-                            external_id=item.external_id,
-                            exception=exc,
+                            index=outcome.index,
+                            external_id=outcome.external_id,
+                            exception=outcome.exception,
                         )
                     )
-                finally:
-                    completed += 1
-                    if on_progress is not None:
-                        try:
-                            on_progress(completed, total)
-                        except Exception:
-                            pass
-
-        tasks = [asyncio.create_task(_process(i, item)) for i, item in enumerate(items)]
-        await asyncio.gather(*tasks)
-
-        if fail_fast and first_error is not None:
-            raise first_error
+                completed += 1
+                _report(on_progress, completed, total)
+                if fail_fast and outcome.exception is not None:
+                    # Closing the stream cancels the tasks still in flight.
+                    raise outcome.exception
+        finally:
+            await results.aclose()
+
+        return BatchUpsertResult(
+            succeeded=succeeded,
+            failed=failed,
+            omitted_count=omitted,
+            skipped_count=skipped,
+        )
+
+    @overload
+    async def update_resource(
+        self,
+        folder_key: FolderRef,
+        resource_key: ResourceRef,
+        payload: Mapping[str, Any],
+        *,
+        refetch: Literal[True] = ...,
+    ) -> ResourceSummary: ...
 
-        return BatchUpsertResult(succeeded=succeeded, failed=failed)
+    @overload
+    async def update_resource(
+        self,
+        folder_key: FolderRef,
+        resource_key: ResourceRef,
+        payload: Mapping[str, Any],
+        *,
+        refetch: bool,
+    ) -> ResourceSummary | None: ...
 
     async def update_resource(
         self,
         folder_key: FolderRef,
         resource_key: ResourceRef,
         payload: Mapping[str, Any],
-    ) -> ResourceSummary:
+        *,
+        refetch: bool = True,
+    ) -> ResourceSummary | None:
+        """Update a resource; see :meth:`ManagementClient.update_resource` for ``refetch``."""
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
-        await self.request(
+        data = await self.request(
             "PUT",
             f"{self._resource_base(folder_key)}/{resource_key}/",
             json_body=payload,
-            parse_json=False,
         )
-        return await self.get_resource(folder_key, resource_key)
+        resource = _updated_resource(data)
+        if resource is None and refetch:
+            return await self.get_resource(folder_key, resource_key)
+        return resource
+
+    def stream_update_resources(
+        self,
+        folder_key: FolderRef,
+        items: Iterable[BatchUpdateItem] | AsyncIterable[BatchUpdateItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = False,
+        refetch: bool = False,
+    ) -> AsyncIterator[BatchOperationOutcome]:
+        """Update resources from a (sync or async) iterable, yielding outcomes as they complete."""
+        folder_key = _resolve_key(folder_key)
+        return self._stream_operation(
+            lambda item: self.update_resource(
+                folder_key, item.key, item.payload, refetch=refetch
+            ),
+            items,
+            _update_pair,
+            max_concurrency,
+            ordered,
+        )
+
+    async def batch_update_resources(
+        self,
+        folder_key: FolderRef,
+        items: Sequence[BatchUpdateItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        fail_fast: bool = False,
+        on_progress: Callable[[int, int], None] | None = None,
+        collect_results: bool = True,
+        refetch: bool = False,
+    ) -> BatchOperationResult:
+        """Update multiple resources concurrently using async tasks, one request per item."""
+        folder_key = _resolve_key(folder_key)
+        return await self._batch_operation(
+            lambda item: self.update_resource(
+                folder_key, item.key, item.payload, refetch=refetch
+            ),
+            items,
+            _update_pair,
+            max_concurrency,
+            fail_fast,
+            on_progress,
+            collect_results,
+        )
 
     async def delete_resource(
-        self, folder_key: FolderRef, resource_key: ResourceRef
+        self,
+        folder_key: FolderRef,
+        resource_key: ResourceRef,
+        *,
+        hash_store: ResourceHashStore | None = None,
     ) -> None:
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
@@ -3739,6 +7697,113 @@ class AsyncManagementClient(_ManagementPathsMixin):
             f"{self._resource_base(folder_key)}/{resource_key}/",
             parse_json=False,
         )
+        if hash_store is not None:
+            hash_store.discard_resource(folder_key, resource_key)
+
+    def stream_delete_resources(
+        self,
+        folder_key: FolderRef,
+        resource_keys: Iterable[ResourceRef] | AsyncIterable[ResourceRef],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = False,
+        missing_ok: bool = False,
+        hash_store: ResourceHashStore | None = None,
+    ) -> AsyncIterator[BatchOperationOutcome]:
+        """Delete resources from a (sync or async) iterable, yielding outcomes as they complete."""
+        folder_key = _resolve_key(folder_key)
+        return self._stream_operation(
+            self._resource_deleter(folder_key, missing_ok, hash_store),
+            resource_keys,
+            _resource_pair,
+            max_concurrency,
+            ordered,
+        )
+
+    async def batch_delete_resources(
+        self,
+        folder_key: FolderRef,
+        resource_keys: Sequence[ResourceRef],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        fail_fast: bool = False,
+        on_progress: Callable[[int, int], None] | None = None,
+        collect_results: bool = True,
+        missing_ok: bool = False,
+        hash_store: ResourceHashStore | None = None,
+    ) -> BatchOperationResult:
+        """Delete multiple resources concurrently using async tasks."""
+        folder_key = _resolve_key(folder_key)
+        return await self._batch_operation(
+            self._resource_deleter(folder_key, missing_ok, hash_store),
+            resource_keys,
+            _resource_pair,
+            max_concurrency,
+            fail_fast,
+            on_progress,
+            collect_results,
+        )
+
+    def _resource_deleter(
+        self,
+        folder_key: str,
+        missing_ok: bool,
+        hash_store: ResourceHashStore | None = None,
+    ) -> Callable[[ResourceRef], Awaitable[None]]:
+        async def delete(resource_key: ResourceRef) -> None:
+            try:
+                await self.delete_resource(
+                    folder_key, resource_key, hash_store=hash_store
+                )
+            except FoxnoseAPIError as exc:
+                if not (missing_ok and _is_not_found(exc)):
+                    raise
+                if hash_store is not None:
+                    hash_store.discard_resource(folder_key, _resolve_key(resource_key))
+
+        return delete
+
+    def _stream_operation(
+        self,
+        operation: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any] | AsyncIterable[Any],
+        pair: Callable[[Any], tuple[str | None, str]],
+        max_concurrency: ConcurrencyLimit,
+        ordered: bool,
+    ) -> AsyncGenerator[BatchOperationOutcome, None]:
+        outcomes = abounded_map(
+            operation,
+            items,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+        return _aoperation_outcomes(outcomes, pair)
+
+    async def _batch_operation(
+        self,
+        operation: Callable[[Any], Awaitable[Any]],
+        items: Sequence[Any],
+        pair: Callable[[Any], tuple[str | None, str]],
+        max_concurrency: ConcurrencyLimit,
+        fail_fast: bool,
+        on_progress: Callable[[int, int], None] | None,
+        collect_results: bool,
+    ) -> BatchOperationResult:
+        if isinstance(max_concurrency, int) and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        tally = _OperationTally(len(items), fail_fast, on_progress, collect_results)
+        if not items:
+            return tally.result()
+        outcomes = self._stream_operation(
+            operation, items, pair, max_concurrency, False
+        )
+        try:
+            async for outcome in outcomes:
+                # With fail_fast this raises; closing the stream cancels the rest.
+                tally.add(outcome)
+        finally:
+            await outcomes.aclose()
+        return tally.result()
 
     async def get_resource_data(
         self, folder_key: FolderRef, resource_key: ResourceRef
@@ -3749,19 +7814,65 @@ class AsyncManagementClient(_ManagementPathsMixin):
             "GET", f"{self._resource_base(folder_key)}/{resource_key}/data/"
         )
 
+    def get_resources_data_many(
+        self,
+        folder_key: FolderRef,
+        resource_keys: Iterable[ResourceRef] | AsyncIterable[ResourceRef],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = True,
+        on_error: Callable[[str, Exception], None] | None = None,
+        retries: int = 2,
+        retry_backoff: float = 1.0,
+    ) -> AsyncDataFetch:
+        """Fetch the published data of many resources concurrently as ``(key, data)`` pairs."""
+        folder_key = _resolve_key(folder_key)
+        outcomes = abounded_map(
+            lambda item: _afetch_retrying(
+                lambda: self.get_resource_data(folder_key, _resolve_key(item)),
+                retries,
+                retry_backoff,
+            ),
+            resource_keys,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+        return AsyncDataFetch(outcomes, _resource_pair, on_error)
+
     async def list_revisions(
         self,
         folder_key: FolderRef,
         resource_key: ResourceRef,
         *,
         params: Mapping[str, Any] | None = None,
-    ) -> RevisionList:
+    ) -> RevisionList | CompactPage:
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         data = await self.request(
             "GET", f"{self._revision_base(folder_key, resource_key)}/", params=params
         )
-        return RevisionList.model_validate(data)
+        return self._validate_page(RevisionList, data)
+
+    def iter_revisions(
+        self,
+        folder_key: FolderRef,
+        resource_key: ResourceRef,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[RevisionSummary | CompactRevisionSummary]:
+        """Iterate over all revisions of a resource, following ``next`` links."""
+        folder_key = _resolve_key(folder_key)
+        resource_key = _resolve_key(resource_key)
+        return _aiterate_pages(
+            lambda query: self.list_revisions(folder_key, resource_key, params=query),
+            params,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
 
     async def create_revision(
         self,
@@ -3787,10 +7898,13 @@ class AsyncManagementClient(_ManagementPathsMixin):
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         revision_key = _resolve_key(revision_key)
-        data = await self.request(
-            "GET",
-            f"{self._revision_base(folder_key, resource_key)}/{revision_key}/",
-        )
+        data = self._cache_lookup("revision", revision_key)
+        if data is None:
+            data = await self.request(
+                "GET",
+                f"{self._revision_base(folder_key, resource_key)}/{revision_key}/",
+            )
+            self._cache_revision(revision_key, data)
         return RevisionSummary.model_validate(data)
 
     async def update_revision(
@@ -3803,6 +7917,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         revision_key = _resolve_key(revision_key)
+        self._forget_revision(revision_key)
         data = await self.request(
             "PUT",
             f"{self._revision_base(folder_key, resource_key)}/{revision_key}/",
@@ -3819,6 +7934,7 @@ class AsyncManagementClient(_ManagementPathsMixin):
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         revision_key = _resolve_key(revision_key)
+        self._forget_revision(revision_key)
         await self.request(
             "DELETE",
             f"{self._revision_base(folder_key, resource_key)}/{revision_key}/",
@@ -3835,11 +7951,13 @@ class AsyncManagementClient(_ManagementPathsMixin):
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         revision_key = _resolve_key(revision_key)
+        self._forget_revision(revision_key)
         data = await self.request(
             "POST",
             f"{self._revision_base(folder_key, resource_key)}/{revision_key}/publish/",
             json_body=payload,
         )
+        self._cache_revision(revision_key, data)
         return RevisionSummary.model_validate(data)
 
     async def validate_revision(
@@ -3857,6 +7975,92 @@ class AsyncManagementClient(_ManagementPathsMixin):
         )
         return await self.request("POST", path)
 
+    def stream_publish_revisions(
+        self,
+        folder_key: FolderRef,
+        revisions: Iterable[RevisionItem] | AsyncIterable[RevisionItem],
+        *,
+        payload: Mapping[str, Any] | None = None,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchOperationOutcome]:
+        """Publish revisions from a (sync or async) iterable, yielding outcomes as they complete."""
+        folder_key = _resolve_key(folder_key)
+        return self._stream_operation(
+            lambda item: self.publish_revision(
+                folder_key, *_revision_pair(item), payload
+            ),
+            revisions,
+            _revision_pair,
+            max_concurrency,
+            ordered,
+        )
+
+    async def batch_publish_revisions(
+        self,
+        folder_key: FolderRef,
+        revisions: Sequence[RevisionItem],
+        *,
+        payload: Mapping[str, Any] | None = None,
+        max_concurrency: ConcurrencyLimit = 5,
+        fail_fast: bool = False,
+        on_progress: Callable[[int, int], None] | None = None,
+        collect_results: bool = True,
+    ) -> BatchOperationResult:
+        """Publish multiple revisions concurrently using async tasks."""
+        folder_key = _resolve_key(folder_key)
+        return await self._batch_operation(
+            lambda item: self.publish_revision(
+                folder_key, *_revision_pair(item), payload
+            ),
+            revisions,
+            _revision_pair,
+            max_concurrency,
+            fail_fast,
+            on_progress,
+            collect_results,
+        )
+
+    def stream_validate_revisions(
+        self,
+        folder_key: FolderRef,
+        revisions: Iterable[RevisionItem] | AsyncIterable[RevisionItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchOperationOutcome]:
+        """Validate revisions from a (sync or async) iterable, yielding outcomes as they complete."""
+        folder_key = _resolve_key(folder_key)
+        return self._stream_operation(
+            lambda item: self.validate_revision(folder_key, *_revision_pair(item)),
+            revisions,
+            _revision_pair,
+            max_concurrency,
+            ordered,
+        )
+
+    async def batch_validate_revisions(
+        self,
+        folder_key: FolderRef,
+        revisions: Sequence[RevisionItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        fail_fast: bool = False,
+        on_progress: Callable[[int, int], None] | None = None,
+        collect_results: bool = True,
+    ) -> BatchOperationResult:
+        """Validate multiple revisions concurrently using async tasks."""
+        folder_key = _resolve_key(folder_key)
+        return await self._batch_operation(
+            lambda item: self.validate_revision(folder_key, *_revision_pair(item)),
+            revisions,
+            _revision_pair,
+            max_concurrency,
+            fail_fast,
+            on_progress,
+            collect_results,
+        )
+
     async def get_revision_data(
         self,
         folder_key: FolderRef,
@@ -3866,10 +8070,41 @@ class AsyncManagementClient(_ManagementPathsMixin):
         folder_key = _resolve_key(folder_key)
         resource_key = _resolve_key(resource_key)
         revision_key = _resolve_key(revision_key)
-        return await self.request(
-            "GET",
-            f"{self._revision_base(folder_key, resource_key)}/{revision_key}/data/",
-        )
+        data = self._cache_lookup("revision_data", revision_key)
+        if data is None:
+            data = await self.request(
+                "GET",
+                f"{self._revision_base(folder_key, resource_key)}/{revision_key}/data/",
+            )
+            self._cache_store(
+                "revision_data", revision_key, data, self._revision_sealed(revision_key)
+            )
+        return data
+
+    def get_revisions_data_many(
+        self,
+        folder_key: FolderRef,
+        revisions: Iterable[RevisionItem] | AsyncIterable[RevisionItem],
+        *,
+        max_concurrency: ConcurrencyLimit = 5,
+        ordered: bool = True,
+        on_error: Callable[[str, Exception], None] | None = None,
+        retries: int = 2,
+        retry_backoff: float = 1.0,
+    ) -> AsyncDataFetch:
+        """Fetch the data of many revisions concurrently as ``(revision_key, data)`` pairs."""
+        folder_key = _resolve_key(folder_key)
+        outcomes = abounded_map(
+            lambda item: _afetch_retrying(
+                lambda: self.get_revision_data(folder_key, *_revision_pair(item)),
+                retries,
+                retry_backoff,
+            ),
+            revisions,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+        return AsyncDataFetch(outcomes, _revision_pair, on_error)
 
     async def aclose(self) -> None:
         await self._transport.aclose()
@@ -0,0 +1,262 @@
+"""Compact ``__slots__`` model backend for high-volume list responses.
+
+The classes in this module mirror the field names of their pydantic
+counterparts in :mod:`foxnose_sdk.management.models` but store values in
+``__slots__`` instead of a per-instance ``__dict__`` and skip pydantic
+validation state. They are selected with
+``ManagementClient(model_backend="compact")`` and apply to the list
+endpoints that can return very large result sets.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, ClassVar
+
+from pydantic import TypeAdapter
+
+from .models import FolderList, ResourceList, RevisionList
+
+_DATETIME_ADAPTER: TypeAdapter[datetime] = TypeAdapter(datetime)
+
+
+def _parse_datetime(value: Any) -> datetime | None:
+    """Parse an ISO-8601 timestamp, falling back to pydantic for exotic formats."""
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        # ``fromisoformat`` only understands the ``Z`` suffix on Python 3.11+.
+        text = value[:-1] + "+00:00" if value[-1:] in ("Z", "z") else value
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
+    return _DATETIME_ADAPTER.validate_python(value)
+
+
+class CompactModel:
+    """Base class for slot-backed models with pydantic-like attribute access.
+
+    Subclasses list ``__slots__`` in the field order of the pydantic model
+    they mirror, which ``model_dump()`` and ``repr()`` follow.
+    """
+
+    __slots__ = ()
+
+    _required: ClassVar[frozenset[str]] = frozenset()
+    _nullable: ClassVar[frozenset[str]] = frozenset()
+    _datetime_fields: ClassVar[frozenset[str]] = frozenset()
+    _plan: ClassVar[tuple[tuple[str, bool, bool, bool], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Precompute per-field decoding flags so ``from_dict`` stays a tight loop.
+        cls._plan = tuple(
+            (
+                name,
+                name in cls._required,
+                name in cls._nullable,
+                name in cls._datetime_fields,
+            )
+            for name in cls.__slots__
+        )
+
+    def __init__(self, **values: Any) -> None:
+        self._load(values)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Any:
+        """Build an instance from a decoded JSON object, ignoring unknown keys."""
+        if not isinstance(data, Mapping):
+            raise TypeError(
+                f"{cls.__name__} expects a mapping, got {type(data).__name__}"
+            )
+        obj = cls.__new__(cls)
+        obj._load(data)
+        return obj
+
+    def _load(self, data: Mapping[str, Any]) -> None:
+        get = data.get
+        for name, required, nullable, is_datetime in self._plan:
+            value = get(name)
+            if value is None:
+                if required and name not in data:
+                    raise ValueError(
+                        f"{type(self).__name__} is missing required field {name!r}"
+                    )
+                # Required fields reject an explicit null unless the pydantic
+                # model types them as optional, so both backends agree.
+                if required and not nullable:
+                    raise ValueError(
+                        f"{type(self).__name__} field {name!r} must not be null"
+                    )
+            elif is_datetime:
+                value = _parse_datetime(value)
+            setattr(self, name, value)
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the field values as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class CompactResourceSummary(CompactModel):
+    """Slot-backed equivalent of :class:`~foxnose_sdk.management.models.ResourceSummary`."""
+
+    __slots__ = (  # noqa: RUF023
+        "key",
+        "folder",
+        "content_type",
+        "created_at",
+        "vectors_size",
+        "name",
+        "component",
+        "resource_owner",
+        "current_revision",
+        "external_id",
+    )
+    _required = frozenset(
+        {"key", "folder", "content_type", "created_at", "vectors_size"}
+    )
+    _datetime_fields = frozenset({"created_at"})
+
+
+class CompactRevisionSummary(CompactModel):
+    """Slot-backed equivalent of :class:`~foxnose_sdk.management.models.RevisionSummary`."""
+
+    __slots__ = (  # noqa: RUF023
+        "key",
+        "resource",
+        "schema_version",
+        "number",
+        "size",
+        "created_at",
+        "status",
+        "is_valid",
+        "published_at",
+        "unpublished_at",
+    )
+    _required = frozenset(__slots__)
+    _nullable = frozenset({"is_valid", "published_at", "unpublished_at"})
+    _datetime_fields = frozenset({"created_at", "published_at", "unpublished_at"})
+
+
+class CompactFolderSummary(CompactModel):
+    """Slot-backed equivalent of :class:`~foxnose_sdk.management.models.FolderSummary`."""
+
+    __slots__ = (  # noqa: RUF023
+        "key",
+        "name",
+        "alias",
+        "folder_type",
+        "content_type",
+        "strict_reference",
+        "created_at",
+        "parent",
+        "mode",
+        "path",
+    )
+    _required = frozenset(
+        {
+            "key",
+            "name",
+            "alias",
+            "folder_type",
+            "content_type",
+            "strict_reference",
+            "created_at",
+        }
+    )
+    _datetime_fields = frozenset({"created_at"})
+
+
+class CompactPage:
+    """Slot-backed equivalent of :class:`~foxnose_sdk.management.models.PaginatedResponse`."""
+
+    __slots__ = ("count", "next", "previous", "results")
+
+    def __init__(
+        self,
+        *,
+        count: int,
+        next: str | None,
+        previous: str | None,
+        results: list[Any],
+    ) -> None:
+        self.count = count
+        self.next = next
+        self.previous = previous
+        self.results = results
+
+    @classmethod
+    def from_dict(
+        cls, item_cls: type[CompactModel], data: Mapping[str, Any]
+    ) -> CompactPage:
+        """Decode a pagination envelope, building ``item_cls`` for each result."""
+        if not isinstance(data, Mapping):
+            raise TypeError(
+                f"{cls.__name__} expects a mapping, got {type(data).__name__}"
+            )
+        try:
+            count = data["count"]
+            results = data["results"]
+        except KeyError as exc:
+            raise ValueError(
+                f"{cls.__name__} is missing required field {exc.args[0]!r}"
+            ) from None
+        build = item_cls.from_dict
+        return cls(
+            count=count,
+            next=data.get("next"),
+            previous=data.get("previous"),
+            results=[build(item) for item in results],
+        )
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the page as a plain dictionary, dumping each result."""
+        return {
+            "count": self.count,
+            "next": self.next,
+            "previous": self.previous,
+            "results": [item.model_dump() for item in self.results],
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactPage(count={self.count!r}, next={self.next!r}, "
+            f"previous={self.previous!r}, results=<{len(self.results)} items>)"
+        )
+
+
+COMPACT_LIST_MODELS: dict[Any, type[CompactModel]] = {
+    ResourceList: CompactResourceSummary,
+    RevisionList: CompactRevisionSummary,
+    FolderList: CompactFolderSummary,
+}
+"""Paginated pydantic models that have a compact counterpart."""
+
+MODEL_BACKENDS = ("pydantic", "compact")
+
+
+__all__ = [
+    "COMPACT_LIST_MODELS",
+    "MODEL_BACKENDS",
+    "CompactFolderSummary",
+    "CompactModel",
+    "CompactPage",
+    "CompactResourceSummary",
+    "CompactRevisionSummary",
+]
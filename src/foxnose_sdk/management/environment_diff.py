@@ -0,0 +1,237 @@
+"""Structured comparison of two environments' configuration.
+
+Objects in different environments have different keys, so they are matched
+by their natural identity instead: locales by code, components and roles by
+name, folders by path and APIs by prefix. Before comparing, every snapshot
+(see :mod:`foxnose_sdk.management.snapshot`) is normalized. Keys,
+timestamps and environment references are dropped, references between
+objects are rewritten to the identities they point to, and nested
+collections (schema fields, permissions, API folders) are keyed by their own
+identity so that ordering differences do not show up as changes.
+
+:func:`diff_environments` exports both environments concurrently and
+returns an :class:`~foxnose_sdk.management.models.EnvironmentDiff`. Give the
+clients an :class:`~foxnose_sdk.management.cache.ImmutableCache` to make
+repeated comparisons cheaper: the fields of published schema versions never
+change, so they are fetched once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+from collections.abc import Mapping
+from typing import Any, Union
+
+from ..concurrency import ConcurrencyLimit
+from .client import AsyncManagementClient, ManagementClient
+from .folder_index import normalize_folder_path
+from .models import EnvironmentChange, EnvironmentDiff
+from .snapshot import check_snapshot, remap_keys
+
+EnvironmentSource = Union[ManagementClient, Mapping[str, Any]]
+AsyncEnvironmentSource = Union[AsyncManagementClient, Mapping[str, Any]]
+
+# Sections compared, with the attribute that identifies an object.
+DIFF_SECTIONS = {
+    "locales": "code",
+    "components": "name",
+    "folders": "path",
+    "management_roles": "name",
+    "flux_roles": "name",
+    "apis": "prefix",
+}
+
+_IGNORED_ATTRIBUTES = frozenset(
+    {"key", "environment", "created_at", "current_version", "path"}
+)
+_IGNORED_FIELD_ATTRIBUTES = frozenset({"key", "path", "parent"})
+
+
+def _folder_paths(folders: list[Mapping[str, Any]]) -> dict[str, str]:
+    by_key = {folder["key"]: folder for folder in folders}
+    paths: dict[str, str] = {}
+
+    def path_of(key: str) -> str:
+        if key not in paths:
+            folder = by_key[key]
+            parent = folder.get("parent")
+            if folder.get("path"):
+                paths[key] = normalize_folder_path(folder["path"])
+            elif parent in by_key:
+                paths[key] = f"{path_of(parent)}/{folder['alias']}"
+            else:
+                paths[key] = folder["alias"]
+        return paths[key]
+
+    for key in by_key:
+        path_of(key)
+    return paths
+
+
+def _identities(snapshot: Mapping[str, Any]) -> dict[str, str]:
+    # Maps every object key to the identity used to match it across
+    # environments.
+    identities = _folder_paths(list(snapshot.get("folders", ())))
+    for section in ("components", "management_roles", "flux_roles", "apis"):
+        attribute = DIFF_SECTIONS[section]
+        for entry in snapshot.get(section, ()):
+            identities[entry["key"]] = entry[attribute]
+    return identities
+
+
+def _normalize_entry(
+    entry: Mapping[str, Any], identities: Mapping[str, str]
+) -> dict[str, Any]:
+    normalized: dict[str, Any] = {
+        name: value
+        for name, value in entry.items()
+        if name not in _IGNORED_ATTRIBUTES
+        and name not in ("schema", "permissions", "folders")
+    }
+    schema = entry.get("schema")
+    for field in schema["fields"] if schema else ():
+        normalized[f"fields[{field['path']}]"] = {
+            name: value
+            for name, value in field.items()
+            if name not in _IGNORED_FIELD_ATTRIBUTES
+        }
+    for permission in entry.get("permissions") or ():
+        normalized[f"permissions[{permission['content_type']}]"] = {
+            "actions": sorted(permission.get("actions") or ()),
+            "all_objects": permission.get("all_objects"),
+            "objects": sorted(remap_keys(permission.get("objects") or [], identities)),
+        }
+    for api_folder in entry.get("folders") or ():
+        folder = identities.get(api_folder["folder"], api_folder["folder"])
+        normalized[f"folders[{folder}]"] = {
+            name: value
+            for name, value in api_folder.items()
+            if name not in _IGNORED_ATTRIBUTES and name != "folder"
+        }
+    return remap_keys(normalized, identities)
+
+
+def normalize_snapshot(
+    snapshot: Mapping[str, Any],
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Key a snapshot's objects by identity, with references resolved.
+
+    Returns:
+        For each compared section, a mapping of identity to the normalized
+        object.
+    """
+    check_snapshot(snapshot)
+    identities = _identities(snapshot)
+    return {
+        section: {
+            identities.get(entry.get("key"), entry[attribute]): _normalize_entry(
+                entry, identities
+            )
+            for entry in snapshot.get(section, ())
+        }
+        for section, attribute in DIFF_SECTIONS.items()
+    }
+
+
+def _compare(
+    source: Any, target: Any, prefix: str, changes: dict[str, tuple[Any, Any]]
+) -> None:
+    if isinstance(source, Mapping) and isinstance(target, Mapping):
+        for name in sorted(set(source) | set(target)):
+            path = f"{prefix}.{name}" if prefix else name
+            _compare(source.get(name), target.get(name), path, changes)
+    elif source != target:
+        changes[prefix] = (source, target)
+
+
+def diff_snapshots(
+    source: Mapping[str, Any], target: Mapping[str, Any]
+) -> EnvironmentDiff:
+    """Compare two snapshots.
+
+    Changes describe what promoting ``source`` onto ``target`` would do:
+    ``"added"`` objects exist only in ``source``, ``"removed"`` objects
+    only in ``target``, and ``"changed"`` objects differ in the attributes
+    listed in ``changes`` as ``(source_value, target_value)`` pairs.
+    """
+    left = normalize_snapshot(source)
+    right = normalize_snapshot(target)
+    diff = EnvironmentDiff(source=source["environment"], target=target["environment"])
+    for section in DIFF_SECTIONS:
+        ours, theirs = left[section], right[section]
+        for identity in sorted(set(ours) | set(theirs)):
+            if identity not in theirs:
+                diff.changes.append(
+                    EnvironmentChange(section=section, name=identity, action="added")
+                )
+            elif identity not in ours:
+                diff.changes.append(
+                    EnvironmentChange(section=section, name=identity, action="removed")
+                )
+            else:
+                changes: dict[str, tuple[Any, Any]] = {}
+                _compare(ours[identity], theirs[identity], "", changes)
+                if changes:
+                    diff.changes.append(
+                        EnvironmentChange(
+                            section=section,
+                            name=identity,
+                            action="changed",
+                            changes=changes,
+                        )
+                    )
+    return diff
+
+
+def diff_environments(
+    source: EnvironmentSource,
+    target: EnvironmentSource,
+    *,
+    max_concurrency: ConcurrencyLimit = 8,
+) -> EnvironmentDiff:
+    """Compare the configuration of two environments.
+
+    Both environments are exported at the same time, each with up to
+    ``max_concurrency`` requests in flight. Either side may also be a
+    snapshot taken earlier with ``export_snapshot()``, which is used as is.
+
+    Args:
+        source: Client (or snapshot) of the environment being promoted.
+        target: Client (or snapshot) of the environment it is compared with.
+        max_concurrency: Maximum number of requests in flight per client.
+    """
+
+    def load(side: EnvironmentSource) -> Mapping[str, Any]:
+        if isinstance(side, Mapping):
+            return side
+        return side.export_snapshot(max_concurrency=max_concurrency)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        left, right = pool.map(load, (source, target))
+    return diff_snapshots(left, right)
+
+
+async def adiff_environments(
+    source: AsyncEnvironmentSource,
+    target: AsyncEnvironmentSource,
+    *,
+    max_concurrency: ConcurrencyLimit = 8,
+) -> EnvironmentDiff:
+    """Async variant of :func:`diff_environments` for ``AsyncManagementClient``."""
+
+    async def load(side: AsyncEnvironmentSource) -> Mapping[str, Any]:
+        if isinstance(side, Mapping):
+            return side
+        return await side.export_snapshot(max_concurrency=max_concurrency)
+
+    left, right = await asyncio.gather(load(source), load(target))
+    return diff_snapshots(left, right)
+
+
+__all__ = [
+    "adiff_environments",
+    "diff_environments",
+    "diff_snapshots",
+    "normalize_snapshot",
+]
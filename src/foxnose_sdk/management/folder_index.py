@@ -0,0 +1,180 @@
+"""In-memory index of an environment's folder tree.
+
+Management endpoints address folders by key while Flux addresses them by
+path. :class:`FolderIndex` holds both mappings together with the parent/child
+adjacency of the tree, so services that resolve the same folders repeatedly do
+not pay an HTTP round trip per lookup. Obtain one with
+``ManagementClient.folder_index()``; the client keeps it current when folders
+are created, updated or deleted through it.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .models import FolderSummary
+
+
+def normalize_folder_path(path: str) -> str:
+    """Strip leading and trailing slashes so ``/a/b/`` and ``a/b`` match."""
+    return path.strip("/")
+
+
+def _as_summary(folder: Any) -> FolderSummary:
+    # Compact listings are converted so lookups always return pydantic models.
+    if isinstance(folder, FolderSummary):
+        return folder
+    return FolderSummary.model_validate(folder.model_dump())
+
+
+class FolderIndex:
+    """Path and key lookup table for folders, with subtree traversal.
+
+    Lookups by key or path are dictionary reads. The index is safe to share
+    between threads; writers take an internal lock.
+
+    Args:
+        folders: Optional initial folders, e.g. the result of
+            ``client.iter_folders()``.
+    """
+
+    def __init__(self, folders: Iterable[Any] = ()) -> None:
+        self._lock = threading.RLock()
+        self._folders: dict[str, FolderSummary] = {}
+        self._paths: dict[str, str] = {}
+        self._keys_by_path: dict[str, str] = {}
+        # Child keys per parent key (``None`` for roots); dicts keep insertion
+        # order and allow O(1) removal.
+        self._children: dict[str | None, dict[str, None]] = {}
+        self.load(folders)
+
+    def load(self, folders: Iterable[Any]) -> None:
+        """Replace the whole index with ``folders``."""
+        summaries = [_as_summary(folder) for folder in folders]
+        with self._lock:
+            self._folders = {folder.key: folder for folder in summaries}
+            self._children = {}
+            for folder in summaries:
+                self._children.setdefault(folder.parent, {})[folder.key] = None
+            self._paths = {}
+            self._keys_by_path = {}
+            for folder in summaries:
+                self._set_path(folder.key, self._derive_path(folder))
+
+    def get(self, key: str) -> FolderSummary | None:
+        """Return the folder with ``key``, if indexed."""
+        return self._folders.get(key)
+
+    def get_by_path(self, path: str) -> FolderSummary | None:
+        """Return the folder at ``path``, if indexed."""
+        key = self._keys_by_path.get(normalize_folder_path(path))
+        return self._folders.get(key) if key is not None else None
+
+    def path_of(self, key: str) -> str | None:
+        """Return the normalized path of the folder with ``key``."""
+        return self._paths.get(key)
+
+    def key_of(self, path: str) -> str | None:
+        """Return the key of the folder at ``path``."""
+        return self._keys_by_path.get(normalize_folder_path(path))
+
+    def children(self, key: str | None = None) -> list[FolderSummary]:
+        """Return the direct children of ``key``, or the root folders."""
+        with self._lock:
+            return [self._folders[child] for child in self._children.get(key, ())]
+
+    def ancestors(self, key: str) -> list[FolderSummary]:
+        """Return the ancestors of ``key`` from its parent up to the root."""
+        result: list[FolderSummary] = []
+        folder = self._folders.get(key)
+        while folder is not None and folder.parent is not None:
+            folder = self._folders.get(folder.parent)
+            if folder is not None:
+                result.append(folder)
+        return result
+
+    def walk(self, key: str | None = None) -> Iterator[FolderSummary]:
+        """Yield ``key`` and all its descendants depth-first (all folders if ``None``)."""
+        with self._lock:
+            stack = [key] if key is not None else list(self._children.get(None, ()))
+            ordered: list[FolderSummary] = []
+            while stack:
+                current = stack.pop()
+                folder = self._folders.get(current)
+                if folder is None:
+                    continue
+                ordered.append(folder)
+                stack.extend(reversed(self._children.get(current, {})))
+        yield from ordered
+
+    def put(self, folder: Any) -> None:
+        """Insert or replace one folder, re-homing it if its parent changed.
+
+        When the folder's path changes (rename or move), the paths of all its
+        descendants are rewritten as well.
+        """
+        folder = _as_summary(folder)
+        with self._lock:
+            previous = self._folders.get(folder.key)
+            if previous is not None and previous.parent != folder.parent:
+                self._children.get(previous.parent, {}).pop(folder.key, None)
+            self._folders[folder.key] = folder
+            self._children.setdefault(folder.parent, {})[folder.key] = None
+            old_path = self._paths.get(folder.key)
+            new_path = self._derive_path(folder)
+            if old_path == new_path:
+                return
+            self._set_path(folder.key, new_path)
+            if old_path is None:
+                return
+            for descendant in list(self.walk(folder.key))[1:]:
+                path = self._paths.get(descendant.key)
+                if path is not None and path.startswith(old_path + "/"):
+                    self._set_path(descendant.key, new_path + path[len(old_path) :])
+
+    def remove(self, key: str) -> int:
+        """Remove the folder with ``key`` and its whole subtree.
+
+        Returns:
+            Number of folders removed.
+        """
+        with self._lock:
+            subtree = list(self.walk(key))
+            for folder in subtree:
+                self._folders.pop(folder.key, None)
+                self._children.pop(folder.key, None)
+                path = self._paths.pop(folder.key, None)
+                if path is not None and self._keys_by_path.get(path) == folder.key:
+                    del self._keys_by_path[path]
+            if subtree:
+                self._children.get(subtree[0].parent, {}).pop(key, None)
+            return len(subtree)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._folders
+
+    def __len__(self) -> int:
+        return len(self._folders)
+
+    def __iter__(self) -> Iterator[FolderSummary]:
+        return iter(list(self._folders.values()))
+
+    def _derive_path(self, folder: FolderSummary) -> str:
+        if folder.path:
+            return normalize_folder_path(folder.path)
+        parent = self._folders.get(folder.parent) if folder.parent else None
+        if parent is None:
+            return folder.alias
+        return f"{self._derive_path(parent)}/{folder.alias}"
+
+    def _set_path(self, key: str, path: str) -> None:
+        old = self._paths.get(key)
+        if old is not None and self._keys_by_path.get(old) == key:
+            del self._keys_by_path[old]
+        self._paths[key] = path
+        self._keys_by_path[path] = key
+
+
+__all__ = ["FolderIndex", "normalize_folder_path"]
@@ -0,0 +1,176 @@
+"""Local content-hash store used to skip re-uploading unchanged resources.
+
+:class:`ResourceHashStore` maps ``(folder, external_id)`` to a SHA-256 digest
+of the canonical JSON of the last payload uploaded for that resource, along
+with the :class:`~foxnose_sdk.management.models.ResourceSummary` the API
+returned. Passing a store as ``hash_store=`` to ``upsert_resource`` or
+``batch_upsert_resources`` turns repeat uploads of identical payloads into
+local lookups, which also avoids creating redundant revisions server-side.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+from .models import ResourceSummary
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resource_hashes (
+    folder TEXT NOT NULL,
+    external_id TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    resource TEXT,
+    resource_key TEXT,
+    PRIMARY KEY (folder, external_id)
+)
+"""
+
+_INDEX = """
+CREATE INDEX IF NOT EXISTS resource_hashes_by_key
+ON resource_hashes (folder, resource_key)
+"""
+
+
+def payload_hash(payload: Mapping[str, Any], component: str | None = None) -> str:
+    """Return the SHA-256 hex digest of a payload's canonical JSON form.
+
+    Keys are sorted and insignificant whitespace is removed, so two payloads
+    that differ only in key order hash identically. A payload wrapped as
+    ``{"data": {...}}`` hashes like its ``data`` object, which is the form
+    published data is read back in. The component key is part of the digest
+    because switching components changes the resource.
+    """
+    if len(payload) == 1 and isinstance(payload.get("data"), Mapping):
+        payload = payload["data"]
+    canonical = json.dumps(
+        {"component": component, "payload": payload},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResourceHashStore:
+    """SQLite-backed map of ``(folder, external_id)`` to last-uploaded hash.
+
+    Args:
+        path: Database file path. Defaults to ``":memory:"``, which keeps the
+            store for the lifetime of the object only.
+
+    The store is safe to share between the worker threads of a batch.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:") -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(resource_hashes)")
+        }
+        if "resource_key" not in columns:
+            # Stores written before resource keys had their own column.
+            self._conn.execute(
+                "ALTER TABLE resource_hashes ADD COLUMN resource_key TEXT"
+            )
+            self._conn.execute(
+                "UPDATE resource_hashes "
+                "SET resource_key = json_extract(resource, '$.key')"
+            )
+        self._conn.execute(_INDEX)
+        self._conn.commit()
+
+    def lookup(
+        self, folder: str, external_id: str, digest: str
+    ) -> ResourceSummary | None:
+        """Return the stored resource if ``digest`` matches the last upload."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, resource FROM resource_hashes "
+                "WHERE folder = ? AND external_id = ?",
+                (folder, external_id),
+            ).fetchone()
+        if row is None or row[0] != digest or row[1] is None:
+            return None
+        return ResourceSummary.model_validate_json(row[1])
+
+    def get_digest(self, folder: str, external_id: str) -> str | None:
+        """Return the stored digest for a resource, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest FROM resource_hashes "
+                "WHERE folder = ? AND external_id = ?",
+                (folder, external_id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(
+        self,
+        folder: str,
+        external_id: str,
+        digest: str,
+        resource: ResourceSummary,
+    ) -> None:
+        """Record ``digest`` as the last uploaded payload for a resource."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resource_hashes "
+                "(folder, external_id, digest, resource, resource_key) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (folder, external_id, digest, resource.model_dump_json(), resource.key),
+            )
+            self._conn.commit()
+
+    def discard(self, folder: str, external_id: str) -> None:
+        """Forget a resource so its next upsert is always sent."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM resource_hashes WHERE folder = ? AND external_id = ?",
+                (folder, external_id),
+            )
+            self._conn.commit()
+
+    def discard_resource(self, folder: str, resource_key: str) -> None:
+        """Forget the entry whose stored resource has key ``resource_key``."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM resource_hashes WHERE folder = ? AND resource_key = ?",
+                (folder, resource_key),
+            )
+            self._conn.commit()
+
+    def clear(self, folder: str | None = None) -> None:
+        """Remove every entry, or only the entries of ``folder``."""
+        with self._lock:
+            if folder is None:
+                self._conn.execute("DELETE FROM resource_hashes")
+            else:
+                self._conn.execute(
+                    "DELETE FROM resource_hashes WHERE folder = ?", (folder,)
+                )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM resource_hashes"
+            ).fetchone()
+        return count
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["ResourceHashStore", "payload_hash"]
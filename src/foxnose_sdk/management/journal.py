@@ -0,0 +1,187 @@
+"""Durable journal that lets interrupted bulk imports resume where they stopped.
+
+A :class:`BatchJournal` is an append-only JSON Lines file. The first line names
+the folder the journal belongs to; every following line records the outcome
+of one item::
+
+    {"journal": 1, "folder": "folder-key"}
+    {"i": 0, "id": "ext-1", "ok": true}
+    {"i": 1, "id": "ext-2", "ok": false, "error": "Bad request (status=400)"}
+
+Passing the same journal file to ``batch_upsert_resources`` or
+``stream_upsert_resources`` again skips every ``external_id`` already recorded
+as successful, so a crashed run can simply be restarted with the same input.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any
+
+from typing_extensions import Self
+
+_VERSION = 1
+
+
+class BatchJournal:
+    """Append-only record of completed and failed batch items.
+
+    Records are flushed to the operating system as they are written and
+    fsynced every ``fsync_every`` records or ``fsync_interval`` seconds,
+    whichever comes first, so a crash loses at most that much progress. A
+    truncated last line left by a crash is ignored when the journal is
+    reopened. The journal is a context manager that closes itself on exit.
+
+    Args:
+        path: Journal file path; created if it does not exist.
+        fsync_every: Number of records between fsync calls (default 100).
+        fsync_interval: Maximum seconds between fsync calls (default 1.0).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        fsync_every: int = 100,
+        fsync_interval: float = 1.0,
+    ) -> None:
+        if fsync_every < 1:
+            raise ValueError("fsync_every must be at least 1")
+        self.path = os.fspath(path)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.folder: str | None = None
+        self._completed: set[str] = set()
+        self._failures: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+        # Held open for the journal's lifetime and released by ``close()``.
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb") as handle:
+                raw = handle.read()
+        except FileNotFoundError:
+            return
+        for line in raw.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Partial line from an interrupted write.
+            if "journal" in record:
+                self.folder = record.get("folder")
+            elif record.get("ok"):
+                self._completed.add(record["id"])
+                self._failures.pop(record["id"], None)
+            else:
+                self._failures[record["id"]] = record.get("error", "")
+        if raw and not raw.endswith(b"\n"):
+            # Start the next record on a fresh line after a torn write.
+            with open(self.path, "ab") as handle:
+                handle.write(b"\n")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def completed(self) -> frozenset[str]:
+        """External IDs recorded as successfully processed."""
+        with self._lock:
+            return frozenset(self._completed)
+
+    @property
+    def failures(self) -> dict[str, str]:
+        """Last recorded error message per external ID that has not succeeded."""
+        with self._lock:
+            return dict(self._failures)
+
+    def is_done(self, external_id: str) -> bool:
+        """Whether ``external_id`` was already processed successfully."""
+        return external_id in self._completed
+
+    def bind(self, folder: str) -> None:
+        """Tie the journal to ``folder``, refusing to mix folders in one file."""
+        with self._lock:
+            if self.folder is None:
+                self.folder = folder
+                # Synced together with the first batch of records.
+                self._write({"journal": _VERSION, "folder": folder}, sync=False)
+            elif self.folder != folder:
+                raise ValueError(
+                    f"Journal {self.path!r} belongs to folder {self.folder!r}, "
+                    f"not {folder!r}"
+                )
+
+    def record_success(
+        self, index: int, external_id: str, *, sync: bool = True
+    ) -> None:
+        """Append a successful outcome.
+
+        With ``sync=False`` the record is flushed but never fsynced here; the
+        caller checks :attr:`sync_due` and calls :meth:`sync` itself, e.g. from
+        a worker thread so an event loop is not blocked on the disk.
+        """
+        with self._lock:
+            self._completed.add(external_id)
+            self._failures.pop(external_id, None)
+            self._write({"i": index, "id": external_id, "ok": True}, sync)
+
+    def record_failure(
+        self, index: int, external_id: str, error: Any, *, sync: bool = True
+    ) -> None:
+        """Append a failed outcome; the item is retried on the next run.
+
+        ``sync`` behaves as in :meth:`record_success`.
+        """
+        message = str(error)
+        with self._lock:
+            self._failures[external_id] = message
+            self._write(
+                {"i": index, "id": external_id, "ok": False, "error": message}, sync
+            )
+
+    @property
+    def sync_due(self) -> bool:
+        """Whether unsynced records have reached ``fsync_every`` or ``fsync_interval``."""
+        return self._pending > 0 and (
+            self._pending >= self.fsync_every
+            or time.monotonic() - self._last_sync >= self.fsync_interval
+        )
+
+    def _write(self, record: dict[str, Any], sync: bool = True) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self._pending += 1
+        if sync and self.sync_due:
+            os.fsync(self._file.fileno())
+            self._pending = 0
+            self._last_sync = time.monotonic()
+
+    def sync(self) -> None:
+        """Flush and fsync all records written so far."""
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+            self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Sync outstanding records and close the file."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+
+__all__ = ["BatchJournal"]
@@ -443,6 +443,13 @@ class BatchUpsertItem(BaseModel):
     component: str | None = None
 
 
+class BatchUpdateItem(BaseModel):
+    """A single resource update in a batch operation."""
+
+    key: str
+    payload: dict[str, Any]
+
+
 class BatchItemError(BaseModel):
     """Error information for a single failed upsert in a batch."""
 
@@ -453,23 +460,116 @@ class BatchItemError(BaseModel):
     exception: Exception
 
 
+class BatchItemResult(BaseModel):
+    """Outcome of a single item in a streaming batch upsert."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    external_id: str
+    resource: ResourceSummary | None = None
+    exception: Exception | None = None
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was upserted successfully."""
+        return self.exception is None
+
+
 class BatchUpsertResult(BaseModel):
-    """Aggregate result of a batch upsert operation."""
+    """Aggregate result of a batch upsert operation.
+
+    When the batch runs with ``collect_results=False`` successful resources
+    are not kept; ``omitted_count`` records how many were dropped. Items left
+    untouched because a hash store showed them unchanged, or a journal showed
+    them already done, are counted in ``skipped_count`` only.
+    """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     succeeded: list[ResourceSummary] = []
     failed: list[BatchItemError] = []
+    omitted_count: int = 0
+    skipped_count: int = 0
+
+    @property
+    def total(self) -> int:
+        """Total number of processed items."""
+        return self.success_count + len(self.failed) + self.skipped_count
+
+    @property
+    def success_count(self) -> int:
+        """Number of items that succeeded."""
+        return len(self.succeeded) + self.omitted_count
+
+    @property
+    def failure_count(self) -> int:
+        """Number of items that failed."""
+        return len(self.failed)
+
+    @property
+    def has_failures(self) -> bool:
+        """Whether any items failed."""
+        return len(self.failed) > 0
+
+
+class BatchOperationOutcome(BaseModel):
+    """Outcome of a single item in a batch delete, publish or validate.
+
+    ``key`` is the resource key for resource operations and the revision key
+    for revision operations, in which case ``resource`` holds the key of the
+    resource the revision belongs to. ``result`` is whatever the single-item
+    method returns (``None`` for deletes).
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    key: str
+    resource: str | None = None
+    result: Any = None
+    exception: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.exception is None
+
+
+class BatchOperationError(BaseModel):
+    """Error information for a single failed item in a batch operation."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    key: str
+    resource: str | None = None
+    exception: Exception
+
+
+class BatchOperationResult(BaseModel):
+    """Aggregate result of a batch delete, publish or validate operation.
+
+    With ``collect_results=False`` successful outcomes are not kept;
+    ``omitted_count`` records how many were dropped.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    succeeded: list[BatchOperationOutcome] = []
+    failed: list[BatchOperationError] = []
+    omitted_count: int = 0
 
     @property
     def total(self) -> int:
         """Total number of processed items."""
-        return len(self.succeeded) + len(self.failed)
+        return self.success_count + len(self.failed)
 
     @property
     def success_count(self) -> int:
         """Number of items that succeeded."""
-        return len(self.succeeded)
+        return len(self.succeeded) + self.omitted_count
 
     @property
     def failure_count(self) -> int:
@@ -482,6 +582,166 @@ class BatchUpsertResult(BaseModel):
         return len(self.failed) > 0
 
 
+class SchemaChange(BaseModel):
+    """One field operation in a schema plan.
+
+    ``action`` is ``"create"``, ``"update"``, ``"delete"`` or ``"replace"``
+    (delete and re-create, used when a field's type changes). ``payload`` is
+    the request body for creates and replaces, and only the changed
+    attributes for updates.
+    """
+
+    action: str
+    path: str
+    parent: str | None = None
+    payload: dict[str, Any] | None = None
+
+
+class SchemaChangeError(BaseModel):
+    """A schema change that failed when the plan was applied."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    change: SchemaChange
+    exception: Exception
+
+
+class SchemaApplyResult(BaseModel):
+    """Outcome of applying a declarative schema to a folder or component.
+
+    ``version`` is the key of the version the changes were written to
+    (``None`` when nothing needed to change). Changes that depend on a failed
+    change are not attempted and are listed in ``skipped``.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    version: str | None = None
+    created_version: bool = False
+    applied: list[SchemaChange] = []
+    failed: list[SchemaChangeError] = []
+    skipped: list[SchemaChange] = []
+    published: bool = False
+
+    @property
+    def changed(self) -> bool:
+        """Whether any change was applied."""
+        return len(self.applied) > 0
+
+    @property
+    def has_failures(self) -> bool:
+        """Whether any change failed."""
+        return len(self.failed) > 0
+
+
+class PermissionChange(BaseModel):
+    """One call of a role permission synchronization.
+
+    ``action`` is ``"upsert"`` or ``"delete"`` for a whole permission, or
+    ``"add_object"``/``"delete_object"`` for one object of a scoped
+    permission; ``payload`` is the request body.
+    """
+
+    action: str
+    content_type: str
+    payload: dict[str, Any] | None = None
+
+
+class PermissionChangeError(BaseModel):
+    """A permission change that failed during synchronization."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    change: PermissionChange
+    exception: Exception
+
+
+class PermissionSyncResult(BaseModel):
+    """Outcome of synchronizing a role's permissions.
+
+    Object additions that depend on a failed permission upsert are not
+    attempted and are listed in ``skipped``.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    role: str
+    applied: list[PermissionChange] = []
+    failed: list[PermissionChangeError] = []
+    skipped: list[PermissionChange] = []
+
+    @property
+    def changed(self) -> bool:
+        """Whether any change was applied."""
+        return len(self.applied) > 0
+
+    @property
+    def has_failures(self) -> bool:
+        """Whether any change failed."""
+        return len(self.failed) > 0
+
+
+class SnapshotStepError(BaseModel):
+    """A snapshot import step that failed."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    step: str
+    exception: Exception
+
+
+class SnapshotImportResult(BaseModel):
+    """Outcome of importing an environment snapshot.
+
+    ``key_map`` maps each exported folder, component, role and API key to the
+    key of the object created for it. Steps that depend on a failed step are
+    not attempted and are listed in ``skipped``.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    key_map: dict[str, str] = {}
+    completed: list[str] = []
+    failed: list[SnapshotStepError] = []
+    skipped: list[str] = []
+
+    @property
+    def has_failures(self) -> bool:
+        """Whether any step failed."""
+        return len(self.failed) > 0
+
+
+class EnvironmentChange(BaseModel):
+    """One object that differs between two environments.
+
+    ``action`` is ``"added"`` (only in the source), ``"removed"`` (only in the
+    target) or ``"changed"``, in which case ``changes`` maps each differing
+    attribute to its ``(source_value, target_value)`` pair.
+    """
+
+    section: str
+    name: str
+    action: str
+    changes: dict[str, tuple[Any, Any]] = {}
+
+
+class EnvironmentDiff(BaseModel):
+    """Configuration differences between a source and a target environment."""
+
+    source: str
+    target: str
+    changes: list[EnvironmentChange] = []
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether the environments differ at all."""
+        return len(self.changes) > 0
+
+    def for_section(self, section: str) -> list[EnvironmentChange]:
+        """Return the changes of one section, e.g. ``"folders"``."""
+        return [change for change in self.changes if change.section == section]
+
+
 __all__ = [
     "PaginatedResponse",
     "ResourceSummary",
@@ -522,6 +782,21 @@ __all__ = [
     "OrganizationPlanStatus",
     "OrganizationUsage",
     "BatchUpsertItem",
+    "BatchUpdateItem",
     "BatchItemError",
+    "BatchItemResult",
     "BatchUpsertResult",
+    "BatchOperationOutcome",
+    "BatchOperationError",
+    "BatchOperationResult",
+    "SchemaChange",
+    "SchemaChangeError",
+    "SchemaApplyResult",
+    "PermissionChange",
+    "PermissionChangeError",
+    "PermissionSyncResult",
+    "SnapshotStepError",
+    "SnapshotImportResult",
+    "EnvironmentChange",
+    "EnvironmentDiff",
 ]
@@ -0,0 +1,206 @@
+"""Process-pool bulk upsert engine for CPU-bound imports.
+
+Threads in :meth:`ManagementClient.batch_upsert_resources` overlap network
+waits, but JSON encoding, request signing and response validation all run
+under the GIL. :func:`process_batch_upsert_resources` spreads that work over
+several processes. Each worker builds its own :class:`ManagementClient`
+(closed when the worker exits) and runs ordinary threaded batches, and the
+parent merges their reports into one
+:class:`~foxnose_sdk.management.models.BatchUpsertResult`.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import multiprocessing.context
+import multiprocessing.util
+import os
+import zlib
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from ..concurrency import _report
+from .client import FolderRef, ManagementClient, _resolve_key
+from .models import BatchItemError, BatchUpsertItem, BatchUpsertResult, ResourceSummary
+
+_worker_client: ManagementClient | None = None
+
+
+def shard_for(external_id: str, shards: int) -> int:
+    """Return the shard an ``external_id`` is routed to.
+
+    CRC-32 is stable across processes and Python runs (unlike ``hash()``), so
+    a given resource is always handled by the same worker.
+    """
+    return zlib.crc32(external_id.encode()) % shards
+
+
+def _init_worker(
+    client_factory: Callable[[], ManagementClient] | None,
+    client_options: Mapping[str, Any],
+) -> None:
+    global _worker_client
+    if client_factory is not None:
+        _worker_client = client_factory()
+    else:
+        _worker_client = ManagementClient(**client_options)
+    # Forked workers leave through ``os._exit``, which skips ``atexit``;
+    # multiprocessing finalizers run on every start method.
+    multiprocessing.util.Finalize(None, _worker_client.close, exitpriority=10)
+
+
+def _run_chunk(
+    folder_key: str,
+    chunk: list[tuple[int, BatchUpsertItem]],
+    max_concurrency: int,
+    fail_fast: bool,
+    collect_results: bool,
+) -> BatchUpsertResult:
+    assert _worker_client is not None, "worker was not initialized"
+    result = _worker_client.batch_upsert_resources(
+        folder_key,
+        [item for _, item in chunk],
+        max_concurrency=max_concurrency,
+        fail_fast=fail_fast,
+        collect_results=collect_results,
+    )
+    # Translate chunk-local indices back to positions in the caller's input.
+    result.failed = [
+        BatchItemError(
+            index=chunk[error.index][0],
+            external_id=error.external_id,
+            exception=error.exception,
+        )
+        for error in result.failed
+    ]
+    return result
+
+
+def process_batch_upsert_resources(
+    folder_key: FolderRef,
+    items: Sequence[BatchUpsertItem],
+    *,
+    client_options: Mapping[str, Any] | None = None,
+    client_factory: Callable[[], ManagementClient] | None = None,
+    processes: int | None = None,
+    max_concurrency: int = 5,
+    chunk_size: int = 200,
+    fail_fast: bool = False,
+    on_progress: Callable[[int, int], None] | None = None,
+    collect_results: bool = True,
+    mp_context: multiprocessing.context.BaseContext | None = None,
+) -> BatchUpsertResult:
+    """
+    Upsert resources across several worker processes.
+
+    Items are sharded by ``external_id`` so every resource is always handled
+    by the same worker, then sent to that worker in chunks of ``chunk_size``.
+    Each worker runs :meth:`ManagementClient.batch_upsert_resources` on its
+    chunks with ``max_concurrency`` threads. At most two chunks per worker are
+    outstanding at a time, bounding memory for very large inputs.
+
+    Args:
+        folder_key: Target folder key (shared across all items).
+        items: Sequence of :class:`BatchUpsertItem` to upsert.
+        client_options: Keyword arguments for :class:`ManagementClient` in
+            each worker. They must be picklable; ``SimpleKeyAuth``,
+            ``SecureKeyAuth`` and ``RetryConfig`` are.
+        client_factory: Alternatively, a picklable module-level callable that
+            returns a configured :class:`ManagementClient`.
+        processes: Number of worker processes (default ``os.cpu_count()``).
+        max_concurrency: Threads per worker process (default 5).
+        chunk_size: Items sent to a worker per task (default 200).
+        fail_fast: If ``True``, stop on first error and raise it.
+        on_progress: Optional callback invoked as
+            ``(completed_count, total_count)`` each time a chunk finishes.
+        collect_results: If ``False``, successful resources are counted in
+            ``omitted_count`` instead of being returned from the workers.
+        mp_context: Optional :mod:`multiprocessing` context, e.g.
+            ``multiprocessing.get_context("spawn")``.
+    """
+    if (client_options is None) == (client_factory is None):
+        raise ValueError("Provide exactly one of client_options or client_factory")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    shards = processes if processes is not None else os.cpu_count() or 1
+    if shards < 1:
+        raise ValueError("processes must be at least 1")
+    folder_key = _resolve_key(folder_key)
+    total = len(items)
+    if total == 0:
+        return BatchUpsertResult()
+
+    succeeded: list[ResourceSummary] = []
+    failed: list[BatchItemError] = []
+    omitted = 0
+    skipped = 0
+    completed = 0
+
+    # One single-process pool per shard pins each shard to one worker.
+    pools = [
+        concurrent.futures.ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(client_factory, dict(client_options or {})),
+        )
+        for _ in range(shards)
+    ]
+    buffers: list[list[tuple[int, BatchUpsertItem]]] = [[] for _ in range(shards)]
+    pending: dict[concurrent.futures.Future[BatchUpsertResult], tuple[int, int]] = {}
+    outstanding = [0] * shards
+
+    def submit(shard: int) -> None:
+        # Keep at most two chunks per worker: one running, one queued.
+        while outstanding[shard] >= 2:
+            drain()
+        chunk, buffers[shard] = buffers[shard], []
+        future = pools[shard].submit(
+            _run_chunk, folder_key, chunk, max_concurrency, fail_fast, collect_results
+        )
+        pending[future] = (shard, len(chunk))
+        outstanding[shard] += 1
+
+    def drain() -> None:
+        nonlocal omitted, skipped, completed
+        done, _ = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            shard, size = pending.pop(future)
+            outstanding[shard] -= 1
+            report = future.result()
+            succeeded.extend(report.succeeded)
+            failed.extend(report.failed)
+            omitted += report.omitted_count
+            skipped += report.skipped_count
+            completed += size
+            _report(on_progress, completed, total)
+
+    try:
+        for index, item in enumerate(items):
+            shard = shard_for(item.external_id, shards)
+            buffers[shard].append((index, item))
+            if len(buffers[shard]) >= chunk_size:
+                submit(shard)
+        for shard in range(shards):
+            if buffers[shard]:
+                submit(shard)
+        while pending:
+            drain()
+    finally:
+        for pool in pools:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    failed.sort(key=lambda error: error.index)
+    return BatchUpsertResult(
+        succeeded=succeeded,
+        failed=failed,
+        omitted_count=omitted,
+        skipped_count=skipped,
+    )
+
+
+__all__ = ["process_batch_upsert_resources", "shard_for"]
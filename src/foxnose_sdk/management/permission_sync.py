@@ -0,0 +1,122 @@
+"""Minimal-diff planning for role permissions.
+
+A desired permission set is a list of permission payloads, as accepted by
+``upsert_management_role_permission``, with an optional ``"objects"`` list
+of object keys the permission is scoped to::
+
+    [
+        {"content_type": "resources", "actions": ["read"], "all_objects": True},
+        {
+            "content_type": "folder-items",
+            "actions": ["read", "update"],
+            "all_objects": False,
+            "objects": ["folder-1", "folder-2"],
+        },
+    ]
+
+:func:`plan_permission_changes` compares it with a role's current
+permissions and permission objects. It returns only the upserts, deletes and
+object additions and removals that are needed. Object changes depend on the
+upsert of their permission, if there is one, and are otherwise independent.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from .models import PermissionChange
+
+
+def _permission_payload(permission: Mapping[str, Any]) -> dict[str, Any]:
+    return {name: value for name, value in permission.items() if name != "objects"}
+
+
+def _differs(wanted: Mapping[str, Any], current: Any) -> bool:
+    if set(wanted.get("actions") or ()) != set(current.actions):
+        return True
+    return any(
+        getattr(current, name, None) != value
+        for name, value in wanted.items()
+        if name not in ("content_type", "actions")
+    )
+
+
+def scoped_content_types(permissions: Sequence[Mapping[str, Any]]) -> list[str]:
+    """Return the content types whose desired permission lists ``objects``."""
+    return [p["content_type"] for p in permissions if p.get("objects") is not None]
+
+
+def plan_permission_changes(
+    current: Iterable[Any],
+    current_objects: Mapping[str, Iterable[str]],
+    permissions: Sequence[Mapping[str, Any]],
+    *,
+    prune: bool = True,
+) -> tuple[list[PermissionChange], list[tuple[int, ...]]]:
+    """Compute the calls needed to turn a role's permissions into ``permissions``.
+
+    Args:
+        current: The role's permissions (``RolePermission`` objects).
+        current_objects: Object keys each scoped content type currently has.
+        permissions: Desired permissions (see the module docstring). A
+            permission without ``"objects"`` leaves its objects untouched;
+            with it, the objects are added or removed to match exactly.
+        prune: Delete permissions whose content type is not in
+            ``permissions`` (default ``True``).
+
+    Returns:
+        The changes and, for each change, the indices of the changes it
+        depends on.
+    """
+    existing = {permission.content_type: permission for permission in current}
+    changes: list[PermissionChange] = []
+    dependencies: list[tuple[int, ...]] = []
+    wanted_types = set()
+
+    for permission in permissions:
+        content_type = permission["content_type"]
+        if content_type in wanted_types:
+            raise ValueError(f"Duplicate permission for {content_type!r}")
+        wanted_types.add(content_type)
+        payload = _permission_payload(permission)
+        upsert: tuple[int, ...] = ()
+        if content_type not in existing or _differs(payload, existing[content_type]):
+            upsert = (len(changes),)
+            changes.append(
+                PermissionChange(
+                    action="upsert", content_type=content_type, payload=payload
+                )
+            )
+            dependencies.append(())
+        objects = permission.get("objects")
+        if objects is None:
+            continue
+        have = set(current_objects.get(content_type, ()))
+        for object_key in sorted(set(objects) - have):
+            changes.append(
+                PermissionChange(
+                    action="add_object",
+                    content_type=content_type,
+                    payload={"content_type": content_type, "object_key": object_key},
+                )
+            )
+            dependencies.append(upsert)
+        for object_key in sorted(have - set(objects)):
+            changes.append(
+                PermissionChange(
+                    action="delete_object",
+                    content_type=content_type,
+                    payload={"content_type": content_type, "object_key": object_key},
+                )
+            )
+            dependencies.append(())
+
+    if prune:
+        for content_type in sorted(set(existing) - wanted_types):
+            changes.append(PermissionChange(action="delete", content_type=content_type))
+            dependencies.append(())
+    return changes, dependencies
+
+
+__all__ = ["plan_permission_changes", "scoped_content_types"]
@@ -0,0 +1,219 @@
+"""Declarative schema-as-code planning for folders and components.
+
+A desired schema is a list of field specs. Each spec is the payload that
+``create_folder_field`` would receive, plus an optional ``"fields"`` list of
+nested field specs::
+
+    [
+        {"key": "title", "name": "Title", "type": "text", "required": True},
+        {
+            "key": "author",
+            "name": "Author",
+            "type": "object",
+            "fields": [{"key": "name", "name": "Name", "type": "text"}],
+        },
+    ]
+
+:func:`plan_schema_changes` compares a spec with the fields a schema version
+currently has and returns the minimal :class:`SchemaPlan`. The plan is a
+dependency graph: a nested field is created only after its parent, while
+independent fields can be written concurrently.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from .models import SchemaChange
+
+# Attributes compared against the live field; other spec keys are only sent
+# when a field is created.
+_COMPARED_ATTRIBUTES = frozenset(
+    {
+        "name",
+        "description",
+        "type",
+        "meta",
+        "json_schema",
+        "required",
+        "nullable",
+        "multiple",
+        "localizable",
+        "searchable",
+        "private",
+        "vectorizable",
+    }
+)
+
+
+class SchemaPlan:
+    """Field changes needed to reach a declarative schema, as a DAG.
+
+    Attributes:
+        changes: Changes in a valid serial order (deletes first, parents
+            before children).
+        dependencies: For each change, the indices of the changes that must
+            succeed before it can run.
+    """
+
+    def __init__(
+        self,
+        changes: Sequence[SchemaChange] = (),
+        dependencies: Sequence[Sequence[int]] = (),
+    ) -> None:
+        self.changes = list(changes)
+        self.dependencies = [tuple(deps) for deps in dependencies]
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __iter__(self) -> Iterator[SchemaChange]:
+        return iter(self.changes)
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __repr__(self) -> str:
+        summary = ", ".join(f"{c.action} {c.path}" for c in self.changes)
+        return f"SchemaPlan([{summary}])"
+
+
+def flatten_schema_spec(
+    fields: Sequence[Mapping[str, Any]],
+) -> list[tuple[str, str | None, dict[str, Any]]]:
+    """Flatten nested field specs into ``(path, parent_path, spec)`` tuples.
+
+    Parents always precede their children. Raises ``ValueError`` for specs
+    without a ``key`` and for duplicate paths.
+    """
+    flat: list[tuple[str, str | None, dict[str, Any]]] = []
+    seen: set[str] = set()
+
+    def visit(specs: Sequence[Mapping[str, Any]], parent: str | None) -> None:
+        for spec in specs:
+            key = spec.get("key")
+            if not isinstance(key, str) or not key:
+                raise ValueError(f"Field spec without a key: {dict(spec)!r}")
+            path = f"{parent}.{key}" if parent else key
+            if path in seen:
+                raise ValueError(f"Duplicate field path in schema spec: {path!r}")
+            seen.add(path)
+            body = {name: value for name, value in spec.items() if name != "fields"}
+            flat.append((path, parent, body))
+            visit(spec.get("fields") or (), path)
+
+    visit(fields, None)
+    return flat
+
+
+def _differs(wanted: Any, current: Any) -> bool:
+    # Nested mappings (``meta``) are compared on the keys the spec sets, so
+    # server-side defaults do not show up as changes.
+    if isinstance(wanted, Mapping) and isinstance(current, Mapping):
+        return any(_differs(value, current.get(key)) for key, value in wanted.items())
+    return bool(wanted != current)
+
+
+def _is_within(path: str, ancestors: set[str]) -> bool:
+    parent, _, _ = path.rpartition(".")
+    while parent:
+        if parent in ancestors:
+            return True
+        parent, _, _ = parent.rpartition(".")
+    return False
+
+
+def plan_schema_changes(
+    current: Iterable[Any],
+    fields: Sequence[Mapping[str, Any]],
+    *,
+    prune: bool = True,
+) -> SchemaPlan:
+    """Compute the minimal change set turning ``current`` into ``fields``.
+
+    Args:
+        current: Fields the version has now (e.g. ``FieldSummary`` objects).
+        fields: Desired field specs (see the module docstring).
+        prune: Delete fields that are not in the spec (default ``True``).
+            Deleting a field removes its nested fields with it, so only the
+            outermost removed field is deleted.
+
+    A field whose ``type`` changes is replaced (deleted and re-created), and
+    its nested fields are re-created after it. Other attributes are updated
+    in place with only the values that differ.
+    """
+    existing = {field.path: field for field in current}
+    desired = flatten_schema_spec(fields)
+    desired_paths = {path for path, _, _ in desired}
+
+    changes: list[SchemaChange] = []
+    dependencies: list[tuple[int, ...]] = []
+    deleted_keys: dict[str, int] = {}
+    if prune:
+        removed = {path for path in existing if path not in desired_paths}
+        for path in sorted(removed, key=lambda p: (p.count("."), p)):
+            if _is_within(path, removed):
+                continue
+            deleted_keys[path.rpartition(".")[2]] = len(changes)
+            changes.append(SchemaChange(action="delete", path=path))
+            dependencies.append(())
+
+    # Index of the change that (re)creates each path.
+    created: dict[str, int] = {}
+    for path, parent, spec in desired:
+        field = existing.get(path)
+        parent_index = created.get(parent) if parent is not None else None
+        if field is None or parent_index is not None:
+            action = "create"
+        elif "type" in spec and spec["type"] != field.type:
+            action = "replace"
+        else:
+            changed = {
+                name: value
+                for name, value in spec.items()
+                if name in _COMPARED_ATTRIBUTES
+                and _differs(value, getattr(field, name, None))
+            }
+            if changed:
+                changes.append(
+                    SchemaChange(
+                        action="update", path=path, parent=parent, payload=changed
+                    )
+                )
+                dependencies.append(())
+            continue
+        payload = dict(spec)
+        if parent is not None:
+            payload["parent"] = parent
+        deps = [index for index in (parent_index,) if index is not None]
+        # A field moved to a new parent may reuse the key of a deleted one.
+        freed = deleted_keys.get(spec["key"])
+        if freed is not None:
+            deps.append(freed)
+        created[path] = len(changes)
+        changes.append(
+            SchemaChange(action=action, path=path, parent=parent, payload=payload)
+        )
+        dependencies.append(tuple(deps))
+    return SchemaPlan(changes, dependencies)
+
+
+def draft_schema_version(versions: Iterable[Any]) -> Any | None:
+    """Return the unpublished, non-archived version with the highest number."""
+    drafts = [
+        version
+        for version in versions
+        if version.published_at is None and version.archived_at is None
+    ]
+    if not drafts:
+        return None
+    return max(drafts, key=lambda version: version.version_number or 0)
+
+
+__all__ = [
+    "SchemaPlan",
+    "draft_schema_version",
+    "flatten_schema_spec",
+    "plan_schema_changes",
+]
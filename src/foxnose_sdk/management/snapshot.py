@@ -0,0 +1,324 @@
+"""Environment snapshots: a single-file export that can be imported elsewhere.
+
+A snapshot is a JSON document holding an environment's configuration:
+locales, components and folders with the fields of their current published
+schema, Management and Flux roles with their permissions, APIs with their
+folders, and API key metadata (never secrets)::
+
+    {"format": "foxnose-snapshot", "version": 1, "environment": "...",
+     "locales": [...], "components": [...], "folders": [...],
+     "management_roles": [...], "flux_roles": [...], "apis": [...],
+     "management_api_keys": [...], "flux_api_keys": [...]}
+
+Importing creates new objects, so every key changes. :func:`plan_snapshot_import`
+turns a snapshot into :class:`SnapshotStep` objects that form a dependency
+graph. For example, a folder waits for its parent and an API folder waits for
+its API and folder. Each step's payload still holds the exported keys, and
+:func:`remap_keys` rewrites them to the new keys as the import runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+SNAPSHOT_FORMAT = "foxnose-snapshot"
+SNAPSHOT_VERSION = 1
+
+SNAPSHOT_SECTIONS = (
+    "locales",
+    "components",
+    "folders",
+    "management_roles",
+    "flux_roles",
+    "apis",
+    "management_api_keys",
+    "flux_api_keys",
+)
+
+_FIELD_ATTRIBUTES = (
+    "key",
+    "name",
+    "description",
+    "type",
+    "meta",
+    "required",
+    "nullable",
+    "multiple",
+    "localizable",
+    "searchable",
+    "private",
+    "vectorizable",
+)
+
+_CREATE_ATTRIBUTES: dict[str, tuple[str, ...]] = {
+    "locale": ("name", "code", "is_default"),
+    "component": ("name", "description", "content_type"),
+    "folder": (
+        "name",
+        "alias",
+        "folder_type",
+        "content_type",
+        "strict_reference",
+        "parent",
+        "mode",
+    ),
+    "management_role": ("name", "description", "full_access"),
+    "flux_role": ("name", "description"),
+    "api": ("name", "prefix", "description", "version", "is_auth_required"),
+    "api_folder": (
+        "folder",
+        "allowed_methods",
+        "description_get_one",
+        "description_get_many",
+        "description_search",
+        "description_schema",
+    ),
+}
+
+
+class SnapshotStep(NamedTuple):
+    """One write of a snapshot import.
+
+    ``kind`` selects the client call, ``key`` is the exported key of the
+    object the step creates or modifies, and ``payload`` is the request body
+    (a field spec list for schema steps, a permission list for permission
+    steps) expressed with exported keys.
+    """
+
+    name: str
+    kind: str
+    key: str
+    payload: Any
+
+
+def new_snapshot(environment: str, **sections: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return an empty snapshot document for ``environment``."""
+    snapshot: dict[str, Any] = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "environment": environment,
+    }
+    for section in SNAPSHOT_SECTIONS:
+        snapshot[section] = list(sections.get(section, ()))
+    return snapshot
+
+
+def write_snapshot(snapshot: Mapping[str, Any], path: str | os.PathLike[str]) -> None:
+    """Write ``snapshot`` to ``path`` as JSON."""
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(snapshot, handle, indent=2, ensure_ascii=False)
+        handle.write("\n")
+
+
+def read_snapshot(path: str | os.PathLike[str]) -> dict[str, Any]:
+    """Read a snapshot written by :func:`write_snapshot`."""
+    with open(path, encoding="utf-8") as handle:
+        snapshot = json.load(handle)
+    check_snapshot(snapshot)
+    return snapshot
+
+
+def check_snapshot(snapshot: Mapping[str, Any]) -> None:
+    """Raise ``ValueError`` unless ``snapshot`` is a supported snapshot."""
+    if snapshot.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError("Not a Foxnose environment snapshot")
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {snapshot.get('version')!r}")
+
+
+def _dump(item: Any) -> dict[str, Any]:
+    if isinstance(item, BaseModel):
+        return item.model_dump(mode="json")
+    # Compact models keep parsed datetimes; serialize them the way pydantic does.
+    return {
+        name: value.isoformat() if isinstance(value, datetime) else value
+        for name, value in item.model_dump().items()
+    }
+
+
+def dump_models(
+    items: Iterable[Any], *, exclude: Iterable[str] = ()
+) -> list[dict[str, Any]]:
+    """Convert API models (pydantic or compact) to JSON-ready dicts."""
+    excluded = set(exclude)
+    return [
+        {name: value for name, value in _dump(item).items() if name not in excluded}
+        for item in items
+    ]
+
+
+def fields_to_spec(fields: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """Nest a flat field list into the spec accepted by ``apply_folder_schema``."""
+    specs: dict[str, dict[str, Any]] = {}
+    roots: list[dict[str, Any]] = []
+    for field in sorted(fields, key=lambda f: f["path"].count(".")):
+        spec = {
+            name: field[name]
+            for name in _FIELD_ATTRIBUTES
+            if field.get(name) is not None
+        }
+        specs[field["path"]] = spec
+        parent = field["path"].rpartition(".")[0]
+        if parent and parent in specs:
+            specs[parent].setdefault("fields", []).append(spec)
+        else:
+            roots.append(spec)
+    return roots
+
+
+def remap_keys(value: Any, key_map: Mapping[str, str]) -> Any:
+    """Replace every string in ``value`` that is an exported key with its new key."""
+    if isinstance(value, str):
+        return key_map.get(value, value)
+    if isinstance(value, Mapping):
+        return {name: remap_keys(item, key_map) for name, item in value.items()}
+    if isinstance(value, list):
+        return [remap_keys(item, key_map) for item in value]
+    return value
+
+
+def _create_payload(kind: str, source: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        name: source[name]
+        for name in _CREATE_ATTRIBUTES[kind]
+        if source.get(name) is not None
+    }
+
+
+def plan_snapshot_import(
+    snapshot: Mapping[str, Any],
+    *,
+    existing_locales: Iterable[str] = (),
+) -> tuple[list[SnapshotStep], list[tuple[int, ...]]]:
+    """Turn a snapshot into import steps and their dependencies.
+
+    Locales whose code is in ``existing_locales`` are skipped. API keys are
+    not imported: their secrets cannot be restored.
+
+    Returns:
+        The steps and, for each step, the indices of the steps it depends on.
+    """
+    check_snapshot(snapshot)
+    steps: list[SnapshotStep] = []
+    dependencies: list[tuple[int, ...]] = []
+    created: dict[str, int] = {}
+
+    def add(step: SnapshotStep, deps: Iterable[int | None] = ()) -> int:
+        steps.append(step)
+        dependencies.append(tuple(sorted({d for d in deps if d is not None})))
+        return len(steps) - 1
+
+    skip = set(existing_locales)
+    for locale in snapshot.get("locales", ()):
+        if locale["code"] not in skip:
+            add(
+                SnapshotStep(
+                    f"locale:{locale['code']}",
+                    "locale",
+                    locale["code"],
+                    _create_payload("locale", locale),
+                )
+            )
+
+    component_schemas: list[int] = []
+    for component in snapshot.get("components", ()):
+        key = component["key"]
+        created[key] = add(
+            SnapshotStep(
+                f"component:{key}",
+                "component",
+                key,
+                _create_payload("component", component),
+            )
+        )
+        if component.get("schema"):
+            spec = fields_to_spec(component["schema"]["fields"])
+            component_schemas.append(
+                add(
+                    SnapshotStep(
+                        f"component_schema:{key}", "component_schema", key, spec
+                    ),
+                    [created[key]],
+                )
+            )
+
+    folders = list(snapshot.get("folders", ()))
+    for folder in folders:
+        key = folder["key"]
+        created[key] = add(
+            SnapshotStep(
+                f"folder:{key}", "folder", key, _create_payload("folder", folder)
+            )
+        )
+    for folder in folders:
+        key = folder["key"]
+        parent = folder.get("parent")
+        if parent in created:
+            dependencies[created[key]] = (created[parent],)
+        if folder.get("schema"):
+            spec = fields_to_spec(folder["schema"]["fields"])
+            add(
+                SnapshotStep(f"folder_schema:{key}", "folder_schema", key, spec),
+                [created[key], *component_schemas],
+            )
+
+    apis = list(snapshot.get("apis", ()))
+    for api in apis:
+        key = api["key"]
+        created[key] = add(
+            SnapshotStep(f"api:{key}", "api", key, _create_payload("api", api))
+        )
+    for api in apis:
+        for api_folder in api.get("folders", ()):
+            folder_key = api_folder["folder"]
+            add(
+                SnapshotStep(
+                    f"api_folder:{api['key']}/{folder_key}",
+                    "api_folder",
+                    api["key"],
+                    _create_payload("api_folder", api_folder),
+                ),
+                [created[api["key"]], created.get(folder_key)],
+            )
+
+    # Permission objects may point at any folder, component or API.
+    referenced = list(created.values())
+    for kind in ("management_role", "flux_role"):
+        for role in snapshot.get(f"{kind}s", ()):
+            key = role["key"]
+            role_step = add(
+                SnapshotStep(f"{kind}:{key}", kind, key, _create_payload(kind, role))
+            )
+            created[key] = role_step
+            if role.get("permissions"):
+                add(
+                    SnapshotStep(
+                        f"{kind}_permissions:{key}",
+                        f"{kind}_permissions",
+                        key,
+                        list(role["permissions"]),
+                    ),
+                    [role_step, *referenced],
+                )
+    return steps, dependencies
+
+
+__all__ = [
+    "SNAPSHOT_FORMAT",
+    "SNAPSHOT_VERSION",
+    "SnapshotStep",
+    "check_snapshot",
+    "dump_models",
+    "fields_to_spec",
+    "new_snapshot",
+    "plan_snapshot_import",
+    "read_snapshot",
+    "remap_keys",
+    "write_snapshot",
+]
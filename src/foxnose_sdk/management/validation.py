@@ -0,0 +1,442 @@
+"""Local pre-flight validation of resource payloads.
+
+Folder and component schemas are published as JSON Schema
+(``SchemaVersionSummary.json_schema``) or can be rebuilt from the field list of
+a version. :class:`PayloadValidator` compiles such a schema once into a tree
+of closures, so each payload is checked with plain Python calls and invalid
+items can be rejected before they cost an API request.
+
+Only the commonly used part of JSON Schema is enforced: ``type``, ``enum``,
+``const``, string length and ``pattern``, numeric bounds and ``multipleOf``,
+``items`` and array size/uniqueness, ``properties``, ``required``,
+``additionalProperties``, object size, ``allOf``/``anyOf``/``oneOf``/``not``
+and local ``$ref``. Unknown keywords (``format``, ...) are ignored, so local
+validation never rejects a payload the API would accept for them.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Iterable, Mapping
+from typing import Any, Callable, NamedTuple
+
+
+class ValidationIssue(NamedTuple):
+    """One problem found in a payload."""
+
+    path: str
+    message: str
+
+
+_Check = Callable[[Any, str, list[ValidationIssue]], None]
+
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: (
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+    ),
+    "integer": lambda value: (
+        (isinstance(value, int) and not isinstance(value, bool))
+        or (isinstance(value, float) and value.is_integer())
+    ),
+    "boolean": lambda value: isinstance(value, bool),
+    "object": lambda value: isinstance(value, Mapping),
+    "array": lambda value: isinstance(value, list),
+    "null": lambda value: value is None,
+}
+
+# Field types whose JSON representation is known; anything else is accepted.
+_FIELD_TYPE_SCHEMAS: dict[str, dict[str, Any]] = {
+    "string": {"type": "string"},
+    "text": {"type": "string"},
+    "integer": {"type": "integer"},
+    "number": {"type": "number"},
+    "float": {"type": "number"},
+    "boolean": {"type": "boolean"},
+    "object": {"type": "object"},
+}
+
+
+def _accept(value: Any, path: str, issues: list[ValidationIssue]) -> None:
+    return None
+
+
+def _reject(value: Any, path: str, issues: list[ValidationIssue]) -> None:
+    issues.append(ValidationIssue(path, "no value is allowed here"))
+
+
+def _json_equal(left: Any, right: Any) -> bool:
+    # ``True == 1`` in Python but not in JSON.
+    if isinstance(left, bool) or isinstance(right, bool):
+        return type(left) is type(right) and left == right
+    return left == right
+
+
+class PayloadValidator:
+    """A JSON Schema compiled into fast validation closures.
+
+    Args:
+        schema: JSON Schema document (a mapping or a boolean schema).
+    """
+
+    def __init__(self, schema: Mapping[str, Any] | bool) -> None:
+        self.schema = schema
+        self._refs: dict[str, _Check] = {}
+        self._check = self._compile(schema)
+
+    def validate(self, payload: Any) -> list[ValidationIssue]:
+        """Return every issue found in ``payload`` (empty when valid)."""
+        issues: list[ValidationIssue] = []
+        self._check(payload, "$", issues)
+        return issues
+
+    def is_valid(self, payload: Any) -> bool:
+        """Whether ``payload`` satisfies the schema."""
+        return not self.validate(payload)
+
+    def _compile(self, schema: Mapping[str, Any] | bool) -> _Check:
+        if schema is True or schema == {}:
+            return _accept
+        if schema is False:
+            return _reject
+        checks: list[_Check] = []
+        if "$ref" in schema:
+            checks.append(self._compile_ref(schema["$ref"]))
+        if "type" in schema:
+            checks.append(self._compile_type(schema["type"]))
+        if "enum" in schema:
+            options = list(schema["enum"])
+
+            def check_enum(
+                value: Any, path: str, issues: list[ValidationIssue]
+            ) -> None:
+                if not any(_json_equal(value, option) for option in options):
+                    issues.append(ValidationIssue(path, f"must be one of {options!r}"))
+
+            checks.append(check_enum)
+        if "const" in schema:
+            expected = schema["const"]
+
+            def check_const(
+                value: Any, path: str, issues: list[ValidationIssue]
+            ) -> None:
+                if not _json_equal(value, expected):
+                    issues.append(ValidationIssue(path, f"must equal {expected!r}"))
+
+            checks.append(check_const)
+        checks.extend(self._compile_string(schema))
+        checks.extend(self._compile_number(schema))
+        checks.extend(self._compile_array(schema))
+        checks.extend(self._compile_object(schema))
+        checks.extend(self._compile_combinators(schema))
+        if not checks:
+            return _accept
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(value: Any, path: str, issues: list[ValidationIssue]) -> None:
+            for check in checks:
+                check(value, path, issues)
+
+        return check_all
+
+    def _compile_ref(self, ref: str) -> _Check:
+        def check_ref(value: Any, path: str, issues: list[ValidationIssue]) -> None:
+            # Resolved lazily so recursive definitions compile.
+            compiled = self._refs.get(ref)
+            if compiled is None:
+                compiled = self._refs[ref] = self._compile(self._resolve(ref))
+            compiled(value, path, issues)
+
+        return check_ref
+
+    def _resolve(self, ref: str) -> Any:
+        if not ref.startswith("#"):
+            return True  # Remote references are not fetched.
+        target: Any = self.schema
+        for part in filter(None, ref[1:].split("/")):
+            part = part.replace("~1", "/").replace("~0", "~")
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        return target
+
+    @staticmethod
+    def _compile_type(expected: str | list[str]) -> _Check:
+        names = [expected] if isinstance(expected, str) else list(expected)
+        tests = [_TYPE_CHECKS[name] for name in names if name in _TYPE_CHECKS]
+        label = " or ".join(names)
+
+        def check_type(value: Any, path: str, issues: list[ValidationIssue]) -> None:
+            if not any(test(value) for test in tests):
+                issues.append(
+                    ValidationIssue(
+                        path, f"expected {label}, got {type(value).__name__}"
+                    )
+                )
+
+        return check_type
+
+    @staticmethod
+    def _compile_string(schema: Mapping[str, Any]) -> list[_Check]:
+        min_length = schema.get("minLength")
+        max_length = schema.get("maxLength")
+        pattern = schema.get("pattern")
+        if min_length is None and max_length is None and pattern is None:
+            return []
+        regex = re.compile(pattern) if pattern is not None else None
+
+        def check_string(value: Any, path: str, issues: list[ValidationIssue]) -> None:
+            if not isinstance(value, str):
+                return
+            if min_length is not None and len(value) < min_length:
+                issues.append(
+                    ValidationIssue(path, f"must be at least {min_length} characters")
+                )
+            if max_length is not None and len(value) > max_length:
+                issues.append(
+                    ValidationIssue(path, f"must be at most {max_length} characters")
+                )
+            if regex is not None and regex.search(value) is None:
+                issues.append(ValidationIssue(path, f"must match {pattern!r}"))
+
+        return [check_string]
+
+    @staticmethod
+    def _compile_number(schema: Mapping[str, Any]) -> list[_Check]:
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+        exclusive_minimum = schema.get("exclusiveMinimum")
+        exclusive_maximum = schema.get("exclusiveMaximum")
+        multiple_of = schema.get("multipleOf")
+        bounds = (minimum, maximum, exclusive_minimum, exclusive_maximum, multiple_of)
+        if all(bound is None for bound in bounds):
+            return []
+
+        def check_number(value: Any, path: str, issues: list[ValidationIssue]) -> None:
+            if not _TYPE_CHECKS["number"](value):
+                return
+            if minimum is not None and value < minimum:
+                issues.append(ValidationIssue(path, f"must be >= {minimum}"))
+            if maximum is not None and value > maximum:
+                issues.append(ValidationIssue(path, f"must be <= {maximum}"))
+            if exclusive_minimum is not None and value <= exclusive_minimum:
+                issues.append(ValidationIssue(path, f"must be > {exclusive_minimum}"))
+            if exclusive_maximum is not None and value >= exclusive_maximum:
+                issues.append(ValidationIssue(path, f"must be < {exclusive_maximum}"))
+            if multiple_of is not None:
+                quotient = value / multiple_of
+                if not math.isclose(quotient, round(quotient)):
+                    issues.append(
+                        ValidationIssue(path, f"must be a multiple of {multiple_of}")
+                    )
+
+        return [check_number]
+
+    def _compile_array(self, schema: Mapping[str, Any]) -> list[_Check]:
+        items = schema.get("items")
+        min_items = schema.get("minItems")
+        max_items = schema.get("maxItems")
+        unique = schema.get("uniqueItems", False)
+        if items is None and min_items is None and max_items is None and not unique:
+            return []
+        item_check = (
+            self._compile(items) if isinstance(items, (Mapping, bool)) else None
+        )
+
+        def check_array(value: Any, path: str, issues: list[ValidationIssue]) -> None:
+            if not isinstance(value, list):
+                return
+            if min_items is not None and len(value) < min_items:
+                issues.append(ValidationIssue(path, f"must have >= {min_items} items"))
+            if max_items is not None and len(value) > max_items:
+                issues.append(ValidationIssue(path, f"must have <= {max_items} items"))
+            if unique:
+                seen: list[Any] = []
+                for item in value:
+                    if any(_json_equal(item, other) for other in seen):
+                        issues.append(ValidationIssue(path, "items must be unique"))
+                        break
+                    seen.append(item)
+            if item_check is not None and item_check is not _accept:
+                for index, item in enumerate(value):
+                    item_check(item, f"{path}[{index}]", issues)
+
+        return [check_array]
+
+    def _compile_object(self, schema: Mapping[str, Any]) -> list[_Check]:
+        properties = {
+            name: self._compile(sub)
+            for name, sub in (schema.get("properties") or {}).items()
+        }
+        required = list(schema.get("required") or ())
+        additional = schema.get("additionalProperties", True)
+        additional_check = (
+            self._compile(additional) if isinstance(additional, Mapping) else None
+        )
+        min_properties = schema.get("minProperties")
+        max_properties = schema.get("maxProperties")
+        if (
+            not properties
+            and not required
+            and additional is True
+            and min_properties is None
+            and max_properties is None
+        ):
+            return []
+
+        def check_object(value: Any, path: str, issues: list[ValidationIssue]) -> None:
+            if not isinstance(value, Mapping):
+                return
+            for name in required:
+                if name not in value:
+                    issues.append(ValidationIssue(f"{path}.{name}", "is required"))
+            for name, item in value.items():
+                check = properties.get(name)
+                if check is not None:
+                    check(item, f"{path}.{name}", issues)
+                elif additional is False:
+                    issues.append(
+                        ValidationIssue(f"{path}.{name}", "is not an allowed property")
+                    )
+                elif additional_check is not None:
+                    additional_check(item, f"{path}.{name}", issues)
+            if min_properties is not None and len(value) < min_properties:
+                issues.append(
+                    ValidationIssue(path, f"must have >= {min_properties} properties")
+                )
+            if max_properties is not None and len(value) > max_properties:
+                issues.append(
+                    ValidationIssue(path, f"must have <= {max_properties} properties")
+                )
+
+        return [check_object]
+
+    def _compile_combinators(self, schema: Mapping[str, Any]) -> list[_Check]:
+        checks: list[_Check] = []
+        for sub in schema.get("allOf") or ():
+            checks.append(self._compile(sub))
+        any_of = [self._compile(sub) for sub in schema.get("anyOf") or ()]
+        one_of = [self._compile(sub) for sub in schema.get("oneOf") or ()]
+        negated = self._compile(schema["not"]) if "not" in schema else None
+
+        def matches(check: _Check, value: Any, path: str) -> bool:
+            scratch: list[ValidationIssue] = []
+            check(value, path, scratch)
+            return not scratch
+
+        if any_of:
+
+            def check_any_of(
+                value: Any, path: str, issues: list[ValidationIssue]
+            ) -> None:
+                if not any(matches(check, value, path) for check in any_of):
+                    issues.append(ValidationIssue(path, "matches none of anyOf"))
+
+            checks.append(check_any_of)
+        if one_of:
+
+            def check_one_of(
+                value: Any, path: str, issues: list[ValidationIssue]
+            ) -> None:
+                count = sum(matches(check, value, path) for check in one_of)
+                if count != 1:
+                    issues.append(
+                        ValidationIssue(
+                            path, f"must match exactly one of oneOf (matched {count})"
+                        )
+                    )
+
+            checks.append(check_one_of)
+        if negated is not None:
+
+            def check_not(value: Any, path: str, issues: list[ValidationIssue]) -> None:
+                if matches(negated, value, path):
+                    issues.append(ValidationIssue(path, "must not match 'not' schema"))
+
+            checks.append(check_not)
+        return checks
+
+
+def schema_from_fields(fields: Iterable[Any]) -> dict[str, Any]:
+    """Build an object JSON Schema from the fields of a schema version.
+
+    Each field contributes its own ``json_schema`` when the API provides one,
+    otherwise a schema derived from its ``type`` and children. ``required``,
+    ``nullable`` and ``multiple`` are honoured.
+    """
+    fields = list(fields)
+    children: dict[str | None, list[Any]] = {}
+    for field in fields:
+        children.setdefault(field.parent, []).append(field)
+
+    def build(field_parent: Any | None) -> dict[str, Any]:
+        if field_parent is None:
+            members = children.get(None, [])
+        else:
+            members = children.get(field_parent.key) or children.get(
+                field_parent.path, []
+            )
+        properties: dict[str, Any] = {}
+        required: list[str] = []
+        for field in members:
+            if field.json_schema:
+                schema: dict[str, Any] = dict(field.json_schema)
+            elif children.get(field.key) or children.get(field.path):
+                schema = build(field)
+            else:
+                schema = dict(_FIELD_TYPE_SCHEMAS.get(field.type, {}))
+                max_length = (field.meta or {}).get("max_length")
+                if max_length is not None and schema.get("type") == "string":
+                    schema["maxLength"] = max_length
+            if field.multiple:
+                schema = {"type": "array", "items": schema}
+            if field.nullable:
+                schema = {"anyOf": [schema, {"type": "null"}]}
+            properties[field.key] = schema
+            if field.required:
+                required.append(field.key)
+        return {"type": "object", "properties": properties, "required": required}
+
+    return build(None)
+
+
+def current_schema_version(versions: Iterable[Any]) -> Any | None:
+    """Return the published, non-archived version with the highest number."""
+    live = [
+        version
+        for version in versions
+        if version.published_at is not None and version.archived_at is None
+    ]
+    if not live:
+        return None
+    return max(
+        live, key=lambda version: (version.version_number or 0, version.published_at)
+    )
+
+
+def resource_data(payload: Mapping[str, Any], validator: PayloadValidator) -> Any:
+    """Return the part of a create/upsert payload that the schema describes.
+
+    Payloads may wrap the resource fields as ``{"data": {...}}``; the wrapper
+    is unwrapped unless the schema itself declares a ``data`` property.
+    """
+    schema = validator.schema
+    declares_data = isinstance(schema, Mapping) and "data" in (
+        schema.get("properties") or {}
+    )
+    if (
+        not declares_data
+        and len(payload) == 1
+        and isinstance(payload.get("data"), Mapping)
+    ):
+        return payload["data"]
+    return payload
+
+
+__all__ = [
+    "PayloadValidator",
+    "ValidationIssue",
+    "current_schema_version",
+    "resource_data",
+    "schema_from_fields",
+]
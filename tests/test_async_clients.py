@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import asyncio
+import gc
 import json
+import os
+import threading
 from typing import Any, Callable
 
 import httpx
 import pytest
 
 from foxnose_sdk.auth import SimpleKeyAuth
+from foxnose_sdk.concurrency import RequestSpec
 from foxnose_sdk.config import FoxnoseConfig
 from foxnose_sdk.flux.client import AsyncFluxClient
 from foxnose_sdk.http import HttpTransport
 from foxnose_sdk.management.client import AsyncManagementClient
-from foxnose_sdk.errors import FoxnoseAPIError
+from foxnose_sdk.errors import FoxnoseAPIError, FoxnoseValidationError
+from foxnose_sdk.management.cache import ImmutableCache
+from foxnose_sdk.management.compact import CompactResourceSummary
+from foxnose_sdk.management.environment_diff import adiff_environments
+from foxnose_sdk.management.hash_store import ResourceHashStore
+from foxnose_sdk.management.journal import BatchJournal
 from foxnose_sdk.management.models import (
+    BatchUpdateItem,
     BatchUpsertItem,
     BatchUpsertResult,
     FolderSummary,
@@ -336,11 +347,13 @@ API_FOLDER_JSON = {
 
 def build_async_management_client(
     handler: Callable[[httpx.Request], httpx.Response],
+    **client_kwargs: Any,
 ) -> AsyncManagementClient:
     client = AsyncManagementClient(
         base_url="https://api.example.com",
         environment_key="env123",
         auth=SimpleKeyAuth("pub", "secret"),
+        **client_kwargs,
     )
     client._transport = HttpTransport(
         config=FoxnoseConfig(base_url="https://api.example.com"),
@@ -762,6 +775,175 @@ async def test_async_list_resources_and_revisions():
     await client.aclose()
 
 
+@pytest.mark.asyncio
+async def test_async_compact_backend_returns_slot_models():
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = {
+            "count": 1,
+            "next": None,
+            "previous": None,
+            "results": [RESOURCE_JSON],
+        }
+        return httpx.Response(200, json=payload)
+
+    client = build_async_management_client(handler, model_backend="compact")
+    resources = await client.list_resources("folder-1")
+    assert isinstance(resources.results[0], CompactResourceSummary)
+    assert resources.results[0].current_revision == "rev-1"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_async_iter_resources_follows_next_links(prefetch):
+    offsets: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = request.url.params.get("offset")
+        offsets.append(offset)
+        start = int(offset or 0)
+        next_link = None
+        if start == 0:
+            next_link = (
+                "https://api.example.com/v1/env123/folders/folder-1/resources/"
+                "?limit=2&offset=2"
+            )
+        payload = {
+            "count": 3,
+            "next": next_link,
+            "previous": None,
+            "results": [
+                {**RESOURCE_JSON, "key": f"resource-{i}"}
+                for i in range(start, min(start + 2, 3))
+            ],
+        }
+        return httpx.Response(200, json=payload)
+
+    client = build_async_management_client(handler)
+    keys = [
+        item.key
+        async for item in client.iter_resources(
+            "folder-1", page_size=2, prefetch=prefetch
+        )
+    ]
+    assert keys == ["resource-0", "resource-1", "resource-2"]
+    assert offsets == [None, "2"]
+
+    offsets.clear()
+    limited = [
+        item.key async for item in client.iter_resources("folder-1", max_items=1)
+    ]
+    assert limited == ["resource-0"]
+    assert offsets == [None]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_iter_resources_retrieves_failed_prefetch_when_closed_early():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("offset") == "2":
+            return httpx.Response(400, json={"message": "Bad request"})
+        payload = {
+            "count": 4,
+            "next": (
+                "https://api.example.com/v1/env123/folders/folder-1/resources/"
+                "?limit=2&offset=2"
+            ),
+            "previous": None,
+            "results": [RESOURCE_JSON, RESOURCE_JSON],
+        }
+        return httpx.Response(200, json=payload)
+
+    loop = asyncio.get_running_loop()
+    unhandled: list[dict[str, Any]] = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+    client = build_async_management_client(handler)
+    try:
+        items = client.iter_resources("folder-1", page_size=2)
+        await items.__anext__()
+        # Let the prefetch of the failing page finish before stopping early.
+        await asyncio.sleep(0.01)
+        await items.aclose()
+        gc.collect()
+        await asyncio.sleep(0)
+    finally:
+        loop.set_exception_handler(None)
+        await client.aclose()
+    assert unhandled == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_async_scan_resources_fetches_offset_windows(ordered):
+    offsets: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        offsets.append(offset)
+        payload = {
+            "count": 5,
+            "next": "https://api.example.com/next" if offset + limit < 5 else None,
+            "previous": None,
+            "results": [
+                {**RESOURCE_JSON, "key": f"resource-{i}"}
+                for i in range(offset, min(offset + limit, 5))
+            ],
+        }
+        return httpx.Response(200, json=payload)
+
+    client = build_async_management_client(handler)
+    keys = [
+        item.key
+        async for item in client.scan_resources(
+            "folder-1", page_size=2, max_concurrency=2, ordered=ordered
+        )
+    ]
+    expected = [f"resource-{i}" for i in range(5)]
+    assert (keys if ordered else sorted(keys)) == expected
+    assert sorted(offsets) == [0, 2, 4]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_async_scan_resources_releases_consumed_pages(ordered):
+    total = 400
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        payload = {
+            "count": total,
+            "next": "https://api.example.com/next" if offset + limit < total else None,
+            "previous": None,
+            "results": [
+                {**RESOURCE_JSON, "key": f"resource-{i}"}
+                for i in range(offset, min(offset + limit, total))
+            ],
+        }
+        return httpx.Response(200, json=payload)
+
+    def live_resources() -> int:
+        gc.collect()
+        return sum(isinstance(obj, ResourceSummary) for obj in gc.get_objects())
+
+    client = build_async_management_client(handler)
+    before = live_resources()
+    peak = 0
+    seen = 0
+    async for _ in client.scan_resources(
+        "folder-1", page_size=10, max_concurrency=3, ordered=ordered
+    ):
+        seen += 1
+        if seen % 50 == 0:
+            peak = max(peak, live_resources() - before)
+    assert seen == total
+    # The current page plus the in-flight window, never the whole folder.
+    assert peak <= 10 * 5
+    await client.aclose()
+
+
 @pytest.mark.asyncio
 async def test_async_publish_revision():
     captured: dict[str, Any] = {}
@@ -1415,6 +1597,476 @@ async def test_async_batch_upsert_resources_rejects_zero_concurrency():
 
 
 @pytest.mark.asyncio
+async def test_async_stream_upsert_resources_accepts_async_iterables():
+    def handler(request: httpx.Request) -> httpx.Response:
+        ext_id = str(request.url).split("external_id=")[1].split("&")[0]
+        if ext_id == "ext-bad":
+            return httpx.Response(
+                400, json={"message": "Bad request", "error_code": "validation_error"}
+            )
+        return httpx.Response(200, json={**RESOURCE_JSON, "external_id": ext_id})
+
+    async def items():
+        for ext_id in ["ext-0", "ext-bad", "ext-2"]:
+            yield BatchUpsertItem(external_id=ext_id, payload={"title": ext_id})
+
+    client = build_async_management_client(handler)
+    results = [
+        result
+        async for result in client.stream_upsert_resources(
+            "folder-1", items(), max_concurrency=2, ordered=True
+        )
+    ]
+    assert [r.external_id for r in results] == ["ext-0", "ext-bad", "ext-2"]
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].exception, FoxnoseAPIError)
+
+    summary = await client.batch_upsert_resources(
+        "folder-1",
+        [BatchUpsertItem(external_id="ext-0", payload={})],
+        collect_results=False,
+    )
+    assert summary.succeeded == []
+    assert summary.success_count == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_upsert_with_hash_store_skips_unchanged_items():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        ext_id = request.url.params["external_id"]
+        return httpx.Response(200, json={**RESOURCE_JSON, "external_id": ext_id})
+
+    client = build_async_management_client(handler)
+    store = ResourceHashStore()
+    await client.upsert_resource(
+        "folder-1", {"title": "x"}, external_id="ext-0", hash_store=store
+    )
+    items = [
+        BatchUpsertItem(external_id=f"ext-{i}", payload={"title": "x"})
+        for i in range(2)
+    ]
+    result = await client.batch_upsert_resources("folder-1", items, hash_store=store)
+    assert result.skipped_count == 1
+    assert result.success_count == 1
+    assert calls == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_stream_upsert_resources_resumes_from_journal(
+    tmp_path, monkeypatch
+):
+    sent: list[str] = []
+    fsync_threads: list[threading.Thread] = []
+    real_fsync = os.fsync
+
+    def recording_fsync(fd: int) -> None:
+        fsync_threads.append(threading.current_thread())
+        real_fsync(fd)
+
+    monkeypatch.setattr("foxnose_sdk.management.journal.os.fsync", recording_fsync)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ext_id = request.url.params["external_id"]
+        sent.append(ext_id)
+        return httpx.Response(200, json={**RESOURCE_JSON, "external_id": ext_id})
+
+    client = build_async_management_client(handler)
+    items = [
+        BatchUpsertItem(external_id=f"ext-{i}", payload={"title": "x"})
+        for i in range(3)
+    ]
+    with BatchJournal(tmp_path / "import.jsonl", fsync_every=1) as journal:
+        async for result in client.stream_upsert_resources(
+            "folder-1", items[:2], journal=journal
+        ):
+            assert result.ok
+        # Records are fsynced in worker threads, never on the event loop.
+        assert fsync_threads
+        assert threading.main_thread() not in fsync_threads
+
+    sent.clear()
+    journal = BatchJournal(tmp_path / "import.jsonl")
+    results = [
+        result
+        async for result in client.stream_upsert_resources(
+            "folder-1", items, journal=journal, ordered=True
+        )
+    ]
+    assert [r.skipped for r in results] == [True, True, False]
+    assert sent == ["ext-2"]
+    journal.close()
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_batch_delete_and_stream_publish_revisions():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "DELETE":
+            if "res-gone" in request.url.path:
+                return httpx.Response(404, json={"message": "Not found"})
+            return httpx.Response(204)
+        return httpx.Response(200, json=REVISION_JSON)
+
+    client = build_async_management_client(handler)
+    result = await client.batch_delete_resources(
+        "folder-1", ["res-0", "res-gone", "res-2"], missing_ok=True
+    )
+    assert result.success_count == 3
+    result = await client.batch_delete_resources("folder-1", ["res-0", "res-gone"])
+    assert [(e.index, e.key) for e in result.failed] == [(1, "res-gone")]
+
+    async def revisions():
+        for i in range(3):
+            yield ("resource-1", f"rev-{i}")
+
+    outcomes = [
+        outcome
+        async for outcome in client.stream_publish_revisions(
+            "folder-1", revisions(), ordered=True
+        )
+    ]
+    assert [o.key for o in outcomes] == ["rev-0", "rev-1", "rev-2"]
+    assert all(o.ok and o.result.key == REVISION_JSON["key"] for o in outcomes)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_get_resources_data_many():
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.path.split("/")[-3]
+        if key == "res-1":
+            return httpx.Response(404, json={"message": "Not found"})
+        return httpx.Response(200, json={"key": key})
+
+    client = build_async_management_client(handler)
+    failed: list[str] = []
+    pairs = [
+        pair
+        async for pair in client.get_resources_data_many(
+            "folder-1",
+            [f"res-{i}" for i in range(4)],
+            max_concurrency=2,
+            on_error=lambda key, exc: failed.append(key),
+        )
+    ]
+    assert pairs == [(k, {"key": k}) for k in ["res-0", "res-2", "res-3"]]
+    assert failed == ["res-1"]
+
+    fetched_data = client.get_resources_data_many(
+        "folder-1", [f"res-{i}" for i in range(4)], max_concurrency=2
+    )
+    assert [key async for key, _ in fetched_data] == ["res-0", "res-2", "res-3"]
+    assert [(e.index, e.key) for e in fetched_data.failed] == [(1, "res-1")]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_batch_update_resources_uses_put_response():
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        return httpx.Response(200, json=RESOURCE_JSON)
+
+    client = build_async_management_client(handler)
+    items = [BatchUpdateItem(key=f"res-{i}", payload={"title": "x"}) for i in range(3)]
+    outcomes = [
+        outcome
+        async for outcome in client.stream_update_resources(
+            "folder-1", items, ordered=True
+        )
+    ]
+    assert methods == ["PUT"] * 3
+    assert [o.key for o in outcomes] == ["res-0", "res-1", "res-2"]
+    assert all(o.result.key == RESOURCE_JSON["key"] for o in outcomes)
+    result = await client.batch_update_resources("folder-1", items)
+    assert result.success_count == 3
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_object_cache_for_published_versions():
+    calls = 0
+    published = {**VERSION_JSON, "published_at": "2024-01-11T00:00:00Z"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json=published)
+
+    client = build_async_management_client(handler, object_cache=ImmutableCache())
+    for _ in range(3):
+        await client.get_component_version("comp-1", "ver-1", include_schema=True)
+    assert calls == 1
+    await client.publish_component_version("comp-1", "ver-1")
+    await client.get_component_version("comp-1", "ver-1", include_schema=True)
+    assert calls == 3
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_folder_index_tracks_mutations():
+    calls: list[str] = []
+    tree = [
+        {**FOLDER_JSON, "key": "root", "alias": "root", "path": "/root"},
+        {
+            **FOLDER_JSON,
+            "key": "leaf",
+            "alias": "leaf",
+            "parent": "root",
+            "path": "/root/leaf",
+        },
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "GET":
+            return httpx.Response(
+                200, json={"count": 2, "next": None, "previous": None, "results": tree}
+            )
+        return httpx.Response(204)
+
+    client = build_async_management_client(handler)
+    index = await client.folder_index()
+    folder = await client.get_folder_by_path("root/leaf")
+    assert folder.key == "leaf"
+    await client.delete_folder("root")
+    assert len(index) == 0
+    assert calls == ["GET", "DELETE"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_batch_upsert_validates_payloads_locally():
+    schema = {
+        "type": "object",
+        "properties": {"title": {"type": "string"}},
+        "required": ["title"],
+    }
+    published = {
+        **VERSION_JSON,
+        "published_at": "2024-01-11T00:00:00Z",
+        "json_schema": schema,
+    }
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.method)
+        if request.url.path.endswith("/model/versions/"):
+            return httpx.Response(
+                200,
+                json={
+                    "count": 1,
+                    "next": None,
+                    "previous": None,
+                    "results": [published],
+                },
+            )
+        return httpx.Response(200, json=RESOURCE_JSON)
+
+    client = build_async_management_client(handler)
+    items = [
+        BatchUpsertItem(external_id="ok", payload={"title": "Hi"}),
+        BatchUpsertItem(external_id="bad", payload={"title": 1}),
+    ]
+    result = await client.batch_upsert_resources("folder-1", items, validate=True)
+    assert result.success_count == 1
+    assert isinstance(result.failed[0].exception, FoxnoseValidationError)
+    with pytest.raises(FoxnoseValidationError, match="'bad'"):
+        await client.upsert_resource(
+            "folder-1", {"title": None}, external_id="bad", validate=True
+        )
+    assert await client.validate_payload("folder-1", {"title": "Hi"}) == []
+    assert requests == ["GET", "PUT"]
+
+
+async def test_async_stream_upsert_validate_loads_schema_once():
+    published = {
+        **VERSION_JSON,
+        "published_at": "2024-01-11T00:00:00Z",
+        "json_schema": {"type": "object"},
+    }
+    requests: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.method)
+        if request.url.path.endswith("/model/versions/"):
+            # Yield so every task reaches the schema load before it finishes.
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200,
+                json={
+                    "count": 1,
+                    "next": None,
+                    "previous": None,
+                    "results": [published],
+                },
+            )
+        return httpx.Response(200, json=RESOURCE_JSON)
+
+    client = build_async_management_client(handler)
+    items = [
+        BatchUpsertItem(external_id=f"ext-{i}", payload={"title": str(i)})
+        for i in range(8)
+    ]
+    results = [
+        result
+        async for result in client.stream_upsert_resources(
+            "folder-1", items, max_concurrency=4, validate=True
+        )
+    ]
+    assert all(result.ok for result in results)
+    assert requests.count("GET") == 1
+    assert requests.count("PUT") == 8
+    await client.aclose()
+
+
+async def test_async_apply_component_schema_writes_to_draft():
+    draft = {**VERSION_JSON, "key": "ver-3", "version_number": 3}
+    title = {**FIELD_JSON, "name": "Old title"}
+    requests: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        if request.method == "GET":
+            page = [draft] if request.url.path.endswith("/versions/") else [title]
+            return httpx.Response(
+                200,
+                json={"count": 1, "next": None, "previous": None, "results": page},
+            )
+        return httpx.Response(200, json=FIELD_JSON)
+
+    client = build_async_management_client(handler)
+    spec = [
+        {"key": "title", "name": "Title", "type": "string"},
+        {"key": "subtitle", "name": "Subtitle", "type": "string"},
+    ]
+    plan = await client.plan_component_schema("comp-1", spec)
+    assert [(c.action, c.path) for c in plan] == [
+        ("update", "title"),
+        ("create", "subtitle"),
+    ]
+    result = await client.apply_component_schema("comp-1", spec)
+    assert result.version == "ver-3" and not result.created_version
+    assert len(result.applied) == 2 and not result.published
+    tree = "/v1/env123/components/comp-1/model/versions/ver-3/schema/tree/"
+    assert ("PUT", tree + "field/") in requests
+    assert ("POST", tree) in requests
+
+
+async def test_async_import_snapshot_skips_steps_below_a_failure():
+    snapshot = {
+        "format": "foxnose-snapshot",
+        "version": 1,
+        "environment": "env-old",
+        "locales": [],
+        "components": [{**COMPONENT_JSON, "key": "old-comp", "schema": None}],
+        "folders": [
+            {**FOLDER_JSON, "key": "old-root", "alias": "broken"},
+            {**FOLDER_JSON, "key": "old-child", "alias": "news", "parent": "old-root"},
+        ],
+        "management_roles": [],
+        "flux_roles": [],
+        "apis": [],
+        "management_api_keys": [],
+        "flux_api_keys": [],
+    }
+    posted: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=[LOCALE_JSON])
+        body = json.loads(request.content)
+        posted.append(body)
+        if body.get("alias") == "broken":
+            return httpx.Response(400, json={"message": "Alias is invalid"})
+        return httpx.Response(201, json={**COMPONENT_JSON, "key": "new-comp"})
+
+    client = build_async_management_client(handler)
+    result = await client.import_snapshot(snapshot)
+    assert result.completed == ["component:old-comp"]
+    assert result.key_map == {"old-comp": "new-comp"}
+    assert [failure.step for failure in result.failed] == ["folder:old-root"]
+    assert isinstance(result.failed[0].exception, FoxnoseAPIError)
+    assert result.skipped == ["folder:old-child"]
+    assert all(body.get("alias") != "news" for body in posted)
+    await client.aclose()
+
+
+async def test_async_diff_environments_against_snapshot():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/env123/locales/":
+            return httpx.Response(200, json=[LOCALE_JSON])
+        items = [COMPONENT_JSON] if request.url.path.endswith("/components/") else []
+        return httpx.Response(
+            200,
+            json={
+                "count": len(items),
+                "next": None,
+                "previous": None,
+                "results": items,
+            },
+        )
+
+    client = build_async_management_client(handler)
+    baseline = await client.export_snapshot()
+    baseline["environment"] = "env-prod"
+    baseline["components"][0]["description"] = "Old description"
+    baseline["locales"] = []
+
+    diff = await adiff_environments(client, baseline)
+    assert (diff.source, diff.target) == ("env123", "env-prod")
+    assert [(c.section, c.name, c.action) for c in diff.changes] == [
+        ("locales", "fr", "added"),
+        ("components", "Profile", "changed"),
+    ]
+    assert diff.changes[1].changes == {
+        "description": ("User profile component", "Old description")
+    }
+    await client.aclose()
+
+
+async def test_async_sync_flux_role_permissions_skips_objects_of_failed_upsert():
+    writes: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET" and request.url.path.endswith("/objects/"):
+            return httpx.Response(200, json=[FLUX_PERMISSION_OBJECT_JSON])
+        if request.method == "GET":
+            return httpx.Response(200, json=[FLUX_ROLE_PERMISSION_JSON])
+        writes.append((request.method, request.url.path))
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(400, json={"message": "Unknown content type"})
+
+    client = build_async_management_client(handler)
+    result = await client.sync_flux_role_permissions(
+        "flux-role-1",
+        [
+            {**FLUX_ROLE_PERMISSION_JSON, "objects": []},
+            {
+                "content_type": "flux-folders",
+                "actions": ["read"],
+                "all_objects": False,
+                "objects": ["api-1"],
+            },
+        ],
+    )
+    assert [f.change.action for f in result.failed] == ["upsert"]
+    assert [c.action for c in result.skipped] == ["add_object"]
+    # The unchanged permission only loses the object it no longer lists.
+    assert [c.action for c in result.applied] == ["delete_object"]
+    root = "/v1/env123/permissions/flux-api/roles/flux-role-1/permissions/"
+    assert sorted(writes) == [("DELETE", root + "objects/"), ("POST", root)]
+    await client.aclose()
+
+
 async def test_async_update_delete_resource_and_get_data():
     captured: list[tuple[str, str]] = []
 
@@ -1757,6 +2409,148 @@ async def test_async_update_api_folder_supports_route_descriptions():
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.asyncio
+async def test_async_flux_fan_out_streams_specs_in_completion_order():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/broken/_search"):
+            return httpx.Response(500, json={"message": "boom"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    client = build_async_flux_client(handler)
+    progress: list[int] = []
+    specs = [
+        RequestSpec("GET", "/v1/articles"),
+        RequestSpec("POST", "/v1/broken/_search", json_body={"limit": 1}),
+        RequestSpec("GET", "/v1/authors/_schema"),
+    ]
+    outcomes = [
+        outcome
+        async for outcome in client.fan_out(
+            specs,
+            ordered=False,
+            on_progress=lambda done, total: progress.append(done),
+        )
+    ]
+    by_index = {outcome.index: outcome for outcome in outcomes}
+    assert by_index[0].result == {"path": "/v1/articles"}
+    assert isinstance(by_index[1].error, FoxnoseAPIError)
+    assert by_index[2].result == {"path": "/v1/authors/_schema"}
+    assert progress == [1, 2, 3]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_flux_iter_resources_follows_cursor():
+    calls: list[dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        calls.append(params)
+        pages = {
+            None: {"results": [{"key": "a"}, {"key": "b"}], "next": "p2"},
+            "p2": {"results": [{"key": "c"}, {"key": "d"}], "next": "p3"},
+            "p3": {"results": [{"key": "e"}], "next": None},
+        }
+        return httpx.Response(200, json=pages[params.get("next")])
+
+    client = build_async_flux_client(handler)
+    keys = [item["key"] async for item in client.iter_resources("articles")]
+    assert keys == ["a", "b", "c", "d", "e"]
+
+    calls.clear()
+    resumed = [
+        item["key"]
+        async for item in client.iter_resources(
+            "articles", cursor="p2", max_items=2, params={"sort": "key"}
+        )
+    ]
+    assert resumed == ["c", "d"]
+    assert calls == [{"sort": "key", "next": "p2"}]
+
+    pages = [
+        page["next"]
+        async for page in client.iter_resource_pages("articles", prefetch=False)
+    ]
+    assert pages == ["p2", "p3", None]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_flux_iter_resource_pages_awaits_cancelled_prefetch():
+    cancelled: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("next") == "p2":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("p2")
+                raise
+        return httpx.Response(200, json={"results": [{"key": "a"}], "next": "p2"})
+
+    client = build_async_flux_client(handler)
+    pages = client.iter_resource_pages("articles")
+    first = await pages.__anext__()
+    assert first["next"] == "p2"
+    await asyncio.sleep(0)
+    await pages.aclose()
+    # The prefetch task has finished cancelling by the time aclose returns.
+    assert cancelled == ["p2"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_flux_search_many_runs_under_cap():
+    active = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        body = json.loads(request.content)
+        if body["q"] == "fail":
+            return httpx.Response(422, json={"message": "Invalid"})
+        return httpx.Response(200, json={"results": [body["q"]]})
+
+    client = build_async_flux_client(handler)
+    queries = [("articles", {"q": f"q{i % 6}"}) for i in range(12)]
+    queries.append(("articles", {"q": "fail"}))
+    outcomes = await client.search_many(queries, max_concurrency=3)
+    assert [outcome.result["results"] for outcome in outcomes[:12]] == [
+        [f"q{i % 6}"] for i in range(12)
+    ]
+    assert isinstance(outcomes[12].error, FoxnoseAPIError)
+    assert peak == 3
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_flux_federated_search_pages_only_competitive_folders():
+    scores = {"a": [9, 8, 7, 6, 5, 4], "b": [10, 1]}
+    offsets: list[tuple[str, int]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        folder = request.url.path.split("/")[2]
+        body = json.loads(request.content)
+        offsets.append((folder, body["offset"]))
+        window = scores[folder][body["offset"] : body["offset"] + body["limit"]]
+        return httpx.Response(200, json={"results": [{"score": v} for v in window]})
+
+    client = build_async_flux_client(handler)
+    hits = await client.federated_search(["a", "b"], {"q": "x"}, top_k=4)
+    assert [(hit.folder_path, hit.score) for hit in hits] == [
+        ("b", 10),
+        ("a", 9),
+        ("a", 8),
+        ("a", 7),
+    ]
+    assert sorted(offsets) == [("a", 0), ("a", 2), ("b", 0), ("b", 2)]
+    await client.aclose()
+
+
 @pytest.mark.asyncio
 async def test_async_flux_list_resources():
     captured: dict[str, Any] = {}
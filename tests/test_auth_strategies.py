@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import datetime as dt
 import hashlib
+import pickle
 
 import pytest
 from cryptography.hazmat.primitives import hashes, serialization
@@ -74,3 +75,16 @@ def test_jwt_auth_raises_on_empty_token():
         JWTAuth.from_static_token("").build_headers(
             RequestData(method="GET", url="https://example.com", path="/", body=b"")
         )
+
+
+def test_secure_auth_survives_pickling():
+    public_key, private_key, public_obj = _generate_keys()
+    restored = pickle.loads(pickle.dumps(SecureKeyAuth(public_key, private_key)))
+    request = RequestData(
+        method="GET", url="https://example.com/api", path="/api", body=b""
+    )
+    headers = restored.build_headers(request)
+    signature = base64.b64decode(headers["Authorization"].split(":", 1)[1])
+    body_hash = hashlib.sha256(b"").hexdigest()
+    expected = f"/api|{body_hash}|{headers['Date']}".encode()
+    public_obj.verify(signature, expected, ec.ECDSA(hashes.SHA256()))
@@ -8,7 +8,8 @@ import httpx
 import pytest
 
 from foxnose_sdk.auth import SimpleKeyAuth
-from foxnose_sdk.config import FoxnoseConfig
+from foxnose_sdk.concurrency import AdaptiveConcurrency, RequestSpec
+from foxnose_sdk.config import FoxnoseConfig, RetryConfig
 from foxnose_sdk.flux.client import FluxClient
 from foxnose_sdk.http import HttpTransport
 from foxnose_sdk.management.client import (
@@ -17,15 +18,31 @@ from foxnose_sdk.management.client import (
     _coerce_permission_object_payload,
     _resolve_key,
 )
-from foxnose_sdk.errors import FoxnoseAPIError
+from foxnose_sdk.errors import FoxnoseAPIError, FoxnoseValidationError
+from foxnose_sdk.management.cache import ImmutableCache
+from foxnose_sdk.management.compact import (
+    CompactFolderSummary,
+    CompactPage,
+    CompactResourceSummary,
+    CompactRevisionSummary,
+)
+from foxnose_sdk.management.environment_diff import diff_environments
+from foxnose_sdk.management.folder_index import FolderIndex
+from foxnose_sdk.management.hash_store import ResourceHashStore
+from foxnose_sdk.management.journal import BatchJournal
 from foxnose_sdk.management.models import (
     BatchItemError,
+    BatchItemResult,
+    BatchUpdateItem,
     BatchUpsertItem,
     BatchUpsertResult,
+    FieldSummary,
     FolderSummary,
     ResourceSummary,
     RevisionSummary,
 )
+from foxnose_sdk.management.schema_apply import plan_schema_changes
+from foxnose_sdk.management.validation import PayloadValidator, ValidationIssue
 
 ORG_KEY = "org-1"
 PROJECT_KEY = "project-1"
@@ -337,11 +354,13 @@ PROTECTED_ENVIRONMENT_JSON = ENVIRONMENT_JSON | {
 
 def build_management_client(
     handler: Callable[[httpx.Request], httpx.Response],
+    **client_kwargs: Any,
 ) -> ManagementClient:
     client = ManagementClient(
         base_url="https://api.example.com",
         environment_key="env123",
         auth=SimpleKeyAuth("pub", "secret"),
+        **client_kwargs,
     )
     client._transport = HttpTransport(  # type: ignore[attr-defined]
         config=FoxnoseConfig(base_url="https://api.example.com"),
@@ -396,6 +415,777 @@ def test_list_folder_tree_children_mode():
     assert "mode=children" in captured["url"]
 
 
+def _folder(key: str, parent: str | None, path: str | None = None) -> dict[str, Any]:
+    return {
+        **FOLDER_JSON,
+        "key": key,
+        "alias": key,
+        "parent": parent,
+        "path": path,
+    }
+
+
+def test_folder_index_resolves_without_requests():
+    tree = [
+        _folder("blog", None, "/blog"),
+        _folder("posts", "blog", "/blog/posts"),
+        _folder("drafts", "posts", "/blog/posts/drafts"),
+        _folder("pages", None, "/pages"),
+    ]
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(f"{request.method} {request.url}")
+        if request.method == "GET" and request.url.path.endswith("/folders/tree/"):
+            offset = int(request.url.params.get("offset", 0))
+            page = tree[offset : offset + 2]
+            next_url = (
+                f"https://api.example.com/v1/env123/folders/tree/?offset={offset + 2}"
+                if offset + 2 < len(tree)
+                else None
+            )
+            return httpx.Response(
+                200,
+                json={
+                    "count": len(tree),
+                    "next": next_url,
+                    "previous": None,
+                    "results": page,
+                },
+            )
+        if request.method == "POST":
+            return httpx.Response(201, json=_folder("news", "blog", "/blog/news"))
+        if request.method == "PUT":
+            return httpx.Response(200, json=_folder("blog", None, "/journal"))
+        return httpx.Response(204)
+
+    client = build_management_client(handler)
+    index = client.folder_index()
+    assert len(requests) == 2
+    assert len(index) == 4
+
+    requests.clear()
+    assert client.get_folder_by_path("/blog/posts/").key == "posts"
+    assert client.get_folder("drafts").parent == "posts"
+    assert [f.key for f in index.children()] == ["blog", "pages"]
+    assert [f.key for f in index.walk("blog")] == ["blog", "posts", "drafts"]
+    assert [f.key for f in index.ancestors("drafts")] == ["posts", "blog"]
+    assert requests == []
+
+    client.create_folder({"name": "News"})
+    assert index.key_of("blog/news") == "news"
+    client.update_folder("blog", {"alias": "journal"})
+    assert index.path_of("drafts") == "journal/posts/drafts"
+    assert index.get_by_path("blog/posts") is None
+    client.delete_folder("posts")
+    assert "drafts" not in index
+    assert [f.key for f in index.children("blog")] == ["news"]
+    assert len(requests) == 3
+
+
+def test_folder_index_derives_missing_paths():
+    index = FolderIndex(
+        FolderSummary.model_validate(folder)
+        for folder in [_folder("child", "root"), _folder("root", None)]
+    )
+    assert index.path_of("child") == "root/child"
+    index.put(FolderSummary.model_validate(_folder("child", None)))
+    assert index.path_of("child") == "child"
+    assert [f.key for f in index.children()] == ["root", "child"]
+    assert index.children("root") == []
+
+
+def _published_version(key: str, number: int, json_schema: Any) -> dict[str, Any]:
+    return {
+        **VERSION_JSON,
+        "key": key,
+        "version_number": number,
+        "published_at": "2024-01-11T00:00:00Z",
+        "json_schema": json_schema,
+    }
+
+
+def test_batch_upsert_validates_payloads_locally():
+    schema = {
+        "type": "object",
+        "properties": {"title": {"type": "string", "maxLength": 5}},
+        "required": ["title"],
+    }
+    versions = [
+        _published_version("ver-1", 1, {"type": "object"}),
+        _published_version("ver-2", 2, schema),
+        {**VERSION_JSON, "key": "ver-3", "version_number": 3},
+    ]
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(f"{request.method} {request.url.path}")
+        if request.url.path.endswith("/model/versions/"):
+            return httpx.Response(
+                200,
+                json={
+                    "count": 3,
+                    "next": None,
+                    "previous": None,
+                    "results": versions,
+                },
+            )
+        return httpx.Response(200, json=RESOURCE_JSON)
+
+    client = build_management_client(handler)
+    items = [
+        BatchUpsertItem(external_id="ok", payload={"title": "Hi"}),
+        BatchUpsertItem(external_id="missing", payload={}),
+        BatchUpsertItem(external_id="long", payload={"title": "Too long"}),
+    ]
+    result = client.batch_upsert_resources("folder-1", items, validate=True)
+    assert result.success_count == 1
+    errors = {error.external_id: error.exception for error in result.failed}
+    assert isinstance(errors["missing"], FoxnoseValidationError)
+    assert errors["missing"].issues == [ValidationIssue("$.title", "is required")]
+    assert errors["long"].issues[0].path == "$.title"
+    assert requests.count("PUT /v1/env123/folders/folder-1/resources/") == 1
+
+    with pytest.raises(FoxnoseValidationError, match="folder 'folder-1'"):
+        client.create_resource("folder-1", {"data": {"title": 5}}, validate=True)
+    assert client.validate_payload("folder-1", {"data": {"title": "Hey"}}) == []
+    assert requests.count("GET /v1/env123/folders/folder-1/model/versions/") == 1
+    assert not any(request.startswith("POST") for request in requests)
+
+
+def test_stream_upsert_validate_loads_schema_once():
+    import time
+
+    schema = {"type": "object", "required": ["title"]}
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(f"{request.method} {request.url.path}")
+        if request.url.path.endswith("/model/versions/"):
+            # A slow schema load lets every worker reach it before it finishes.
+            time.sleep(0.05)
+            return httpx.Response(
+                200,
+                json={
+                    "count": 1,
+                    "next": None,
+                    "previous": None,
+                    "results": [_published_version("ver-1", 1, schema)],
+                },
+            )
+        return _upsert_echo_handler(request)
+
+    client = build_management_client(handler)
+    items = [
+        BatchUpsertItem(external_id=f"ext-{i}", payload={"title": str(i)})
+        for i in range(8)
+    ]
+    results = list(
+        client.stream_upsert_resources(
+            "folder-1", items, max_concurrency=4, validate=True
+        )
+    )
+    assert all(result.ok for result in results)
+    assert requests.count("GET /v1/env123/folders/folder-1/model/versions/") == 1
+
+
+def test_payload_validator_falls_back_to_fields():
+    fields = [
+        {**FIELD_JSON, "json_schema": None},
+        {
+            **FIELD_JSON,
+            "key": "tags",
+            "path": "tags",
+            "json_schema": None,
+            "required": False,
+            "multiple": True,
+            "nullable": True,
+        },
+    ]
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(f"{request.method} {request.url.path}")
+        path = request.url.path
+        if path.endswith("/model/versions/"):
+            page = [_published_version("ver-1", 1, None)]
+        elif path.endswith("/schema/tree/"):
+            page = fields
+        elif path.endswith("/publish/"):
+            return httpx.Response(200, json=_published_version("ver-2", 2, None))
+        else:
+            return httpx.Response(200, json=_published_version("ver-1", 1, None))
+        return httpx.Response(
+            200,
+            json={"count": len(page), "next": None, "previous": None, "results": page},
+        )
+
+    client = build_management_client(handler)
+    validator = client.get_payload_validator("folder-1", component="comp-1")
+    assert validator.is_valid({"title": "Post", "tags": None})
+    assert validator.is_valid({"title": "Post", "tags": ["a", "b"]})
+    issues = validator.validate({"title": "x" * 51, "tags": [1]})
+    assert [issue.path for issue in issues] == ["$.title", "$.tags"]
+    assert client.get_payload_validator("folder-1", component="comp-1") is validator
+    assert requests[0] == "GET /v1/env123/components/comp-1/model/versions/"
+
+    client.publish_component_version("comp-1", "ver-2")
+    assert client.get_payload_validator("folder-1", component="comp-1") is not validator
+
+
+def test_payload_validator_supports_schema_keywords():
+    validator = PayloadValidator(
+        {
+            "type": "object",
+            "$defs": {"slug": {"type": "string", "pattern": "^[a-z-]+$"}},
+            "properties": {
+                "slug": {"$ref": "#/$defs/slug"},
+                "rating": {"type": "integer", "minimum": 1, "maximum": 5},
+                "status": {"enum": ["draft", "live"]},
+                "flags": {
+                    "type": "array",
+                    "items": {"type": "boolean"},
+                    "uniqueItems": True,
+                },
+                "extra": {"oneOf": [{"type": "string"}, {"type": "number"}]},
+            },
+            "additionalProperties": False,
+        }
+    )
+    assert validator.is_valid(
+        {"slug": "a-b", "rating": 3.0, "status": "live", "flags": [True, False]}
+    )
+    issues = validator.validate(
+        {
+            "slug": "A B",
+            "rating": True,
+            "status": "gone",
+            "flags": [True, True],
+            "extra": None,
+            "unknown": 1,
+        }
+    )
+    assert [issue.path for issue in issues] == [
+        "$.slug",
+        "$.rating",
+        "$.status",
+        "$.flags",
+        "$.extra",
+        "$.unknown",
+    ]
+
+
+def _field(path: str, type_: str = "text", **extra: Any) -> dict[str, Any]:
+    parent, _, key = path.rpartition(".")
+    return {
+        **FIELD_JSON,
+        "key": key,
+        "name": key.title(),
+        "path": path,
+        "parent": parent or None,
+        "type": type_,
+        "required": False,
+        **extra,
+    }
+
+
+def test_plan_schema_changes_computes_minimal_diff():
+    current = [
+        FieldSummary.model_validate(field)
+        for field in [
+            _field("title", required=True),
+            _field("body"),
+            _field("author", "object"),
+            _field("author.name"),
+            _field("author.bio"),
+            _field("views", "integer"),
+        ]
+    ]
+    spec = [
+        {"key": "title", "name": "Headline", "type": "text", "required": True},
+        {
+            "key": "author",
+            "name": "Author",
+            "type": "object",
+            "fields": [
+                {"key": "name", "name": "Name", "type": "text"},
+                {"key": "email", "name": "Email", "type": "text"},
+            ],
+        },
+        {"key": "views", "name": "Views", "type": "number"},
+        {
+            "key": "seo",
+            "name": "SEO",
+            "type": "object",
+            "fields": [{"key": "slug", "name": "Slug", "type": "text"}],
+        },
+    ]
+    plan = plan_schema_changes(current, spec)
+    assert [(c.action, c.path) for c in plan] == [
+        ("delete", "body"),
+        ("delete", "author.bio"),
+        ("update", "title"),
+        ("create", "author.email"),
+        ("replace", "views"),
+        ("create", "seo"),
+        ("create", "seo.slug"),
+    ]
+    assert plan.changes[2].payload == {"name": "Headline"}
+    assert plan.changes[3].payload["parent"] == "author"
+    assert plan.dependencies[6] == (5,)
+    assert not plan_schema_changes(current[:1], [spec[0] | {"name": "Title"}])
+    with pytest.raises(ValueError, match="Duplicate"):
+        plan_schema_changes([], [spec[0], spec[0]])
+
+
+def test_apply_folder_schema_creates_version_and_publishes():
+    published = {**VERSION_JSON, "published_at": "2024-01-11T00:00:00Z"}
+    current = [_field("title"), _field("legacy")]
+    requests: list[tuple[str, str, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.replace("/v1/env123/folders/folder-1/model", "")
+        requests.append((request.method, path, request.url.params.get("path")))
+        if request.method == "GET" and path == "/versions/":
+            page = [published]
+        elif request.method == "GET":
+            page = current
+        elif path == "/versions/":
+            assert request.url.params["copy_from"] == "ver-1"
+            return httpx.Response(201, json={**VERSION_JSON, "key": "ver-2"})
+        elif request.method == "POST" and path.endswith("/schema/tree/"):
+            body = json.loads(request.content)
+            return httpx.Response(201, json=_field(body["key"]))
+        elif request.method == "DELETE":
+            return httpx.Response(204)
+        else:
+            return httpx.Response(200, json={**published, "key": "ver-2"})
+        return httpx.Response(
+            200,
+            json={"count": len(page), "next": None, "previous": None, "results": page},
+        )
+
+    client = build_management_client(handler)
+    spec = [
+        {"key": "title", "name": "Title", "type": "text"},
+        {
+            "key": "seo",
+            "name": "SEO",
+            "type": "object",
+            "fields": [{"key": "slug", "name": "Slug", "type": "text"}],
+        },
+    ]
+    result = client.apply_folder_schema(
+        "folder-1", spec, publish=True, max_concurrency=4
+    )
+    assert result.version == "ver-2"
+    assert result.created_version and result.published
+    assert [(c.action, c.path) for c in result.applied] == [
+        ("delete", "legacy"),
+        ("create", "seo"),
+        ("create", "seo.slug"),
+    ]
+    writes = [r for r in requests if r[0] != "GET"]
+    assert writes[0] == ("POST", "/versions/", None)
+    assert writes[-1] == ("POST", "/versions/ver-2/publish/", None)
+    creates = [r for r in writes if r[1] == "/versions/ver-2/schema/tree/"]
+    assert len(creates) == 2
+    assert ("DELETE", "/versions/ver-2/schema/tree/field/", "legacy") in writes
+
+    requests.clear()
+    current = [_field("title"), _field("seo", "object", name="SEO"), _field("seo.slug")]
+    published["key"] = "ver-2"
+    result = client.apply_folder_schema("folder-1", spec)
+    assert result.version is None and not result.changed
+    assert all(method == "GET" for method, _, _ in requests)
+
+
+API_INFO_JSON = {
+    "key": "api-1",
+    "name": "Blog",
+    "prefix": "blog",
+    "description": None,
+    "environment": ENV_KEY,
+    "version": None,
+    "is_auth_required": True,
+    "created_at": "2024-01-10T00:00:00Z",
+}
+
+
+def _page(items: list[dict[str, Any]]) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"count": len(items), "next": None, "previous": None, "results": items},
+    )
+
+
+def test_export_snapshot_collects_environment(tmp_path):
+    published = {**VERSION_JSON, "published_at": "2024-01-11T00:00:00Z"}
+    child = {**FOLDER_JSON, "key": "folder-2", "alias": "news", "parent": "folder-1"}
+    pages = {
+        "/v1/env123/components/": [COMPONENT_JSON],
+        "/v1/env123/folders/tree/": [FOLDER_JSON, child],
+        "/v1/env123/permissions/management-api/roles/": [MANAGEMENT_ROLE_JSON],
+        "/v1/env123/permissions/flux-api/roles/": [FLUX_ROLE_JSON],
+        "/v1/env123/api/": [API_INFO_JSON],
+        "/v1/env123/api/api-1/folders/": [API_FOLDER_JSON],
+        "/v1/env123/permissions/management-api/api-keys/": [MANAGEMENT_API_KEY_JSON],
+        "/v1/env123/permissions/flux-api/api-keys/": [FLUX_API_KEY_JSON],
+        "/v1/env123/folders/folder-1/model/versions/": [published],
+        "/v1/env123/folders/folder-1/model/versions/ver-1/schema/tree/": [
+            _field("seo", "object"),
+            _field("seo.slug"),
+        ],
+        "/v1/env123/folders/folder-2/model/versions/": [VERSION_JSON],
+        "/v1/env123/components/component-1/model/versions/": [],
+    }
+    permissions = {
+        "/v1/env123/permissions/management-api/roles/role-1/permissions/": [
+            {**ROLE_PERMISSION_JSON, "objects": ["folder-1"]}
+        ],
+        "/v1/env123/permissions/flux-api/roles/flux-role-1/permissions/": [
+            FLUX_ROLE_PERMISSION_JSON
+        ],
+        "/v1/env123/locales/": [LOCALE_JSON],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "GET"
+        if request.url.path in permissions:
+            return httpx.Response(200, json=permissions[request.url.path])
+        return _page(pages[request.url.path])
+
+    client = build_management_client(handler)
+    target = tmp_path / "snapshot.json"
+    snapshot = client.export_snapshot(target, max_concurrency=4)
+
+    assert snapshot["format"] == "foxnose-snapshot"
+    assert snapshot["environment"] == "env123"
+    assert [f["key"] for f in snapshot["folders"]] == ["folder-1", "folder-2"]
+    folder, draft_only = snapshot["folders"]
+    assert folder["schema"]["version"] == "Draft"
+    assert [f["path"] for f in folder["schema"]["fields"]] == ["seo", "seo.slug"]
+    assert draft_only["schema"] is None
+    assert snapshot["components"][0]["schema"] is None
+    assert snapshot["management_roles"][0]["permissions"][0]["objects"] == ["folder-1"]
+    assert snapshot["apis"][0]["folders"][0]["folder"] == "folder-1"
+    assert "secret_key" not in snapshot["management_api_keys"][0]
+    assert "secret_key" not in snapshot["flux_api_keys"][0]
+    assert json.loads(target.read_text()) == snapshot
+
+
+def test_import_snapshot_remaps_keys_in_dependency_order():
+    snapshot = {
+        "format": "foxnose-snapshot",
+        "version": 1,
+        "environment": "env-old",
+        "locales": [LOCALE_JSON, {**LOCALE_JSON, "code": "de", "name": "Deutsch"}],
+        "components": [],
+        # The child is listed first; the import still waits for its parent.
+        "folders": [
+            {**FOLDER_JSON, "key": "old-child", "alias": "news", "parent": "old-root"},
+            {
+                **FOLDER_JSON,
+                "key": "old-root",
+                "schema": {"version": "v1", "fields": [_field("title")]},
+            },
+        ],
+        "management_roles": [
+            {
+                **MANAGEMENT_ROLE_JSON,
+                "key": "old-role",
+                "permissions": [{**ROLE_PERMISSION_JSON, "objects": ["old-child"]}],
+            }
+        ],
+        "flux_roles": [],
+        "apis": [
+            {
+                **API_INFO_JSON,
+                "key": "old-api",
+                "folders": [{"folder": "old-child", "allowed_methods": ["get_one"]}],
+            }
+        ],
+        "management_api_keys": [MANAGEMENT_API_KEY_JSON],
+        "flux_api_keys": [],
+    }
+    writes: list[tuple[str, str, Any]] = []
+    created = iter(range(1, 100))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "GET" and path == "/v1/env123/locales/":
+            return httpx.Response(200, json=[LOCALE_JSON])
+        if request.method == "GET":
+            return _page([])
+        body = json.loads(request.content) if request.content else None
+        writes.append((request.method, path, body))
+        key = f"new-{next(created)}"
+        if path == "/v1/env123/folders/tree/":
+            return httpx.Response(201, json={**FOLDER_JSON, **body, "key": key})
+        if path == "/v1/env123/api/":
+            return httpx.Response(201, json={**API_INFO_JSON, **body, "key": key})
+        if path.endswith("/roles/"):
+            return httpx.Response(201, json={**MANAGEMENT_ROLE_JSON, "key": key})
+        if path.endswith("/locales/"):
+            return httpx.Response(201, json={**LOCALE_JSON, **body})
+        if path.endswith("/versions/"):
+            return httpx.Response(201, json={**VERSION_JSON, "key": key})
+        if path.endswith("/schema/tree/"):
+            return httpx.Response(201, json=_field(body["key"]))
+        if path.endswith("/folders/") and "/api/" in path:
+            return httpx.Response(201, json={**API_FOLDER_JSON, **body})
+        if path.endswith("/batch/"):
+            return httpx.Response(200, json=body)
+        return httpx.Response(200, json=VERSION_JSON)
+
+    client = build_management_client(handler)
+    result = client.import_snapshot(snapshot, max_concurrency=4)
+
+    assert not result.has_failures and not result.skipped
+    assert "locale:fr" not in result.completed
+    assert len(result.completed) == 8
+    key_map = result.key_map
+    assert set(key_map) == {"old-root", "old-child", "old-role", "old-api"}
+
+    def body_of(path: str) -> list[Any]:
+        return [body for method, p, body in writes if p == path]
+
+    folders = body_of("/v1/env123/folders/tree/")
+    assert "parent" not in folders[0]
+    assert {"name": "Folder", "alias": "news"}.items() <= folders[1].items()
+    assert folders[1]["parent"] == key_map["old-root"]
+    assert body_of("/v1/env123/locales/") == [
+        {"name": "Deutsch", "code": "de", "is_default": False}
+    ]
+    api_folders = body_of(f"/v1/env123/api/{key_map['old-api']}/folders/")
+    assert api_folders == [
+        {"folder": key_map["old-child"], "allowed_methods": ["get_one"]}
+    ]
+    role_root = "/v1/env123/permissions/management-api/roles"
+    permissions = body_of(f"{role_root}/{key_map['old-role']}/permissions/batch/")
+    assert permissions[0][0]["objects"] == [key_map["old-child"]]
+    schema_root = f"/v1/env123/folders/{key_map['old-root']}/model/versions/"
+    assert body_of(schema_root) == [{"name": "Version 1"}]
+    assert not any("api-keys" in path for _, path, _ in writes)
+
+
+def _environment_handler(
+    prefix: str,
+    *,
+    required: bool,
+    apis: list[dict[str, Any]],
+    locales: list[dict[str, Any]],
+    requests: list[str],
+) -> Callable[[httpx.Request], httpx.Response]:
+    root = {**FOLDER_JSON, "key": f"{prefix}-root", "alias": "blog"}
+    news = {**FOLDER_JSON, "key": f"{prefix}-news", "alias": "news"}
+    news["parent"] = root["key"]
+    published = {**VERSION_JSON, "key": f"{prefix}-v1"}
+    published["published_at"] = "2024-01-11T00:00:00Z"
+    role = {**MANAGEMENT_ROLE_JSON, "key": f"{prefix}-role"}
+    permission = {**ROLE_PERMISSION_JSON, "objects": [news["key"]]}
+    lists = {
+        "/v1/env123/locales/": locales,
+        f"/v1/env123/permissions/management-api/roles/{role['key']}/permissions/": [
+            permission
+        ],
+    }
+    pages = {
+        "/v1/env123/folders/tree/": [root, news],
+        "/v1/env123/permissions/management-api/roles/": [role],
+        "/v1/env123/api/": apis,
+        f"/v1/env123/folders/{root['key']}/model/versions/": [published],
+        f"/v1/env123/folders/{root['key']}/model/versions/{published['key']}"
+        "/schema/tree/": [_field("title", required=required)],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path in lists:
+            return httpx.Response(200, json=lists[request.url.path])
+        return _page(pages.get(request.url.path, []))
+
+    return handler
+
+
+def test_diff_environments_matches_objects_by_identity():
+    source_requests: list[str] = []
+    target_requests: list[str] = []
+    api = {**API_INFO_JSON, "key": "s-api"}
+    source = build_management_client(
+        _environment_handler(
+            "s",
+            required=False,
+            apis=[api],
+            locales=[LOCALE_JSON],
+            requests=source_requests,
+        ),
+        object_cache=ImmutableCache(),
+    )
+    target = build_management_client(
+        _environment_handler(
+            "t",
+            required=True,
+            apis=[],
+            locales=[LOCALE_JSON, {**LOCALE_JSON, "code": "de"}],
+            requests=target_requests,
+        ),
+    )
+
+    diff = diff_environments(source, target, max_concurrency=4)
+    assert diff.has_changes
+    summary = [(c.section, c.name, c.action) for c in diff.changes]
+    assert summary == [
+        ("locales", "de", "removed"),
+        ("folders", "blog", "changed"),
+        ("apis", "blog", "added"),
+    ]
+    # Keys differ, but the role's permission scope points at the same folder.
+    assert diff.for_section("management_roles") == []
+    assert diff.changes[1].changes == {"fields[title].required": (False, True)}
+
+    # The published field tree is served from the source's cache next time.
+    fields = "/v1/env123/folders/s-root/model/versions/s-v1/schema/tree/"
+    assert source_requests.count(fields) == 1
+    again = diff_environments(source, target.export_snapshot())
+    assert again == diff
+    assert source_requests.count(fields) == 1
+
+
+def test_sync_management_role_permissions_sends_only_differences():
+    current = [
+        {**ROLE_PERMISSION_JSON, "actions": ["read", "update"]},
+        {"content_type": "folder-items", "actions": ["read"], "all_objects": False},
+        {"content_type": "schemas", "actions": ["read"], "all_objects": True},
+    ]
+    calls: list[tuple[str, str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.replace(
+            "/v1/env123/permissions/management-api/roles/role-1/permissions/", "/"
+        )
+        body = json.loads(request.content) if request.content else None
+        if request.method == "GET" and path == "/":
+            return httpx.Response(200, json=current)
+        if request.method == "GET":
+            assert request.url.params["content_type"] == "folder-items"
+            return httpx.Response(
+                200,
+                json=[
+                    {"content_type": "folder-items", "object_key": "folder-1"},
+                    {"content_type": "folder-items", "object_key": "folder-2"},
+                ],
+            )
+        calls.append((request.method, path, body or dict(request.url.params)))
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(201, json=body)
+
+    client = build_management_client(handler)
+    result = client.sync_management_role_permissions(
+        "role-1",
+        [
+            {**ROLE_PERMISSION_JSON, "actions": ["update", "read"]},
+            {
+                "content_type": "folder-items",
+                "actions": ["read", "update"],
+                "all_objects": False,
+                "objects": ["folder-2", "folder-3"],
+            },
+        ],
+        max_concurrency=4,
+    )
+
+    added = {"content_type": "folder-items", "object_key": "folder-3"}
+    removed = {"content_type": "folder-items", "object_key": "folder-1"}
+    assert not result.has_failures and not result.skipped
+    assert [(c.action, c.content_type) for c in result.applied] == [
+        ("upsert", "folder-items"),
+        ("add_object", "folder-items"),
+        ("delete_object", "folder-items"),
+        ("delete", "schemas"),
+    ]
+    assert sorted(calls, key=repr) == sorted(
+        [
+            (
+                "POST",
+                "/",
+                {
+                    "content_type": "folder-items",
+                    "actions": ["read", "update"],
+                    "all_objects": False,
+                },
+            ),
+            ("POST", "/objects/", added),
+            ("DELETE", "/objects/", removed),
+            ("DELETE", "/", {"content_type": "schemas"}),
+        ],
+        key=repr,
+    )
+    # The upsert precedes the object it scopes.
+    upsert = ("POST", "/", result.applied[0].payload)
+    assert calls.index(("POST", "/objects/", added)) > calls.index(upsert)
+
+    calls.clear()
+    current[1] = {
+        "content_type": "folder-items",
+        "actions": ["read", "update"],
+        "all_objects": False,
+        "objects": ["folder-2", "folder-3"],
+    }
+    del current[2]
+    result = client.sync_management_role_permissions(
+        "role-1",
+        [
+            {**ROLE_PERMISSION_JSON, "actions": ["read", "update"]},
+            {**current[1]},
+        ],
+    )
+    assert not result.changed and calls == []
+
+
+def test_fan_out_runs_calls_and_specs_with_errors_captured():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/missing/"):
+            return httpx.Response(404, json={"message": "Not found"})
+        if request.method == "POST":
+            return httpx.Response(200, json={"echo": json.loads(request.content)})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    client = build_management_client(handler)
+    progress: list[tuple[int, int]] = []
+    outcomes = list(
+        client.fan_out(
+            client.request,
+            [
+                ("GET", "/v1/env123/a/"),
+                ("GET", "/v1/env123/missing/"),
+                ("GET", "/v1/b/"),
+            ],
+            max_concurrency=2,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+    )
+    assert [outcome.index for outcome in outcomes] == [0, 1, 2]
+    assert outcomes[0].result == {"path": "/v1/env123/a/"}
+    assert isinstance(outcomes[1].error, FoxnoseAPIError)
+    assert outcomes[2].error is None
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    specs = [
+        RequestSpec("GET", "/v1/env123/a/", params={"page": "2"}),
+        RequestSpec("POST", "/v1/env123/b/", json_body={"name": "B"}),
+    ]
+    results = sorted(
+        (outcome.index, outcome.result)
+        for outcome in client.fan_out(specs, ordered=False)
+    )
+    assert results == [
+        (0, {"path": "/v1/env123/a/"}),
+        (1, {"echo": {"name": "B"}}),
+    ]
+
+
 def test_create_folder_posts_payload():
     captured = {}
 
@@ -955,6 +1745,206 @@ def test_list_resources_returns_model():
     assert captured["path"] == "/v1/env123/folders/folder-1/resources/"
 
 
+def test_compact_backend_returns_slot_models():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "revisions" in request.url.path:
+            results = [REVISION_JSON]
+        elif "resources" in request.url.path:
+            results = [RESOURCE_JSON]
+        else:
+            results = [FOLDER_JSON]
+        payload = {"count": 1, "next": None, "previous": None, "results": results}
+        return httpx.Response(200, json=payload)
+
+    client = build_management_client(handler, model_backend="compact")
+    resources = client.list_resources("folder-1")
+    assert isinstance(resources, CompactPage)
+    resource = resources.results[0]
+    assert isinstance(resource, CompactResourceSummary)
+    assert not hasattr(resource, "__dict__")
+    assert (
+        resource.model_dump()
+        == ResourceSummary.model_validate(RESOURCE_JSON).model_dump()
+    )
+
+    revision = client.list_revisions("folder-1", resource).results[0]
+    assert isinstance(revision, CompactRevisionSummary)
+    assert (
+        revision.created_at == RevisionSummary.model_validate(REVISION_JSON).created_at
+    )
+    assert revision.published_at is None
+
+    folder = client.list_folders().results[0]
+    assert isinstance(folder, CompactFolderSummary)
+    assert folder.alias == "folder"
+
+
+def test_compact_backend_rejects_missing_required_field():
+    def handler(request: httpx.Request) -> httpx.Response:
+        item = {k: v for k, v in RESOURCE_JSON.items() if k != "folder"}
+        payload = {"count": 1, "next": None, "previous": None, "results": [item]}
+        return httpx.Response(200, json=payload)
+
+    client = build_management_client(handler, model_backend="compact")
+    with pytest.raises(ValueError, match="folder"):
+        client.list_resources("folder-1")
+
+
+def test_compact_backend_rejects_null_required_field_like_pydantic():
+    def handler(request: httpx.Request) -> httpx.Response:
+        item = {**RESOURCE_JSON, "folder": None}
+        payload = {"count": 1, "next": None, "previous": None, "results": [item]}
+        return httpx.Response(200, json=payload)
+
+    for backend in ("pydantic", "compact"):
+        client = build_management_client(handler, model_backend=backend)
+        with pytest.raises(ValueError, match="folder"):
+            client.list_resources("folder-1")
+
+
+def test_unknown_model_backend_raises():
+    with pytest.raises(ValueError, match="model_backend"):
+        ManagementClient(
+            environment_key="env123",
+            auth=SimpleKeyAuth("pub", "secret"),
+            model_backend="msgspec",
+        )
+
+
+def test_list_resources_interns_repeated_values():
+    def handler(request: httpx.Request) -> httpx.Response:
+        items = [{**RESOURCE_JSON, "key": f"resource-{i}"} for i in range(3)]
+        payload = {"count": 3, "next": None, "previous": None, "results": items}
+        # Encode to bytes so every decoded value is a distinct string object.
+        return httpx.Response(200, content=json.dumps(payload).encode())
+
+    client = build_management_client(handler)
+    results = client.list_resources("folder-1").results
+    assert results[0].folder is results[1].folder is results[2].folder
+    assert results[0].content_type is results[2].content_type
+
+    client = build_management_client(handler, intern_strings=False)
+    results = client.list_resources("folder-1").results
+    assert results[0].folder == results[1].folder
+    assert results[0].folder is not results[1].folder
+
+
+def test_list_resources_interns_fields_missing_from_first_item():
+    def handler(request: httpx.Request) -> httpx.Response:
+        first = {k: v for k, v in RESOURCE_JSON.items() if k != "component"}
+        items = [first] + [
+            {**RESOURCE_JSON, "key": f"resource-{i}", "component": "comp-1"}
+            for i in range(1, 3)
+        ]
+        payload = {"count": 3, "next": None, "previous": None, "results": items}
+        return httpx.Response(200, content=json.dumps(payload).encode())
+
+    client = build_management_client(handler)
+    results = client.list_resources("folder-1").results
+    assert results[0].component is None
+    assert results[1].component is results[2].component
+
+
+def _paged_resources_handler(requests_seen: list[dict[str, str]], total: int = 5):
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        requests_seen.append(params)
+        limit = int(params.get("limit", 2))
+        offset = int(params.get("offset", 0))
+        items = [
+            {**RESOURCE_JSON, "key": f"resource-{i}"}
+            for i in range(offset, min(offset + limit, total))
+        ]
+        next_link = None
+        if offset + limit < total:
+            next_link = (
+                "https://api.example.com/v1/env123/folders/folder-1/resources/"
+                f"?limit={limit}&offset={offset + limit}"
+            )
+        payload = {
+            "count": total,
+            "next": next_link,
+            "previous": None,
+            "results": items,
+        }
+        return httpx.Response(200, json=payload)
+
+    return handler
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_resources_follows_next_links(prefetch):
+    seen: list[dict[str, str]] = []
+    client = build_management_client(_paged_resources_handler(seen))
+    keys = [
+        item.key
+        for item in client.iter_resources(
+            "folder-1", page_size=2, params={"search": "x"}, prefetch=prefetch
+        )
+    ]
+    assert keys == [f"resource-{i}" for i in range(5)]
+    assert [params.get("offset") for params in seen] == [None, "2", "4"]
+    assert all(params["limit"] == "2" for params in seen)
+    assert all(params["search"] == "x" for params in seen)
+
+
+def test_iter_resources_max_items_stops_early():
+    seen: list[dict[str, str]] = []
+    client = build_management_client(_paged_resources_handler(seen))
+    items = list(client.iter_resources("folder-1", page_size=2, max_items=2))
+    assert [item.key for item in items] == ["resource-0", "resource-1"]
+    assert len(seen) == 1
+    assert list(client.iter_resources("folder-1", max_items=0)) == []
+
+
+def test_iter_resources_validates_arguments():
+    client = build_management_client(lambda request: httpx.Response(200, json={}))
+    with pytest.raises(ValueError):
+        client.iter_resources("folder-1", page_size=0)
+    with pytest.raises(ValueError):
+        client.iter_resources("folder-1", max_items=-1)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_scan_resources_fetches_offset_windows(ordered):
+    seen: list[dict[str, str]] = []
+    client = build_management_client(_paged_resources_handler(seen, total=7))
+    keys = [
+        item.key
+        for item in client.scan_resources(
+            "folder-1", page_size=2, max_concurrency=3, ordered=ordered
+        )
+    ]
+    expected = [f"resource-{i}" for i in range(7)]
+    if ordered:
+        assert keys == expected
+    else:
+        assert sorted(keys) == expected
+    assert sorted(int(params["offset"]) for params in seen) == [0, 2, 4, 6]
+
+
+def test_scan_resources_steps_by_server_page_size():
+    seen: list[dict[str, str]] = []
+    handler = _paged_resources_handler(seen, total=5)
+
+    def capped(request: httpx.Request) -> httpx.Response:
+        # Simulate a server that caps ``limit`` at 2 regardless of the request.
+        url = request.url.copy_set_param("limit", "2")
+        return handler(httpx.Request(request.method, url))
+
+    client = build_management_client(capped)
+    keys = [item.key for item in client.scan_resources("folder-1", page_size=50)]
+    assert keys == [f"resource-{i}" for i in range(5)]
+
+
+def test_scan_resources_validates_arguments():
+    client = build_management_client(lambda request: httpx.Response(200, json={}))
+    with pytest.raises(ValueError):
+        client.scan_resources("folder-1", page_size=0)
+    with pytest.raises(ValueError):
+        client.scan_resources("folder-1", max_concurrency=0)
+
+
 def test_create_resource_supports_component_param():
     captured = {}
 
@@ -1303,6 +2293,20 @@ def test_batch_upsert_resources_progress_callback():
     assert completed_values == [1, 2, 3]
 
 
+def test_batch_upsert_resources_logs_failing_progress_callback(caplog):
+    def progress(done: int, total: int) -> None:
+        raise RuntimeError("callback bug")
+
+    client = build_management_client(_upsert_echo_handler)
+    items = [
+        BatchUpsertItem(external_id=f"ext-{i}", payload={"title": f"Item {i}"})
+        for i in range(2)
+    ]
+    result = client.batch_upsert_resources("folder-1", items, on_progress=progress)
+    assert result.success_count == 2
+    assert [r.levelname for r in caplog.records] == ["ERROR", "ERROR"]
+
+
 def test_batch_upsert_resources_with_component():
     captured: list[str] = []
 
@@ -1333,6 +2337,403 @@ def test_batch_upsert_resources_rejects_zero_concurrency():
         client.batch_upsert_resources("folder-1", items, max_concurrency=0)
 
 
+def _upsert_echo_handler(request: httpx.Request) -> httpx.Response:
+    ext_id = str(request.url).split("external_id=")[1].split("&")[0]
+    if ext_id == "ext-bad":
+        return httpx.Response(
+            400, json={"message": "Bad request", "error_code": "validation_error"}
+        )
+    return httpx.Response(200, json={**RESOURCE_JSON, "external_id": ext_id})
+
+
+def test_stream_upsert_resources_yields_ordered_results():
+    client = build_management_client(_upsert_echo_handler)
+    ids = ["ext-0", "ext-bad", "ext-2", "ext-3"]
+    items = (BatchUpsertItem(external_id=i, payload={"title": i}) for i in ids)
+    results = list(
+        client.stream_upsert_resources(
+            "folder-1", items, max_concurrency=2, ordered=True
+        )
+    )
+    assert [r.external_id for r in results] == ids
+    assert all(isinstance(r, BatchItemResult) for r in results)
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert isinstance(results[1].exception, FoxnoseAPIError)
+    assert results[1].resource is None
+    assert results[2].resource.external_id == "ext-2"
+
+
+def test_stream_upsert_resources_pulls_items_lazily():
+    pulled = 0
+
+    def items():
+        nonlocal pulled
+        for i in range(1000):
+            pulled += 1
+            yield BatchUpsertItem(external_id=f"ext-{i}", payload={"title": "x"})
+
+    client = build_management_client(_upsert_echo_handler)
+    stream = client.stream_upsert_resources("folder-1", items(), max_concurrency=3)
+    first = next(stream)
+    assert first.ok
+    assert pulled <= 4
+    stream.close()
+    assert pulled <= 4
+
+
+def test_batch_upsert_resources_without_collecting_results():
+    client = build_management_client(_upsert_echo_handler)
+    items = [
+        BatchUpsertItem(external_id=i, payload={"title": i})
+        for i in ["ext-0", "ext-bad", "ext-2"]
+    ]
+    result = client.batch_upsert_resources("folder-1", items, collect_results=False)
+    assert result.succeeded == []
+    assert result.omitted_count == 2
+    assert result.success_count == 2
+    assert result.failure_count == 1
+    assert result.total == 3
+    assert result.failed[0].index == 1
+
+
+def test_batch_upsert_resources_with_adaptive_concurrency():
+    client = build_management_client(_upsert_echo_handler)
+    # A generous tolerance keeps scheduling jitter from triggering backoff.
+    limiter = AdaptiveConcurrency(initial=1, max_limit=3, latency_tolerance=1000)
+    items = [
+        BatchUpsertItem(external_id=f"ext-{i}", payload={"title": "x"})
+        for i in range(20)
+    ]
+    result = client.batch_upsert_resources("folder-1", items, max_concurrency=limiter)
+    assert result.success_count == 20
+    assert limiter.limit == 3
+    assert [sample.limit for sample in limiter.history] == [1, 2, 3]
+
+
+def test_upsert_resource_skips_unchanged_payload(tmp_path):
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return _upsert_echo_handler(request)
+
+    client = build_management_client(handler)
+    store = ResourceHashStore(tmp_path / "hashes.db")
+    first = client.upsert_resource(
+        "folder-1", {"a": 1, "b": 2}, external_id="ext-1", hash_store=store
+    )
+    # Same content with a different key order hashes identically.
+    second = client.upsert_resource(
+        "folder-1", {"b": 2, "a": 1}, external_id="ext-1", hash_store=store
+    )
+    assert calls == 1
+    assert second == first
+    client.upsert_resource(
+        "folder-1", {"a": 1, "b": 3}, external_id="ext-1", hash_store=store
+    )
+    assert calls == 2
+    store.close()
+
+    reopened = ResourceHashStore(tmp_path / "hashes.db")
+    assert len(reopened) == 1
+    reopened.close()
+
+
+def test_batch_upsert_resources_counts_skipped_items():
+    client = build_management_client(_upsert_echo_handler)
+    store = ResourceHashStore()
+    items = [
+        BatchUpsertItem(external_id=f"ext-{i}", payload={"title": i}) for i in range(4)
+    ]
+    client.batch_upsert_resources("folder-1", items[:3], hash_store=store)
+
+    result = client.batch_upsert_resources("folder-1", items, hash_store=store)
+    assert result.skipped_count == 3
+    assert [r.external_id for r in result.succeeded] == ["ext-3"]
+    assert result.success_count == 1
+    assert result.total == 4
+
+
+def test_batch_upsert_skipped_items_do_not_feed_adaptive_limiter():
+    import time
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.02)
+        return _upsert_echo_handler(request)
+
+    client = build_management_client(handler)
+    store = ResourceHashStore()
+    items = [
+        BatchUpsertItem(external_id=f"ext-{i}", payload={"title": i}) for i in range(40)
+    ]
+    client.batch_upsert_resources("folder-1", items[:30], hash_store=store)
+
+    # Skipped items return in microseconds; if they counted as calls, every
+    # real upsert would look far slower than the baseline and back off.
+    limiter = AdaptiveConcurrency(initial=4, max_limit=8, latency_tolerance=5)
+    result = client.batch_upsert_resources(
+        "folder-1", items, hash_store=store, max_concurrency=limiter
+    )
+    assert result.skipped_count == 30
+    assert result.success_count == 10
+    assert limiter.limit >= 4
+    assert min(sample.limit for sample in limiter.history) == 4
+
+
+def test_delete_resource_discards_hash_store_entry():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "DELETE":
+            if "res-2" in request.url.path:
+                return httpx.Response(404, json={"message": "Not found"})
+            return httpx.Response(204)
+        ext_id = request.url.params["external_id"]
+        return httpx.Response(
+            200,
+            json={**RESOURCE_JSON, "key": f"res-{ext_id}", "external_id": ext_id},
+        )
+
+    client = build_management_client(handler)
+    store = ResourceHashStore()
+    for ext_id in ("0", "1", "2"):
+        client.upsert_resource(
+            "folder-1", {"title": ext_id}, external_id=ext_id, hash_store=store
+        )
+    client.delete_resource("folder-1", "res-0", hash_store=store)
+    assert store.get_digest("folder-1", "0") is None
+    assert len(store) == 2
+
+    result = client.batch_delete_resources(
+        "folder-1", ["res-1", "res-2"], missing_ok=True, hash_store=store
+    )
+    assert result.success_count == 2
+    assert len(store) == 0
+
+
+def test_seed_hash_store_from_published_data():
+    listing = [
+        {**RESOURCE_JSON, "key": "res-1", "external_id": "ext-1"},
+        {**RESOURCE_JSON, "key": "res-2", "external_id": "ext-2"},
+        {**RESOURCE_JSON, "key": "res-3", "external_id": None},
+    ]
+    upserts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "PUT":
+            upserts.append(request.url.params["external_id"])
+            return _upsert_echo_handler(request)
+        if path.endswith("/res-1/data/"):
+            return httpx.Response(200, json={"title": "one"})
+        if path.endswith("/data/"):
+            return httpx.Response(404, json={"message": "Not published"})
+        payload = {"count": 3, "next": None, "previous": None, "results": listing}
+        return httpx.Response(200, json=payload)
+
+    client = build_management_client(handler)
+    store = ResourceHashStore()
+    assert client.seed_hash_store("folder-1", store) == 1
+    items = [
+        BatchUpsertItem(external_id="ext-1", payload={"title": "one"}),
+        BatchUpsertItem(external_id="ext-2", payload={"title": "two"}),
+    ]
+    result = client.batch_upsert_resources("folder-1", items, hash_store=store)
+    assert result.skipped_count == 1
+    assert upserts == ["ext-2"]
+    # Seeded hashes also match payloads sent with the ``data`` wrapper.
+    wrapped = client.upsert_resource(
+        "folder-1", {"data": {"title": "one"}}, external_id="ext-1", hash_store=store
+    )
+    assert wrapped.key == "res-1"
+    assert upserts == ["ext-2"]
+
+
+def test_hash_store_indexes_resource_keys_of_older_stores(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "hashes.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE resource_hashes (folder TEXT NOT NULL, "
+        "external_id TEXT NOT NULL, digest TEXT NOT NULL, resource TEXT, "
+        "PRIMARY KEY (folder, external_id))"
+    )
+    resource = {**RESOURCE_JSON, "key": "res-1", "external_id": "ext-1"}
+    conn.execute(
+        "INSERT INTO resource_hashes VALUES (?, ?, ?, ?)",
+        ("folder-1", "ext-1", "digest", json.dumps(resource)),
+    )
+    conn.commit()
+    conn.close()
+
+    store = ResourceHashStore(path)
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN DELETE FROM resource_hashes "
+        "WHERE folder = ? AND resource_key = ?",
+        ("folder-1", "res-1"),
+    ).fetchall()
+    assert "resource_hashes_by_key" in str(plan)
+    store.discard_resource("folder-1", "res-1")
+    assert len(store) == 0
+    store.close()
+
+
+def test_batch_upsert_resources_resumes_from_journal(tmp_path):
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.params["external_id"])
+        return _upsert_echo_handler(request)
+
+    client = build_management_client(handler)
+    path = tmp_path / "import.jsonl"
+    items = [
+        BatchUpsertItem(external_id=ext_id, payload={"title": ext_id})
+        for ext_id in ["ext-0", "ext-bad", "ext-2"]
+    ]
+    journal = BatchJournal(path)
+    first = client.batch_upsert_resources("folder-1", items, journal=journal)
+    journal.close()
+    assert first.success_count == 2
+    assert first.failure_count == 1
+
+    # Simulate a crash that left a torn record at the end of the file.
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write('{"i": 3, "id": "ext-')
+
+    sent.clear()
+    journal = BatchJournal(path)
+    assert journal.completed == {"ext-0", "ext-2"}
+    assert "ext-bad" in journal.failures
+    second = client.batch_upsert_resources("folder-1", items, journal=journal)
+    assert sent == ["ext-bad"]
+    assert second.skipped_count == 2
+    assert second.failure_count == 1
+    journal.close()
+
+    with pytest.raises(ValueError, match="belongs to folder"):
+        client.batch_upsert_resources("folder-2", items, journal=BatchJournal(path))
+
+
+@pytest.mark.parametrize(
+    ("put_body", "refetch", "expected_requests"),
+    [
+        (RESOURCE_JSON, True, ["PUT"]),
+        (None, True, ["PUT", "GET"]),
+        (None, False, ["PUT"]),
+    ],
+)
+def test_update_resource_single_round_trip(put_body, refetch, expected_requests):
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        if request.method == "PUT" and put_body is None:
+            return httpx.Response(200)
+        return httpx.Response(200, json=RESOURCE_JSON)
+
+    client = build_management_client(handler)
+    resource = client.update_resource(
+        "folder-1", "res-1", {"title": "x"}, refetch=refetch
+    )
+    assert methods == expected_requests
+    if refetch or put_body is not None:
+        assert resource.key == RESOURCE_JSON["key"]
+    else:
+        assert resource is None
+
+
+def test_batch_update_resources_sends_one_request_per_item():
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        if request.url.path.endswith("/res-bad/"):
+            return httpx.Response(400, json={"message": "Invalid"})
+        return httpx.Response(200)
+
+    client = build_management_client(handler)
+    items = [
+        BatchUpdateItem(key=key, payload={"title": key})
+        for key in ["res-0", "res-bad", "res-2"]
+    ]
+    result = client.batch_update_resources("folder-1", items, max_concurrency=2)
+    assert methods == ["PUT"] * 3
+    assert result.success_count == 2
+    assert [(e.index, e.key) for e in result.failed] == [(1, "res-bad")]
+    assert all(outcome.result is None for outcome in result.succeeded)
+
+
+def test_batch_delete_resources_reports_failures_and_missing():
+    deleted: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.path.rstrip("/").rsplit("/", 1)[-1]
+        if key == "res-gone":
+            return httpx.Response(404, json={"message": "Not found"})
+        if key == "res-locked":
+            return httpx.Response(409, json={"message": "Locked"})
+        deleted.append(key)
+        return httpx.Response(204)
+
+    client = build_management_client(handler)
+    keys = ["res-0", "res-gone", "res-locked", "res-3"]
+    progress: list[tuple[int, int]] = []
+    result = client.batch_delete_resources(
+        "folder-1", keys, max_concurrency=2, on_progress=lambda *p: progress.append(p)
+    )
+    assert sorted(deleted) == ["res-0", "res-3"]
+    assert [(e.index, e.key) for e in sorted(result.failed, key=lambda e: e.index)] == [
+        (1, "res-gone"),
+        (2, "res-locked"),
+    ]
+    assert progress[-1] == (4, 4)
+
+    result = client.batch_delete_resources("folder-1", keys, missing_ok=True)
+    assert result.success_count == 3
+    assert [e.key for e in result.failed] == ["res-locked"]
+    assert result.failed[0].exception.status_code == 409
+
+    with pytest.raises(FoxnoseAPIError):
+        client.batch_delete_resources("folder-1", keys, fail_fast=True)
+
+
+def test_stream_publish_and_validate_revisions():
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/validate/"):
+            return httpx.Response(200, json={"errors": []})
+        body = json.loads(request.content) if request.content else None
+        assert body == {"note": "release"}
+        return httpx.Response(200, json=REVISION_JSON)
+
+    client = build_management_client(handler)
+    revision = RevisionSummary.model_validate(REVISION_JSON)
+    items = [("resource-1", "rev-a"), revision]
+
+    outcomes = list(
+        client.stream_publish_revisions(
+            "folder-1", items, payload={"note": "release"}, ordered=True
+        )
+    )
+    assert [(o.resource, o.key) for o in outcomes] == [
+        ("resource-1", "rev-a"),
+        (revision.resource, revision.key),
+    ]
+    assert all(isinstance(o.result, RevisionSummary) for o in outcomes)
+
+    result = client.batch_validate_revisions("folder-1", items, collect_results=False)
+    assert result.omitted_count == 2
+    assert not result.has_failures
+    assert (
+        "/v1/env123/folders/folder-1/resources/resource-1/revisions/rev-a/validate/"
+        in paths
+    )
+
+
 def test_publish_revision_uses_nested_path():
     captured = {}
 
@@ -1349,6 +2750,79 @@ def test_publish_revision_uses_nested_path():
     )
 
 
+@pytest.mark.parametrize("ordered", [True, False])
+def test_get_resources_data_many_skips_failed_items(ordered):
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.path.split("/")[-3]
+        if key == "res-missing":
+            return httpx.Response(404, json={"message": "Not found"})
+        return httpx.Response(200, json={"key": key})
+
+    client = build_management_client(handler)
+    keys = [f"res-{i}" for i in range(6)]
+    keys.insert(2, "res-missing")
+    errors: dict[str, int] = {}
+    pairs = list(
+        client.get_resources_data_many(
+            "folder-1",
+            keys,
+            max_concurrency=3,
+            ordered=ordered,
+            on_error=lambda key, exc: errors.update({key: exc.status_code}),
+        )
+    )
+    fetched = [key for key, _ in pairs]
+    if ordered:
+        assert fetched == [key for key in keys if key != "res-missing"]
+    else:
+        assert sorted(fetched) == sorted(k for k in keys if k != "res-missing")
+    assert all(data == {"key": key} for key, data in pairs)
+    assert errors == {"res-missing": 404}
+
+    # Without a callback the failure is collected and the rest still arrive.
+    fetched_data = client.get_resources_data_many("folder-1", keys)
+    assert len(list(fetched_data)) == 6
+    assert [(e.index, e.key) for e in fetched_data.failed] == [(2, "res-missing")]
+    assert fetched_data.failed[0].exception.status_code == 404
+
+
+def test_get_resources_data_many_retries_overloaded_items():
+    attempts: dict[str, int] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.path.split("/")[-3]
+        attempts[key] = attempts.get(key, 0) + 1
+        if key == "res-flaky" and attempts[key] < 3:
+            return httpx.Response(503, json={"message": "Unavailable"})
+        if key == "res-down":
+            return httpx.Response(503, json={"message": "Unavailable"})
+        return httpx.Response(200, json={"key": key})
+
+    client = build_management_client(handler)
+    client._transport._retry = RetryConfig(attempts=1)  # type: ignore[attr-defined]
+    fetched_data = client.get_resources_data_many(
+        "folder-1", ["res-0", "res-flaky", "res-down"], retry_backoff=0
+    )
+    assert [key for key, _ in fetched_data] == ["res-0", "res-flaky"]
+    assert [error.key for error in fetched_data.failed] == ["res-down"]
+    assert attempts == {"res-0": 1, "res-flaky": 3, "res-down": 3}
+
+
+def test_get_revisions_data_many_accepts_pairs_and_summaries():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"path": request.url.path})
+
+    client = build_management_client(handler)
+    revision = RevisionSummary.model_validate(REVISION_JSON)
+    pairs = list(
+        client.get_revisions_data_many("folder-1", [("resource-1", "rev-a"), revision])
+    )
+    assert [key for key, _ in pairs] == ["rev-a", revision.key]
+    assert pairs[0][1]["path"] == (
+        "/v1/env123/folders/folder-1/resources/resource-1/revisions/rev-a/data/"
+    )
+
+
 def test_get_revision_data_returns_dict():
     def handler(request: httpx.Request) -> httpx.Response:
         return httpx.Response(200, json={"title": "Sample"})
@@ -1358,6 +2832,132 @@ def test_get_revision_data_returns_dict():
     assert data["title"] == "Sample"
 
 
+def test_object_cache_serves_published_schema_versions():
+    requests: list[str] = []
+    published = {**VERSION_JSON, "published_at": "2024-01-11T00:00:00Z"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params.get("include_schema")
+        requests.append(f"{request.method} {request.url.path} {query}")
+        if "ver-draft" in request.url.path:
+            return httpx.Response(200, json={**VERSION_JSON, "key": "ver-draft"})
+        body = dict(published)
+        if query == "false":
+            body.pop("json_schema")
+        return httpx.Response(200, json=body)
+
+    cache = ImmutableCache(mutable_ttl=0)
+    client = build_management_client(handler, object_cache=cache)
+    path = "GET /v1/env123/folders/folder-1/model/versions/ver-1/"
+    for _ in range(3):
+        version = client.get_folder_version("folder-1", "ver-1", include_schema=True)
+        assert version.json_schema == {"type": "object"}
+        client.get_component_version("comp-1", "ver-draft")
+    # The frozen schema is reused; only the lifecycle metadata is refetched.
+    assert [r for r in requests if r.startswith(path)] == [
+        f"{path} true",
+        f"{path} false",
+        f"{path} false",
+    ]
+    assert len([r for r in requests if "comp-1/model/versions/ver-draft/" in r]) == 3
+
+    published["archived_at"] = "2024-02-01T00:00:00Z"
+    version = client.get_folder_version("folder-1", "ver-1", include_schema=True)
+    assert version.archived_at is not None
+    assert version.json_schema == {"type": "object"}
+
+
+def test_object_cache_forgets_draft_versions_on_field_changes():
+    fields: list[str] = ["title"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "/schema/tree/" in request.url.path:
+            fields.append("body")
+            return httpx.Response(200, json=FIELD_JSON)
+        schema = {"type": "object", "properties": {f: {} for f in fields}}
+        return httpx.Response(200, json={**VERSION_JSON, "json_schema": schema})
+
+    client = build_management_client(handler, object_cache=ImmutableCache())
+    draft = client.get_folder_version("folder-1", "ver-1", include_schema=True)
+    assert list(draft.json_schema["properties"]) == ["title"]
+    client.create_folder_field("folder-1", "ver-1", {"key": "body"})
+    draft = client.get_folder_version("folder-1", "ver-1", include_schema=True)
+    assert list(draft.json_schema["properties"]) == ["title", "body"]
+
+
+def test_object_cache_forgets_sibling_versions_on_publish():
+    calls: list[str] = []
+    archived: dict[str, str | None] = {"ver-1": None}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.url.path.endswith("/publish/"):
+            archived["ver-1"] = "2024-02-01T00:00:00Z"
+        return httpx.Response(
+            200,
+            json={
+                **VERSION_JSON,
+                "published_at": "2024-01-11T00:00:00Z",
+                "archived_at": archived["ver-1"],
+            },
+        )
+
+    client = build_management_client(handler, object_cache=ImmutableCache())
+    assert client.get_folder_version("folder-1", "ver-1").archived_at is None
+    assert client.get_folder_version("folder-1", "ver-1").archived_at is None
+    client.publish_folder_version("folder-1", "ver-2")
+    assert client.get_folder_version("folder-1", "ver-1").archived_at is not None
+    assert calls == ["GET", "POST", "GET"]
+
+
+def test_object_cache_keeps_published_revision_data_on_disk(tmp_path):
+    requests: list[str] = []
+    published = {**REVISION_JSON, "status": "published"}
+    published["published_at"] = "2024-01-11T00:00:00Z"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("/data/"):
+            return httpx.Response(200, json={"title": "Frozen"})
+        return httpx.Response(200, json=published)
+
+    path = tmp_path / "objects.db"
+    client = build_management_client(
+        handler, object_cache=ImmutableCache(path=path, mutable_ttl=0)
+    )
+    # Data of a revision not known to be published is not kept.
+    client.get_revision_data("folder-1", "resource-1", "rev-1")
+    client.get_revision_data("folder-1", "resource-1", "rev-1")
+    assert len(requests) == 2
+    assert client.get_revision("folder-1", "resource-1", "rev-1").status == "published"
+    client.get_revision_data("folder-1", "resource-1", "rev-1")
+    client.object_cache.close()
+
+    requests.clear()
+    client = build_management_client(
+        handler, object_cache=ImmutableCache(path=path, mutable_ttl=0)
+    )
+    data = client.get_revision_data("folder-1", "resource-1", "rev-1")
+    assert data == {"title": "Frozen"}
+    assert requests == []
+    # Revision metadata still goes to the API because its status can change.
+    client.get_revision("folder-1", "resource-1", "rev-1")
+    assert len(requests) == 1
+
+
+def test_immutable_cache_evicts_least_recently_used():
+    cache = ImmutableCache(max_entries=2)
+    cache.put("revision_data", "a", {"v": 1}, immutable=True)
+    cache.put("revision_data", "b", {"v": 2}, immutable=True)
+    cached = cache.get("revision_data", "a")
+    cached["v"] = 99  # callers get a copy
+    cache.put("revision_data", "c", {"v": 3}, immutable=True)
+    assert cache.get("revision_data", "a") == {"v": 1}
+    assert cache.get("revision_data", "b") is None
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
 def test_list_components_and_versions():
     recorded: list[str] = []
 
@@ -1607,6 +3207,182 @@ def test_flux_client_builds_paths_correctly():
     ]
 
 
+def _flux_catalogue_handler(
+    calls: list[dict[str, str]], total: int = 7
+) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        calls.append(params)
+        limit = int(params.get("limit", 3))
+        start = int(params.get("next", "c0")[1:])
+        end = min(start + limit, total)
+        return httpx.Response(
+            200,
+            json={
+                "results": [{"key": f"r{i}"} for i in range(start, end)],
+                "next": f"c{end}" if end < total else None,
+            },
+        )
+
+    return handler
+
+
+def _flux_with_handler(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> FluxClient:
+    flux = FluxClient(
+        base_url="https://env.fxns.io",
+        api_prefix="blog",
+        auth=SimpleKeyAuth("pub", "secret"),
+    )
+    flux._transport = HttpTransport(  # type: ignore[attr-defined]
+        config=FoxnoseConfig(base_url="https://env.fxns.io"),
+        auth=SimpleKeyAuth("pub", "secret"),
+        sync_client=httpx.Client(
+            base_url="https://env.fxns.io", transport=httpx.MockTransport(handler)
+        ),
+    )
+    return flux
+
+
+def test_flux_iter_resources_follows_cursor_and_resumes():
+    calls: list[dict[str, str]] = []
+    flux = _flux_with_handler(_flux_catalogue_handler(calls))
+
+    keys = [item["key"] for item in flux.iter_resources("articles", page_size=3)]
+    assert keys == [f"r{i}" for i in range(7)]
+    assert calls == [
+        {"limit": "3"},
+        {"limit": "3", "next": "c3"},
+        {"limit": "3", "next": "c6"},
+    ]
+
+    pages = flux.iter_resource_pages("articles", page_size=3)
+    saved = next(pages)["next"]
+    pages.close()
+    resumed = [
+        item["key"]
+        for item in flux.iter_resources("articles", page_size=3, cursor=saved)
+    ]
+    assert resumed == ["r3", "r4", "r5", "r6"]
+
+    calls.clear()
+    limited = list(flux.iter_resources("articles", page_size=3, max_items=5))
+    assert [item["key"] for item in limited] == ["r0", "r1", "r2", "r3", "r4"]
+    # The page after the one holding item 5 is never requested.
+    assert len(calls) == 2
+
+    calls.clear()
+    list(flux.iter_resources("articles", page_size=3, max_items=3))
+    assert len(calls) == 1
+
+
+def test_flux_search_many_dedupes_and_keeps_input_order():
+    sent: list[tuple[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        sent.append((request.url.path, body))
+        if request.url.path == "/blog/broken/_search":
+            return httpx.Response(400, json={"message": "Bad query"})
+        return httpx.Response(200, json={"results": [body["q"]]})
+
+    flux = _flux_with_handler(handler)
+    queries = [
+        ("articles", {"q": "cats", "limit": 5}),
+        ("broken", {"q": "dogs"}),
+        ("/articles/", {"limit": 5, "q": "cats"}),
+        ("authors", {"q": "cats", "limit": 5}),
+    ]
+    outcomes = flux.search_many(queries, max_concurrency=2)
+    assert [outcome.item for outcome in outcomes] == queries
+    assert [outcome.index for outcome in outcomes] == [0, 1, 2, 3]
+    assert outcomes[0].result == {"results": ["cats"]}
+    assert isinstance(outcomes[1].error, FoxnoseAPIError)
+    assert outcomes[1].result is None
+    assert outcomes[2].result is outcomes[0].result
+    assert outcomes[3].result == {"results": ["cats"]}
+    assert len(sent) == 3
+
+
+def test_flux_federated_search_merges_top_k_and_stops_early():
+    scores = {
+        "news": [0.99, 0.97, 0.95, 0.93, 0.91, 0.5],
+        "docs": [0.98, 0.4, 0.3, 0.2],
+        "blog": [0.1, 0.05],
+    }
+    requests: list[tuple[str, int, int]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        folder = request.url.path.split("/")[2]
+        body = json.loads(request.content)
+        assert body["find_text"] == {"query": "x"}
+        requests.append((folder, body["offset"], body["limit"]))
+        window = scores[folder][body["offset"] : body["offset"] + body["limit"]]
+        return httpx.Response(
+            200, json={"results": [{"folder": folder, "score": v} for v in window]}
+        )
+
+    flux = _flux_with_handler(handler)
+    hits = flux.federated_search(
+        ["news", "docs", "blog"],
+        {"find_text": {"query": "x"}, "limit": 100},
+        top_k=5,
+        page_size=2,
+    )
+    assert [(hit.folder_path, hit.score) for hit in hits] == [
+        ("news", 0.99),
+        ("docs", 0.98),
+        ("news", 0.97),
+        ("news", 0.95),
+        ("news", 0.93),
+    ]
+    assert hits[0].hit == {"folder": "news", "score": 0.99}
+    # "news" blocks the merge after its first page, so it is paged further
+    # with a doubled page size. "docs" is fetched along with it because its
+    # last buffered hit could still be needed; "blog" is never paged again.
+    assert sorted(requests) == [
+        ("blog", 0, 2),
+        ("docs", 0, 2),
+        ("docs", 2, 4),
+        ("news", 0, 2),
+        ("news", 2, 4),
+    ]
+
+
+def test_flux_federated_search_returns_everything_when_folders_run_out():
+    def handler(request: httpx.Request) -> httpx.Response:
+        folder = request.url.path.split("/")[2]
+        if folder == "broken":
+            return httpx.Response(500, json={"message": "boom"})
+        hits = {"a": [{"rank": 3}, {"rank": 1}], "b": [{"rank": 2}]}[folder]
+        return httpx.Response(200, json={"results": hits})
+
+    flux = _flux_with_handler(handler)
+    hits = flux.federated_search(
+        ["a", "b"], {}, top_k=10, score=lambda hit: hit["rank"]
+    )
+    assert [hit.score for hit in hits] == [3, 2, 1]
+    with pytest.raises(FoxnoseAPIError):
+        flux.federated_search(["a", "broken"], {}, top_k=3, score="rank")
+
+
+def test_flux_fan_out_fetches_resources_over_one_client():
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.path.rsplit("/", 1)[-1]
+        if key == "gone":
+            return httpx.Response(404, json={"message": "Not found"})
+        return httpx.Response(200, json={"key": key})
+
+    flux = _flux_with_handler(handler)
+    args = [("articles", "a-1"), ("articles", "gone"), ("articles", "a-3")]
+    outcomes = list(flux.fan_out(flux.get_resource, args, max_concurrency=3))
+    assert [outcome.item for outcome in outcomes] == args
+    assert outcomes[0].result == {"key": "a-1"}
+    assert isinstance(outcomes[1].error, FoxnoseAPIError)
+    assert outcomes[2].result == {"key": "a-3"}
+
+
 # ---------------------------------------------------------------------------
 # _resolve_key unit tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from foxnose_sdk.concurrency import (
+    AdaptiveConcurrency,
+    Unmetered,
+    abounded_dag,
+    abounded_map,
+    bounded_dag,
+    bounded_map,
+    fan_out,
+)
+from foxnose_sdk.errors import FoxnoseAPIError, FoxnoseTransportError
+
+
+def _api_error(status: int) -> FoxnoseAPIError:
+    return FoxnoseAPIError(message="error", status_code=status)
+
+
+def test_adaptive_concurrency_grows_while_healthy():
+    limiter = AdaptiveConcurrency(initial=2, max_limit=4)
+    for _ in range(50):
+        limiter.record(0.01)
+    assert limiter.limit == 4
+    assert [sample.limit for sample in limiter.history] == [2, 3, 4]
+
+
+def test_adaptive_concurrency_backs_off_on_throttling():
+    limiter = AdaptiveConcurrency(initial=8)
+    limiter.record(0.01, _api_error(429))
+    assert limiter.limit == 4
+    # Further failures from the same burst do not back off again immediately.
+    limiter.record(0.01, _api_error(503))
+    assert limiter.limit == 4
+    assert limiter.history[-1].limit == 4
+
+
+def test_adaptive_concurrency_ignores_client_errors():
+    limiter = AdaptiveConcurrency(initial=8)
+    limiter.record(0.01, _api_error(400))
+    assert limiter.limit == 8
+    assert AdaptiveConcurrency.is_overload(FoxnoseTransportError("boom"))
+    assert not AdaptiveConcurrency.is_overload(ValueError("boom"))
+
+
+def test_adaptive_concurrency_baseline_ignores_fast_errors():
+    limiter = AdaptiveConcurrency(initial=8, max_limit=16)
+    limiter.record(0.001, _api_error(404))
+    for _ in range(40):
+        limiter.record(0.1)
+    assert limiter.limit > 8
+    assert min(sample.limit for sample in limiter.history) == 8
+
+
+def test_adaptive_concurrency_baseline_follows_recent_calls():
+    limiter = AdaptiveConcurrency(initial=8, max_limit=16, baseline_window=5)
+    limiter.record(0.001)
+    for _ in range(5):
+        limiter.record(0.1)
+    lowered = limiter.limit
+    assert lowered < 8
+    # Once the outlier leaves the window, healthy calls grow the limit again.
+    for _ in range(40):
+        limiter.record(0.1)
+    assert limiter.limit > lowered
+
+
+def test_adaptive_concurrency_backs_off_on_latency_growth():
+    limiter = AdaptiveConcurrency(initial=10, latency_tolerance=2.0)
+    limiter.record(0.01)
+    for _ in range(20):
+        limiter.record(0.5)
+    assert limiter.limit < 10
+
+
+def test_adaptive_concurrency_validates_arguments():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(min_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(initial=100, max_limit=10)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(backoff=1.5)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(baseline_window=0)
+
+
+def test_map_keeps_unmetered_calls_out_of_the_limiter():
+    limiter = AdaptiveConcurrency(initial=2, max_limit=4)
+    outcomes = list(
+        bounded_map(Unmetered, range(20), max_concurrency=limiter, ordered=True)
+    )
+    assert [outcome.result for outcome in outcomes] == list(range(20))
+    assert limiter.limit == 2
+    assert len(limiter.history) == 1
+
+
+def test_bounded_map_respects_adaptive_limit():
+    peak = 0
+    current = 0
+    lock = threading.Lock()
+
+    def work(item: int) -> int:
+        nonlocal peak, current
+        with lock:
+            current += 1
+            peak = max(peak, current)
+        time.sleep(0.005)
+        with lock:
+            current -= 1
+        if item % 10 == 0:
+            raise _api_error(429)
+        return item * 2
+
+    limiter = AdaptiveConcurrency(initial=2, max_limit=3)
+    outcomes = list(bounded_map(work, range(40), max_concurrency=limiter))
+    assert len(outcomes) == 40
+    assert sum(1 for outcome in outcomes if outcome.error is not None) == 4
+    assert peak <= 3
+    assert len(limiter.history) > 1
+
+
+def test_bounded_map_ordered_and_lazy():
+    pulled = []
+
+    def source():
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    stream = bounded_map(lambda i: i + 1, source(), max_concurrency=2, ordered=True)
+    assert [next(stream).result for _ in range(3)] == [1, 2, 3]
+    stream.close()
+    assert len(pulled) <= 5
+
+
+def test_bounded_dag_runs_nodes_after_their_dependencies():
+    # 0 -> 1 -> 2, 3 independent, 4 depends on the failing 5.
+    dependencies = [(), (0,), (1,), (), (5,), ()]
+    started: list[int] = []
+    lock = threading.Lock()
+
+    def work(node: int) -> int:
+        with lock:
+            started.append(node)
+        time.sleep(0.001)
+        if node == 5:
+            raise _api_error(400)
+        return node * 10
+
+    outcomes = list(bounded_dag(work, list(range(6)), dependencies, max_concurrency=3))
+    assert sorted(o.index for o in outcomes) == [0, 1, 2, 3, 5]
+    assert started.index(0) < started.index(1) < started.index(2)
+    assert 4 not in started
+    errors = {o.index: o.error for o in outcomes if o.error is not None}
+    assert list(errors) == [5]
+    with pytest.raises(ValueError):
+        bounded_dag(work, [1, 2], [()], max_concurrency=1)
+
+
+async def test_abounded_dag_overlaps_independent_branches():
+    running = 0
+    peak = 0
+
+    async def work(node: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.005)
+        running -= 1
+        return node
+
+    dependencies = [(), (), (0,), (1,)]
+    order = [
+        outcome.index
+        async for outcome in abounded_dag(
+            work, list(range(4)), dependencies, max_concurrency=4
+        )
+    ]
+    assert peak == 2
+    assert order.index(0) < order.index(2)
+    assert order.index(1) < order.index(3)
+
+
+async def test_abounded_map_accepts_async_iterables():
+    async def source():
+        for i in range(5):
+            yield i
+
+    async def work(item: int) -> int:
+        await asyncio.sleep(0.001 * (5 - item))
+        if item == 3:
+            raise _api_error(503)
+        return item
+
+    limiter = AdaptiveConcurrency(initial=2)
+    outcomes = [
+        outcome
+        async for outcome in abounded_map(
+            work, source(), max_concurrency=limiter, ordered=True
+        )
+    ]
+    assert [outcome.index for outcome in outcomes] == [0, 1, 2, 3, 4]
+    assert isinstance(outcomes[3].error, FoxnoseAPIError)
+    assert limiter.history[-1].limit >= 1
+
+
+def test_fan_out_unpacks_tuples_and_logs_failing_progress_callback(caplog):
+    def progress(done: int, total: int) -> None:
+        raise RuntimeError("callback bug")
+
+    outcomes = list(
+        fan_out(
+            lambda a, b=0: a + b,
+            [(1, 2), 5, (3,)],
+            max_concurrency=2,
+            on_progress=progress,
+        )
+    )
+    assert [outcome.result for outcome in outcomes] == [3, 5, 3]
+    failures = [r for r in caplog.records if r.name == "foxnose_sdk.concurrency"]
+    assert len(failures) == 3
+    assert "callback bug" in str(failures[0].exc_info[1])
+
+
+def test_bounded_map_rejects_zero_concurrency():
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        bounded_map(lambda item: item, [1], max_concurrency=0)
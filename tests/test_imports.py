@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import foxnose_sdk
+import foxnose_sdk.management
+
+SRC = str(Path(foxnose_sdk.__file__).resolve().parents[1])
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Run ``code`` with ``-X importtime``; return cumulative microseconds per module."""
+    env = {**os.environ, "PYTHONPATH": SRC}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_package_defers_clients_and_models():
+    times = _import_times("import foxnose_sdk")
+    assert "foxnose_sdk" in times
+    loaded = set(times)
+    assert not any(name.startswith("foxnose_sdk.management") for name in loaded)
+    assert not any(name.startswith("foxnose_sdk.flux") for name in loaded)
+    assert "pydantic" not in loaded
+    assert "cryptography" not in loaded
+
+
+def test_flux_with_simple_key_auth_skips_management_and_cryptography():
+    times = _import_times(
+        "import foxnose_sdk\nfoxnose_sdk.FluxClient\nfoxnose_sdk.SimpleKeyAuth\n"
+    )
+    loaded = set(times)
+    assert "foxnose_sdk.flux.client" in loaded
+    assert "foxnose_sdk.management.client" not in loaded
+    assert "foxnose_sdk.management.models" not in loaded
+    assert "cryptography" not in loaded
+    # The package itself must stay a small fraction of the Flux client import.
+    assert times["foxnose_sdk"] < times["foxnose_sdk.flux.client"]
+
+
+def test_lazy_exports_resolve():
+    for package in (foxnose_sdk, foxnose_sdk.management):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+        assert set(package.__all__) <= set(dir(package))
+    assert foxnose_sdk.ManagementClient is foxnose_sdk.management.ManagementClient
+    with pytest.raises(AttributeError, match="NotAnExport"):
+        foxnose_sdk.NotAnExport  # noqa: B018
+
+
+def test_submodules_resolve_as_attributes():
+    code = (
+        "import foxnose_sdk\n"
+        "assert foxnose_sdk.errors.FoxnoseAPIError is foxnose_sdk.FoxnoseAPIError\n"
+        "assert foxnose_sdk.config.RetryConfig is foxnose_sdk.RetryConfig\n"
+        "assert foxnose_sdk.management.cache.ImmutableCache is not None\n"
+        "assert foxnose_sdk.flux.client.FluxClient is foxnose_sdk.FluxClient\n"
+    )
+    _import_times(code)
+    with pytest.raises(AttributeError, match="not_a_module"):
+        foxnose_sdk.not_a_module  # noqa: B018
+    with pytest.raises(AttributeError, match="not_a_module"):
+        foxnose_sdk.management.not_a_module  # noqa: B018
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+import pickle
+
+import httpx
+import pytest
+
+from foxnose_sdk.auth import SimpleKeyAuth
+from foxnose_sdk.config import FoxnoseConfig
+from foxnose_sdk.errors import FoxnoseAPIError
+from foxnose_sdk.http import HttpTransport
+from foxnose_sdk.management.client import ManagementClient
+from foxnose_sdk.management.models import BatchUpsertItem
+from foxnose_sdk.management.multiprocess import (
+    process_batch_upsert_resources,
+    shard_for,
+)
+
+RESOURCE_JSON = {
+    "key": "resource-1",
+    "folder": "folder-1",
+    "content_type": "document",
+    "created_at": "2024-01-10T00:00:00Z",
+    "vectors_size": 0,
+    "name": "Resource",
+    "component": None,
+    "resource_owner": None,
+    "current_revision": "rev-1",
+    "external_id": None,
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    ext_id = request.url.params["external_id"]
+    if ext_id.startswith("bad"):
+        return httpx.Response(
+            400, json={"message": "Bad request", "error_code": "validation_error"}
+        )
+    return httpx.Response(
+        200,
+        json={**RESOURCE_JSON, "external_id": ext_id, "name": str(os.getpid())},
+    )
+
+
+def _client_factory(cls: type[ManagementClient] = ManagementClient) -> ManagementClient:
+    client = cls(
+        base_url="https://api.example.com",
+        environment_key="env123",
+        auth=SimpleKeyAuth("pub", "secret"),
+    )
+    client._transport = HttpTransport(
+        config=FoxnoseConfig(base_url="https://api.example.com"),
+        auth=SimpleKeyAuth("pub", "secret"),
+        sync_client=httpx.Client(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(_handler),
+        ),
+    )
+    return client
+
+
+class _ClosingClient(ManagementClient):
+    def close(self) -> None:
+        with open(os.environ["FOXNOSE_TEST_CLOSED"], "a") as log:
+            log.write(f"{os.getpid()}\n")
+        super().close()
+
+
+def _closing_client_factory() -> ManagementClient:
+    return _client_factory(_ClosingClient)
+
+
+def test_process_batch_upsert_merges_worker_reports():
+    ids = [f"ext-{i}" for i in range(30)] + ["bad-1", "bad-2"]
+    items = [BatchUpsertItem(external_id=i, payload={"title": i}) for i in ids]
+    progress: list[tuple[int, int]] = []
+
+    result = process_batch_upsert_resources(
+        "folder-1",
+        items,
+        client_factory=_client_factory,
+        processes=2,
+        chunk_size=4,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert result.success_count == 30
+    assert {r.external_id for r in result.succeeded} == set(ids[:30])
+    assert [e.index for e in result.failed] == [30, 31]
+    assert isinstance(result.failed[0].exception, FoxnoseAPIError)
+    assert result.failed[0].exception.status_code == 400
+    assert progress[-1] == (32, 32)
+
+    # Every external_id is handled by the worker of its shard.
+    workers: dict[int, set[str]] = {}
+    for resource in result.succeeded:
+        workers.setdefault(shard_for(resource.external_id, 2), set()).add(resource.name)
+    assert all(len(pids) == 1 for pids in workers.values())
+    assert len(workers) == 2
+    assert workers[0] != workers[1]
+
+
+def test_process_batch_upsert_fail_fast_raises():
+    items = [BatchUpsertItem(external_id="bad-1", payload={})]
+    with pytest.raises(FoxnoseAPIError):
+        process_batch_upsert_resources(
+            "folder-1",
+            items,
+            client_factory=_client_factory,
+            processes=1,
+            fail_fast=True,
+        )
+
+
+def test_process_batch_upsert_validates_client_arguments():
+    items = [BatchUpsertItem(external_id="ext-1", payload={})]
+    with pytest.raises(ValueError, match="exactly one"):
+        process_batch_upsert_resources("folder-1", items)
+    with pytest.raises(ValueError, match="exactly one"):
+        process_batch_upsert_resources(
+            "folder-1",
+            items,
+            client_options={"environment_key": "env"},
+            client_factory=_client_factory,
+        )
+
+
+def test_api_error_survives_pickling():
+    error = FoxnoseAPIError(
+        message="Bad request",
+        status_code=400,
+        error_code="validation_error",
+        response_headers={"x-request-id": "abc"},
+    )
+    restored = pickle.loads(pickle.dumps(error))
+    assert restored == error
+    assert str(restored) == str(error)
+
+
+def test_process_batch_upsert_closes_worker_clients(tmp_path, monkeypatch):
+    log = tmp_path / "closed.log"
+    monkeypatch.setenv("FOXNOSE_TEST_CLOSED", str(log))
+    items = [BatchUpsertItem(external_id=f"ext-{i}", payload={}) for i in range(8)]
+
+    result = process_batch_upsert_resources(
+        "folder-1",
+        items,
+        client_factory=_closing_client_factory,
+        processes=2,
+        chunk_size=2,
+    )
+
+    assert result.success_count == 8
+    pids = log.read_text().split()
+    assert len(pids) == 2
+    assert len(set(pids)) == 2